@@ -9,7 +9,11 @@ responses. This endpoint stores URLs with short IDs and redirects users
 to the correct URL.
 
 Usage:
-    python custom_server.py [--port PORT] [--host HOST]
+    python custom_server.py [--port PORT] [--host HOST] [--workers N]
+
+With --workers > 1 each worker process builds its own app through
+create_app_from_env(); use the shared SQLite URL cache backend
+(url_cache.backend: sqlite) so every worker resolves the same /r/{id} links.
 """
 
 import os
@@ -23,21 +27,42 @@ project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 import uvicorn
-from fastapi import HTTPException, Request
-from fastapi.responses import RedirectResponse, JSONResponse
 
 # Import ADK's get_fast_api_app function
 from google.adk.cli.cli_tools_click import get_fast_api_app
 from google.adk.cli.utils import logs
 
-# Import our URL cache
+# Import our URL cache and redirect routes
 from src.infrastructure.cache.url_cache import url_cache
+from src.presentation.api.redirect_routes import create_redirect_router
+from src.presentation.api.zip_routes import create_zip_router, create_zip_stream_router
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _build_url_signer():
+    """Build the container's URL signer (used to resolve lazy cache entries)."""
+    from src.container import get_container
+
+    return get_container().url_signer
+
+
+def _get_zip_job_service():
+    """Get the container's ZIP job service (status of background ZIP jobs)."""
+    from src.container import get_container
+
+    return get_container().zip_job_service
+
+
+def _get_zip_stream_service():
+    """Get the container's ZIP stream service (on-the-fly ZIP downloads)."""
+    from src.container import get_container
+
+    return get_container().zip_stream_service
+
+
 def create_app_with_redirect(
     agents_dir: str,
     allow_origins: list[str] = None,
@@ -62,61 +87,41 @@ def create_app_with_redirect(
         **kwargs
     )
 
-    # Add our custom redirect endpoint
-    @app.get("/r/{url_id}")
-    async def redirect_to_url(url_id: str, request: Request):
-        """
-        Redirect to stored signed URL or return JSON with URL.
-
-        This endpoint is used to bypass LLM corruption of signed URLs.
-        The backend stores URLs with short IDs, and this endpoint
-        redirects users to the actual GCS signed URL.
-
-        Behavior:
-        - If Accept header contains 'application/json': returns JSON with URL
-        - Otherwise: returns 302 redirect to the signed URL
-
-        Args:
-            url_id: Short ID for the stored URL
-            request: FastAPI request object
-
-        Returns:
-            302 redirect OR JSON response with URL
-        """
-        url = url_cache.get(url_id)
-
-        if url is None:
-            logger.warning(f"URL not found for ID: {url_id}")
-            raise HTTPException(
-                status_code=404,
-                detail=f"URL not found or expired. ID: {url_id}"
-            )
+    # Add our custom redirect endpoint (+ cache health)
+    app.include_router(create_redirect_router(url_cache))
+
+    # Background ZIP job status / download links
+    app.include_router(create_zip_router(_get_zip_job_service))
 
-        # Check if frontend wants JSON response
-        accept_header = request.headers.get("accept", "")
-        if "application/json" in accept_header:
-            logger.info(f"Returning JSON for {url_id} (frontend request)")
-            return JSONResponse(content={"url": url, "url_id": url_id})
-
-        # Default: redirect for direct browser access
-        logger.info(f"Redirecting {url_id} to URL (length: {len(url)})")
-        return RedirectResponse(url=url, status_code=302)
-
-    # Add health check that includes cache stats
-    @app.get("/health/cache")
-    async def cache_health():
-        """Get URL cache statistics."""
-        return {
-            "status": "healthy",
-            "cache": url_cache.stats()
-        }
+    # ZIPs streamed to the client while PDFs are fetched (nothing stored)
+    app.include_router(create_zip_stream_router(_get_zip_stream_service))
+
+    # Workers that never ran the agent still need a signer for lazy entries
+    url_cache.set_signer_factory(_build_url_signer)
 
     logger.info("✅ Custom redirect endpoint added: /r/{url_id}")
+    logger.info("✅ Batch redirect endpoint added: POST /r/batch")
     logger.info("✅ Cache health endpoint added: /health/cache")
+    logger.info("✅ ZIP job endpoints added: /zip/{package_id}/status, /zip/{package_id}/download")
+    logger.info("✅ ZIP stream endpoint added: /zip/stream/{token}")
 
     return app
 
 
+def create_app_from_env():
+    """
+    App factory for multi-worker mode.
+
+    uvicorn imports this in every worker process; settings are passed by
+    main() through environment variables.
+    """
+    allow_origins = os.getenv("CUSTOM_SERVER_ALLOW_ORIGINS", "*")
+    return create_app_with_redirect(
+        agents_dir=os.getenv("CUSTOM_SERVER_AGENTS_DIR", "my-agents"),
+        allow_origins=[allow_origins] if allow_origins else None,
+    )
+
+
 def main():
     """Main entry point for custom server."""
     parser = argparse.ArgumentParser(description="Custom ADK Server with URL Redirect")
@@ -125,6 +130,12 @@ def main():
     parser.add_argument("--agents-dir", default="my-agents", help="Directory containing agents")
     parser.add_argument("--allow-origins", default="*", help="CORS allowed origins")
     parser.add_argument("--log-level", default="INFO", help="Log level")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.getenv("WORKERS", 1)),
+        help="Number of worker processes",
+    )
 
     args = parser.parse_args()
 
@@ -138,8 +149,31 @@ def main():
     print(f"Port: {args.port}")
     print(f"Agents Dir: {args.agents_dir}")
     print(f"Allow Origins: {args.allow_origins}")
+    print(f"Workers: {args.workers}")
+    print(f"URL Cache: {url_cache.stats()['backend']}")
     print("=" * 60)
 
+    if args.workers > 1:
+        if url_cache.stats()["backend"] == "memory":
+            logger.warning(
+                "⚠️ Running %d workers with the in-memory URL cache: /r/{id} "
+                "links will 404 on workers that did not create them. "
+                "Set url_cache.backend to sqlite.",
+                args.workers,
+            )
+
+        os.environ["CUSTOM_SERVER_AGENTS_DIR"] = args.agents_dir
+        os.environ["CUSTOM_SERVER_ALLOW_ORIGINS"] = args.allow_origins or ""
+        uvicorn.run(
+            "custom_server:create_app_from_env",
+            factory=True,
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+            app_dir=str(project_root),
+        )
+        return
+
     # Parse allow_origins
     allow_origins = [args.allow_origins] if args.allow_origins else None
 
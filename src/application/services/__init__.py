@@ -6,10 +6,14 @@ Orchestration layer for business operations (Use Cases).
 
 from .invoice_service import InvoiceService
 from .zip_service import ZipService
+from .zip_job_service import ZipJobService
+from .zip_stream_service import ZipStreamService
 from .conversation_service import ConversationService
 
 __all__ = [
     "InvoiceService",
     "ZipService",
+    "ZipJobService",
+    "ZipStreamService",
     "ConversationService",
 ]
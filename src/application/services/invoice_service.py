@@ -6,12 +6,15 @@ Orchestrates domain models, repositories, and URL signing.
 """
 
 import sys
-from typing import List, Optional, Dict, Any
+from typing import TYPE_CHECKING, Iterator, List, Optional, Dict, Any
 from datetime import date
 
 from src.core.domain.models import Invoice
 from src.core.domain.interfaces import IInvoiceRepository, IURLSigner
 
+if TYPE_CHECKING:
+    from src.infrastructure.gcs.batch_signing_engine import BatchSigningEngine
+
 
 class InvoiceService:
     """
@@ -21,21 +24,32 @@ class InvoiceService:
     Implements business logic for invoice operations.
     """
 
-    def __init__(self, invoice_repository: IInvoiceRepository, url_signer: IURLSigner):
+    def __init__(
+        self,
+        invoice_repository: IInvoiceRepository,
+        url_signer: IURLSigner,
+        batch_signing_engine: Optional["BatchSigningEngine"] = None,
+    ):
         """
         Initialize invoice service
 
         Args:
             invoice_repository: Invoice data access implementation
             url_signer: URL signing implementation
+            batch_signing_engine: Optional concurrent signer for multiple PDFs
+                (falls back to sequential url_signer calls when None)
         """
         self.invoice_repo = invoice_repository
         self.url_signer = url_signer
+        self.batch_signing_engine = batch_signing_engine
 
         print(f"SERVICE Initialized InvoiceService", file=sys.stderr)
 
     def get_invoice_by_number(
-        self, invoice_number: str, generate_urls: bool = True
+        self,
+        invoice_number: str,
+        generate_urls: bool = True,
+        projection: Optional[str] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Get invoice by invoice number
@@ -43,19 +57,53 @@ class InvoiceService:
         Args:
             invoice_number: Invoice number (Factura)
             generate_urls: Whether to generate signed URLs for PDFs
+            projection: InvoiceProjection profile (default: FULL)
 
         Returns:
             Invoice dictionary with optional signed URLs, or None if not found
         """
-        invoice = self.invoice_repo.find_by_invoice_number(invoice_number)
+        invoice = self.invoice_repo.find_by_invoice_number(
+            invoice_number, projection=projection
+        )
 
         if not invoice:
             return None
 
         return self._prepare_invoice_response(invoice, generate_urls)
 
+    def get_invoices_by_numbers(
+        self,
+        invoice_numbers: List[str],
+        generate_urls: bool = True,
+        projection: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get several invoices by invoice number with one batched lookup
+
+        Args:
+            invoice_numbers: Invoice numbers (Factura)
+            generate_urls: Whether to generate signed URLs for PDFs
+            projection: InvoiceProjection profile (default: FULL)
+
+        Returns:
+            List of invoice dictionaries in the order of invoice_numbers
+            (unknown numbers are skipped)
+        """
+        invoices = self.invoice_repo.find_by_invoice_numbers(
+            invoice_numbers, projection=projection
+        )
+
+        return [
+            self._prepare_invoice_response(invoice, generate_urls)
+            for invoice in invoices
+        ]
+
     def get_invoices_by_rut(
-        self, rut: str, limit: Optional[int] = None, generate_urls: bool = True
+        self,
+        rut: str,
+        limit: Optional[int] = None,
+        generate_urls: bool = True,
+        projection: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
         Get invoices by customer RUT
@@ -64,11 +112,12 @@ class InvoiceService:
             rut: Customer RUT
             limit: Maximum number of results
             generate_urls: Whether to generate signed URLs for PDFs
+            projection: InvoiceProjection profile (default: FULL)
 
         Returns:
             List of invoice dictionaries with optional signed URLs
         """
-        invoices = self.invoice_repo.find_by_rut(rut, limit)
+        invoices = self.invoice_repo.find_by_rut(rut, limit, projection=projection)
 
         return [
             self._prepare_invoice_response(invoice, generate_urls)
@@ -76,7 +125,11 @@ class InvoiceService:
         ]
 
     def get_invoices_by_solicitante(
-        self, solicitante: str, limit: Optional[int] = None, generate_urls: bool = True
+        self,
+        solicitante: str,
+        limit: Optional[int] = None,
+        generate_urls: bool = True,
+        projection: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
         Get invoices by solicitante code
@@ -85,11 +138,14 @@ class InvoiceService:
             solicitante: Solicitante code
             limit: Maximum number of results
             generate_urls: Whether to generate signed URLs for PDFs
+            projection: InvoiceProjection profile (default: FULL)
 
         Returns:
             List of invoice dictionaries with optional signed URLs
         """
-        invoices = self.invoice_repo.find_by_solicitante(solicitante, limit)
+        invoices = self.invoice_repo.find_by_solicitante(
+            solicitante, limit, projection=projection
+        )
 
         return [
             self._prepare_invoice_response(invoice, generate_urls)
@@ -102,6 +158,7 @@ class InvoiceService:
         end_date: date,
         rut: Optional[str] = None,
         generate_urls: bool = True,
+        projection: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
         Get invoices by date range
@@ -111,19 +168,115 @@ class InvoiceService:
             end_date: End date (inclusive)
             rut: Optional RUT filter
             generate_urls: Whether to generate signed URLs for PDFs
+            projection: InvoiceProjection profile (default: FULL)
 
         Returns:
             List of invoice dictionaries with optional signed URLs
         """
-        invoices = self.invoice_repo.find_by_date_range(start_date, end_date, rut)
+        invoices = self.invoice_repo.find_by_date_range(
+            start_date, end_date, rut, projection=projection
+        )
 
         return [
             self._prepare_invoice_response(invoice, generate_urls)
             for invoice in invoices
         ]
 
+    def iter_invoices_by_rut(
+        self,
+        rut: str,
+        after_factura: Optional[str] = None,
+        limit: Optional[int] = None,
+        generate_urls: bool = True,
+        page_size: Optional[int] = None,
+        projection: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream invoices by customer RUT, newest invoice number first
+
+        Each invoice is prepared as soon as its page arrives, so large RUTs
+        are never held in memory at once.
+
+        Args:
+            rut: Customer RUT
+            after_factura: Keyset cursor (last invoice number already seen)
+            limit: Maximum number of results
+            generate_urls: Whether to generate signed URLs for PDFs
+            page_size: Rows fetched per page (repository default if None)
+            projection: InvoiceProjection profile (default: FULL)
+
+        Yields:
+            Invoice dictionaries with optional signed URLs
+        """
+        for invoice in self.invoice_repo.iter_by_rut(
+            rut,
+            after_factura=after_factura,
+            limit=limit,
+            page_size=page_size,
+            projection=projection,
+        ):
+            yield self._prepare_invoice_response(invoice, generate_urls)
+
+    def iter_invoices_by_solicitante(
+        self,
+        solicitante: str,
+        after_factura: Optional[str] = None,
+        limit: Optional[int] = None,
+        generate_urls: bool = True,
+        page_size: Optional[int] = None,
+        projection: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream invoices by solicitante code (see iter_invoices_by_rut)
+
+        Yields:
+            Invoice dictionaries with optional signed URLs
+        """
+        for invoice in self.invoice_repo.iter_by_solicitante(
+            solicitante,
+            after_factura=after_factura,
+            limit=limit,
+            page_size=page_size,
+            projection=projection,
+        ):
+            yield self._prepare_invoice_response(invoice, generate_urls)
+
+    def iter_invoices_by_date_range(
+        self,
+        start_date: date,
+        end_date: date,
+        rut: Optional[str] = None,
+        after_factura: Optional[str] = None,
+        limit: Optional[int] = None,
+        generate_urls: bool = True,
+        page_size: Optional[int] = None,
+        projection: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream invoices by date range (see iter_invoices_by_rut)
+
+        Results are ordered by invoice number, the cursor column.
+
+        Yields:
+            Invoice dictionaries with optional signed URLs
+        """
+        for invoice in self.invoice_repo.iter_by_date_range(
+            start_date,
+            end_date,
+            rut,
+            after_factura=after_factura,
+            limit=limit,
+            page_size=page_size,
+            projection=projection,
+        ):
+            yield self._prepare_invoice_response(invoice, generate_urls)
+
     def search_invoices(
-        self, query: str, limit: Optional[int] = None, generate_urls: bool = True
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        generate_urls: bool = True,
+        projection: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
         Search invoices by query
@@ -132,11 +285,12 @@ class InvoiceService:
             query: Search query
             limit: Maximum number of results
             generate_urls: Whether to generate signed URLs for PDFs
+            projection: InvoiceProjection profile (default: FULL)
 
         Returns:
             List of invoice dictionaries with optional signed URLs
         """
-        invoices = self.invoice_repo.search(query, limit)
+        invoices = self.invoice_repo.search(query, limit, projection=projection)
 
         return [
             self._prepare_invoice_response(invoice, generate_urls)
@@ -153,6 +307,21 @@ class InvoiceService:
         Returns:
             Dictionary mapping PDF type to signed URL
         """
+        if self.batch_signing_engine is not None:
+            pdf_types = list(invoice.pdf_paths.keys())
+            results = self.batch_signing_engine.sign_all(
+                [invoice.pdf_paths[pdf_type] for pdf_type in pdf_types]
+            )
+            signed_urls = {}
+            for pdf_type, result in zip(pdf_types, results):
+                if result.error:
+                    print(
+                        f"WARNING Failed to generate URL for {pdf_type}: {result.error}",
+                        file=sys.stderr,
+                    )
+                signed_urls[pdf_type] = result.signed_url
+            return signed_urls
+
         signed_urls = {}
 
         for pdf_type, gs_path in invoice.pdf_paths.items():
@@ -0,0 +1,424 @@
+"""
+ZIP Job Service
+===============
+Background ZIP creation with a persisted status.
+
+Building a large ZIP takes seconds to minutes. Running it inside the agent
+tool call holds the LLM turn and the request until the archive is uploaded.
+Jobs are instead queued on a bounded worker pool and the caller gets the
+package ID (and a /zip/{package_id}/download link) immediately. Requests
+that exceed the volume caps become one job per volume (submit_volumes).
+
+Job state lives in zip_packages so any worker or instance can answer
+status requests:
+
+    PENDING --> CREATING --> READY
+       |            |
+       +------------+-----> FAILED
+
+Configuration (config.yaml):
+    pdf:
+      zip:
+        creation_timeout: 900       # Unfinished jobs older than this are FAILED
+        async_jobs:
+          enabled: true
+          max_workers: 2            # Concurrent builds per process
+          max_queued: 20            # Pending + running jobs per process
+"""
+
+import concurrent.futures
+import dataclasses
+import sys
+import threading
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from src.core.config import ConfigLoader
+from src.core.domain.interfaces import (
+    IInvoiceRepository,
+    IZipRepository,
+    InvoiceProjection,
+)
+from src.core.domain.models import Invoice, ZipPackage, ZipStatus
+from src.application.services.zip_download_planner import ZipDownloadPlan
+from src.application.services.zip_service import ZipService
+
+# Allowed status transitions of a job
+ZIP_JOB_TRANSITIONS = {
+    ZipStatus.PENDING: {ZipStatus.CREATING, ZipStatus.FAILED},
+    ZipStatus.CREATING: {ZipStatus.READY, ZipStatus.FAILED},
+    ZipStatus.READY: set(),
+    ZipStatus.FAILED: set(),
+    ZipStatus.EXPIRED: set(),
+}
+
+
+class ZipJobQueueFullError(Exception):
+    """Raised when the process already has max_queued unfinished jobs"""
+
+
+class ZipJobService:
+    """
+    Runs ZIP creation jobs on a bounded background pool
+
+    Example:
+        >>> job = zip_jobs.submit(["0105635394", "0105635395"], pdf_type="both")
+        >>> job.status
+        <ZipStatus.PENDING: 'pending'>
+        >>> zip_jobs.get_status(job.package_id).is_ready
+    """
+
+    def __init__(
+        self,
+        zip_service: ZipService,
+        zip_repository: IZipRepository,
+        invoice_repository: IInvoiceRepository,
+        config: ConfigLoader,
+    ):
+        """
+        Initialize ZIP job service
+
+        Args:
+            zip_service: Service that builds and uploads the archive
+            zip_repository: ZIP package persistence (job status)
+            invoice_repository: Invoice lookup for the requested numbers
+            config: Configuration loader
+        """
+        self.zip_service = zip_service
+        self.zip_repo = zip_repository
+        self.invoice_repo = invoice_repository
+
+        self.max_workers = max(1, int(config.get("pdf.zip.async_jobs.max_workers", 2)))
+        self.max_queued = max(
+            self.max_workers, int(config.get("pdf.zip.async_jobs.max_queued", 20))
+        )
+        self.expiration_days = config.get("pdf.zip.expiration_days", 7)
+        self.creation_timeout = timedelta(
+            seconds=float(config.get("pdf.zip.creation_timeout", 900))
+        )
+
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="zip-job",
+        )
+        # Latest state of jobs started by this process (package_id -> package)
+        self._jobs: Dict[str, ZipPackage] = {}
+        self._unfinished = 0
+        self._lock = threading.Lock()
+
+        print("SERVICE Initialized ZipJobService", file=sys.stderr)
+        print(
+            f"        - Workers: {self.max_workers}, max queued: {self.max_queued}",
+            file=sys.stderr,
+        )
+
+    def submit(
+        self,
+        invoice_numbers: List[str],
+        pdf_type: str = "both",
+        pdf_variant: str = "cf",
+        package_name: Optional[str] = None,
+    ) -> ZipPackage:
+        """
+        Queue a ZIP job and return its PENDING package
+
+        Args:
+            invoice_numbers: Invoice numbers to include
+            pdf_type: Filter type ('both', 'tributaria_only', 'cedible_only', etc.)
+            pdf_variant: Variant filter ('cf', 'sf', 'both')
+            package_name: Optional custom package name
+
+        Returns:
+            ZipPackage with status PENDING (already persisted)
+
+        Raises:
+            ValueError: If no invoice numbers are given
+            ZipJobQueueFullError: If max_queued jobs are unfinished
+        """
+        invoice_numbers = list(dict.fromkeys(str(n) for n in invoice_numbers if n))
+        if not invoice_numbers:
+            raise ValueError("Cannot create ZIP from empty invoice list")
+
+        self._reserve_zip_jobs(1)
+        try:
+            return self._start_zip_job(
+                invoice_numbers, pdf_type, pdf_variant, package_name
+            )
+        except Exception:
+            with self._lock:
+                self._unfinished -= 1
+            raise
+
+    def submit_volumes(
+        self,
+        invoice_numbers: List[str],
+        pdf_type: str = "both",
+        pdf_variant: str = "cf",
+        package_name: Optional[str] = None,
+    ) -> List[ZipPackage]:
+        """
+        Queue one ZIP job per volume and return their PENDING packages
+
+        With pdf.zip.volumes.enabled the invoices are looked up and split
+        into volumes before returning (one batched invoice query and one
+        batched metadata lookup, no PDF downloads), so the caller can hand
+        out one link per volume right away. Each volume is a job of its own
+        and takes one queue slot. Without volumes this is submit().
+
+        Args:
+            invoice_numbers: Invoice numbers to include
+            pdf_type: Filter type ('both', 'tributaria_only', 'cedible_only', etc.)
+            pdf_variant: Variant filter ('cf', 'sf', 'both')
+            package_name: Optional custom package name; volumes get a
+                "_parte_{i}_de_{n}" suffix
+
+        Returns:
+            ZipPackage with status PENDING per volume, in invoice order
+
+        Raises:
+            ValueError: If no invoice numbers are given or none is found
+            ZipJobQueueFullError: If the volumes do not fit in the queue
+        """
+        if not self.zip_service.volumes_enabled:
+            return [self.submit(invoice_numbers, pdf_type, pdf_variant, package_name)]
+
+        invoice_numbers = list(dict.fromkeys(str(n) for n in invoice_numbers if n))
+        if not invoice_numbers:
+            raise ValueError("Cannot create ZIP from empty invoice list")
+        invoices = self._load_invoices(invoice_numbers)
+        if not invoices:
+            raise ValueError("No invoices found")
+
+        volumes = self.zip_service.plan_zip_volumes(invoices, pdf_type, pdf_variant)
+        names = self.zip_service.get_zip_volume_names(
+            package_name, len(invoices), len(volumes)
+        )
+
+        self._reserve_zip_jobs(len(volumes))
+        jobs = []
+        try:
+            for (volume, plan), name in zip(volumes, names):
+                jobs.append(
+                    self._start_zip_job(
+                        [invoice.factura for invoice in volume.invoices],
+                        pdf_type,
+                        pdf_variant,
+                        name,
+                        invoices=volume.invoices,
+                        plan=plan,
+                    )
+                )
+        finally:
+            # Slots of volumes that could not be started
+            with self._lock:
+                self._unfinished -= len(volumes) - len(jobs)
+        return jobs
+
+    def _reserve_zip_jobs(self, count: int) -> None:
+        """
+        Take queue slots for count jobs (all or none)
+
+        Raises:
+            ZipJobQueueFullError: If fewer than count slots are free
+        """
+        with self._lock:
+            if self._unfinished + count > self.max_queued:
+                raise ZipJobQueueFullError(
+                    f"{self._unfinished} ZIP jobs already queued or running"
+                )
+            self._unfinished += count
+
+    def _start_zip_job(
+        self,
+        invoice_numbers: List[str],
+        pdf_type: str,
+        pdf_variant: str,
+        package_name: Optional[str],
+        invoices: Optional[List[Invoice]] = None,
+        plan: Optional[ZipDownloadPlan] = None,
+    ) -> ZipPackage:
+        """Persist a PENDING job and hand it to the pool (the caller holds its slot)"""
+        job = ZipPackage(
+            package_id=str(uuid.uuid4()),
+            invoice_numbers=invoice_numbers,
+            status=ZipStatus.PENDING,
+            metadata={"expiration_days": self.expiration_days},
+        )
+
+        try:
+            self.zip_repo.create(job)
+            with self._lock:
+                self._jobs[job.package_id] = job
+            self._executor.submit(
+                self._run_zip_job,
+                job,
+                pdf_type,
+                pdf_variant,
+                package_name,
+                invoices,
+                plan,
+            )
+        except Exception:
+            with self._lock:
+                self._jobs.pop(job.package_id, None)
+            raise
+
+        print(
+            f"ZIP Job {job.package_id} queued ({len(invoice_numbers)} invoices, "
+            f"pdf_type={pdf_type}, pdf_variant={pdf_variant})",
+            file=sys.stderr,
+        )
+        return job
+
+    def get_status(self, package_id: str) -> Optional[ZipPackage]:
+        """
+        Current state of a ZIP job or package
+
+        Jobs started by this process are answered from memory; others are
+        read from the repository. Unfinished jobs older than
+        pdf.zip.creation_timeout (e.g. their worker died) are reported as
+        FAILED.
+
+        Args:
+            package_id: Package ID returned by submit()
+
+        Returns:
+            ZipPackage or None if unknown
+        """
+        with self._lock:
+            job = self._jobs.get(package_id)
+        if job is not None:
+            return job
+
+        package = self.zip_repo.find_by_id(package_id)
+        if package is None:
+            return None
+
+        if package.status in (ZipStatus.PENDING, ZipStatus.CREATING):
+            age = datetime.now(timezone.utc) - package.created_at
+            if age > self.creation_timeout:
+                return package.with_status(
+                    ZipStatus.FAILED, "ZIP job did not finish before creation_timeout"
+                )
+        return package
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop accepting jobs (running builds finish unless the process exits)"""
+        self._executor.shutdown(wait=wait)
+
+    def _run_zip_job(
+        self,
+        job: ZipPackage,
+        pdf_type: str,
+        pdf_variant: str,
+        package_name: Optional[str],
+        invoices: Optional[List[Invoice]] = None,
+        plan: Optional[ZipDownloadPlan] = None,
+    ) -> None:
+        """
+        Worker body: load invoices, build the archive, persist the outcome
+
+        Volumes come with their invoices and download plan (see
+        submit_volumes) and are not looked up again.
+        """
+        try:
+            job = self._transition_zip_job(job, job.with_status(ZipStatus.CREATING))
+
+            if invoices is None:
+                invoices = self._load_invoices(job.invoice_numbers)
+            if not invoices:
+                raise ValueError("No invoices found")
+
+            built = self.zip_service.create_zip_from_invoices(
+                invoices,
+                package_name=package_name,
+                pdf_type=pdf_type,
+                pdf_variant=pdf_variant,
+                package_id=job.package_id,
+                generations=plan.generations if plan else None,
+                plan=plan,
+            )
+
+            if built.package_id != job.package_id:
+                # Served by an existing or concurrent identical package: point
+                # this job at its archive (and its earlier expiration)
+                ready = dataclasses.replace(
+                    built,
+                    package_id=job.package_id,
+                    invoice_numbers=job.invoice_numbers,
+                    created_at=job.created_at,
+                    metadata=job.metadata,
+                )
+                self._transition_zip_job(job, ready)
+            else:
+                # ZipService already persisted the READY record
+                self._record_zip_job(built)
+
+            print(
+                f"ZIP Job {job.package_id} ready ({built.file_size_bytes} bytes)",
+                file=sys.stderr,
+            )
+
+        except Exception as e:
+            print(f"ERROR ZIP job {job.package_id} failed: {e}", file=sys.stderr)
+            current = self._jobs.get(job.package_id, job)
+            if current.status in (ZipStatus.PENDING, ZipStatus.CREATING):
+                try:
+                    self._transition_zip_job(
+                        current, current.with_status(ZipStatus.FAILED, str(e))
+                    )
+                except Exception as persist_error:
+                    print(
+                        f"ERROR Persisting failure of ZIP job {job.package_id}: "
+                        f"{persist_error}",
+                        file=sys.stderr,
+                    )
+                    self._record_zip_job(current.with_status(ZipStatus.FAILED, str(e)))
+            else:
+                self._record_zip_job(current)
+
+        finally:
+            with self._lock:
+                self._unfinished -= 1
+
+    def _transition_zip_job(self, current: ZipPackage, new: ZipPackage) -> ZipPackage:
+        """
+        Persist a status change after checking it is allowed
+
+        Raises:
+            ValueError: If the transition is not in ZIP_JOB_TRANSITIONS
+        """
+        if new.status not in ZIP_JOB_TRANSITIONS[current.status]:
+            raise ValueError(
+                f"Invalid ZIP job transition {current.status.value} -> {new.status.value}"
+            )
+        self.zip_repo.update(new)
+        self._record_zip_job(new)
+        return new
+
+    def _record_zip_job(self, package: ZipPackage) -> None:
+        """Remember the latest state of a job for local status requests"""
+        with self._lock:
+            self._jobs[package.package_id] = package
+            # Finished jobs are also in the repository; keep memory bounded
+            finished = [
+                package_id
+                for package_id, job in self._jobs.items()
+                if job.status in (ZipStatus.READY, ZipStatus.FAILED)
+            ]
+            for package_id in finished[: max(0, len(finished) - 1000)]:
+                del self._jobs[package_id]
+
+    def _load_invoices(self, invoice_numbers: List[str]) -> List[Invoice]:
+        """Look up the requested invoices (unknown numbers are skipped)"""
+        invoices = self.invoice_repo.find_by_invoice_numbers(
+            invoice_numbers, projection=InvoiceProjection.ZIP
+        )
+        missing = len(invoice_numbers) - len(invoices)
+        if missing:
+            print(
+                f"ZIP Job: {missing} of {len(invoice_numbers)} invoices not found, skipped",
+                file=sys.stderr,
+            )
+        return invoices
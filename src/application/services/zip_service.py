@@ -5,21 +5,50 @@ Application service for ZIP package operations.
 Handles ZIP creation, download URL generation, and cleanup.
 """
 
+import dataclasses
+import hashlib
+import json
+import mmap
 import sys
 import time
 import threading
 import uuid
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Tuple, Union
 from datetime import datetime, timedelta, timezone
 import zipfile
 import io
 import concurrent.futures
+from google.api_core.exceptions import PreconditionFailed
 from google.cloud import storage
 
 from src.core.domain.models import ZipPackage, ZipStatus, Invoice
 from src.core.domain.interfaces import IZipRepository, IURLSigner
 from src.core.config import ConfigLoader
 from src.core.domain.entities.conversation import ZipPerformanceMetrics
+from src.infrastructure.cache.pdf_blob_cache import BlobCacheStats, LocalBlobCache
+from src.infrastructure.gcs.adaptive_concurrency import AIMDConcurrencyController
+from src.infrastructure.gcs.composite_upload import (
+    CompositeUploadResult,
+    ParallelCompositeUploader,
+)
+from src.infrastructure.gcs.object_metadata import (
+    fetch_object_generations,
+    fetch_object_metadata,
+)
+from src.infrastructure.gcs.zip_compression import ZipCompressionPolicy
+from src.infrastructure.gcs.streaming_zip_writer import (
+    StreamingZipWriter,
+    align_chunk_size,
+    current_rss_bytes,
+)
+from src.application.services.zip_download_planner import (
+    ZipDownloadPlan,
+    plan_zip_downloads,
+)
+from src.application.services.zip_volume_planner import (
+    ZipVolumePlan,
+    plan_zip_volumes,
+)
 
 
 class ZipService:
@@ -54,6 +83,55 @@ class ZipService:
         self.max_concurrent_downloads = config.get(
             "pdf.zip.max_concurrent_downloads", 10
         )
+        self.adaptive_concurrency_enabled = config.get(
+            "pdf.zip.adaptive_concurrency.enabled", False
+        )
+        self.streaming_enabled = config.get("pdf.zip.streaming.enabled", False)
+        self.upload_chunk_size = align_chunk_size(
+            float(config.get("pdf.zip.streaming.chunk_size_mb", 8)) * 1024 * 1024
+        )
+        self.download_window = int(
+            config.get("pdf.zip.streaming.window_per_worker", 2)
+        ) * int(self.max_concurrent_downloads)
+
+        # Large buffered archives are uploaded as parallel parts + compose
+        self.composite_upload_enabled = config.get(
+            "pdf.zip.composite_upload.enabled", False
+        )
+        self.composite_upload_threshold = int(
+            float(config.get("pdf.zip.composite_upload.threshold_mb", 150))
+            * 1024
+            * 1024
+        )
+        self.composite_uploader = ParallelCompositeUploader.from_config(config)
+
+        # Volume splitting (pdf.zip.max_files PDFs / max_volume_mb per archive)
+        self.volumes_enabled = config.get("pdf.zip.volumes.enabled", False)
+        self.volume_max_files = int(config.get("pdf.zip.max_files", 50))
+        self.volume_max_bytes = int(
+            float(config.get("pdf.zip.volumes.max_volume_mb", 500)) * 1024 * 1024
+        )
+        self.volume_max_parallel = max(1, int(config.get("pdf.zip.volumes.max_parallel", 2)))
+
+        # Download planning: one metadata lookup, largest-first, deduplicated
+        self.planning_enabled = config.get("pdf.zip.planning.enabled", False)
+        self.planning_default_mb_per_s = float(
+            config.get("pdf.zip.planning.default_mb_per_s", 20)
+        )
+        # Aggregate download throughput of the last planned build (MB/s)
+        self._observed_download_mb_per_s: Optional[float] = None
+
+        self.reuse_enabled = config.get("pdf.zip.reuse.enabled", False)
+        self.reuse_min_remaining = timedelta(
+            hours=float(config.get("pdf.zip.reuse.min_remaining_hours", 1))
+        )
+
+        # Optional on-disk cache of source PDFs (None when disabled)
+        self.pdf_cache = LocalBlobCache.from_config(config)
+
+        # Identical builds in progress: fingerprint -> Future[ZipPackage]
+        self._inflight_builds: Dict[str, concurrent.futures.Future] = {}
+        self._inflight_lock = threading.Lock()
 
         # Initialize GCS client for ZIP upload
         self.storage_client = storage.Client(project=self.write_project)
@@ -67,6 +145,28 @@ class ZipService:
             f"        - Expiration: {self.zip_expiration_days} days",
             file=sys.stderr,
         )
+        print(
+            f"        - Streaming upload: {self.streaming_enabled}",
+            file=sys.stderr,
+        )
+        print(
+            f"        - Adaptive download concurrency: {self.adaptive_concurrency_enabled}",
+            file=sys.stderr,
+        )
+        print(
+            f"        - Package reuse: {self.reuse_enabled}",
+            file=sys.stderr,
+        )
+        print(
+            f"        - Volumes: {self.volumes_enabled} "
+            f"({self.volume_max_files} PDFs / "
+            f"{self.volume_max_bytes // (1024 * 1024)} MB each)",
+            file=sys.stderr,
+        )
+        print(
+            f"        - PDF cache: {self.pdf_cache is not None}",
+            file=sys.stderr,
+        )
 
     def create_zip_from_invoices(
         self,
@@ -74,13 +174,22 @@ class ZipService:
         package_name: Optional[str] = None,
         pdf_type: str = "both",
         pdf_variant: str = "cf",
+        compression: Optional[str] = None,
+        package_id: Optional[str] = None,
+        generations: Optional[Dict[str, Optional[int]]] = None,
+        plan: Optional[ZipDownloadPlan] = None,
     ) -> ZipPackage:
         """
         Create ZIP package from list of invoices
 
+        With pdf.zip.reuse.enabled, a ready package built from the same
+        invoices, filters and PDF generations is re-signed instead of being
+        rebuilt, and concurrent identical requests share one build.
+
         Args:
             invoices: List of invoice entities
-            package_name: Optional custom package name
+            package_name: Optional custom package name (ignored when an
+                existing package is reused)
             pdf_type: Filter type:
                 - 'both': Tributaria + Cedible (default)
                 - 'tributaria_only': Only Copia Tributaria
@@ -91,6 +200,17 @@ class ZipService:
                 - 'cf': Con Fondo (default)
                 - 'sf': Sin Fondo
                 - 'both': Both CF and SF variants
+            compression: Compression policy (default: pdf.zip.compression.mode):
+                - 'store': No compression (PDFs are already compressed)
+                - 'deflate': DEFLATE at pdf.zip.compression.level
+                - 'adaptive': Store entries that do not compress well
+            package_id: ID of an already persisted job record (ZipJobService)
+                to build into; a new record is created when omitted. A reused
+                package keeps its own ID.
+            generations: Source PDF generations already read (e.g. while
+                planning volumes); fetched when omitted and needed
+            plan: Download plan already built from object metadata (see
+                plan_zip); built when omitted and pdf.zip.planning.enabled
 
         Returns:
             ZipPackage entity with download URL
@@ -101,8 +221,459 @@ class ZipService:
         if not invoices:
             raise ValueError("Cannot create ZIP from empty invoice list")
 
-        # Generate package ID
-        package_id = str(uuid.uuid4())
+        compression_policy = ZipCompressionPolicy.from_config(self.config, compression)
+        start_time = time.time()
+
+        if plan is None and self.planning_enabled:
+            plan = self.plan_zip(invoices, pdf_type, pdf_variant)
+        if generations is None and plan is not None:
+            generations = plan.generations
+
+        # Source PDF generations drive both package reuse and the PDF cache
+        if generations is None and (self.reuse_enabled or self.pdf_cache is not None):
+            generations = self._get_zip_source_generations(
+                invoices, pdf_type, pdf_variant
+            )
+
+        fingerprint = None
+        if self.reuse_enabled and generations is not None:
+            fingerprint = self._zip_fingerprint(
+                invoices, pdf_type, pdf_variant, generations
+            )
+        if fingerprint is None:
+            return self._build_zip_package(
+                invoices,
+                package_name,
+                pdf_type,
+                pdf_variant,
+                compression_policy,
+                package_id=package_id,
+                generations=generations,
+                plan=plan,
+            )
+
+        # Identical requests in this process wait for one build
+        with self._inflight_lock:
+            build = self._inflight_builds.get(fingerprint)
+            is_leader = build is None
+            if is_leader:
+                build = concurrent.futures.Future()
+                self._inflight_builds[fingerprint] = build
+
+        if not is_leader:
+            print(
+                f"ZIP Waiting for in-flight build of identical package "
+                f"(fingerprint {fingerprint[:12]})",
+                file=sys.stderr,
+            )
+            zip_package = build.result()
+            self._last_zip_metrics = self._reused_zip_metrics(zip_package, start_time)
+            return zip_package
+
+        try:
+            zip_package = self._reuse_zip_package(fingerprint, start_time)
+            if zip_package is None:
+                zip_package = self._build_zip_package(
+                    invoices,
+                    package_name,
+                    pdf_type,
+                    pdf_variant,
+                    compression_policy,
+                    fingerprint=fingerprint,
+                    package_id=package_id,
+                    generations=generations,
+                    plan=plan,
+                )
+            build.set_result(zip_package)
+            return zip_package
+        except BaseException as e:
+            build.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight_builds.pop(fingerprint, None)
+
+    def create_zip_volumes_from_invoices(
+        self,
+        invoices: List[Invoice],
+        package_name: Optional[str] = None,
+        pdf_type: str = "both",
+        pdf_variant: str = "cf",
+    ) -> List[ZipPackage]:
+        """
+        Create one or more ZIP packages (volumes) from list of invoices
+
+        Volumes are planned from the source PDF sizes (batched metadata
+        lookup, nothing is downloaded) so each holds at most
+        pdf.zip.max_files PDFs and pdf.zip.volumes.max_volume_mb of content,
+        and are built in parallel. Each volume is a regular package (reuse
+        and coalescing apply per volume).
+
+        Args:
+            invoices: List of invoice entities
+            package_name: Optional custom package name; volumes get a
+                "_parte_{i}_de_{n}" suffix
+            pdf_type: Filter type (see create_zip_from_invoices)
+            pdf_variant: Variant filter ('cf', 'sf', 'both')
+
+        Returns:
+            ZipPackage per volume, in invoice order
+
+        Raises:
+            Exception: If any volume fails
+        """
+        if not invoices:
+            raise ValueError("Cannot create ZIP from empty invoice list")
+        if not self.volumes_enabled:
+            return [
+                self.create_zip_from_invoices(
+                    invoices, package_name, pdf_type=pdf_type, pdf_variant=pdf_variant
+                )
+            ]
+
+        volumes = self.plan_zip_volumes(invoices, pdf_type, pdf_variant)
+        if len(volumes) == 1:
+            _, plan = volumes[0]
+            return [
+                self.create_zip_from_invoices(
+                    invoices,
+                    package_name,
+                    pdf_type=pdf_type,
+                    pdf_variant=pdf_variant,
+                    generations=plan.generations if plan else None,
+                    plan=plan,
+                )
+            ]
+
+        names = self.get_zip_volume_names(package_name, len(invoices), len(volumes))
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(self.volume_max_parallel, len(volumes)),
+            thread_name_prefix="zip-volume",
+        ) as executor:
+            futures = [
+                executor.submit(
+                    self.create_zip_from_invoices,
+                    volume.invoices,
+                    name,
+                    pdf_type,
+                    pdf_variant,
+                    generations=plan.generations if plan else None,
+                    plan=plan,
+                )
+                for (volume, plan), name in zip(volumes, names)
+            ]
+            return [future.result() for future in futures]
+
+    def plan_zip_volumes(
+        self,
+        invoices: List[Invoice],
+        pdf_type: str = "both",
+        pdf_variant: str = "cf",
+    ) -> List[Tuple[ZipVolumePlan, Optional[ZipDownloadPlan]]]:
+        """
+        Split invoices into volumes from one batched metadata lookup
+
+        Nothing is downloaded. Each volume holds at most pdf.zip.max_files
+        PDFs and pdf.zip.volumes.max_volume_mb of content and comes with its
+        download plan (None when the metadata lookup failed, in which case
+        volumes are planned by file count only). With volumes disabled the
+        whole set is one volume.
+
+        Args:
+            invoices: List of invoice entities
+            pdf_type: Filter type (see create_zip_from_invoices)
+            pdf_variant: Variant filter ('cf', 'sf', 'both')
+
+        Returns:
+            (volume, download plan) per volume, in invoice order
+        """
+        if not self.volumes_enabled:
+            plan = None
+            if self.planning_enabled:
+                plan = self.plan_zip(invoices, pdf_type, pdf_variant)
+            return [(ZipVolumePlan(invoices=list(invoices)), plan)]
+
+        gs_paths = [
+            gs_path
+            for _, gs_path in self._zip_entries(invoices, pdf_type, pdf_variant)
+        ]
+        try:
+            metadata = fetch_object_metadata(self.storage_client, gs_paths)
+        except Exception as e:
+            print(
+                f"[ZIP Service] WARN Could not read PDF sizes, "
+                f"volumes planned by file count only: {e}",
+                file=sys.stderr,
+            )
+            metadata = None
+
+        volumes = plan_zip_volumes(
+            invoices,
+            pdf_type,
+            pdf_variant,
+            object_sizes={
+                gs_path: entry.size for gs_path, entry in (metadata or {}).items() if entry
+            },
+            max_files=self.volume_max_files,
+            max_bytes=self.volume_max_bytes,
+        )
+
+        if len(volumes) > 1:
+            print(
+                f"ZIP Splitting {len(gs_paths)} PDFs into {len(volumes)} volumes: "
+                + ", ".join(
+                    f"{volume.pdf_count} PDFs / {volume.estimated_bytes / (1024 * 1024):.1f} MB"
+                    for volume in volumes
+                ),
+                file=sys.stderr,
+            )
+
+        planned = []
+        for volume in volumes:
+            plan = None
+            if metadata is not None:
+                # Reuses the lookup above: a volume's plan needs no extra calls
+                entries = self._zip_entries(volume.invoices, pdf_type, pdf_variant)
+                plan = plan_zip_downloads(
+                    entries, {gs_path: metadata.get(gs_path) for _, gs_path in entries}
+                )
+            planned.append((volume, plan))
+        return planned
+
+    @staticmethod
+    def get_zip_volume_names(
+        package_name: Optional[str], invoice_count: int, volume_count: int
+    ) -> List[Optional[str]]:
+        """
+        Package names of the volumes of one request
+
+        A single volume keeps package_name (None = default name); several
+        get a "_parte_{i}_de_{n}" suffix.
+        """
+        if volume_count == 1:
+            return [package_name]
+        base_name = package_name or f"facturas_{invoice_count}_items"
+        return [
+            f"{base_name}_parte_{index}_de_{volume_count}"
+            for index in range(1, volume_count + 1)
+        ]
+
+    def plan_zip(
+        self,
+        invoices: List[Invoice],
+        pdf_type: str = "both",
+        pdf_variant: str = "cf",
+    ) -> ZipDownloadPlan:
+        """
+        Plan the downloads of a ZIP from one batched metadata lookup
+
+        Nothing is downloaded. The plan fetches each distinct gs:// path once,
+        largest first; if the metadata lookup fails it keeps invoice order.
+
+        Args:
+            invoices: List of invoice entities
+            pdf_type: Filter type (see create_zip_from_invoices)
+            pdf_variant: Variant filter ('cf', 'sf', 'both')
+
+        Returns:
+            ZipDownloadPlan (see get_zip_estimate for predictions)
+        """
+        entries = self._zip_entries(invoices, pdf_type, pdf_variant)
+        try:
+            metadata = fetch_object_metadata(
+                self.storage_client, [gs_path for _, gs_path in entries]
+            )
+        except Exception as e:
+            print(
+                f"[ZIP Service] WARN Could not read PDF metadata, "
+                f"downloads scheduled in invoice order: {e}",
+                file=sys.stderr,
+            )
+            metadata = None
+        return plan_zip_downloads(entries, metadata)
+
+    def get_zip_estimate(
+        self,
+        invoices: List[Invoice],
+        pdf_type: str = "both",
+        pdf_variant: str = "cf",
+        plan: Optional[ZipDownloadPlan] = None,
+    ) -> Dict:
+        """
+        Predict the size and download time of a ZIP before building it
+
+        Download time assumes the throughput of the last planned build, or
+        pdf.zip.planning.default_mb_per_s before the first one.
+
+        Args:
+            invoices: List of invoice entities
+            pdf_type: Filter type (see create_zip_from_invoices)
+            pdf_variant: Variant filter ('cf', 'sf', 'both')
+            plan: Plan already built for these invoices (built when omitted)
+
+        Returns:
+            Dict with entries, downloads, duplicate_entries, missing_objects,
+            download_bytes, largest_object_bytes, predicted_zip_bytes,
+            predicted_download_ms, assumed_mb_per_s and metadata_available
+        """
+        plan = plan or self.plan_zip(invoices, pdf_type, pdf_variant)
+        return plan.summary(self._expected_download_mb_per_s())
+
+    def get_zip_package(self, package_id: str) -> Optional[ZipPackage]:
+        """
+        Get ZIP package by ID
+
+        Args:
+            package_id: Package ID
+
+        Returns:
+            ZipPackage or None if not found
+        """
+        return self.zip_repo.find_by_id(package_id)
+
+    def get_recent_packages(self, limit: int = 10) -> List[ZipPackage]:
+        """
+        Get recent ZIP packages
+
+        Args:
+            limit: Maximum number of results
+
+        Returns:
+            List of recent ZIP packages
+        """
+        return self.zip_repo.find_recent(limit)
+
+    def cleanup_expired_packages(self) -> int:
+        """
+        Delete expired ZIP packages
+
+        Returns:
+            Number of deleted packages
+        """
+        print("ZIP Running cleanup of expired packages", file=sys.stderr)
+        deleted_count = self.zip_repo.delete_expired()
+        print(
+            f"ZIP Cleanup: {deleted_count} packages deleted",
+            file=sys.stderr,
+        )
+        return deleted_count
+
+    def get_last_zip_metrics(self) -> Optional[ZipPerformanceMetrics]:
+        """
+        Get performance metrics from last ZIP creation.
+
+        Used by conversation tracking to capture ZIP generation metrics.
+
+        Returns:
+            ZipPerformanceMetrics from last create_zip_from_invoices() call,
+            or None if no ZIP has been created yet
+        """
+        return self._last_zip_metrics
+
+    def write_zip_to_stream(
+        self,
+        invoices: List[Invoice],
+        stream,
+        pdf_type: str = "both",
+        pdf_variant: str = "cf",
+    ) -> ZipPerformanceMetrics:
+        """
+        Write a ZIP of the invoices' PDFs straight into a stream
+
+        Used to serve an archive to an HTTP client while its members are
+        still being downloaded: nothing is uploaded or persisted. The stream
+        need not be seekable (entries use data descriptors).
+
+        Args:
+            invoices: List of invoice entities
+            stream: Writable file object (the caller closes it)
+            pdf_type: Filter type ('both', 'tributaria_only', 'cedible_only', etc.)
+            pdf_variant: Variant filter ('cf', 'sf', 'both')
+
+        Returns:
+            ZipPerformanceMetrics of the streamed archive
+        """
+        zip_start_time = time.time()
+        if self.planning_enabled:
+            plan = self.plan_zip(invoices, pdf_type, pdf_variant)
+        else:
+            plan = plan_zip_downloads(self._zip_entries(invoices, pdf_type, pdf_variant))
+        generations = plan.generations
+        if generations is None and self.pdf_cache is not None:
+            generations = self._get_zip_source_generations(
+                invoices, pdf_type, pdf_variant
+            )
+        plan_metrics = self._download_plan_metrics(plan)
+
+        cache_stats = BlobCacheStats()
+        concurrency = self._new_download_concurrency()
+        writer = StreamingZipWriter(
+            self._get_pdf_download_func(generations, cache_stats),
+            max_workers=self.max_concurrent_downloads,
+            window=self.download_window,
+            compression_policy=ZipCompressionPolicy.from_config(self.config),
+            concurrency=concurrency if self.adaptive_concurrency_enabled else None,
+        )
+        result = writer.write(plan.entries, stream)
+        self._record_download_throughput(plan, result.parallel_download_time_ms)
+
+        zip_generation_time_ms = int((time.time() - zip_start_time) * 1000)
+        metrics = ZipPerformanceMetrics(
+            generation_time_ms=zip_generation_time_ms,
+            parallel_download_time_ms=result.parallel_download_time_ms,
+            files_included=result.files_included,
+            files_missing=result.files_missing,
+            total_size_bytes=result.bytes_written,
+            time_to_first_upload_ms=result.time_to_first_upload_ms,
+            peak_rss_bytes=result.peak_rss_bytes,
+            **plan_metrics,
+            **self._concurrency_metrics(
+                concurrency if self.adaptive_concurrency_enabled else None
+            ),
+            **self._compression_metrics(result.compression),
+            **self._pdf_cache_metrics(cache_stats),
+        )
+
+        print(
+            f"[ZIP Service] 📊 Streamed ZIP to client: {zip_generation_time_ms}ms total, "
+            f"first bytes at {result.time_to_first_upload_ms}ms, "
+            f"{result.files_included} files ({result.bytes_written} bytes)",
+            file=sys.stderr,
+        )
+        return metrics
+
+    def _build_zip_package(
+        self,
+        invoices: List[Invoice],
+        package_name: Optional[str],
+        pdf_type: str,
+        pdf_variant: str,
+        compression_policy: ZipCompressionPolicy,
+        fingerprint: Optional[str] = None,
+        package_id: Optional[str] = None,
+        generations: Optional[Dict[str, Optional[int]]] = None,
+        plan: Optional[ZipDownloadPlan] = None,
+    ) -> ZipPackage:
+        """
+        Build, upload, sign and persist a new ZIP package
+
+        Args:
+            invoices: List of invoice entities
+            package_name: Optional custom package name
+            pdf_type: Filter type ('both', 'tributaria_only', 'cedible_only', etc.)
+            pdf_variant: Variant filter ('cf', 'sf', 'both')
+            compression_policy: Per-entry compression
+            fingerprint: Content fingerprint stored for later reuse
+            package_id: ID of an existing record to update (default: new record)
+            generations: gs:// path -> object generation (enables the PDF cache)
+            plan: Download order and predictions (default: invoice order)
+
+        Returns:
+            ZipPackage entity with download URL
+        """
+        # Generate package ID (job records are created by ZipJobService)
+        is_new_record = package_id is None
+        package_id = package_id or str(uuid.uuid4())
         invoice_numbers = [inv.factura for inv in invoices]
 
         print(
@@ -112,34 +683,60 @@ class ZipService:
         )
 
         # Create initial package record
+        metadata = {"expiration_days": self.zip_expiration_days}
+        if fingerprint:
+            metadata["fingerprint"] = fingerprint
         zip_package = ZipPackage(
             package_id=package_id,
             invoice_numbers=invoice_numbers,
             status=ZipStatus.CREATING,
-            metadata={"expiration_days": self.zip_expiration_days},
+            metadata=metadata,
         )
 
         try:
             # Persist initial record
-            self.zip_repo.create(zip_package)
+            if is_new_record:
+                self.zip_repo.create(zip_package)
+            else:
+                self.zip_repo.update(zip_package)
 
-            # Create ZIP file in memory and collect performance metrics
-            # Pass filters to _create_zip_buffer
-            zip_buffer, zip_metrics = self._create_zip_buffer(
-                invoices, pdf_type=pdf_type, pdf_variant=pdf_variant
-            )
+            friendly_name = package_name or f"facturas_{len(invoices)}_items"
+
+            if self.streaming_enabled:
+                # Download, compress and upload concurrently (bounded memory)
+                gcs_path, file_size, zip_metrics = self._stream_zip_to_gcs(
+                    package_id,
+                    invoices,
+                    friendly_name,
+                    pdf_type=pdf_type,
+                    pdf_variant=pdf_variant,
+                    compression_policy=compression_policy,
+                    generations=generations,
+                    plan=plan,
+                )
+            else:
+                # Create ZIP file in memory and collect performance metrics
+                # Pass filters to _create_zip_buffer
+                zip_buffer, zip_metrics = self._create_zip_buffer(
+                    invoices,
+                    pdf_type=pdf_type,
+                    pdf_variant=pdf_variant,
+                    compression_policy=compression_policy,
+                    generations=generations,
+                    plan=plan,
+                )
+
+                # Upload to GCS - get friendly filename for signed URL
+                gcs_path, file_size, upload_metrics = self._upload_zip_to_gcs(
+                    package_id,
+                    zip_buffer,
+                    friendly_name,
+                )
+                zip_metrics = dataclasses.replace(zip_metrics, **upload_metrics)
 
             # Store metrics for later retrieval by conversation tracker
             self._last_zip_metrics = zip_metrics
 
-            # Upload to GCS - get friendly filename for signed URL
-            friendly_name = package_name or f"facturas_{len(invoices)}_items"
-            gcs_path, file_size = self._upload_zip_to_gcs(
-                package_id,
-                zip_buffer,
-                friendly_name,
-            )
-
             # Generate signed URL for download
             # GCS max: 7 days, convert to timedelta and cap at limit
             # The blob name already includes the friendly filename, so no need for content-disposition
@@ -178,75 +775,183 @@ class ZipService:
 
             raise
 
-    def get_zip_package(self, package_id: str) -> Optional[ZipPackage]:
+    def _get_zip_source_generations(
+        self, invoices: List[Invoice], pdf_type: str, pdf_variant: str
+    ) -> Optional[Dict[str, Optional[int]]]:
         """
-        Get ZIP package by ID
-
-        Args:
-            package_id: Package ID
+        Current GCS generation of every PDF a package would include
 
         Returns:
-            ZipPackage or None if not found
+            gs:// path -> generation (None for missing objects), or None if
+            the lookup failed (reuse and the PDF cache are then skipped)
         """
-        return self.zip_repo.find_by_id(package_id)
+        gs_paths = [
+            gs_path
+            for invoice in invoices
+            for gs_path in invoice.filter_pdf_paths(pdf_type, pdf_variant).values()
+        ]
+        try:
+            return fetch_object_generations(self.storage_client, gs_paths)
+        except Exception as e:
+            print(
+                f"[ZIP Service] WARN Could not read PDF generations, "
+                f"package reuse and PDF cache skipped: {e}",
+                file=sys.stderr,
+            )
+            return None
 
-    def get_recent_packages(self, limit: int = 10) -> List[ZipPackage]:
+    def _zip_fingerprint(
+        self,
+        invoices: List[Invoice],
+        pdf_type: str,
+        pdf_variant: str,
+        generations: Optional[Dict[str, Optional[int]]] = None,
+    ) -> Optional[str]:
         """
-        Get recent ZIP packages
+        Content fingerprint of a ZIP request
+
+        Hash of the sorted invoice numbers, the PDF filters and the current
+        GCS generation of every PDF that would be included, so a package is
+        only reused while none of its sources has been overwritten.
 
         Args:
-            limit: Maximum number of results
+            invoices: List of invoice entities
+            pdf_type: Filter type
+            pdf_variant: Variant filter
+            generations: Already fetched generations (fetched when omitted)
 
         Returns:
-            List of recent ZIP packages
+            Hex digest, or None if the generations could not be read
         """
-        return self.zip_repo.find_recent(limit)
+        if generations is None:
+            generations = self._get_zip_source_generations(
+                invoices, pdf_type, pdf_variant
+            )
+            if generations is None:
+                return None
+
+        payload = {
+            "invoices": sorted(str(inv.factura) for inv in invoices),
+            "pdf_type": pdf_type,
+            "pdf_variant": pdf_variant,
+            "objects": sorted(
+                [gs_path, generation] for gs_path, generation in generations.items()
+            ),
+        }
+        serialized = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
 
-    def cleanup_expired_packages(self) -> int:
+    def _reuse_zip_package(
+        self, fingerprint: str, start_time: float
+    ) -> Optional[ZipPackage]:
         """
-        Delete expired ZIP packages
+        Re-sign an existing ready package with the same fingerprint
+
+        The package is skipped if it expires within the reuse margin or its
+        archive is no longer in GCS.
+
+        Args:
+            fingerprint: Content fingerprint of the request
+            start_time: Request start (for metrics)
 
         Returns:
-            Number of deleted packages
+            ZipPackage with a fresh download URL, or None to build a new one
         """
-        print("ZIP Running cleanup of expired packages", file=sys.stderr)
-        deleted_count = self.zip_repo.delete_expired()
-        print(
-            f"ZIP Cleanup: {deleted_count} packages deleted",
-            file=sys.stderr,
-        )
-        return deleted_count
+        try:
+            existing = self.zip_repo.find_ready_by_fingerprint(fingerprint)
+        except Exception as e:
+            print(
+                f"[ZIP Service] WARN Package reuse lookup failed: {e}",
+                file=sys.stderr,
+            )
+            return None
 
-    def get_last_zip_metrics(self) -> Optional[ZipPerformanceMetrics]:
-        """
-        Get performance metrics from last ZIP creation.
+        if existing is None or not existing.gcs_path or existing.is_expired:
+            return None
 
-        Used by conversation tracking to capture ZIP generation metrics.
+        remaining = existing.time_until_expiry
+        if remaining is None or remaining < self.reuse_min_remaining:
+            return None
 
-        Returns:
-            ZipPerformanceMetrics from last create_zip_from_invoices() call,
-            or None if no ZIP has been created yet
-        """
-        return self._last_zip_metrics
+        bucket_name, blob_name = self.url_signer.extract_bucket_and_blob(
+            existing.gcs_path
+        )
+        if not self.storage_client.bucket(bucket_name).blob(blob_name).exists():
+            print(
+                f"[ZIP Service] Reusable package {existing.package_id} has no "
+                f"archive in GCS, rebuilding",
+                file=sys.stderr,
+            )
+            return None
+
+        # Never sign past the package's own expiration (GCS max: 7 days)
+        expiration = min(remaining, timedelta(days=min(self.zip_expiration_days, 7)))
+        download_url = self.url_signer.generate_signed_url(
+            existing.gcs_path, expiration=expiration
+        )
+        zip_package = existing.with_download_info(
+            gcs_path=existing.gcs_path,
+            download_url=download_url,
+            file_size_bytes=existing.file_size_bytes,
+            pdf_count=existing.pdf_count,
+        )
+        self._last_zip_metrics = self._reused_zip_metrics(zip_package, start_time)
+
+        print(
+            f"ZIP Reusing package {existing.package_id} "
+            f"(fingerprint {fingerprint[:12]}, {existing.file_size_bytes} bytes)",
+            file=sys.stderr,
+        )
+        return zip_package
+
+    def _reused_zip_metrics(
+        self, zip_package: ZipPackage, start_time: float
+    ) -> ZipPerformanceMetrics:
+        """Metrics for a request served by an existing or in-flight package"""
+        return ZipPerformanceMetrics(
+            generation_time_ms=int((time.time() - start_time) * 1000),
+            parallel_download_time_ms=0,
+            max_workers_used=0,
+            files_included=zip_package.pdf_count,
+            files_missing=0,
+            total_size_bytes=zip_package.file_size_bytes,
+            reused_package_id=zip_package.package_id,
+        )
 
     def _create_zip_buffer(
         self,
         invoices: List[Invoice],
         pdf_type: str = "both",
         pdf_variant: str = "cf",
+        compression_policy: Optional[ZipCompressionPolicy] = None,
+        generations: Optional[Dict[str, Optional[int]]] = None,
+        plan: Optional[ZipDownloadPlan] = None,
     ) -> tuple[io.BytesIO, ZipPerformanceMetrics]:
         """
         Create ZIP file in memory from invoices
 
+        Downloads are submitted in plan order (largest first when the plan
+        has object sizes) and a PDF shared by several invoices is downloaded
+        once and written under each of its names.
+
         Args:
             invoices: List of invoice entities
             pdf_type: Filter type ('both', 'tributaria_only', 'cedible_only', etc.)
             pdf_variant: Variant filter ('cf', 'sf', 'both')
+            compression_policy: Per-entry compression (default: from config)
+            generations: gs:// path -> object generation (PDF cache keys)
+            plan: Download plan (default: invoice order, deduplicated)
 
         Returns:
             Tuple of (BytesIO buffer, ZipPerformanceMetrics)
         """
         zip_buffer = io.BytesIO()
+        compression_policy = compression_policy or ZipCompressionPolicy.from_config(
+            self.config
+        )
+        compression_stats = compression_policy.new_stats()
+        cache_stats = BlobCacheStats()
+        download_pdf = self._get_pdf_download_func(generations, cache_stats)
 
         # ⏱️ Start timing for performance metrics
         zip_start_time = time.time()
@@ -254,87 +959,114 @@ class ZipService:
         files_missing = 0
 
         # Count total PDFs to download (using filtered paths)
-        total_pdfs = sum(
-            len(inv.filter_pdf_paths(pdf_type, pdf_variant)) for inv in invoices
+        plan = plan or plan_zip_downloads(
+            self._zip_entries(invoices, pdf_type, pdf_variant)
         )
+        total_pdfs = plan.entry_count
         print(
             f"[ZIP Service] Creating ZIP: {total_pdfs} PDFs "
             f"from {len(invoices)} invoices "
             f"(pdf_type={pdf_type}, pdf_variant={pdf_variant})",
             file=sys.stderr,
         )
+        plan_metrics = self._download_plan_metrics(plan)
+        concurrency = self._new_download_concurrency()
+        download_pdf = concurrency.instrument(download_pdf)
         print(
             f"[ZIP Service] ThreadPoolExecutor: "
-            f"{self.max_concurrent_downloads} workers",
+            f"{concurrency.limit} workers (bounds "
+            f"{concurrency.min_workers}-{concurrency.max_workers})",
             file=sys.stderr,
         )
 
+        # (filenames in ZIP, gs:// path, retries so far), in plan order
+        pending = [(download.arcnames, download.gs_path, 0) for download in plan.downloads]
+        pending.reverse()
+
         with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
-            # Download PDFs concurrently and add to ZIP
+            # Download PDFs concurrently and add to ZIP; the controller's
+            # limit decides how many downloads are in flight
             with concurrent.futures.ThreadPoolExecutor(
-                max_workers=self.max_concurrent_downloads
+                max_workers=max(1, min(concurrency.max_workers, len(plan.downloads)))
             ) as executor:
-                # Submit all download tasks (using FILTERED paths)
                 future_to_pdf = {}
-                start_submit = time.time()
-                for invoice in invoices:
-                    # Use filtered paths instead of all paths
-                    filtered_paths = invoice.filter_pdf_paths(pdf_type, pdf_variant)
-                    for pdf_key, gs_path in filtered_paths.items():
-                        future = executor.submit(self._download_pdf_from_gcs, gs_path)
-                        pdf_filename = f"{invoice.factura}_{pdf_key}.pdf"
-                        future_to_pdf[future] = (pdf_filename, gs_path)
-
-                submit_time = time.time() - start_submit
-                print(
-                    f"[ZIP Service] Submitted {len(future_to_pdf)} "
-                    f"tasks in {submit_time:.2f}s",
-                    file=sys.stderr,
-                )
+
+                def submit_ready() -> None:
+                    while pending and len(future_to_pdf) < concurrency.limit:
+                        pdf_filenames, gs_path, attempt = pending.pop()
+                        future = executor.submit(download_pdf, gs_path)
+                        future_to_pdf[future] = (pdf_filenames, gs_path, attempt)
 
                 # Collect results and add to ZIP
                 completed = 0
                 start_downloads = time.time()
-                for future in concurrent.futures.as_completed(future_to_pdf):
-                    pdf_filename, gs_path = future_to_pdf[future]
-                    completed += 1
-                    try:
-                        pdf_content = future.result()
+                submit_ready()
+                while future_to_pdf:
+                    done, _ = concurrent.futures.wait(
+                        future_to_pdf, return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+                    for future in done:
+                        pdf_filenames, gs_path, attempt = future_to_pdf.pop(future)
+                        try:
+                            pdf_content = future.result()
+                        except Exception as e:
+                            if concurrency.should_retry(e, attempt):
+                                # Retried at the reduced concurrency
+                                pending.append((pdf_filenames, gs_path, attempt + 1))
+                                print(
+                                    f"[ZIP] RETRY {gs_path} after throttling "
+                                    f"(attempt {attempt + 1})",
+                                    file=sys.stderr,
+                                )
+                                continue
+                            completed += len(pdf_filenames)
+                            files_missing += len(pdf_filenames)  # 📊 Track failed files
+                            print(
+                                f"[ZIP] [{completed}/{total_pdfs}] "
+                                f"FAIL {gs_path}: {e}",
+                                file=sys.stderr,
+                            )
+                            continue
+
                         pdf_size_kb = len(pdf_content) / 1024
-                        zip_file.writestr(pdf_filename, pdf_content)
-                        files_included += 1  # 📊 Track successful files
-                        print(
-                            f"[ZIP] [{completed}/{len(future_to_pdf)}] "
-                            f"{pdf_filename} ({pdf_size_kb:.1f} KB)",
-                            file=sys.stderr,
-                        )
-                    except Exception as e:
-                        files_missing += 1  # 📊 Track failed files
-                        print(
-                            f"[ZIP] [{completed}/{len(future_to_pdf)}] "
-                            f"FAIL {gs_path}: {e}",
-                            file=sys.stderr,
-                        )
+                        for pdf_filename in pdf_filenames:
+                            completed += 1
+                            compression_policy.write_entry(
+                                zip_file, pdf_filename, pdf_content, compression_stats
+                            )
+                            files_included += 1  # 📊 Track successful files
+                            print(
+                                f"[ZIP] [{completed}/{total_pdfs}] "
+                                f"{pdf_filename} ({pdf_size_kb:.1f} KB)",
+                                file=sys.stderr,
+                            )
+                    submit_ready()
 
                 parallel_download_time_ms = int((time.time() - start_downloads) * 1000)
                 print(
                     f"[ZIP Service] ✓ Downloads: " f"{parallel_download_time_ms}ms",
                     file=sys.stderr,
                 )
+                self._record_download_throughput(plan, parallel_download_time_ms)
 
         zip_buffer.seek(0)
 
         # 📊 Calculate final metrics
         zip_generation_time_ms = int((time.time() - zip_start_time) * 1000)
-        zip_total_size_bytes = zip_buffer.tell()
+        zip_total_size_bytes = zip_buffer.getbuffer().nbytes
 
         metrics = ZipPerformanceMetrics(
             generation_time_ms=zip_generation_time_ms,
             parallel_download_time_ms=parallel_download_time_ms,
-            max_workers_used=self.max_concurrent_downloads,
             files_included=files_included,
             files_missing=files_missing,
             total_size_bytes=zip_total_size_bytes,
+            # Whole archive is held in memory until upload starts
+            peak_rss_bytes=current_rss_bytes(),
+            **plan_metrics,
+            **self._concurrency_metrics(concurrency),
+            **self._compression_metrics(compression_stats),
+            **self._pdf_cache_metrics(cache_stats),
         )
 
         print(
@@ -345,21 +1077,355 @@ class ZipService:
 
         return zip_buffer, metrics
 
-    def _download_pdf_from_gcs(self, gs_path: str) -> bytes:
+    def _stream_zip_to_gcs(
+        self,
+        package_id: str,
+        invoices: List[Invoice],
+        package_name: str,
+        pdf_type: str = "both",
+        pdf_variant: str = "cf",
+        compression_policy: Optional[ZipCompressionPolicy] = None,
+        generations: Optional[Dict[str, Optional[int]]] = None,
+        plan: Optional[ZipDownloadPlan] = None,
+    ) -> tuple[str, int, ZipPerformanceMetrics]:
+        """
+        Build the ZIP directly into a GCS resumable upload
+
+        Entries are appended as downloads complete and full chunks are
+        uploaded while later PDFs are still downloading, so peak memory is
+        bounded by the download window plus one upload chunk instead of the
+        whole archive. Archives the plan predicts at
+        pdf.zip.composite_upload.threshold_mb or more are instead cut into
+        parts that upload concurrently as they fill (bounded by
+        max_parts_in_flight) and are composed at the end.
+
+        Args:
+            package_id: Package ID
+            invoices: List of invoice entities
+            package_name: Package name (used for friendly download filename)
+            pdf_type: Filter type ('both', 'tributaria_only', 'cedible_only', etc.)
+            pdf_variant: Variant filter ('cf', 'sf', 'both')
+            compression_policy: Per-entry compression (default: from config)
+            generations: gs:// path -> object generation (PDF cache keys)
+            plan: Download plan (default: invoice order, deduplicated)
+
+        Returns:
+            Tuple of (gcs_path, file_size_bytes, ZipPerformanceMetrics)
+        """
+        zip_start_time = time.time()
+
+        plan = plan or plan_zip_downloads(
+            self._zip_entries(invoices, pdf_type, pdf_variant)
+        )
+        entries = plan.entries
+        plan_metrics = self._download_plan_metrics(plan)
+        print(
+            f"[ZIP Service] Streaming ZIP: {len(entries)} PDFs "
+            f"from {len(invoices)} invoices "
+            f"(workers={self.max_concurrent_downloads}, window={self.download_window}, "
+            f"chunk={self.upload_chunk_size // 1024} KB)",
+            file=sys.stderr,
+        )
+
+        blob_name = self._zip_blob_name(package_id, package_name)
+        bucket = self.storage_client.bucket(self.write_bucket)
+        blob = bucket.blob(blob_name)
+        blob.metadata = {
+            "friendly_filename": blob_name.rsplit("/", 1)[-1],
+            "package_id": package_id,
+        }
+
+        cache_stats = BlobCacheStats()
+        concurrency = self._new_download_concurrency()
+        writer = StreamingZipWriter(
+            self._get_pdf_download_func(generations, cache_stats),
+            max_workers=self.max_concurrent_downloads,
+            window=self.download_window,
+            compression_policy=(
+                compression_policy or ZipCompressionPolicy.from_config(self.config)
+            ),
+            concurrency=concurrency if self.adaptive_concurrency_enabled else None,
+        )
+
+        # Both sinks discard the upload if the build fails (BlobWriter
+        # terminates the resumable session, the composite stream deletes its
+        # parts), so a partial archive is never finalized
+        composite = self._zip_needs_composite_upload(plan)
+        if composite:
+            print(
+                f"[ZIP Service] Predicted archive "
+                f"{plan.predicted_zip_bytes() / (1024 * 1024):.1f} MB: uploading "
+                f"{self.composite_uploader.part_size_bytes // (1024 * 1024)} MB "
+                f"parts as they fill",
+                file=sys.stderr,
+            )
+            upload = self.composite_uploader.open(blob, content_type="application/zip")
+            first_upload_bytes = self.composite_uploader.part_size_bytes
+        else:
+            upload = blob.open(
+                "wb",
+                chunk_size=self.upload_chunk_size,
+                content_type="application/zip",
+                ignore_flush=True,
+            )
+            first_upload_bytes = self.upload_chunk_size
+        with upload as upload_stream:
+            result = writer.write(
+                entries, upload_stream, first_upload_bytes=first_upload_bytes
+            )
+        self._record_download_throughput(plan, result.parallel_download_time_ms)
+
+        zip_generation_time_ms = int((time.time() - zip_start_time) * 1000)
+        time_to_first_upload_ms = result.time_to_first_upload_ms
+        if time_to_first_upload_ms is None:
+            # Archive smaller than one chunk: uploaded when the stream closed
+            time_to_first_upload_ms = zip_generation_time_ms
+
+        metrics = ZipPerformanceMetrics(
+            generation_time_ms=zip_generation_time_ms,
+            parallel_download_time_ms=result.parallel_download_time_ms,
+            files_included=result.files_included,
+            files_missing=result.files_missing,
+            total_size_bytes=result.bytes_written,
+            time_to_first_upload_ms=time_to_first_upload_ms,
+            peak_rss_bytes=result.peak_rss_bytes,
+            end_to_end_mb_per_s=round(
+                result.bytes_written
+                / (1024 * 1024)
+                / max(zip_generation_time_ms / 1000, 0.001),
+                2,
+            ),
+            **self._streamed_upload_metrics(
+                upload.result if composite else None, result.bytes_written
+            ),
+            **plan_metrics,
+            **self._concurrency_metrics(
+                concurrency if self.adaptive_concurrency_enabled else None
+            ),
+            **self._compression_metrics(result.compression),
+            **self._pdf_cache_metrics(cache_stats),
+        )
+
+        gcs_path = f"gs://{self.write_bucket}/{blob_name}"
+        print(
+            f"[ZIP Service] 📊 Streamed {blob_name}: {zip_generation_time_ms}ms total, "
+            f"first upload at {time_to_first_upload_ms}ms, "
+            f"{result.files_included} files ({result.bytes_written} bytes), "
+            f"peak RSS {result.peak_rss_bytes / (1024 * 1024):.1f} MB",
+            file=sys.stderr,
+        )
+
+        return gcs_path, result.bytes_written, metrics
+
+    def _streamed_upload_metrics(
+        self, composite: Optional[CompositeUploadResult], bytes_written: int
+    ) -> dict:
+        """
+        ZipPerformanceMetrics upload fields of a streamed build
+
+        A resumable upload runs for the whole build, so it has no upload
+        time of its own and only its chunk count is reported. A composite
+        upload reports the time its parts were uploading.
+        """
+        if composite is None:
+            return {
+                "streamed_chunks": max(1, -(-bytes_written // self.upload_chunk_size))
+            }
+        return {
+            "upload_time_ms": composite.upload_time_ms,
+            "upload_mb_per_s": round(
+                composite.bytes_uploaded
+                / (1024 * 1024)
+                / max(composite.upload_time_ms / 1000, 0.001),
+                2,
+            ),
+            "upload_parts": composite.parts,
+        }
+
+    def _zip_needs_composite_upload(self, plan: Optional[ZipDownloadPlan]) -> bool:
+        """
+        Whether a streamed archive should be uploaded as composite parts
+
+        True when the plan predicts pdf.zip.composite_upload.threshold_mb or
+        more. Without metadata the size is unknown and the archive goes
+        through one resumable upload.
+        """
+        if not self.composite_upload_enabled or plan is None:
+            return False
+        if not plan.metadata_available:
+            return False
+        return plan.predicted_zip_bytes() >= self.composite_upload_threshold
+
+    def _download_plan_metrics(self, plan: ZipDownloadPlan) -> dict:
+        """ZipPerformanceMetrics fields for a build's download plan"""
+        metrics = {"duplicate_downloads_avoided": plan.duplicate_entries}
+        if not plan.metadata_available:
+            return metrics
+        estimate = plan.summary(self._expected_download_mb_per_s())
+        print(
+            f"[ZIP Service] Plan: {estimate['downloads']} downloads "
+            f"({estimate['duplicate_entries']} shared, "
+            f"{estimate['missing_objects']} missing), "
+            f"{estimate['download_bytes'] / (1024 * 1024):.1f} MB largest-first, "
+            f"predicted {estimate['predicted_download_ms']}ms at "
+            f"{estimate['assumed_mb_per_s']} MB/s",
+            file=sys.stderr,
+        )
+        metrics.update(
+            planned_download_bytes=estimate["download_bytes"],
+            predicted_zip_bytes=estimate["predicted_zip_bytes"],
+            predicted_download_ms=estimate["predicted_download_ms"],
+        )
+        return metrics
+
+    def _expected_download_mb_per_s(self) -> float:
+        """Throughput used for predictions (last planned build, else configured)"""
+        return self._observed_download_mb_per_s or self.planning_default_mb_per_s
+
+    def _record_download_throughput(
+        self, plan: ZipDownloadPlan, parallel_download_time_ms: int
+    ) -> None:
+        """Remember the aggregate download throughput of a planned build"""
+        if not plan.metadata_available or plan.download_bytes <= 0:
+            return
+        if parallel_download_time_ms <= 0:
+            return
+        self._observed_download_mb_per_s = (
+            plan.download_bytes / (1024 * 1024) / (parallel_download_time_ms / 1000)
+        )
+
+    def _new_download_concurrency(self) -> AIMDConcurrencyController:
+        """Per-build download concurrency (fixed at max_concurrent_downloads when disabled)"""
+        return AIMDConcurrencyController.from_config(
+            self.config, default_workers=int(self.max_concurrent_downloads)
+        )
+
+    def _concurrency_metrics(
+        self, concurrency: Optional[AIMDConcurrencyController]
+    ) -> dict:
+        """ZipPerformanceMetrics fields for a build's download concurrency"""
+        if concurrency is None:
+            return {"max_workers_used": self.max_concurrent_downloads}
+        summary = concurrency.summary()
+        print(
+            f"[ZIP Service] Concurrency: {summary['concurrency_initial']} -> "
+            f"{summary['concurrency_final']} (peak {summary['concurrency_peak']}, "
+            f"{concurrency.throttled} throttled), curve "
+            + ", ".join(
+                f"{point['concurrency']}@{point['mb_per_s']}MB/s"
+                for point in summary["throughput_curve"]
+            ),
+            file=sys.stderr,
+        )
+        return summary
+
+    @staticmethod
+    def _compression_metrics(stats) -> dict:
+        """ZipPerformanceMetrics fields for a package's compression stats"""
+        print(
+            f"[ZIP Service] Compression ({stats.mode}): ratio {stats.ratio}, "
+            f"{stats.entries_stored} stored / {stats.entries_deflated} deflated, "
+            f"CPU {stats.cpu_time_ms:.0f}ms (saved ~{stats.cpu_time_saved_ms:.0f}ms)",
+            file=sys.stderr,
+        )
+        return {
+            "compression_mode": stats.mode,
+            "compression_ratio": stats.ratio,
+            "compression_cpu_ms": int(stats.cpu_time_ms),
+            "compression_cpu_saved_ms": int(stats.cpu_time_saved_ms),
+            "entries_stored": stats.entries_stored,
+        }
+
+    def _pdf_cache_metrics(self, stats: BlobCacheStats) -> dict:
+        """ZipPerformanceMetrics fields for a package's PDF cache usage"""
+        if self.pdf_cache is None:
+            return {}
+        print(
+            f"[ZIP Service] PDF cache: {stats.hits} hits / {stats.misses} misses "
+            f"(ratio {stats.hit_ratio}), {stats.bytes_saved / (1024 * 1024):.1f} MB "
+            f"not downloaded",
+            file=sys.stderr,
+        )
+        return {
+            "pdf_cache_hits": stats.hits,
+            "pdf_cache_misses": stats.misses,
+            "pdf_cache_hit_ratio": stats.hit_ratio,
+            "pdf_cache_bytes_saved": stats.bytes_saved,
+        }
+
+    def _get_pdf_download_func(
+        self,
+        generations: Optional[Dict[str, Optional[int]]],
+        cache_stats: BlobCacheStats,
+    ) -> Callable[[str], Union[bytes, mmap.mmap]]:
+        """Download callable for the ZIP writers, bound to this package's cache keys"""
+        generations = generations or {}
+
+        def download(gs_path: str):
+            return self._download_pdf_from_gcs(
+                gs_path, generations.get(gs_path), cache_stats
+            )
+
+        return download
+
+    @staticmethod
+    def _zip_entries(
+        invoices: List[Invoice], pdf_type: str, pdf_variant: str
+    ) -> List[tuple]:
+        """(filename in ZIP, gs:// path) of every PDF selected by the filters"""
+        return [
+            (f"{invoice.factura}_{pdf_key}.pdf", gs_path)
+            for invoice in invoices
+            for pdf_key, gs_path in invoice.filter_pdf_paths(pdf_type, pdf_variant).items()
+        ]
+
+    def _zip_blob_name(self, package_id: str, package_name: str) -> str:
+        """Blob name embedding the friendly filename: zips/{package_id}/{name}.zip"""
+        # Sanitize package_name just in case
+        safe_name = package_name.replace("/", "_").replace("\\", "_")
+        if not safe_name.endswith(".zip"):
+            safe_name += ".zip"
+        return f"zips/{package_id}/{safe_name}"
+
+    def _download_pdf_from_gcs(
+        self,
+        gs_path: str,
+        generation: Optional[int] = None,
+        cache_stats: Optional[BlobCacheStats] = None,
+    ):
         """
         Download PDF content from GCS
 
+        With the PDF cache enabled and a known generation, a cached copy is
+        returned as a read-only mmap and misses are stored after download.
+
         Args:
             gs_path: GCS path (gs://bucket/path/to/file.pdf)
+            generation: Object generation (cache key; None skips the cache)
+            cache_stats: Per-package cache accounting
 
         Returns:
-            PDF file content as bytes
+            PDF file content (bytes, or mmap on a cache hit)
         """
         thread_name = threading.current_thread().name
         start_time = time.time()
 
         bucket_name, blob_name = self.url_signer.extract_bucket_and_blob(gs_path)
         blob_path_short = blob_name.split("/")[-1]
+        use_cache = self.pdf_cache is not None and generation is not None
+
+        if use_cache:
+            cached = self.pdf_cache.get(bucket_name, blob_name, generation)
+            if cached is not None:
+                if cache_stats is not None:
+                    cache_stats.record_hit(len(cached))
+                print(
+                    f"[{thread_name}] ✓ {blob_path_short} (cache)",
+                    file=sys.stderr,
+                )
+                return cached
+            if cache_stats is not None:
+                cache_stats.record_miss()
 
         print(
             f"[{thread_name}] ⬇ {blob_path_short}",
@@ -368,7 +1434,16 @@ class ZipService:
 
         bucket = self.storage_client.bucket(bucket_name)
         blob = bucket.blob(blob_name)
-        content = blob.download_as_bytes()
+        if use_cache:
+            try:
+                # Only cache content that matches the key's generation
+                content = blob.download_as_bytes(if_generation_match=generation)
+                self.pdf_cache.put(bucket_name, blob_name, generation, content)
+            except PreconditionFailed:
+                # Overwritten since the generations were read
+                content = blob.download_as_bytes()
+        else:
+            content = blob.download_as_bytes()
 
         elapsed = time.time() - start_time
         print(
@@ -380,17 +1455,21 @@ class ZipService:
 
     def _upload_zip_to_gcs(
         self, package_id: str, zip_buffer: io.BytesIO, package_name: str
-    ) -> tuple[str, int]:
+    ) -> tuple[str, int, dict]:
         """
         Upload ZIP buffer to GCS
 
+        Archives of at least pdf.zip.composite_upload.threshold_mb are
+        uploaded as concurrent parts and composed; smaller ones in a single
+        request.
+
         Args:
             package_id: Package ID
             zip_buffer: ZIP file buffer
             package_name: Package name (used for friendly download filename)
 
         Returns:
-            Tuple of (gcs_path, file_size_bytes)
+            Tuple of (gcs_path, file_size_bytes, upload ZipPerformanceMetrics fields)
 
         Note:
             Uses nested path with friendly name to ensure browser downloads correct filename
@@ -398,12 +1477,8 @@ class ZipService:
             Format: zips/{package_id}/{package_name}.zip
         """
         # Embed friendly name in blob path to avoid signed URL encoding issues
-        # Sanitize package_name just in case
-        safe_name = package_name.replace("/", "_").replace("\\", "_")
-        if not safe_name.endswith(".zip"):
-            safe_name += ".zip"
-            
-        blob_name = f"zips/{package_id}/{safe_name}"
+        blob_name = self._zip_blob_name(package_id, package_name)
+        safe_name = blob_name.rsplit("/", 1)[-1]
 
         # Get bucket and blob
         bucket = self.storage_client.bucket(self.write_bucket)
@@ -415,18 +1490,41 @@ class ZipService:
             "package_id": package_id,
         }
 
-        # Upload with content-type
-        zip_buffer.seek(0)
-        blob.upload_from_file(zip_buffer, content_type="application/zip")
+        file_size = zip_buffer.getbuffer().nbytes
+        upload_start = time.time()
+        upload_parts = 1
+
+        if self.composite_upload_enabled and file_size >= self.composite_upload_threshold:
+            result = self.composite_uploader.upload(
+                zip_buffer, blob, content_type="application/zip"
+            )
+            upload_parts = result.parts
+        else:
+            # Upload with content-type
+            zip_buffer.seek(0)
+            blob.upload_from_file(zip_buffer, content_type="application/zip")
+
+        upload_time_ms = int((time.time() - upload_start) * 1000)
+        upload_mb_per_s = round(
+            file_size / (1024 * 1024) / max(upload_time_ms / 1000, 0.001), 2
+        )
 
-        # Calculate GCS path and file size
+        # Calculate GCS path
         gcs_path = f"gs://{self.write_bucket}/{blob_name}"
-        file_size = zip_buffer.getbuffer().nbytes
 
         print(
             f"[ZIP Service] Uploaded: {blob_name} "
-            f"(size: {file_size} bytes)",
+            f"(size: {file_size} bytes, {upload_parts} part(s), "
+            f"{upload_time_ms}ms, {upload_mb_per_s} MB/s)",
             file=sys.stderr,
         )
 
-        return gcs_path, file_size
+        return (
+            gcs_path,
+            file_size,
+            {
+                "upload_time_ms": upload_time_ms,
+                "upload_mb_per_s": upload_mb_per_s,
+                "upload_parts": upload_parts,
+            },
+        )
@@ -0,0 +1,297 @@
+"""
+ZIP Stream Service
+==================
+On-the-fly ZIP downloads for medium bundles.
+
+The package flow downloads every PDF into the backend, uploads the archive
+to GCS, signs it and only then hands out a link. Here the agent hands out
+/zip/stream/{token} right away; when it is opened the archive is written
+straight into the HTTP response while its members are fetched from GCS, so
+the download starts as soon as the first PDF arrives and nothing is stored.
+
+Tokens are stateless: the invoice numbers, PDF filters and expiry are
+signed with HMAC-SHA256, so any worker or instance sharing the secret can
+serve them. They are long, so the agent wraps them in a /r/{id} short link
+like any other signed URL.
+
+Configuration (config.yaml):
+    pdf:
+      zip:
+        stream:
+          enabled: false            # Enable once the token secret is set
+          max_pdfs: 60              # Larger bundles use ZIP packages
+          token_ttl_minutes: 60
+          token_secret: ""          # Set PDF_ZIP_STREAM_TOKEN_SECRET in production
+          chunk_size_kb: 64         # Response chunk size
+          buffered_chunks: 16       # Chunks buffered ahead of the client
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import queue
+import secrets
+import sys
+import threading
+import time
+import zlib
+from typing import Iterator, List, Optional, Tuple
+
+from src.core.config import ConfigLoader
+from src.core.domain.interfaces import IInvoiceRepository, InvoiceProjection
+from src.core.domain.models import Invoice
+from src.application.services.zip_service import ZipService
+
+
+class ZipStreamTokenError(Exception):
+    """Raised when a stream token is malformed, forged or expired"""
+
+    def __init__(self, message: str, expired: bool = False):
+        super().__init__(message)
+        self.expired = expired
+
+
+class _ChunkPipe:
+    """
+    Bounded pipe between the thread building the ZIP and the HTTP response
+
+    The writer side coalesces zipfile's small writes into chunks and blocks
+    when ``max_chunks`` are waiting (backpressure from a slow client). When
+    the reader stops early (client disconnected) writes raise
+    BrokenPipeError so the build stops downloading.
+    """
+
+    _EOF = object()
+
+    def __init__(self, chunk_size: int, max_chunks: int):
+        self._chunk_size = chunk_size
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max(1, max_chunks))
+        self._buffer = bytearray()
+        self._cancelled = threading.Event()
+
+    def write(self, data) -> int:
+        if self._cancelled.is_set():
+            raise BrokenPipeError("ZIP stream client disconnected")
+        self._buffer += data
+        if len(self._buffer) >= self._chunk_size:
+            self._put(bytes(self._buffer))
+            self._buffer.clear()
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self, error: Optional[BaseException] = None) -> None:
+        """Send buffered bytes and the end marker (or the build error)"""
+        try:
+            if error is None and self._buffer:
+                self._put(bytes(self._buffer))
+            self._buffer.clear()
+            self._put(error if error is not None else self._EOF)
+        except BrokenPipeError:
+            pass
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    def __iter__(self) -> Iterator[bytes]:
+        while True:
+            item = self._queue.get()
+            if item is self._EOF:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+
+    def _put(self, item) -> None:
+        while True:
+            try:
+                self._queue.put(item, timeout=0.5)
+                return
+            except queue.Full:
+                if self._cancelled.is_set():
+                    raise BrokenPipeError("ZIP stream client disconnected")
+
+
+class ZipStreamService:
+    """
+    Issues stream tokens and streams ZIPs for them
+
+    Example:
+        >>> token = zip_stream.issue_token(["0105635394", "0105635395"])
+        >>> filename, chunks = zip_stream.open_stream(token)
+        >>> for chunk in chunks: response.write(chunk)
+    """
+
+    def __init__(
+        self,
+        zip_service: ZipService,
+        invoice_repository: IInvoiceRepository,
+        config: ConfigLoader,
+    ):
+        """
+        Initialize ZIP stream service
+
+        Args:
+            zip_service: Service that writes the archive
+            invoice_repository: Invoice lookup for token invoice numbers
+            config: Configuration loader
+        """
+        self.zip_service = zip_service
+        self.invoice_repo = invoice_repository
+
+        self.max_pdfs = int(config.get("pdf.zip.stream.max_pdfs", 60))
+        self.token_ttl_seconds = float(config.get("pdf.zip.stream.token_ttl_minutes", 60)) * 60
+        self.chunk_size = int(float(config.get("pdf.zip.stream.chunk_size_kb", 64)) * 1024)
+        self.buffered_chunks = int(config.get("pdf.zip.stream.buffered_chunks", 16))
+
+        secret = config.get("pdf.zip.stream.token_secret", "")
+        if not secret:
+            # Tokens then only verify in this process
+            print(
+                "WARN pdf.zip.stream.token_secret not set: using a per-process "
+                "secret (set PDF_ZIP_STREAM_TOKEN_SECRET when running several "
+                "workers or instances)",
+                file=sys.stderr,
+            )
+            secret = secrets.token_hex(32)
+        self._secret = str(secret).encode("utf-8")
+
+        print("SERVICE Initialized ZipStreamService", file=sys.stderr)
+        print(
+            f"        - Max PDFs: {self.max_pdfs}, token TTL: "
+            f"{self.token_ttl_seconds / 60:.0f} min",
+            file=sys.stderr,
+        )
+
+    def issue_token(
+        self,
+        invoice_numbers: List[str],
+        pdf_type: str = "both",
+        pdf_variant: str = "cf",
+    ) -> str:
+        """
+        Create a signed token for /zip/stream/{token}
+
+        Args:
+            invoice_numbers: Invoice numbers to include
+            pdf_type: Filter type ('both', 'tributaria_only', 'cedible_only', etc.)
+            pdf_variant: Variant filter ('cf', 'sf', 'both')
+
+        Returns:
+            URL-safe token
+
+        Raises:
+            ValueError: If no invoice numbers are given
+        """
+        invoice_numbers = list(dict.fromkeys(str(n) for n in invoice_numbers if n))
+        if not invoice_numbers:
+            raise ValueError("Cannot create ZIP from empty invoice list")
+
+        payload = json.dumps(
+            {
+                "n": invoice_numbers,
+                "t": pdf_type,
+                "v": pdf_variant,
+                "e": int(time.time() + self.token_ttl_seconds),
+            },
+            separators=(",", ":"),
+        ).encode("utf-8")
+        body = _b64encode(zlib.compress(payload, 9))
+        return f"{body}.{self._sign(body)}"
+
+    def resolve_token(self, token: str) -> Tuple[List[str], str, str]:
+        """
+        Verify a token and read its request
+
+        Returns:
+            Tuple of (invoice_numbers, pdf_type, pdf_variant)
+
+        Raises:
+            ZipStreamTokenError: If the token is invalid or expired
+        """
+        body, _, signature = token.partition(".")
+        expected = self._sign(body).encode("ascii")
+        if not body or not hmac.compare_digest(signature.encode("utf-8"), expected):
+            raise ZipStreamTokenError("Invalid ZIP stream token")
+        try:
+            payload = json.loads(zlib.decompress(_b64decode(body)))
+            invoice_numbers = [str(n) for n in payload["n"]]
+            pdf_type, pdf_variant, expires_at = payload["t"], payload["v"], payload["e"]
+        except (ValueError, KeyError, TypeError, zlib.error) as e:
+            raise ZipStreamTokenError(f"Invalid ZIP stream token: {e}")
+        if time.time() > expires_at:
+            raise ZipStreamTokenError("ZIP stream token expired", expired=True)
+        return invoice_numbers, pdf_type, pdf_variant
+
+    def open_stream(self, token: str) -> Tuple[str, Iterator[bytes]]:
+        """
+        Resolve a token and start building its ZIP
+
+        The token and invoices are checked before anything is streamed, so
+        the caller can still answer with an error status.
+
+        Args:
+            token: Token from issue_token()
+
+        Returns:
+            Tuple of (download filename, iterator of ZIP chunks)
+
+        Raises:
+            ZipStreamTokenError: If the token is invalid or expired
+            LookupError: If none of the invoices exist
+        """
+        invoice_numbers, pdf_type, pdf_variant = self.resolve_token(token)
+        invoices = self.invoice_repo.find_by_invoice_numbers(
+            invoice_numbers, projection=InvoiceProjection.ZIP
+        )
+        if not invoices:
+            raise LookupError("No invoices found")
+
+        filename = f"facturas_{len(invoices)}_items.zip"
+        print(
+            f"ZIP Streaming {filename} (pdf_type={pdf_type}, pdf_variant={pdf_variant})",
+            file=sys.stderr,
+        )
+        return filename, self._stream_zip_chunks(invoices, pdf_type, pdf_variant)
+
+    def _stream_zip_chunks(
+        self, invoices: List[Invoice], pdf_type: str, pdf_variant: str
+    ) -> Iterator[bytes]:
+        """Build the ZIP on a background thread and yield it chunk by chunk"""
+        pipe = _ChunkPipe(self.chunk_size, self.buffered_chunks)
+
+        def build() -> None:
+            try:
+                self.zip_service.write_zip_to_stream(
+                    invoices, pipe, pdf_type=pdf_type, pdf_variant=pdf_variant
+                )
+            except BrokenPipeError:
+                print("ZIP Stream stopped: client disconnected", file=sys.stderr)
+                pipe.close()
+            except Exception as e:
+                print(f"ERROR Streaming ZIP: {e}", file=sys.stderr)
+                pipe.close(e)
+            else:
+                pipe.close()
+
+        builder = threading.Thread(target=build, name="zip-stream", daemon=True)
+        builder.start()
+        try:
+            yield from pipe
+        finally:
+            # Client gone or response finished: unblock and stop the builder
+            pipe.cancel()
+
+    def _sign(self, body: str) -> str:
+        digest = hmac.new(self._secret, body.encode("utf-8"), hashlib.sha256).digest()
+        return _b64encode(digest[:16])
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(text: str) -> bytes:
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
@@ -0,0 +1,87 @@
+"""
+ZIP Volume Planner
+==================
+Splits a large invoice set into several ZIP volumes before anything is
+downloaded.
+
+One arbitrarily large archive can exceed the instance memory (buffered
+builds) and the time a user is willing to wait for a single download.
+Volumes are planned from GCS object sizes and capped by file count and
+bytes; an invoice's PDFs always stay in the same volume, and invoices keep
+their order so volume N holds a contiguous range.
+
+Configuration (config.yaml):
+    pdf:
+      zip:
+        max_files: 50               # PDFs per volume
+        volumes:
+          enabled: true
+          max_volume_mb: 500        # Source bytes per volume
+          max_parallel: 2           # Volumes built at the same time
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from src.core.domain.models import Invoice
+
+
+@dataclass
+class ZipVolumePlan:
+    """Invoices and expected content of one volume"""
+
+    invoices: List[Invoice] = field(default_factory=list)
+    gs_paths: List[str] = field(default_factory=list)
+    estimated_bytes: int = 0
+
+    @property
+    def pdf_count(self) -> int:
+        return len(self.gs_paths)
+
+
+def plan_zip_volumes(
+    invoices: List[Invoice],
+    pdf_type: str,
+    pdf_variant: str,
+    object_sizes: Dict[str, Optional[int]],
+    max_files: int,
+    max_bytes: Optional[int] = None,
+) -> List[ZipVolumePlan]:
+    """
+    Pack invoices into volumes of at most ``max_files`` PDFs and ``max_bytes``
+
+    A volume is closed when the next invoice would exceed either cap; an
+    invoice that exceeds a cap on its own gets a volume of its own.
+
+    Args:
+        invoices: Invoices in the order they should appear
+        pdf_type: Filter type ('both', 'tributaria_only', 'cedible_only', etc.)
+        pdf_variant: Variant filter ('cf', 'sf', 'both')
+        object_sizes: gs:// path -> size in bytes (unknown sizes count as 0)
+        max_files: PDFs per volume
+        max_bytes: Source bytes per volume (None = no size cap)
+
+    Returns:
+        Volume plans in invoice order (at least one)
+    """
+    max_files = max(1, int(max_files))
+    volumes = [ZipVolumePlan()]
+
+    for invoice in invoices:
+        gs_paths = list(invoice.filter_pdf_paths(pdf_type, pdf_variant).values())
+        invoice_bytes = sum(object_sizes.get(gs_path) or 0 for gs_path in gs_paths)
+
+        current = volumes[-1]
+        exceeds_files = current.pdf_count + len(gs_paths) > max_files
+        exceeds_bytes = (
+            max_bytes is not None and current.estimated_bytes + invoice_bytes > max_bytes
+        )
+        if current.invoices and (exceeds_files or exceeds_bytes):
+            current = ZipVolumePlan()
+            volumes.append(current)
+
+        current.invoices.append(invoice)
+        current.gs_paths.extend(gs_paths)
+        current.estimated_bytes += invoice_bytes
+
+    return volumes
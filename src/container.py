@@ -19,8 +19,15 @@ from src.infrastructure.bigquery import (
     BigQueryZipRepository,
     BigQueryConversationRepository,
 )
-from src.infrastructure.gcs import RobustURLSigner, LegacyURLSigner
-from src.application.services import InvoiceService, ZipService, ConversationService
+from src.infrastructure.gcs import RobustURLSigner, LegacyURLSigner, CachingURLSigner
+from src.infrastructure.gcs.batch_signing_engine import BatchSigningEngine
+from src.application.services import (
+    InvoiceService,
+    ZipService,
+    ZipJobService,
+    ZipStreamService,
+    ConversationService,
+)
 
 
 class ServiceContainer:
@@ -45,10 +52,13 @@ class ServiceContainer:
         self._zip_repository: Optional[IZipRepository] = None
         self._conversation_repository: Optional[IConversationRepository] = None
         self._url_signer: Optional[IURLSigner] = None
+        self._batch_signing_engine: Optional[BatchSigningEngine] = None
 
         # Application layer (lazy-loaded)
         self._invoice_service: Optional[InvoiceService] = None
         self._zip_service: Optional[ZipService] = None
+        self._zip_job_service: Optional[ZipJobService] = None
+        self._zip_stream_service: Optional[ZipStreamService] = None
         self._conversation_service: Optional[ConversationService] = None
 
         print("CONTAINER Initialized ServiceContainer", file=sys.stderr)
@@ -61,7 +71,14 @@ class ServiceContainer:
     def invoice_repository(self) -> IInvoiceRepository:
         """Get invoice repository (lazy-loaded singleton)"""
         if self._invoice_repository is None:
-            self._invoice_repository = BigQueryInvoiceRepository(self.config)
+            metrics = None
+            if self.config.get("bigquery.result_cache.enabled", False):
+                from src.core.di import ServiceContainer as StabilityContainer
+
+                metrics = StabilityContainer.get_instance().get_metrics_collector()
+            self._invoice_repository = BigQueryInvoiceRepository(
+                self.config, metrics_collector=metrics
+            )
         return self._invoice_repository
 
     @property
@@ -90,21 +107,46 @@ class ServiceContainer:
         Selects implementation based on configuration:
         - RobustURLSigner: Production (clock-skew resistant)
         - LegacyURLSigner: Debugging/rollback only
+
+        When pdf.signed_urls.cache.enabled is true, the selected signer is
+        wrapped in CachingURLSigner to reuse still-valid signatures.
         """
         if self._url_signer is None:
             use_robust = self.config.get("features.use_robust_signed_urls", True)
 
             if use_robust:
-                self._url_signer = RobustURLSigner(self.config)
+                signer = RobustURLSigner(self.config)
                 print("CONTAINER Using RobustURLSigner (production)", file=sys.stderr)
             else:
-                self._url_signer = LegacyURLSigner(self.config)
+                signer = LegacyURLSigner(self.config)
                 print(
                     "CONTAINER Using LegacyURLSigner (debugging mode)", file=sys.stderr
                 )
 
+            if self.config.get("pdf.signed_urls.cache.enabled", True):
+                from src.core.di import ServiceContainer as StabilityContainer
+
+                metrics = StabilityContainer.get_instance().get_metrics_collector()
+                signer = CachingURLSigner(signer, self.config, metrics_collector=metrics)
+
+            self._url_signer = signer
+
         return self._url_signer
 
+    @property
+    def batch_signing_engine(self) -> BatchSigningEngine:
+        """
+        Get batch signing engine (lazy-loaded singleton)
+
+        Signs lists of gs:// URLs concurrently through url_signer while
+        respecting the process-wide signBlob rate limit.
+        """
+        if self._batch_signing_engine is None:
+            self._batch_signing_engine = BatchSigningEngine(
+                self.url_signer.generate_signed_url
+            )
+        return self._batch_signing_engine
+
     # ================================================================
     # Application Layer - Services
     # ================================================================
@@ -114,7 +156,9 @@ class ServiceContainer:
         """Get invoice service (lazy-loaded singleton)"""
         if self._invoice_service is None:
             self._invoice_service = InvoiceService(
-                invoice_repository=self.invoice_repository, url_signer=self.url_signer
+                invoice_repository=self.invoice_repository,
+                url_signer=self.url_signer,
+                batch_signing_engine=self.batch_signing_engine,
             )
         return self._invoice_service
 
@@ -129,6 +173,39 @@ class ServiceContainer:
             )
         return self._zip_service
 
+    @property
+    def zip_job_service(self) -> ZipJobService:
+        """
+        Get background ZIP job service (lazy-loaded singleton)
+
+        Builds ZIP packages on a bounded worker pool and tracks their
+        status in zip_packages.
+        """
+        if self._zip_job_service is None:
+            self._zip_job_service = ZipJobService(
+                zip_service=self.zip_service,
+                zip_repository=self.zip_repository,
+                invoice_repository=self.invoice_repository,
+                config=self.config,
+            )
+        return self._zip_job_service
+
+    @property
+    def zip_stream_service(self) -> ZipStreamService:
+        """
+        Get on-the-fly ZIP stream service (lazy-loaded singleton)
+
+        Issues /zip/stream/{token} links and writes their archives straight
+        into the HTTP response.
+        """
+        if self._zip_stream_service is None:
+            self._zip_stream_service = ZipStreamService(
+                zip_service=self.zip_service,
+                invoice_repository=self.invoice_repository,
+                config=self.config,
+            )
+        return self._zip_stream_service
+
     @property
     def conversation_service(self) -> ConversationService:
         """Get conversation service (lazy-loaded singleton)"""
@@ -152,8 +229,15 @@ class ServiceContainer:
         self._zip_repository = None
         self._conversation_repository = None
         self._url_signer = None
+        if self._batch_signing_engine is not None:
+            self._batch_signing_engine.shutdown()
+        self._batch_signing_engine = None
         self._invoice_service = None
         self._zip_service = None
+        if self._zip_job_service is not None:
+            self._zip_job_service.shutdown()
+        self._zip_job_service = None
+        self._zip_stream_service = None
         self._conversation_service = None
 
         print("CONTAINER Reset complete - all singletons cleared", file=sys.stderr)
@@ -194,6 +278,14 @@ class ServiceContainer:
             f"  ZIP Service: {'✓ Loaded' if self._zip_service else '○ Not loaded'}",
             file=sys.stderr,
         )
+        print(
+            f"  ZIP Job Service: {'✓ Loaded' if self._zip_job_service else '○ Not loaded'}",
+            file=sys.stderr,
+        )
+        print(
+            f"  ZIP Stream Service: {'✓ Loaded' if self._zip_stream_service else '○ Not loaded'}",
+            file=sys.stderr,
+        )
         print(
             f"  Conversation Service: {'✓ Loaded' if self._conversation_service else '○ Not loaded'}",
             file=sys.stderr,
@@ -21,10 +21,13 @@ from src.domain.interfaces.time_sync import ITimeSyncValidator
 from src.domain.interfaces.environment_validator import IEnvironmentValidator
 from src.domain.interfaces.retry_strategy import IRetryStrategy
 from src.domain.interfaces.metrics_collector import IMetricsCollector
+from src.domain.interfaces.clock_offset import IClockOffsetProvider
 from src.infrastructure.gcs.time_sync_validator import TimeSyncValidator
 from src.infrastructure.gcs.environment_validator import EnvironmentValidator
 from src.infrastructure.gcs.retry_strategy import RetryStrategy
 from src.infrastructure.gcs.url_metrics_collector import URLMetricsCollector
+from src.infrastructure.gcs.clock_offset_tracker import ClockOffsetTracker
+from src.core.config import get_config
 from src.services.signed_url_service import SignedURLService
 
 
@@ -40,6 +43,7 @@ class ServiceContainer:
     - Environment validator
     - Retry strategy
     - Metrics collector
+    - Clock offset tracker
     - Signed URL service
 
     Thread-safe lazy initialization ensures components are created
@@ -61,6 +65,7 @@ class ServiceContainer:
         self._environment_validator: Optional[IEnvironmentValidator] = None
         self._retry_strategy: Optional[IRetryStrategy] = None
         self._metrics_collector: Optional[IMetricsCollector] = None
+        self._clock_offset_tracker: Optional[IClockOffsetProvider] = None
         self._signed_url_service: Optional[SignedURLService] = None
 
         # Component locks
@@ -68,6 +73,7 @@ class ServiceContainer:
         self._env_validator_lock = Lock()
         self._retry_lock = Lock()
         self._metrics_lock = Lock()
+        self._clock_offset_lock = Lock()
         self._service_lock = Lock()
 
         logger.info("ServiceContainer initialized")
@@ -201,6 +207,40 @@ class ServiceContainer:
 
         return self._metrics_collector
 
+    def get_clock_offset_tracker(self) -> Optional[IClockOffsetProvider]:
+        """
+        Get background clock offset tracker instance
+
+        Lazy initialization - creates and starts the tracker on first call,
+        then attaches it to the time sync validator and metrics collector.
+
+        Returns:
+            IClockOffsetProvider implementation, or None if disabled via
+            gcs.time_sync.tracker.enabled
+
+        Example:
+            >>> container = ServiceContainer.get_instance()
+            >>> tracker = container.get_clock_offset_tracker()
+            >>> tracker.current_offset()
+        """
+        if not get_config().get("gcs.time_sync.tracker.enabled", True):
+            return None
+
+        if self._clock_offset_tracker is None:
+            with self._clock_offset_lock:
+                if self._clock_offset_tracker is None:
+                    time_sync = self.get_time_sync_validator()
+                    tracker = ClockOffsetTracker(time_sync_validator=time_sync)
+                    tracker.start()
+
+                    time_sync.set_clock_offset_provider(tracker)
+                    self.get_metrics_collector().set_clock_offset_provider(tracker)
+
+                    self._clock_offset_tracker = tracker
+                    logger.debug("ClockOffsetTracker created")
+
+        return self._clock_offset_tracker
+
     def get_signed_url_service(self) -> SignedURLService:
         """
         Get signed URL service instance with all dependencies injected
@@ -224,6 +264,7 @@ class ServiceContainer:
                     env_validator = self.get_environment_validator()
                     retry = self.get_retry_strategy()
                     metrics = self.get_metrics_collector()
+                    clock_offset = self.get_clock_offset_tracker()
 
                     # Create service with dependency injection
                     self._signed_url_service = SignedURLService(
@@ -231,6 +272,7 @@ class ServiceContainer:
                         environment_validator=env_validator,
                         retry_strategy=retry,
                         metrics_collector=metrics,
+                        clock_offset_tracker=clock_offset,
                     )
 
                     logger.info(
@@ -82,6 +82,46 @@ class ZipPerformanceMetrics:
         files_included: Number of files successfully included in ZIP
         files_missing: Number of files that failed to download
         total_size_bytes: Total size of generated ZIP file (bytes)
+        time_to_first_upload_ms: Time until the first archive bytes reached
+            GCS (milliseconds; streaming pipeline)
+        peak_rss_bytes: Peak process resident memory while building (bytes)
+        compression_mode: Compression policy used ('store', 'deflate', 'adaptive')
+        compression_ratio: Compressed / uncompressed size of all entries
+        compression_cpu_ms: CPU time spent adding entries (milliseconds)
+        compression_cpu_saved_ms: Estimated DEFLATE CPU avoided by storing
+            incompressible entries (milliseconds; adaptive mode)
+        entries_stored: Entries written without compression
+        reused_package_id: Existing package served instead of building a new
+            one (content fingerprint match or identical in-flight build)
+        pdf_cache_hits: Source PDFs read from the local PDF cache
+        pdf_cache_misses: Source PDFs downloaded (cache enabled, not cached)
+        pdf_cache_hit_ratio: pdf_cache_hits / cache lookups
+        pdf_cache_bytes_saved: Bytes served from the cache instead of GCS
+        concurrency_initial: Download concurrency the build started with
+        concurrency_final: Download concurrency when the build finished
+        concurrency_peak: Highest download concurrency reached (also
+            reported as max_workers_used)
+        throughput_curve: Per-epoch download throughput, one dict per epoch
+            with concurrency, downloads, mb_per_s, avg_latency_ms, throttled
+        upload_time_ms: Time spent uploading (milliseconds; for streamed
+            composite uploads, the time parts were uploading; None for a
+            streamed resumable upload, which spans the whole build)
+        upload_mb_per_s: Archive size / upload_time_ms (MB per second;
+            None for streamed resumable uploads)
+        upload_parts: Objects the archive was uploaded as (1, or the
+            composite part count; None for streamed resumable uploads)
+        streamed_chunks: Resumable upload chunks sent by a streamed build
+        end_to_end_mb_per_s: Archive size / generation_time_ms of a
+            streamed build (download, compression and upload together)
+        planned_download_bytes: Source bytes the download plan expected to
+            fetch (from object metadata, each distinct object once)
+        duplicate_downloads_avoided: Entries served by a download shared
+            with another entry (same gs:// path in several invoices)
+        predicted_zip_bytes: Archive size predicted before the build
+        predicted_download_ms: Download time predicted before the build
+
+    Only the first six fields map to conversation_logs columns; the rest are
+    reported in logs and are not part of to_dict().
     """
 
     generation_time_ms: Optional[int] = None
@@ -90,6 +130,31 @@ class ZipPerformanceMetrics:
     files_included: Optional[int] = None
     files_missing: Optional[int] = None
     total_size_bytes: Optional[int] = None
+    time_to_first_upload_ms: Optional[int] = None
+    peak_rss_bytes: Optional[int] = None
+    compression_mode: Optional[str] = None
+    compression_ratio: Optional[float] = None
+    compression_cpu_ms: Optional[int] = None
+    compression_cpu_saved_ms: Optional[int] = None
+    entries_stored: Optional[int] = None
+    reused_package_id: Optional[str] = None
+    pdf_cache_hits: Optional[int] = None
+    pdf_cache_misses: Optional[int] = None
+    pdf_cache_hit_ratio: Optional[float] = None
+    pdf_cache_bytes_saved: Optional[int] = None
+    concurrency_initial: Optional[int] = None
+    concurrency_final: Optional[int] = None
+    concurrency_peak: Optional[int] = None
+    throughput_curve: Optional[List[Dict[str, Any]]] = None
+    upload_time_ms: Optional[int] = None
+    upload_mb_per_s: Optional[float] = None
+    upload_parts: Optional[int] = None
+    streamed_chunks: Optional[int] = None
+    end_to_end_mb_per_s: Optional[float] = None
+    planned_download_bytes: Optional[int] = None
+    duplicate_downloads_avoided: Optional[int] = None
+    predicted_zip_bytes: Optional[int] = None
+    predicted_download_ms: Optional[int] = None
 
     def to_dict(self) -> Dict[str, Optional[int]]:
         """Serialize to dict for BigQuery insert."""
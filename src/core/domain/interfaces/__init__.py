@@ -4,12 +4,18 @@ Domain Interfaces
 Abstract interfaces for dependency injection and testability.
 """
 
-from .repository import IInvoiceRepository, IZipRepository, IConversationRepository
+from .repository import (
+    IInvoiceRepository,
+    IZipRepository,
+    IConversationRepository,
+    InvoiceProjection,
+)
 from .url_signer import IURLSigner
 
 __all__ = [
     "IInvoiceRepository",
     "IZipRepository",
     "IConversationRepository",
+    "InvoiceProjection",
     "IURLSigner",
 ]
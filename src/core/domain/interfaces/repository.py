@@ -6,36 +6,79 @@ Infrastructure layer provides concrete implementations.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from typing import Iterable, Iterator, List, Optional, Dict, Any
 from datetime import datetime, date
 
 from src.core.domain.models import Invoice, ZipPackage, Conversation
 
 
+class InvoiceProjection:
+    """
+    Column profiles an invoice finder can be asked to read
+
+    Repositories that cannot project columns ignore the profile and return
+    complete invoices.
+    """
+
+    ZIP = "zip"  # Invoice number, customer and PDF paths
+    LISTING = "listing"  # Every mapped column except line-item details
+    FULL = "full"  # Every column
+
+
 class IInvoiceRepository(ABC):
     """Interface for invoice data access"""
 
     @abstractmethod
-    def find_by_invoice_number(self, invoice_number: str) -> Optional[Invoice]:
+    def find_by_invoice_number(
+        self, invoice_number: str, projection: Optional[str] = None
+    ) -> Optional[Invoice]:
         """
         Find invoice by invoice number
 
         Args:
             invoice_number: Invoice number (Factura)
+            projection: InvoiceProjection profile (default: FULL)
 
         Returns:
             Invoice or None if not found
         """
         pass
 
+    def find_by_invoice_numbers(
+        self, invoice_numbers: List[str], projection: Optional[str] = None
+    ) -> List[Invoice]:
+        """
+        Find several invoices by invoice number
+
+        Default implementation calls find_by_invoice_number() once per
+        number; repositories override it with a single batched query.
+
+        Args:
+            invoice_numbers: Invoice numbers (Factura)
+            projection: InvoiceProjection profile (default: FULL)
+
+        Returns:
+            Invoices found, in the order of invoice_numbers (unknown numbers
+            are skipped, duplicates resolved once)
+        """
+        invoices = []
+        for invoice_number in dict.fromkeys(invoice_numbers):
+            invoice = self.find_by_invoice_number(invoice_number)
+            if invoice is not None:
+                invoices.append(invoice)
+        return invoices
+
     @abstractmethod
-    def find_by_rut(self, rut: str, limit: Optional[int] = None) -> List[Invoice]:
+    def find_by_rut(
+        self, rut: str, limit: Optional[int] = None, projection: Optional[str] = None
+    ) -> List[Invoice]:
         """
         Find invoices by customer RUT
 
         Args:
             rut: Customer RUT
             limit: Maximum number of results
+            projection: InvoiceProjection profile (default: FULL)
 
         Returns:
             List of invoices
@@ -44,7 +87,10 @@ class IInvoiceRepository(ABC):
 
     @abstractmethod
     def find_by_solicitante(
-        self, solicitante: str, limit: Optional[int] = None
+        self,
+        solicitante: str,
+        limit: Optional[int] = None,
+        projection: Optional[str] = None,
     ) -> List[Invoice]:
         """
         Find invoices by solicitante code
@@ -52,6 +98,7 @@ class IInvoiceRepository(ABC):
         Args:
             solicitante: Solicitante code
             limit: Maximum number of results
+            projection: InvoiceProjection profile (default: FULL)
 
         Returns:
             List of invoices
@@ -60,7 +107,11 @@ class IInvoiceRepository(ABC):
 
     @abstractmethod
     def find_by_date_range(
-        self, start_date: date, end_date: date, rut: Optional[str] = None
+        self,
+        start_date: date,
+        end_date: date,
+        rut: Optional[str] = None,
+        projection: Optional[str] = None,
     ) -> List[Invoice]:
         """
         Find invoices by date range
@@ -69,20 +120,94 @@ class IInvoiceRepository(ABC):
             start_date: Start date (inclusive)
             end_date: End date (inclusive)
             rut: Optional RUT filter
+            projection: InvoiceProjection profile (default: FULL)
 
         Returns:
             List of invoices
         """
         pass
 
+    def iter_by_rut(
+        self,
+        rut: str,
+        after_factura: Optional[str] = None,
+        limit: Optional[int] = None,
+        page_size: Optional[int] = None,
+        projection: Optional[str] = None,
+    ) -> Iterator[Invoice]:
+        """
+        Stream invoices by customer RUT, newest invoice number first
+
+        Default implementation filters find_by_rut(); repositories override
+        it to fetch page by page, so memory stays bounded by page_size.
+
+        Args:
+            rut: Customer RUT
+            after_factura: Keyset cursor: only invoices numbered below this
+                (the last invoice number of the previous page)
+            limit: Maximum number of results
+            page_size: Rows fetched per page (repository default if None)
+            projection: InvoiceProjection profile (default: FULL)
+
+        Yields:
+            Invoices ordered by invoice number, descending
+        """
+        yield from _after_cursor(
+            self.find_by_rut(rut, projection=projection), after_factura, limit
+        )
+
+    def iter_by_solicitante(
+        self,
+        solicitante: str,
+        after_factura: Optional[str] = None,
+        limit: Optional[int] = None,
+        page_size: Optional[int] = None,
+        projection: Optional[str] = None,
+    ) -> Iterator[Invoice]:
+        """
+        Stream invoices by solicitante code, newest invoice number first
+
+        Same contract as iter_by_rut().
+        """
+        yield from _after_cursor(
+            self.find_by_solicitante(solicitante, projection=projection),
+            after_factura,
+            limit,
+        )
+
+    def iter_by_date_range(
+        self,
+        start_date: date,
+        end_date: date,
+        rut: Optional[str] = None,
+        after_factura: Optional[str] = None,
+        limit: Optional[int] = None,
+        page_size: Optional[int] = None,
+        projection: Optional[str] = None,
+    ) -> Iterator[Invoice]:
+        """
+        Stream invoices by date range, newest invoice number first
+
+        Same contract as iter_by_rut(). Unlike find_by_date_range(), results
+        are ordered by invoice number (the cursor column), not by date.
+        """
+        yield from _after_cursor(
+            self.find_by_date_range(start_date, end_date, rut, projection=projection),
+            after_factura,
+            limit,
+        )
+
     @abstractmethod
-    def search(self, query: str, limit: Optional[int] = None) -> List[Invoice]:
+    def search(
+        self, query: str, limit: Optional[int] = None, projection: Optional[str] = None
+    ) -> List[Invoice]:
         """
         Search invoices by query (full-text search if supported)
 
         Args:
             query: Search query
             limit: Maximum number of results
+            projection: InvoiceProjection profile (default: FULL)
 
         Returns:
             List of invoices
@@ -90,6 +215,16 @@ class IInvoiceRepository(ABC):
         pass
 
 
+def _after_cursor(
+    invoices: Iterable[Invoice], after_factura: Optional[str], limit: Optional[int]
+) -> Iterator[Invoice]:
+    """Apply keyset cursor and limit to an already loaded result"""
+    ordered = sorted(invoices, key=lambda invoice: invoice.factura, reverse=True)
+    if after_factura is not None:
+        ordered = [invoice for invoice in ordered if invoice.factura < after_factura]
+    return iter(ordered[:limit] if limit else ordered)
+
+
 class IZipRepository(ABC):
     """Interface for ZIP package data access"""
 
@@ -155,6 +290,21 @@ class IZipRepository(ABC):
         """
         pass
 
+    def find_ready_by_fingerprint(self, fingerprint: str) -> Optional[ZipPackage]:
+        """
+        Find a ready, non-expired ZIP package built from identical content
+
+        Default implementation finds nothing (no reuse); repositories that
+        persist the package fingerprint override it.
+
+        Args:
+            fingerprint: Content fingerprint stored in package metadata
+
+        Returns:
+            Most recent matching ZIP package or None
+        """
+        return None
+
 
 class IConversationRepository(ABC):
     """Interface for conversation tracking data access"""
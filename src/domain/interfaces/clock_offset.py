@@ -0,0 +1,77 @@
+"""
+Clock Offset Provider Interface
+================================
+Interface for components that keep a cached estimate of the offset between
+the local clock and Google's clock.
+
+Signers consult this estimate on every URL instead of measuring the clock
+themselves, so reads must be cheap (no network I/O).
+
+Sign convention: offset = local time - Google time, so a positive offset
+means the local clock is ahead and Google's time is ``local - offset``.
+Implementations must convert sources with the opposite convention (ntplib's
+``response.offset`` is server - local) before publishing them.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+
+class IClockOffsetProvider(ABC):
+    """
+    Interface for cached clock offset estimation
+
+    Implementations must provide:
+    - O(1) access to the current offset and sync state
+    - Skew-compensated timestamps for request signing
+    - A diagnostic snapshot for metrics endpoints
+    """
+
+    @abstractmethod
+    def current_offset(self) -> Optional[float]:
+        """
+        Get the current smoothed clock offset
+
+        Returns:
+            Offset in seconds (positive = local clock ahead of Google),
+            or None if no fresh estimate is available
+
+        Example:
+            >>> offset = tracker.current_offset()
+            >>> if offset is not None and abs(offset) > 60:
+            ...     print("Local clock is skewed")
+        """
+        pass
+
+    @abstractmethod
+    def sync_status(self) -> Optional[bool]:
+        """
+        Get synchronization status derived from the cached offset
+
+        Returns:
+            True if within threshold, False if skewed, None if unknown/stale
+        """
+        pass
+
+    @abstractmethod
+    def signing_time(self) -> datetime:
+        """
+        Get the current UTC time corrected by the cached offset
+
+        Returns:
+            Timezone-aware UTC datetime aligned with Google's clock, i.e.
+            local time minus current_offset() (falls back to the local clock
+            when no estimate is available)
+        """
+        pass
+
+    @abstractmethod
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get a diagnostic snapshot of the tracker state
+
+        Returns:
+            Dictionary with offset, source, age and sample counters
+        """
+        pass
@@ -185,3 +185,21 @@ class IMetricsCollector(ABC):
             ...     return signed_url
         """
         pass
+
+    def record_cache_event(self, cache_name: str, event: str, count: int = 1):
+        """
+        Record a cache event (hit, miss, eviction, ...)
+
+        Optional hook with a no-op default so existing implementations keep
+        working; URLMetricsCollector aggregates these per cache name.
+
+        Args:
+            cache_name: Logical cache identifier (e.g. "signed_url")
+            event: Event name ("hit", "miss", "eviction", ...)
+            count: Number of events to record
+
+        Example:
+            >>> collector = URLMetricsCollector()
+            >>> collector.record_cache_event("signed_url", "hit")
+        """
+        pass
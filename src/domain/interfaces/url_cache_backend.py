@@ -0,0 +1,142 @@
+"""
+URL Cache Backend Interface
+===========================
+Storage interface behind URLCache (short ID -> signed URL / lazy gs:// entry).
+
+The in-memory backend is process-local; persistent backends let several
+server workers or instances resolve the same /r/{id} links and keep them
+alive across restarts.
+
+Entries are plain dicts with the keys:
+    url                 Signed URL (None for a lazy entry not yet signed)
+    gs_url              gs:// path for lazy entries (None for eager entries)
+    expiration_seconds  Requested signed URL lifetime (None = signer default)
+    friendly_filename   Download filename passed to the signer
+    signed_expires_at   Epoch seconds when the signed URL expires (or None)
+    expires_at          Epoch seconds when the short ID expires
+    created_at          Epoch seconds when the entry was stored
+    dedup_key           Content key for deterministic IDs (None = random ID)
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class IURLCacheBackend(ABC):
+    """
+    Interface for URL cache storage
+
+    Implementations must be safe to call from multiple threads; shared
+    backends must also be safe across processes.
+    """
+
+    @abstractmethod
+    def put(self, short_id: str, entry: Dict[str, Any]) -> None:
+        """
+        Store (or replace) an entry
+
+        Args:
+            short_id: Short ID key
+            entry: Entry dict (see module docstring)
+        """
+        pass
+
+    @abstractmethod
+    def get(self, short_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch an entry
+
+        Args:
+            short_id: Short ID key
+
+        Returns:
+            Copy of the entry dict, or None if unknown
+        """
+        pass
+
+    def get_many(self, short_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch several entries in one round trip
+
+        Default implementation loops over get(); backends override it to
+        take their lock (or run their query) once.
+
+        Args:
+            short_ids: Short ID keys
+
+        Returns:
+            Mapping of short ID to entry copy (unknown IDs are omitted)
+        """
+        entries = {}
+        for short_id in short_ids:
+            entry = self.get(short_id)
+            if entry is not None:
+                entries[short_id] = entry
+        return entries
+
+    @abstractmethod
+    def update_signed_url(
+        self, short_id: str, url: str, signed_expires_at: Optional[float]
+    ) -> None:
+        """
+        Record a (re-)signed URL for a lazy entry
+
+        Args:
+            short_id: Short ID key
+            url: Newly signed URL
+            signed_expires_at: Epoch seconds when the signed URL expires
+        """
+        pass
+
+    def update_signed_urls(
+        self, updates: Dict[str, Tuple[str, Optional[float]]]
+    ) -> None:
+        """
+        Record several (re-)signed URLs in one round trip
+
+        Default implementation loops over update_signed_url(); backends
+        override it to take their lock (or run one transaction) once.
+
+        Args:
+            updates: Mapping of short ID to (url, signed_expires_at)
+        """
+        for short_id, (url, signed_expires_at) in updates.items():
+            self.update_signed_url(short_id, url, signed_expires_at)
+
+    @abstractmethod
+    def delete(self, short_id: str) -> None:
+        """Remove an entry if present"""
+        pass
+
+    def delete_many(self, short_ids: List[str]) -> None:
+        """
+        Remove several entries in one round trip
+
+        Default implementation loops over delete().
+        """
+        for short_id in short_ids:
+            self.delete(short_id)
+
+    @abstractmethod
+    def purge_expired(self, now: float) -> int:
+        """
+        Remove entries whose short ID has expired
+
+        Args:
+            now: Current epoch seconds
+
+        Returns:
+            Number of entries removed
+        """
+        pass
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get storage statistics
+
+        Returns:
+            Dict with at least total_entries, lazy_entries, lazy_pending
+            and backend (backend name)
+        """
+        pass
@@ -232,26 +232,35 @@ def generate_stable_signed_urls_batch(
             f"Clock skew detectado - usando buffer de {buffer_minutes}m para batch"
         )
 
+    # Firmar en paralelo con el limitador compartido de signBlob
+    # (reintenta 429 con backoff adaptativo y conserva el orden de entrada)
+    from src.infrastructure.gcs.batch_signing_engine import BatchSigningEngine
+
+    engine = BatchSigningEngine(
+        lambda blob_name: generate_stable_signed_url(
+            bucket_name=bucket_name,
+            blob_name=blob_name,
+            expiration_hours=expiration_hours,
+            service_account_path=service_account_path,
+            credentials=credentials,
+            method=method,
+            force_buffer_minutes=buffer_minutes,  # Reutilizar buffer calculado
+        )
+    )
+    try:
+        results = engine.sign_all(blob_names)
+    finally:
+        engine.shutdown()
+
     urls = {}
     successful = 0
 
-    for blob_name in blob_names:
-        try:
-            url = generate_stable_signed_url(
-                bucket_name=bucket_name,
-                blob_name=blob_name,
-                expiration_hours=expiration_hours,
-                service_account_path=service_account_path,
-                credentials=credentials,
-                method=method,
-                force_buffer_minutes=buffer_minutes,  # Reutilizar buffer calculado
-            )
-            urls[blob_name] = url
+    for result in results:
+        urls[result.target] = result.signed_url
+        if result.success:
             successful += 1
-
-        except Exception as e:
-            logger.error(f"Error generando URL para {blob_name}: {e}")
-            urls[blob_name] = None
+        else:
+            logger.error(f"Error generando URL para {result.target}: {result.error}")
 
     logger.info(
         f"Batch completado: {successful}/{len(blob_names)} URLs generadas exitosamente"
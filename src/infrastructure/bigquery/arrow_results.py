@@ -0,0 +1,212 @@
+"""
+Arrow Result Conversion
+=======================
+Columnar bulk path for large invoice result sets.
+
+The REST row iterator hands over one Row per invoice, which the repository
+turns into a dict and then an Invoice. For statistics and monthly exports
+(thousands of rows) that per-row work dominates. Here results are
+downloaded as Arrow record batches - through the BigQuery Storage Read API
+when google-cloud-bigquery-storage is installed, otherwise with the REST
+``to_arrow`` download - and either converted column by column or
+aggregated without leaving Arrow.
+
+pyarrow is optional: without it ARROW_AVAILABLE is False and the repository
+keeps its row-by-row finders.
+
+Configuration (config.yaml):
+    bigquery:
+      arrow:
+        use_storage_api: true   # false = always download through REST
+"""
+
+import sys
+from typing import Any, Dict, List, Optional
+
+from src.core.domain.models import Invoice
+
+# Arrow support - optional, fails gracefully
+try:
+    import pyarrow
+    import pyarrow.compute as pc
+
+    ARROW_AVAILABLE = True
+except ImportError:
+    pyarrow = None
+    pc = None
+    ARROW_AVAILABLE = False
+
+# Storage Read API client - optional, to_arrow falls back to REST pages
+try:
+    from google.cloud import bigquery_storage  # noqa: F401
+
+    BQ_STORAGE_AVAILABLE = True
+except ImportError:
+    BQ_STORAGE_AVAILABLE = False
+
+PDF_FIELDS = [
+    "pdf_tributaria_cf",
+    "pdf_cedible_cf",
+    "pdf_tributaria_sf",
+    "pdf_cedible_sf",
+    "pdf_termico",
+]
+
+
+def require_arrow() -> None:
+    """
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    if not ARROW_AVAILABLE:
+        raise ImportError(
+            "pyarrow is required for the Arrow bulk path (pip install pyarrow)"
+        )
+
+
+def query_job_to_arrow(query_job, use_storage_api: bool = True) -> "pyarrow.Table":
+    """
+    Download a finished query's results as an Arrow table
+
+    Uses the Storage Read API when available and allowed. If the read
+    session fails (e.g. missing bigquery.readsessions.create permission)
+    the results are downloaded again through REST.
+
+    Args:
+        query_job: google.cloud.bigquery QueryJob
+        use_storage_api: Try the Storage Read API first
+
+    Returns:
+        pyarrow.Table with one column per selected field
+    """
+    require_arrow()
+    if use_storage_api and BQ_STORAGE_AVAILABLE:
+        try:
+            return query_job.to_arrow(create_bqstorage_client=True)
+        except Exception as e:
+            print(
+                f"REPO WARN Storage Read API download failed, using REST: {e}",
+                file=sys.stderr,
+            )
+    # QueryJob.to_arrow starts a new row iterator, so a failed attempt is harmless
+    return query_job.to_arrow(create_bqstorage_client=False)
+
+
+def invoices_from_arrow(
+    table: "pyarrow.Table",
+    field_mapping: Dict[str, str],
+    include_raw_row: bool = False,
+) -> List[Invoice]:
+    """
+    Convert an Arrow table to invoices, column by column
+
+    Produces the same invoices as Invoice.from_bigquery_row() per row, but
+    each column is converted to Python once instead of building a dict per
+    row and looking every field up in it.
+
+    Args:
+        table: Result table (columns named as in the BigQuery table)
+        field_mapping: gasco.field_mapping (generic name -> column)
+        include_raw_row: Also store the row dict in metadata["raw_row"]
+            (off by default: it rebuilds the per-row dicts this path avoids)
+
+    Returns:
+        Invoices in table order
+    """
+    require_arrow()
+    row_count = table.num_rows
+    present = set(table.column_names)
+
+    def column(name: str, default: str) -> List[Any]:
+        column_name = field_mapping.get(name, default)
+        if column_name in present:
+            return table.column(column_name).to_pylist()
+        return [None] * row_count
+
+    facturas = column("numero_factura", "Factura")
+    ruts = column("cliente_rut", "Rut")
+    nombres = column("cliente_nombre", "Nombre")
+    solicitantes = column("solicitante", "Solicitante")
+    referencias = column("factura_referencia", "Factura_Referencia")
+    detalles = column("detalles_items", "DetallesFactura")
+
+    pdf_column_names = [field_mapping.get(name, name) for name in PDF_FIELDS]
+    pdf_columns = [
+        (column_name, table.column(column_name).to_pylist())
+        for column_name in pdf_column_names
+        if column_name in present
+    ]
+    raw_rows = table.to_pylist() if include_raw_row else None
+
+    invoices = []
+    for i in range(row_count):
+        metadata: Dict[str, Any] = {"source": "bigquery"}
+        if raw_rows is not None:
+            metadata["raw_row"] = raw_rows[i]
+        invoices.append(
+            Invoice(
+                factura=facturas[i],
+                rut=ruts[i],
+                nombre=nombres[i],
+                solicitante=solicitantes[i],
+                factura_referencia=referencias[i],
+                detalles_factura=detalles[i],
+                pdf_paths={key: values[i] for key, values in pdf_columns if values[i]},
+                metadata=metadata,
+            )
+        )
+    return invoices
+
+
+def summarize_invoices(
+    table: "pyarrow.Table",
+    field_mapping: Dict[str, str],
+    top_customers: Optional[int] = 10,
+) -> Dict[str, Any]:
+    """
+    Aggregate an invoice table without converting rows
+
+    Args:
+        table: Result table with at least the invoice number and RUT columns
+        field_mapping: gasco.field_mapping (generic name -> column)
+        top_customers: Number of customers to list by invoice count
+            (None = all)
+
+    Returns:
+        Dictionary with total_invoices, distinct_customers,
+        pdfs_available (per PDF column) and top_customers
+        ([{rut, invoices}], most invoices first)
+    """
+    require_arrow()
+    number_field = field_mapping.get("numero_factura", "Factura")
+    rut_field = field_mapping.get("cliente_rut", "Rut")
+    present = set(table.column_names)
+
+    pdfs_available = {}
+    for name in PDF_FIELDS:
+        column_name = field_mapping.get(name, name)
+        if column_name in present:
+            # Nulls are skipped by sum; empty paths count as missing
+            has_pdf = pc.greater(pc.utf8_length(table.column(column_name)), 0)
+            pdfs_available[column_name] = pc.sum(has_pdf).as_py() or 0
+
+    per_customer = (
+        table.group_by(rut_field)
+        .aggregate([(number_field, "count")])
+        .sort_by([(f"{number_field}_count", "descending")])
+    )
+    if top_customers is not None:
+        per_customer = per_customer.slice(0, top_customers)
+
+    return {
+        "total_invoices": table.num_rows,
+        "distinct_customers": pc.count_distinct(table.column(rut_field)).as_py(),
+        "pdfs_available": pdfs_available,
+        "top_customers": [
+            {"rut": rut, "invoices": count}
+            for rut, count in zip(
+                per_customer.column(rut_field).to_pylist(),
+                per_customer.column(f"{number_field}_count").to_pylist(),
+            )
+        ],
+    }
@@ -13,6 +13,7 @@ from google.api_core import retry
 from src.core.domain.models import Conversation, ConversationStatus, TokenUsage
 from src.core.domain.interfaces import IConversationRepository
 from src.core.config import ConfigLoader, get_config
+from src.infrastructure.bigquery.single_flight import SingleFlight, fetch_query_rows
 
 
 def _get_query_deadline() -> float:
@@ -43,6 +44,9 @@ class BigQueryConversationRepository(IConversationRepository):
         # Initialize BigQuery client
         self.client = bigquery.Client(project=self.project_id)
 
+        # Identical concurrent reads share one job (None when disabled)
+        self.single_flight = SingleFlight.from_config(config)
+
         print(f"REPO Initialized BigQueryConversationRepository", file=sys.stderr)
         print(f"     - Project: {self.project_id}", file=sys.stderr)
         print(f"     - Table: {self.table_full_path}", file=sys.stderr)
@@ -201,11 +205,10 @@ class BigQueryConversationRepository(IConversationRepository):
         )
 
         try:
-            results = self._execute_query(query, job_config)
-            rows = list(results)
+            rows = self._query_rows(query, job_config)
 
             if rows:
-                return Conversation.from_bigquery_row(self._row_to_dict(rows[0]))
+                return Conversation.from_bigquery_row(rows[0])
             return None
 
         except Exception as e:
@@ -228,10 +231,9 @@ class BigQueryConversationRepository(IConversationRepository):
         )
 
         try:
-            results = self._execute_query(query, job_config)
             return [
-                Conversation.from_bigquery_row(self._row_to_dict(row))
-                for row in results
+                Conversation.from_bigquery_row(row)
+                for row in self._query_rows(query, job_config)
             ]
 
         except Exception as e:
@@ -267,11 +269,10 @@ class BigQueryConversationRepository(IConversationRepository):
         )
 
         try:
-            results = self._execute_query(query, job_config)
-            rows = list(results)
+            rows = self._query_rows(query, job_config)
 
             if rows:
-                stats = self._row_to_dict(rows[0])
+                stats = rows[0]
 
                 # Calculate success rate
                 total = stats.get("total_conversations", 0)
@@ -305,6 +306,14 @@ class BigQueryConversationRepository(IConversationRepository):
         query_job = self.client.query(query, job_config=job_config)
         return query_job.result()
 
+    def _query_rows(
+        self, query: str, job_config: Optional[bigquery.QueryJobConfig] = None
+    ) -> List[Dict[str, Any]]:
+        """Rows of a read query as dicts (identical concurrent reads share one job)"""
+        return fetch_query_rows(
+            self.single_flight, query, job_config, self._execute_query, self._row_to_dict
+        )
+
     def _row_to_dict(self, row) -> Dict[str, Any]:
         """Convert BigQuery Row to dictionary"""
         return dict(row.items())
@@ -2,17 +2,87 @@
 BigQuery Invoice Repository Implementation
 ===========================================
 Concrete implementation of IInvoiceRepository using Google BigQuery.
+
+Finders read the columns of a projection profile instead of ``SELECT *``.
+BigQuery bills and transfers by column, and ``DetallesFactura`` (line
+items) is by far the widest one, so ZIP building and listings skip it.
+Profiles list gasco.field_mapping names; the FULL profile keeps ``*``.
+
+With bigquery.result_cache.enabled, result rows are served from a
+read-through cache (see QueryResultCache) that is dropped whenever the
+table's modification time changes. Below the cache, identical concurrent
+queries share one job (see SingleFlight).
+
+The iter_* finders stream instead: they bypass the cache, fetch
+bigquery.pagination.page_size rows per page and take an ``after_factura``
+keyset cursor, so the next page is a new query that starts below the last
+invoice number seen rather than an OFFSET re-scan.
+
+For bulk reads (statistics, monthly exports) the *_bulk / arrow methods
+download the result as Arrow record batches (see arrow_results) and
+convert or aggregate it column by column. They need pyarrow.
+
+Configuration (config.yaml):
+    bigquery:
+      projection:
+        profiles:                   # Override the default column lists
+          zip: [numero_factura, cliente_rut, ...]
+      result_cache:
+        enabled: true
+      pagination:
+        page_size: 500
+      arrow:
+        use_storage_api: true
 """
 
 import sys
-from typing import List, Optional, Dict, Any
+import threading
+import time
+from typing import TYPE_CHECKING, Iterator, List, Optional, Dict, Any
 from datetime import date
 from google.cloud import bigquery
 from google.api_core import retry
 
 from src.core.domain.models import Invoice
-from src.core.domain.interfaces import IInvoiceRepository
+from src.core.domain.interfaces import IInvoiceRepository, InvoiceProjection
 from src.core.config import ConfigLoader, get_config
+from src.domain.interfaces.metrics_collector import IMetricsCollector
+from src.infrastructure.bigquery.arrow_results import (
+    ARROW_AVAILABLE,
+    invoices_from_arrow,
+    query_job_to_arrow,
+    summarize_invoices,
+)
+from src.infrastructure.bigquery.single_flight import SingleFlight, fetch_query_rows
+from src.infrastructure.cache.query_result_cache import (
+    QueryResultCache,
+    query_cache_key,
+)
+
+if TYPE_CHECKING:
+    import pyarrow
+
+_PDF_FIELDS = [
+    "pdf_tributaria_cf",
+    "pdf_cedible_cf",
+    "pdf_tributaria_sf",
+    "pdf_cedible_sf",
+    "pdf_termico",
+]
+
+# gasco.field_mapping names read by each profile (FULL reads every column)
+DEFAULT_PROJECTION_PROFILES: Dict[str, List[str]] = {
+    InvoiceProjection.ZIP: ["numero_factura", "cliente_rut", "cliente_nombre"]
+    + _PDF_FIELDS,
+    InvoiceProjection.LISTING: [
+        "numero_factura",
+        "solicitante",
+        "factura_referencia",
+        "cliente_rut",
+        "cliente_nombre",
+    ]
+    + _PDF_FIELDS,
+}
 
 
 def _get_query_deadline() -> float:
@@ -28,12 +98,17 @@ class BigQueryInvoiceRepository(IInvoiceRepository):
     using read-only credentials.
     """
 
-    def __init__(self, config: ConfigLoader):
+    def __init__(
+        self,
+        config: ConfigLoader,
+        metrics_collector: Optional[IMetricsCollector] = None,
+    ):
         """
         Initialize BigQuery repository
 
         Args:
             config: Configuration loader instance
+            metrics_collector: Optional collector for result cache counters
         """
         self.config = config
 
@@ -44,6 +119,20 @@ class BigQueryInvoiceRepository(IInvoiceRepository):
         # Get field mapping for Gasco table
         self.field_mapping = config.get("gasco.field_mapping", {})
 
+        # Identical concurrent queries share one job (None when disabled)
+        self.single_flight = SingleFlight.from_config(
+            config, metrics_collector=metrics_collector
+        )
+
+        # Read-through cache of result rows (None when disabled)
+        self.result_cache = QueryResultCache.from_config(
+            config, self._get_table_modified, metrics_collector=metrics_collector
+        )
+
+        # Bytes processed per projection profile (see get_projection_stats)
+        self._projection_stats: Dict[str, Dict[str, int]] = {}
+        self._stats_lock = threading.Lock()
+
         # Initialize BigQuery client (uses Application Default Credentials)
         self.client = bigquery.Client(project=self.project_id)
 
@@ -51,30 +140,29 @@ class BigQueryInvoiceRepository(IInvoiceRepository):
         print(f"     - Project: {self.project_id}", file=sys.stderr)
         print(f"     - Table: {self.table_full_path}", file=sys.stderr)
 
-    def find_by_invoice_number(self, invoice_number: str) -> Optional[Invoice]:
+    def find_by_invoice_number(
+        self, invoice_number: str, projection: Optional[str] = None
+    ) -> Optional[Invoice]:
         """Find invoice by invoice number (Factura)"""
+        projection = projection or InvoiceProjection.FULL
         query = f"""
-            SELECT *
+            SELECT {self._select_list(projection)}
             FROM `{self.table_full_path}`
             WHERE {self.field_mapping['numero_factura']} = @invoice_number
             LIMIT 1
         """
 
-        job_config = bigquery.QueryJobConfig(
-            query_parameters=[
-                bigquery.ScalarQueryParameter(
-                    "invoice_number", "STRING", invoice_number
-                )
-            ]
+        job_config = self._job_config(
+            projection,
+            [bigquery.ScalarQueryParameter("invoice_number", "STRING", invoice_number)],
         )
 
         try:
-            results = self._execute_query(query, job_config)
-            rows = list(results)
+            rows = self._query_rows(query, job_config)
 
             if rows:
                 return Invoice.from_bigquery_row(
-                    self._row_to_dict(rows[0]), field_mapping=self.field_mapping
+                    rows[0], field_mapping=self.field_mapping
                 )
             return None
 
@@ -85,29 +173,83 @@ class BigQueryInvoiceRepository(IInvoiceRepository):
             )
             raise
 
-    def find_by_rut(self, rut: str, limit: Optional[int] = None) -> List[Invoice]:
+    def find_by_invoice_numbers(
+        self, invoice_numbers: List[str], projection: Optional[str] = None
+    ) -> List[Invoice]:
+        """
+        Find several invoices with one query per chunk of numbers
+
+        Uses ``IN UNNEST(@numbers)`` with chunks of
+        bigquery.batch_lookup.chunk_size numbers, instead of one query per
+        invoice.
+        """
+        numbers = list(dict.fromkeys(str(n) for n in invoice_numbers if n))
+        if not numbers:
+            return []
+        projection = projection or InvoiceProjection.FULL
+
+        chunk_size = max(1, int(self.config.get("bigquery.batch_lookup.chunk_size", 1000)))
+        number_field = self.field_mapping["numero_factura"]
+        query = f"""
+            SELECT {self._select_list(projection)}
+            FROM `{self.table_full_path}`
+            WHERE {number_field} IN UNNEST(@invoice_numbers)
+        """
+
+        found: Dict[str, Invoice] = {}
+        try:
+            for start in range(0, len(numbers), chunk_size):
+                chunk = numbers[start : start + chunk_size]
+                job_config = self._job_config(
+                    projection,
+                    [bigquery.ArrayQueryParameter("invoice_numbers", "STRING", chunk)],
+                )
+                for row_dict in self._query_rows(query, job_config):
+                    # First row wins, like LIMIT 1 in find_by_invoice_number
+                    found.setdefault(
+                        str(row_dict.get(number_field)),
+                        Invoice.from_bigquery_row(
+                            row_dict, field_mapping=self.field_mapping
+                        ),
+                    )
+
+        except Exception as e:
+            print(
+                f"ERROR Finding {len(numbers)} invoices by number: {e}",
+                file=sys.stderr,
+            )
+            raise
+
+        print(
+            f"REPO Batch lookup: {len(found)}/{len(numbers)} invoices found "
+            f"in {-(-len(numbers) // chunk_size)} queries",
+            file=sys.stderr,
+        )
+        return [found[number] for number in numbers if number in found]
+
+    def find_by_rut(
+        self, rut: str, limit: Optional[int] = None, projection: Optional[str] = None
+    ) -> List[Invoice]:
         """Find invoices by customer RUT"""
         limit_clause = f"LIMIT {limit}" if limit else ""
+        projection = projection or InvoiceProjection.FULL
 
         query = f"""
-            SELECT *
+            SELECT {self._select_list(projection)}
             FROM `{self.table_full_path}`
             WHERE {self.field_mapping['cliente_rut']} = @rut
             ORDER BY {self.field_mapping['numero_factura']} DESC
             {limit_clause}
         """
 
-        job_config = bigquery.QueryJobConfig(
-            query_parameters=[bigquery.ScalarQueryParameter("rut", "STRING", rut)]
+        job_config = self._job_config(
+            projection, [bigquery.ScalarQueryParameter("rut", "STRING", rut)]
         )
 
         try:
-            results = self._execute_query(query, job_config)
             return [
-                Invoice.from_bigquery_row(
-                    self._row_to_dict(row), field_mapping=self.field_mapping
-                )
-                for row in results
+                Invoice.from_bigquery_row(row, field_mapping=self.field_mapping)
+                for row in self._query_rows(query, job_config)
             ]
 
         except Exception as e:
@@ -115,32 +257,32 @@ class BigQueryInvoiceRepository(IInvoiceRepository):
             raise
 
     def find_by_solicitante(
-        self, solicitante: str, limit: Optional[int] = None
+        self,
+        solicitante: str,
+        limit: Optional[int] = None,
+        projection: Optional[str] = None,
     ) -> List[Invoice]:
         """Find invoices by solicitante code"""
         limit_clause = f"LIMIT {limit}" if limit else ""
+        projection = projection or InvoiceProjection.FULL
 
         query = f"""
-            SELECT *
+            SELECT {self._select_list(projection)}
             FROM `{self.table_full_path}`
             WHERE {self.field_mapping['solicitante']} = @solicitante
             ORDER BY {self.field_mapping['numero_factura']} DESC
             {limit_clause}
         """
 
-        job_config = bigquery.QueryJobConfig(
-            query_parameters=[
-                bigquery.ScalarQueryParameter("solicitante", "STRING", solicitante)
-            ]
+        job_config = self._job_config(
+            projection,
+            [bigquery.ScalarQueryParameter("solicitante", "STRING", solicitante)],
         )
 
         try:
-            results = self._execute_query(query, job_config)
             return [
-                Invoice.from_bigquery_row(
-                    self._row_to_dict(row), field_mapping=self.field_mapping
-                )
-                for row in results
+                Invoice.from_bigquery_row(row, field_mapping=self.field_mapping)
+                for row in self._query_rows(query, job_config)
             ]
 
         except Exception as e:
@@ -151,9 +293,103 @@ class BigQueryInvoiceRepository(IInvoiceRepository):
             raise
 
     def find_by_date_range(
-        self, start_date: date, end_date: date, rut: Optional[str] = None
+        self,
+        start_date: date,
+        end_date: date,
+        rut: Optional[str] = None,
+        projection: Optional[str] = None,
     ) -> List[Invoice]:
         """Find invoices by date range"""
+        query, job_config = self._date_range_query(start_date, end_date, rut, projection)
+
+        try:
+            return [
+                Invoice.from_bigquery_row(row, field_mapping=self.field_mapping)
+                for row in self._query_rows(query, job_config)
+            ]
+
+        except Exception as e:
+            print(f"ERROR Finding invoices by date range: {e}", file=sys.stderr)
+            raise
+
+    def fetch_arrow_by_date_range(
+        self,
+        start_date: date,
+        end_date: date,
+        rut: Optional[str] = None,
+        projection: Optional[str] = None,
+    ) -> "pyarrow.Table":
+        """
+        Invoices of a date range as an Arrow table (columnar, not cached)
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        query, job_config = self._date_range_query(start_date, end_date, rut, projection)
+
+        try:
+            return self._execute_arrow_query(query, job_config)
+
+        except Exception as e:
+            print(f"ERROR Fetching invoices by date range as Arrow: {e}", file=sys.stderr)
+            raise
+
+    def find_by_date_range_bulk(
+        self,
+        start_date: date,
+        end_date: date,
+        rut: Optional[str] = None,
+        projection: Optional[str] = None,
+    ) -> List[Invoice]:
+        """
+        Same result as find_by_date_range(), converted column by column
+
+        For large ranges (exports). Falls back to find_by_date_range() when
+        pyarrow is not installed.
+        """
+        if not ARROW_AVAILABLE:
+            print(
+                "REPO WARN pyarrow not installed, bulk read uses the row iterator",
+                file=sys.stderr,
+            )
+            return self.find_by_date_range(start_date, end_date, rut, projection)
+
+        table = self.fetch_arrow_by_date_range(start_date, end_date, rut, projection)
+        return invoices_from_arrow(table, self.field_mapping)
+
+    def get_date_range_summary(
+        self,
+        start_date: date,
+        end_date: date,
+        rut: Optional[str] = None,
+        top_customers: Optional[int] = 10,
+    ) -> Dict[str, Any]:
+        """
+        Invoice statistics of a date range, aggregated in Arrow
+
+        Reads the LISTING profile and never builds Invoice objects.
+
+        Returns:
+            total_invoices, distinct_customers, pdfs_available, top_customers
+            (see arrow_results.summarize_invoices)
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        table = self.fetch_arrow_by_date_range(
+            start_date, end_date, rut, projection=InvoiceProjection.LISTING
+        )
+        return summarize_invoices(table, self.field_mapping, top_customers)
+
+    def _date_range_query(
+        self,
+        start_date: date,
+        end_date: date,
+        rut: Optional[str],
+        projection: Optional[str],
+    ):
+        """Query and job config of find_by_date_range()"""
+        projection = projection or InvoiceProjection.FULL
         rut_filter = ""
         query_params = [
             bigquery.ScalarQueryParameter("start_date", "DATE", start_date),
@@ -166,39 +402,110 @@ class BigQueryInvoiceRepository(IInvoiceRepository):
 
         # Note: Assuming there's a date field in the table (adjust field name if needed)
         query = f"""
-            SELECT *
+            SELECT {self._select_list(projection)}
             FROM `{self.table_full_path}`
             WHERE fecha_emision BETWEEN @start_date AND @end_date
             {rut_filter}
             ORDER BY fecha_emision DESC
         """
 
-        job_config = bigquery.QueryJobConfig(query_parameters=query_params)
+        return query, self._job_config(projection, query_params)
+
+    def iter_by_rut(
+        self,
+        rut: str,
+        after_factura: Optional[str] = None,
+        limit: Optional[int] = None,
+        page_size: Optional[int] = None,
+        projection: Optional[str] = None,
+    ) -> Iterator[Invoice]:
+        """Stream invoices by customer RUT, one page at a time"""
+        try:
+            yield from self._iter_invoices(
+                f"{self.field_mapping['cliente_rut']} = @rut",
+                [bigquery.ScalarQueryParameter("rut", "STRING", rut)],
+                after_factura,
+                limit,
+                page_size,
+                projection,
+            )
 
+        except Exception as e:
+            print(f"ERROR Streaming invoices by RUT {rut}: {e}", file=sys.stderr)
+            raise
+
+    def iter_by_solicitante(
+        self,
+        solicitante: str,
+        after_factura: Optional[str] = None,
+        limit: Optional[int] = None,
+        page_size: Optional[int] = None,
+        projection: Optional[str] = None,
+    ) -> Iterator[Invoice]:
+        """Stream invoices by solicitante code, one page at a time"""
         try:
-            results = self._execute_query(query, job_config)
-            return [
-                Invoice.from_bigquery_row(
-                    self._row_to_dict(row), field_mapping=self.field_mapping
-                )
-                for row in results
-            ]
+            yield from self._iter_invoices(
+                f"{self.field_mapping['solicitante']} = @solicitante",
+                [bigquery.ScalarQueryParameter("solicitante", "STRING", solicitante)],
+                after_factura,
+                limit,
+                page_size,
+                projection,
+            )
 
         except Exception as e:
-            print(f"ERROR Finding invoices by date range: {e}", file=sys.stderr)
+            print(
+                f"ERROR Streaming invoices by solicitante {solicitante}: {e}",
+                file=sys.stderr,
+            )
             raise
 
-    def search(self, query_text: str, limit: Optional[int] = None) -> List[Invoice]:
+    def iter_by_date_range(
+        self,
+        start_date: date,
+        end_date: date,
+        rut: Optional[str] = None,
+        after_factura: Optional[str] = None,
+        limit: Optional[int] = None,
+        page_size: Optional[int] = None,
+        projection: Optional[str] = None,
+    ) -> Iterator[Invoice]:
+        """Stream invoices by date range, one page at a time"""
+        condition = "fecha_emision BETWEEN @start_date AND @end_date"
+        query_params = [
+            bigquery.ScalarQueryParameter("start_date", "DATE", start_date),
+            bigquery.ScalarQueryParameter("end_date", "DATE", end_date),
+        ]
+        if rut:
+            condition += f" AND {self.field_mapping['cliente_rut']} = @rut"
+            query_params.append(bigquery.ScalarQueryParameter("rut", "STRING", rut))
+
+        try:
+            yield from self._iter_invoices(
+                condition, query_params, after_factura, limit, page_size, projection
+            )
+
+        except Exception as e:
+            print(f"ERROR Streaming invoices by date range: {e}", file=sys.stderr)
+            raise
+
+    def search(
+        self,
+        query_text: str,
+        limit: Optional[int] = None,
+        projection: Optional[str] = None,
+    ) -> List[Invoice]:
         """
         Search invoices by query (searches across multiple fields)
 
         Searches in: invoice number, RUT, customer name, solicitante
         """
         limit_clause = f"LIMIT {limit}" if limit else ""
+        projection = projection or InvoiceProjection.FULL
 
         # Build search condition (case-insensitive partial match)
         query = f"""
-            SELECT *
+            SELECT {self._select_list(projection)}
             FROM `{self.table_full_path}`
             WHERE (
                 LOWER({self.field_mapping['numero_factura']}) LIKE @search_pattern
@@ -211,21 +518,15 @@ class BigQueryInvoiceRepository(IInvoiceRepository):
         """
 
         search_pattern = f"%{query_text.lower()}%"
-        job_config = bigquery.QueryJobConfig(
-            query_parameters=[
-                bigquery.ScalarQueryParameter(
-                    "search_pattern", "STRING", search_pattern
-                )
-            ]
+        job_config = self._job_config(
+            projection,
+            [bigquery.ScalarQueryParameter("search_pattern", "STRING", search_pattern)],
         )
 
         try:
-            results = self._execute_query(query, job_config)
             return [
-                Invoice.from_bigquery_row(
-                    self._row_to_dict(row), field_mapping=self.field_mapping
-                )
-                for row in results
+                Invoice.from_bigquery_row(row, field_mapping=self.field_mapping)
+                for row in self._query_rows(query, job_config)
             ]
 
         except Exception as e:
@@ -235,22 +536,212 @@ class BigQueryInvoiceRepository(IInvoiceRepository):
             )
             raise
 
+    def _query_rows(
+        self, query: str, job_config: Optional[bigquery.QueryJobConfig] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Rows of a query as dicts, through the result cache when enabled
+
+        Misses go through single-flight, so callers racing on an expired
+        entry share one BigQuery job.
+
+        Args:
+            query: SQL query
+            job_config: Query configuration (parameters, projection label)
+
+        Returns:
+            List of row dictionaries
+        """
+
+        def load() -> List[Dict[str, Any]]:
+            return fetch_query_rows(
+                self.single_flight, query, job_config, self._execute_query, self._row_to_dict
+            )
+
+        if self.result_cache is None:
+            return load()
+        projection = (job_config.labels or {}).get("projection") if job_config else None
+        return self.result_cache.get_or_load(
+            query_cache_key(query, job_config, projection), load
+        )
+
+    def _iter_invoices(
+        self,
+        condition: str,
+        query_params: List[Any],
+        after_factura: Optional[str],
+        limit: Optional[int],
+        page_size: Optional[int],
+        projection: Optional[str],
+    ) -> Iterator[Invoice]:
+        """
+        Invoices matching ``condition`` by descending invoice number, page by page
+
+        The query runs when the first invoice is requested. Rows are read
+        through the job's page iterator and converted as they arrive, so
+        only the current page is held in memory and no result cache is used.
+
+        Args:
+            condition: SQL WHERE condition using named parameters
+            query_params: Parameters referenced by condition
+            after_factura: Keyset cursor (only invoice numbers below it)
+            limit: Maximum number of results
+            page_size: Rows per page (default: bigquery.pagination.page_size)
+            projection: InvoiceProjection profile (default: FULL)
+        """
+        projection = projection or InvoiceProjection.FULL
+        page_size = page_size or int(self.config.get("bigquery.pagination.page_size", 500))
+        number_field = self.field_mapping["numero_factura"]
+
+        query_params = list(query_params)
+        if after_factura is not None:
+            condition = f"({condition}) AND {number_field} < @after_factura"
+            query_params.append(
+                bigquery.ScalarQueryParameter("after_factura", "STRING", after_factura)
+            )
+        limit_clause = f"LIMIT {int(limit)}" if limit else ""
+
+        query = f"""
+            SELECT {self._select_list(projection)}
+            FROM `{self.table_full_path}`
+            WHERE {condition}
+            ORDER BY {number_field} DESC
+            {limit_clause}
+        """
+
+        job_config = self._job_config(projection, query_params)
+        for row in self._execute_query(query, job_config, page_size=page_size):
+            yield Invoice.from_bigquery_row(
+                self._row_to_dict(row), field_mapping=self.field_mapping
+            )
+
+    def _get_table_modified(self):
+        """Last modification time of the invoice table (result cache freshness)"""
+        return self.client.get_table(self.table_full_path).modified
+
     @retry.Retry(predicate=retry.if_transient_error, deadline=_get_query_deadline())
     def _execute_query(
-        self, query: str, job_config: Optional[bigquery.QueryJobConfig] = None
+        self,
+        query: str,
+        job_config: Optional[bigquery.QueryJobConfig] = None,
+        page_size: Optional[int] = None,
     ):
         """
         Execute BigQuery query with retry on transient errors
 
+        Args:
+            query: SQL query
+            job_config: Query configuration
+            page_size: Rows per result page (None = BigQuery default)
+
+        Returns:
+            Query results iterator (fetches further pages as it is consumed)
+        """
+        start = time.time()
+        query_job = self.client.query(query, job_config=job_config)
+        results = query_job.result(page_size=page_size)
+        self._record_job_stats(query_job, job_config, start)
+        return results
+
+    @retry.Retry(predicate=retry.if_transient_error, deadline=_get_query_deadline())
+    def _execute_arrow_query(
+        self, query: str, job_config: Optional[bigquery.QueryJobConfig] = None
+    ) -> "pyarrow.Table":
+        """
+        Execute BigQuery query and download the results as Arrow
+
         Args:
             query: SQL query
             job_config: Query configuration
 
         Returns:
-            Query results iterator
+            pyarrow.Table (Storage Read API when available, else REST)
         """
+        start = time.time()
         query_job = self.client.query(query, job_config=job_config)
-        return query_job.result()
+        query_job.result()
+        table = query_job_to_arrow(
+            query_job,
+            use_storage_api=bool(self.config.get("bigquery.arrow.use_storage_api", True)),
+        )
+        self._record_job_stats(query_job, job_config, start)
+        return table
+
+    def _record_job_stats(
+        self,
+        query_job,
+        job_config: Optional[bigquery.QueryJobConfig],
+        start: float,
+    ) -> None:
+        projection = (job_config.labels or {}).get("projection") if job_config else None
+        if projection:
+            self._record_projection_stats(
+                projection,
+                query_job.total_bytes_processed or 0,
+                int((time.time() - start) * 1000),
+            )
+
+    def get_projection_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Bytes processed per projection profile since startup
+
+        Returns:
+            Profile -> {queries, bytes_processed, avg_bytes_per_query,
+            total_ms, avg_ms}
+        """
+        with self._stats_lock:
+            return {
+                projection: {
+                    **stats,
+                    "avg_bytes_per_query": stats["bytes_processed"] // stats["queries"],
+                    "avg_ms": stats["total_ms"] // stats["queries"],
+                }
+                for projection, stats in self._projection_stats.items()
+            }
+
+    def _record_projection_stats(
+        self, projection: str, bytes_processed: int, elapsed_ms: int
+    ) -> None:
+        with self._stats_lock:
+            stats = self._projection_stats.setdefault(
+                projection, {"queries": 0, "bytes_processed": 0, "total_ms": 0}
+            )
+            stats["queries"] += 1
+            stats["bytes_processed"] += bytes_processed
+            stats["total_ms"] += elapsed_ms
+        print(
+            f"REPO Query [{projection}]: {bytes_processed / (1024 * 1024):.2f} MB "
+            f"processed in {elapsed_ms}ms",
+            file=sys.stderr,
+        )
+
+    def _select_list(self, projection: str) -> str:
+        """
+        SELECT list of a projection profile
+
+        Raises:
+            ValueError: If the profile is unknown
+        """
+        if projection == InvoiceProjection.FULL:
+            return "*"
+        fields = self.config.get(
+            f"bigquery.projection.profiles.{projection}",
+            DEFAULT_PROJECTION_PROFILES.get(projection),
+        )
+        if not fields:
+            raise ValueError(f"Unknown invoice projection: {projection}")
+        # Unmapped names are skipped, like from_bigquery_row falls back to None
+        columns = [self.field_mapping[name] for name in fields if name in self.field_mapping]
+        return ", ".join(dict.fromkeys(columns)) or "*"
+
+    @staticmethod
+    def _job_config(
+        projection: str, query_parameters: List[Any]
+    ) -> bigquery.QueryJobConfig:
+        """Query config labelled with its projection (shows in INFORMATION_SCHEMA.JOBS)"""
+        return bigquery.QueryJobConfig(
+            query_parameters=query_parameters, labels={"projection": projection}
+        )
 
     def _row_to_dict(self, row) -> Dict[str, Any]:
         """
@@ -0,0 +1,190 @@
+"""
+Single-Flight Query Coalescing
+==============================
+Concurrent callers running the same read query share one BigQuery job.
+
+When several sessions ask about the same month or RUT at once (or a cached
+result expires under load) each of them used to submit an identical job.
+Here the first caller for a key (the leader) runs the query; callers that
+arrive while it is in flight wait for and share its result.
+
+Semantics:
+- Only in-flight calls are shared: once the leader finishes, the next
+  caller runs a new query (caching is QueryResultCache's job, above this)
+- An error is raised to the leader and every waiter; it is not remembered
+- A waiter that gives up (wait_timeout_seconds) only stops waiting: the
+  leader's job keeps running and still serves the other waiters
+- Writes (INSERT/UPDATE/DELETE) must not go through here
+
+Configuration (config.yaml):
+    bigquery:
+      single_flight:
+        enabled: true
+        wait_timeout_seconds: 120   # Waiter gives up after this (0 = no limit)
+"""
+
+import concurrent.futures
+import sys
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, TypeVar
+
+from src.core.config import ConfigLoader
+from src.domain.interfaces.metrics_collector import IMetricsCollector
+from src.infrastructure.cache.query_result_cache import query_cache_key
+
+T = TypeVar("T")
+
+CACHE_NAME = "bigquery_single_flight"
+
+
+class SingleFlight:
+    """
+    Runs one call per key at a time and shares its outcome
+
+    Results are shared objects: return immutable values (e.g. tuples of
+    row dicts that callers copy) so one waiter cannot change another's.
+
+    Example:
+        >>> flights = SingleFlight()
+        >>> rows = flights.do(key, lambda: tuple(run_query()))
+    """
+
+    def __init__(
+        self,
+        wait_timeout_seconds: Optional[float] = None,
+        metrics_collector: Optional[IMetricsCollector] = None,
+    ):
+        """
+        Initialize single-flight group
+
+        Args:
+            wait_timeout_seconds: How long a waiter waits for the leader
+                (None = until it finishes)
+            metrics_collector: Optional collector for leader/shared counters
+        """
+        self.wait_timeout_seconds = wait_timeout_seconds
+        self.metrics = metrics_collector
+
+        self._in_flight: Dict[Hashable, concurrent.futures.Future] = {}
+        self._lock = Lock()
+
+        self._executions = 0
+        self._shared = 0
+        self._timeouts = 0
+
+    @classmethod
+    def from_config(
+        cls,
+        config: ConfigLoader,
+        metrics_collector: Optional[IMetricsCollector] = None,
+    ) -> Optional["SingleFlight"]:
+        """Build from bigquery.single_flight (None when disabled)"""
+        if not config.get("bigquery.single_flight.enabled", True):
+            return None
+        timeout = float(config.get("bigquery.single_flight.wait_timeout_seconds", 120))
+        return cls(
+            wait_timeout_seconds=timeout if timeout > 0 else None,
+            metrics_collector=metrics_collector,
+        )
+
+    def _record(self, event: str) -> None:
+        if self.metrics is not None:
+            self.metrics.record_cache_event(CACHE_NAME, event)
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """
+        Run ``fn`` for ``key`` unless an identical call is in flight
+
+        Args:
+            key: Identity of the call (e.g. SQL + parameters)
+            fn: The call; runs in the leader's thread
+
+        Returns:
+            The leader's result
+
+        Raises:
+            Exception: The leader's error (raised to every caller)
+            concurrent.futures.TimeoutError: If a waiter gave up
+        """
+        with self._lock:
+            flight = self._in_flight.get(key)
+            is_leader = flight is None
+            if is_leader:
+                flight = concurrent.futures.Future()
+                self._in_flight[key] = flight
+                self._executions += 1
+            else:
+                self._shared += 1
+
+        if not is_leader:
+            self._record("shared")
+            try:
+                return flight.result(timeout=self.wait_timeout_seconds)
+            except concurrent.futures.TimeoutError:
+                with self._lock:
+                    self._timeouts += 1
+                print(
+                    f"REPO WARN Gave up waiting {self.wait_timeout_seconds:.0f}s "
+                    f"for an identical in-flight query",
+                    file=sys.stderr,
+                )
+                raise
+
+        self._record("leader")
+        try:
+            result = fn()
+        except BaseException as e:
+            # Waiters must never hang, whatever stopped the leader
+            self._finish(key)
+            flight.set_exception(e)
+            raise
+        self._finish(key)
+        flight.set_result(result)
+        return result
+
+    def _finish(self, key: Hashable) -> None:
+        # Callers arriving from now on start a new flight
+        with self._lock:
+            self._in_flight.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get coalescing statistics"""
+        with self._lock:
+            calls = self._executions + self._shared
+            return {
+                "in_flight": len(self._in_flight),
+                "executions": self._executions,
+                "shared": self._shared,
+                "timeouts": self._timeouts,
+                "shared_ratio": round(self._shared / calls, 4) if calls else 0.0,
+            }
+
+
+def fetch_query_rows(
+    single_flight: Optional[SingleFlight],
+    query: str,
+    job_config,
+    execute: Callable[..., Any],
+    row_to_dict: Callable[[Any], Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """
+    Rows of a read query as dicts, sharing identical in-flight queries
+
+    Args:
+        single_flight: Coalescing group (None = always run the query)
+        query: SQL query
+        job_config: QueryJobConfig with the query parameters
+        execute: Runs (query, job_config) and returns an iterable of rows
+        row_to_dict: Converts one row
+
+    Returns:
+        Row dicts owned by the caller
+    """
+
+    def run() -> Tuple[Dict[str, Any], ...]:
+        return tuple(row_to_dict(row) for row in execute(query, job_config))
+
+    if single_flight is None:
+        return list(run())
+    rows = single_flight.do(query_cache_key(query, job_config), run)
+    return [dict(row) for row in rows]
@@ -13,6 +13,7 @@ from google.api_core import retry
 from src.core.domain.models import ZipPackage, ZipStatus
 from src.core.domain.interfaces import IZipRepository
 from src.core.config import ConfigLoader, get_config
+from src.infrastructure.bigquery.single_flight import SingleFlight, fetch_query_rows
 
 
 def _get_query_deadline() -> float:
@@ -43,6 +44,9 @@ class BigQueryZipRepository(IZipRepository):
         # Initialize BigQuery client
         self.client = bigquery.Client(project=self.project_id)
 
+        # Identical concurrent reads share one job (None when disabled)
+        self.single_flight = SingleFlight.from_config(config)
+
         print(f"REPO Initialized BigQueryZipRepository", file=sys.stderr)
         print(f"     - Project: {self.project_id}", file=sys.stderr)
         print(f"     - Table: {self.table_full_path}", file=sys.stderr)
@@ -71,6 +75,7 @@ class BigQueryZipRepository(IZipRepository):
             "expires_at": expires_iso,
             "count": zip_package.pdf_count,
             "error_message": zip_package.error_message,
+            "fingerprint": self._package_fingerprint(zip_package),
         }
 
         job_config = bigquery.QueryJobConfig(
@@ -136,6 +141,7 @@ class BigQueryZipRepository(IZipRepository):
             "expires_at": expires_iso,
             "count": zip_package.pdf_count,
             "error_message": zip_package.error_message,
+            "fingerprint": self._package_fingerprint(zip_package),
         }
 
         job_config = bigquery.QueryJobConfig(
@@ -185,11 +191,10 @@ class BigQueryZipRepository(IZipRepository):
         )
 
         try:
-            results = self._execute_query(query, job_config)
-            rows = list(results)
+            rows = self._query_rows(query, job_config)
 
             if rows:
-                return ZipPackage.from_bigquery_row(self._row_to_dict(rows[0]))
+                return ZipPackage.from_bigquery_row(rows[0])
             return None
 
         except Exception as e:
@@ -210,9 +215,9 @@ class BigQueryZipRepository(IZipRepository):
         )
 
         try:
-            results = self._execute_query(query, job_config)
             return [
-                ZipPackage.from_bigquery_row(self._row_to_dict(row)) for row in results
+                ZipPackage.from_bigquery_row(row)
+                for row in self._query_rows(query, job_config)
             ]
 
         except Exception as e:
@@ -250,6 +255,59 @@ class BigQueryZipRepository(IZipRepository):
             print(f"ERROR Deleting expired ZIP packages: {e}", file=sys.stderr)
             raise
 
+    def find_ready_by_fingerprint(self, fingerprint: str) -> Optional[ZipPackage]:
+        """Find the newest ready, non-expired package with this fingerprint"""
+        now = datetime.now(timezone.utc)
+        # Packages older than the configured lifetime are expired anyway;
+        # bounding created_at keeps the scan small
+        max_age_days = int(self.config.get("pdf.zip.expiration_days", 7))
+
+        query = f"""
+            SELECT *
+            FROM `{self.table_full_path}`
+            WHERE JSON_VALUE(metadata, '$.fingerprint') = @fingerprint
+              AND status = @status
+              AND gcs_path IS NOT NULL
+              AND created_at >= @since
+              AND TIMESTAMP(JSON_VALUE(metadata, '$.expires_at')) > @now
+            ORDER BY created_at DESC
+            LIMIT 1
+        """
+
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[
+                bigquery.ScalarQueryParameter("fingerprint", "STRING", fingerprint),
+                bigquery.ScalarQueryParameter(
+                    "status", "STRING", ZipStatus.READY.value
+                ),
+                bigquery.ScalarQueryParameter(
+                    "since", "TIMESTAMP", now - timedelta(days=max_age_days)
+                ),
+                bigquery.ScalarQueryParameter("now", "TIMESTAMP", now),
+            ]
+        )
+
+        try:
+            rows = list(self._execute_query(query, job_config))
+            if rows:
+                return ZipPackage.from_bigquery_row(self._row_to_dict(rows[0]))
+            return None
+
+        except Exception as e:
+            print(
+                f"ERROR Finding ZIP package by fingerprint {fingerprint[:12]}: {e}",
+                file=sys.stderr,
+            )
+            raise
+
+    @staticmethod
+    def _package_fingerprint(zip_package: ZipPackage) -> Optional[str]:
+        """Fingerprint from new packages or from packages read back from BigQuery"""
+        metadata = zip_package.metadata or {}
+        return metadata.get("fingerprint") or (
+            metadata.get("raw_metadata") or {}
+        ).get("fingerprint")
+
     @retry.Retry(predicate=retry.if_transient_error, deadline=_get_query_deadline())
     def _execute_query(
         self, query: str, job_config: Optional[bigquery.QueryJobConfig] = None
@@ -258,6 +316,14 @@ class BigQueryZipRepository(IZipRepository):
         query_job = self.client.query(query, job_config=job_config)
         return query_job.result()
 
+    def _query_rows(
+        self, query: str, job_config: Optional[bigquery.QueryJobConfig] = None
+    ) -> List[Dict[str, Any]]:
+        """Rows of a read query as dicts (identical concurrent reads share one job)"""
+        return fetch_query_rows(
+            self.single_flight, query, job_config, self._execute_query, self._row_to_dict
+        )
+
     def _row_to_dict(self, row) -> Dict[str, Any]:
         """Convert BigQuery Row to dictionary"""
         return dict(row.items())
@@ -4,6 +4,24 @@ Cache Infrastructure
 Provides caching services for the application.
 """
 
-from .url_cache import URLCache, url_cache
+from .pdf_blob_cache import BlobCacheStats, LocalBlobCache
+from .query_result_cache import QueryResultCache, query_cache_key
+from .url_cache import LazySigningError, URLCache, url_cache
+from .url_cache_backends import (
+    MemoryURLCacheBackend,
+    SQLiteURLCacheBackend,
+    create_url_cache_backend,
+)
 
-__all__ = ["URLCache", "url_cache"]
+__all__ = [
+    "BlobCacheStats",
+    "LocalBlobCache",
+    "QueryResultCache",
+    "query_cache_key",
+    "LazySigningError",
+    "URLCache",
+    "url_cache",
+    "MemoryURLCacheBackend",
+    "SQLiteURLCacheBackend",
+    "create_url_cache_backend",
+]
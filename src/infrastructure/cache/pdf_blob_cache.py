@@ -0,0 +1,276 @@
+"""
+Local PDF Blob Cache
+====================
+On-disk cache of source PDFs used to assemble ZIP packages.
+
+Invoice PDFs are immutable once published and the same documents appear in
+many packages. Entries are keyed by (bucket, blob, generation): GCS assigns
+a new generation whenever an object is overwritten, so a cached file can
+never be served for changed content.
+
+- Size cap with LRU eviction (order kept in memory, seeded from file
+  mtimes at startup; hits touch the file so the order survives restarts)
+- Atomic writes: content goes to a temporary file in the cache directory,
+  is fsynced and then renamed into place, so readers never see a partial
+  file
+- Hits are returned as read-only mmaps, so the ZIP writer reads the PDF
+  straight from the page cache without copying it into the heap
+
+Several processes may share the directory; each keeps its own index, so the
+size cap is enforced per process and a file evicted by another process is
+treated as a miss.
+
+Configuration (config.yaml):
+    pdf:
+      zip:
+        pdf_cache:
+          enabled: false
+          directory: /tmp/pdf_blob_cache
+          max_size_mb: 2048
+"""
+
+import hashlib
+import mmap
+import os
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Union
+
+from src.core.config import ConfigLoader
+
+_TEMP_PREFIX = ".tmp-"
+
+
+@dataclass
+class BlobCacheStats:
+    """Per-package cache accounting (updated from download threads)"""
+
+    hits: int = 0
+    misses: int = 0
+    bytes_saved: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record_hit(self, size: int) -> None:
+        with self._lock:
+            self.hits += 1
+            self.bytes_saved += size
+
+    def record_miss(self) -> None:
+        with self._lock:
+            self.misses += 1
+
+    @property
+    def hit_ratio(self) -> Optional[float]:
+        """Hits / lookups (None before the first lookup)"""
+        lookups = self.hits + self.misses
+        return round(self.hits / lookups, 4) if lookups else None
+
+
+class LocalBlobCache:
+    """
+    Size-capped on-disk cache of GCS objects keyed by generation
+
+    Example:
+        >>> cache = LocalBlobCache("/tmp/pdf_blob_cache", max_bytes=2 << 30)
+        >>> cache.put("bucket", "a.pdf", 1712345678901234, pdf_bytes)
+        >>> data = cache.get("bucket", "a.pdf", 1712345678901234)  # mmap
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        """
+        Initialize cache and index existing files
+
+        Args:
+            directory: Cache directory (created if missing)
+            max_bytes: Total size cap; least recently used files are evicted
+        """
+        self.directory = directory
+        self.max_bytes = int(max_bytes)
+        self._lock = threading.Lock()
+        # cache key -> file size, least recently used first
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+        os.makedirs(directory, exist_ok=True)
+        self._load_index()
+
+        print(
+            f"[PDF_CACHE] {directory}: {len(self._entries)} files, "
+            f"{self._total_bytes / (1024 * 1024):.1f} / "
+            f"{self.max_bytes / (1024 * 1024):.0f} MB",
+            file=sys.stderr,
+        )
+
+    @classmethod
+    def from_config(cls, config: ConfigLoader) -> Optional["LocalBlobCache"]:
+        """Build the cache from pdf.zip.pdf_cache, or None if disabled"""
+        if not config.get("pdf.zip.pdf_cache.enabled", False):
+            return None
+        return cls(
+            directory=config.get("pdf.zip.pdf_cache.directory", "/tmp/pdf_blob_cache"),
+            max_bytes=int(
+                float(config.get("pdf.zip.pdf_cache.max_size_mb", 2048)) * 1024 * 1024
+            ),
+        )
+
+    def get(
+        self, bucket: str, blob_name: str, generation: int
+    ) -> Optional[Union[mmap.mmap, bytes]]:
+        """
+        Look up an object generation
+
+        Returns:
+            Read-only mmap of the cached content (b"" for empty objects), or
+            None on a miss
+        """
+        key = self._cache_key(bucket, blob_name, generation)
+        path = self._path(key)
+        try:
+            with open(path, "rb") as cached_file:
+                size = os.fstat(cached_file.fileno()).st_size
+                content = (
+                    mmap.mmap(cached_file.fileno(), 0, access=mmap.ACCESS_READ)
+                    if size
+                    else b""
+                )
+        except FileNotFoundError:
+            with self._lock:
+                self._misses += 1
+                self._forget(key)
+            return None
+
+        with self._lock:
+            self._hits += 1
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            else:
+                # Written by another process sharing the directory
+                self._entries[key] = size
+                self._total_bytes += size
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return content
+
+    def put(self, bucket: str, blob_name: str, generation: int, data: bytes) -> None:
+        """
+        Store an object generation (atomic; errors are logged, not raised)
+
+        Args:
+            bucket: Bucket name
+            blob_name: Object name
+            generation: Object generation the content belongs to
+            data: Object content
+        """
+        size = len(data)
+        if size > self.max_bytes:
+            return
+
+        key = self._cache_key(bucket, blob_name, generation)
+        path = self._path(key)
+        temp_path = None
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(
+                dir=os.path.dirname(path), prefix=_TEMP_PREFIX
+            )
+            with os.fdopen(fd, "wb") as temp_file:
+                temp_file.write(data)
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+            os.replace(temp_path, path)
+            temp_path = None
+        except OSError as e:
+            print(f"[PDF_CACHE] WARN Could not cache {blob_name}: {e}", file=sys.stderr)
+            if temp_path:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+            return
+
+        with self._lock:
+            self._forget(key)
+            self._entries[key] = size
+            self._total_bytes += size
+            evicted = self._evict_over_cap()
+
+        for evicted_key in evicted:
+            try:
+                os.unlink(self._path(evicted_key))
+            except FileNotFoundError:
+                pass
+
+    def stats(self) -> Dict[str, Any]:
+        """Lifetime statistics of this process"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "directory": self.directory,
+                "files": len(self._entries),
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": round(self._hits / lookups, 4) if lookups else None,
+                "evictions": self._evictions,
+            }
+
+    @staticmethod
+    def _cache_key(bucket: str, blob_name: str, generation: int) -> str:
+        return hashlib.sha256(
+            f"{bucket}/{blob_name}#{generation}".encode("utf-8")
+        ).hexdigest()
+
+    def _path(self, key: str) -> str:
+        # Two-level fan-out keeps directories small
+        return os.path.join(self.directory, key[:2], key)
+
+    def _forget(self, key: str) -> None:
+        """Drop a key from the index (caller holds the lock)"""
+        size = self._entries.pop(key, None)
+        if size is not None:
+            self._total_bytes -= size
+
+    def _evict_over_cap(self) -> list:
+        """Pop LRU keys until under the cap (caller holds the lock)"""
+        evicted = []
+        while self._total_bytes > self.max_bytes and self._entries:
+            key, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            self._evictions += 1
+            evicted.append(key)
+        return evicted
+
+    def _load_index(self) -> None:
+        """Index files left by earlier runs, oldest first; drop temp files"""
+        found = []
+        for shard in os.scandir(self.directory):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                try:
+                    if entry.name.startswith(_TEMP_PREFIX):
+                        os.unlink(entry.path)
+                        continue
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                found.append((stat.st_mtime, entry.name, stat.st_size))
+
+        for _, key, size in sorted(found):
+            self._entries[key] = size
+            self._total_bytes += size
+
+        for key in self._evict_over_cap():
+            try:
+                os.unlink(self._path(key))
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,271 @@
+"""
+Query Result Cache
+==================
+Read-through cache of BigQuery result rows for the invoice repository.
+
+The agent asks about the same RUT or invoice several times in one session,
+and every lookup used to be a new BigQuery job (seconds of latency, billed
+bytes). Results are cached by (SQL template, parameters, projection):
+
+Eviction:   LRU (max_entries) + TTL (ttl_seconds)
+Freshness:  the source table's ``modified`` timestamp is read at most every
+            freshness_check_seconds; when it changes every entry is dropped
+Size guard: results with more than max_rows_per_entry rows are not cached
+
+Configuration (config.yaml):
+    bigquery:
+      result_cache:
+        enabled: true
+        max_entries: 1000
+        ttl_seconds: 300
+        freshness_check_seconds: 60
+        max_rows_per_entry: 500
+"""
+
+import json
+import sys
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.core.config import ConfigLoader
+from src.domain.interfaces.metrics_collector import IMetricsCollector
+
+CACHE_NAME = "invoice_query"
+
+
+def query_cache_key(query: str, job_config, projection: Optional[str] = None) -> Tuple:
+    """
+    Cache key of a parameterized query
+
+    Args:
+        query: SQL template (values are passed as query parameters)
+        job_config: QueryJobConfig holding the query parameters (or None)
+        projection: Projection profile of the query
+
+    Returns:
+        Hashable (query, parameters, projection) key
+    """
+    parameters = getattr(job_config, "query_parameters", None) or []
+    serialized = json.dumps(
+        [parameter.to_api_repr() for parameter in parameters],
+        sort_keys=True,
+        default=str,
+    )
+    return (" ".join(query.split()), serialized, projection)
+
+
+class QueryResultCache:
+    """
+    Thread-safe LRU + TTL cache of query result rows
+
+    Rows are loaded outside the lock, so a slow query never blocks hits for
+    other keys. Each caller gets its own copy of the row dicts.
+
+    Example:
+        >>> cache = QueryResultCache(lambda: client.get_table(table).modified)
+        >>> rows = cache.get_or_load(key, lambda: run_query())
+    """
+
+    def __init__(
+        self,
+        table_modified: Callable[[], Any],
+        max_entries: int = 1000,
+        ttl_seconds: float = 300,
+        freshness_check_seconds: float = 60,
+        max_rows_per_entry: int = 500,
+        metrics_collector: Optional[IMetricsCollector] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize result cache
+
+        Args:
+            table_modified: Returns the source table's last modification
+                (any comparable value, e.g. Table.modified)
+            max_entries: Maximum cached results (LRU beyond that)
+            ttl_seconds: Lifetime of a cached result
+            freshness_check_seconds: Minimum interval between table_modified calls
+            max_rows_per_entry: Larger results are returned but not cached
+            metrics_collector: Optional collector for hit/miss/eviction counters
+            clock: Monotonic time source (tests)
+        """
+        self.table_modified = table_modified
+        self.max_entries = max(1, int(max_entries))
+        self.ttl_seconds = float(ttl_seconds)
+        self.freshness_check_seconds = float(freshness_check_seconds)
+        self.max_rows_per_entry = int(max_rows_per_entry)
+        self.metrics = metrics_collector
+        self._clock = clock
+
+        # key -> (rows, expires_at)
+        self._entries: "OrderedDict[Tuple, Tuple[Tuple[Dict[str, Any], ...], float]]" = (
+            OrderedDict()
+        )
+        self._lock = Lock()
+
+        # Bumped on invalidation so loads started before it are not stored
+        self._generation = 0
+        self._table_version: Any = None
+        self._last_freshness_check: Optional[float] = None
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @classmethod
+    def from_config(
+        cls,
+        config: ConfigLoader,
+        table_modified: Callable[[], Any],
+        metrics_collector: Optional[IMetricsCollector] = None,
+    ) -> Optional["QueryResultCache"]:
+        """Build the cache from bigquery.result_cache (None when disabled)"""
+        if not config.get("bigquery.result_cache.enabled", False):
+            return None
+        cache = cls(
+            table_modified,
+            max_entries=int(config.get("bigquery.result_cache.max_entries", 1000)),
+            ttl_seconds=float(config.get("bigquery.result_cache.ttl_seconds", 300)),
+            freshness_check_seconds=float(
+                config.get("bigquery.result_cache.freshness_check_seconds", 60)
+            ),
+            max_rows_per_entry=int(
+                config.get("bigquery.result_cache.max_rows_per_entry", 500)
+            ),
+            metrics_collector=metrics_collector,
+        )
+        print(
+            f"REPO Query result cache enabled (max_entries={cache.max_entries}, "
+            f"ttl={cache.ttl_seconds:.0f}s, freshness check every "
+            f"{cache.freshness_check_seconds:.0f}s)",
+            file=sys.stderr,
+        )
+        return cache
+
+    def _record(self, event: str, count: int = 1) -> None:
+        if self.metrics is not None:
+            self.metrics.record_cache_event(CACHE_NAME, event, count)
+
+    def get_or_load(
+        self, key: Tuple, loader: Callable[[], List[Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Return cached rows for ``key`` or load, cache and return them
+
+        Args:
+            key: Key from query_cache_key()
+            loader: Runs the query and returns its rows as dicts
+
+        Returns:
+            Rows (copies; callers may modify them)
+
+        Raises:
+            Exception: Propagated from loader (errors are not cached)
+        """
+        self._check_freshness()
+        now = self._clock()
+
+        expired = False
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > now:
+                self._entries.move_to_end(key)
+                self._hits += 1
+            else:
+                if entry is not None:
+                    del self._entries[key]
+                    self._evictions += 1
+                    expired = True
+                entry = None
+                self._misses += 1
+            generation = self._generation
+
+        if entry is not None:
+            self._record("hit")
+            return [dict(row) for row in entry[0]]
+
+        self._record("miss")
+        if expired:
+            self._record("eviction")
+
+        rows = loader()
+        if len(rows) <= self.max_rows_per_entry:
+            evicted = 0
+            with self._lock:
+                # Skip results loaded before an invalidation
+                if generation == self._generation:
+                    self._entries[key] = (
+                        tuple(dict(row) for row in rows),
+                        self._clock() + self.ttl_seconds,
+                    )
+                    self._entries.move_to_end(key)
+                    while len(self._entries) > self.max_entries:
+                        self._entries.popitem(last=False)
+                        evicted += 1
+                    self._evictions += evicted
+            if evicted:
+                self._record("eviction", evicted)
+        return rows
+
+    def invalidate(self) -> int:
+        """
+        Drop every cached result
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            removed = len(self._entries)
+            self._entries.clear()
+            self._generation += 1
+            self._invalidations += 1
+        self._record("invalidation")
+        return removed
+
+    def _check_freshness(self) -> None:
+        """Invalidate when the source table changed (checked at most every interval)"""
+        now = self._clock()
+        with self._lock:
+            last = self._last_freshness_check
+            if last is not None and now - last < self.freshness_check_seconds:
+                return
+            # Claimed: concurrent callers skip this round
+            self._last_freshness_check = now
+
+        try:
+            modified = self.table_modified()
+        except Exception as e:
+            print(
+                f"REPO WARN Could not read table modification time, "
+                f"cached results kept until TTL: {e}",
+                file=sys.stderr,
+            )
+            return
+
+        with self._lock:
+            previous = self._table_version
+            self._table_version = modified
+        if previous is not None and modified != previous:
+            removed = self.invalidate()
+            print(
+                f"REPO Invoice table modified ({modified}), "
+                f"{removed} cached results dropped",
+                file=sys.stderr,
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+                "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+            }
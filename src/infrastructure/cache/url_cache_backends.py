@@ -0,0 +1,504 @@
+"""
+URL Cache Backends
+==================
+Storage implementations for URLCache.
+
+- MemoryURLCacheBackend: process-local, bounded (entry/byte caps with LRU
+  eviction, heap-driven expiry); default, single worker
+- SQLiteURLCacheBackend: on-disk SQLite database in WAL mode, shared by
+  every worker/process pointing at the same file and surviving restarts;
+  capped at max_entries (oldest created first, expired entries before that)
+
+Configuration (config.yaml):
+    url_cache:
+      backend: sqlite              # memory | sqlite
+      sqlite_path: /tmp/url_cache.sqlite3
+      busy_timeout_ms: 5000
+      max_entries: 50000           # both backends
+      max_bytes: 67108864          # memory backend only (64 MB)
+
+Environment overrides follow the config loader convention
+(URL_CACHE_BACKEND, URL_CACHE_SQLITE_PATH, ...).
+"""
+
+import heapq
+import os
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.core.config import get_config
+from src.domain.interfaces.url_cache_backend import IURLCacheBackend
+
+_COLUMNS = (
+    "url",
+    "gs_url",
+    "expiration_seconds",
+    "friendly_filename",
+    "signed_expires_at",
+    "expires_at",
+    "created_at",
+    "dedup_key",
+)
+
+
+class _MemoryEntry:
+    """Compact in-memory entry; timestamps are time.monotonic() based."""
+
+    __slots__ = (
+        "url",
+        "gs_url",
+        "expiration_seconds",
+        "friendly_filename",
+        "signed_expires_at",
+        "deadline",
+        "created",
+        "dedup_key",
+        "size",
+    )
+
+    def __init__(self, entry: Dict[str, Any], wall_now: float, mono_now: float):
+        self.url = entry.get("url")
+        self.gs_url = entry.get("gs_url")
+        self.expiration_seconds = entry.get("expiration_seconds")
+        self.friendly_filename = entry.get("friendly_filename")
+        self.signed_expires_at = entry.get("signed_expires_at")
+        self.deadline = mono_now + (entry["expires_at"] - wall_now)
+        self.created = mono_now + (entry.get("created_at", wall_now) - wall_now)
+        self.dedup_key = entry.get("dedup_key")
+        self.size = self.estimate_size()
+
+    def estimate_size(self) -> int:
+        """Approximate bytes held by this entry (strings + fixed overhead)."""
+        return _ENTRY_OVERHEAD_BYTES + sum(
+            len(value)
+            for value in (self.url, self.gs_url, self.friendly_filename, self.dedup_key)
+            if value
+        )
+
+    def to_dict(self, wall_now: float, mono_now: float) -> Dict[str, Any]:
+        return {
+            "url": self.url,
+            "gs_url": self.gs_url,
+            "expiration_seconds": self.expiration_seconds,
+            "friendly_filename": self.friendly_filename,
+            "signed_expires_at": self.signed_expires_at,
+            "expires_at": wall_now + (self.deadline - mono_now),
+            "created_at": wall_now + (self.created - mono_now),
+            "dedup_key": self.dedup_key,
+        }
+
+
+# Short ID key + slotted object + OrderedDict link + heap tuple
+_ENTRY_OVERHEAD_BYTES = 240
+
+
+class MemoryURLCacheBackend(IURLCacheBackend):
+    """
+    Thread-safe in-process backend with bounded memory
+
+    - LRU order kept by an OrderedDict; the least recently used entries are
+      evicted once max_entries or max_bytes is exceeded
+    - Expiry driven by a min-heap of deadlines, so purging only touches
+      expired entries (stale heap items are skipped lazily)
+    - Every put() also drains a few expired entries from the heap head,
+      amortizing cleanup instead of pausing for a full scan
+    """
+
+    # Expired entries drained opportunistically per put()
+    PURGE_BATCH = 8
+
+    def __init__(self, max_entries: int = 50000, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Initialize memory backend
+
+        Args:
+            max_entries: Hard cap on stored entries
+            max_bytes: Hard cap on the estimated memory footprint
+        """
+        self.max_entries = int(max_entries)
+        self.max_bytes = int(max_bytes)
+        self._entries: "OrderedDict[str, _MemoryEntry]" = OrderedDict()
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._bytes = 0
+        self._lazy = 0
+        self._lazy_pending = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._lock = threading.Lock()
+
+    def _add(self, short_id: str, entry: _MemoryEntry) -> None:
+        self._entries[short_id] = entry
+        self._bytes += entry.size
+        if entry.gs_url:
+            self._lazy += 1
+            self._lazy_pending += entry.url is None
+
+    def _remove(self, short_id: str) -> None:
+        entry = self._entries.pop(short_id)
+        self._bytes -= entry.size
+        if entry.gs_url:
+            self._lazy -= 1
+            self._lazy_pending -= entry.url is None
+
+    def _purge_locked(self, mono_now: float, limit: Optional[int] = None) -> int:
+        removed = 0
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= mono_now and (limit is None or removed < limit):
+            deadline, short_id = heapq.heappop(heap)
+            entry = self._entries.get(short_id)
+            # Skip heap items left behind by replaced or evicted entries
+            if entry is not None and entry.deadline == deadline:
+                self._remove(short_id)
+                removed += 1
+        self._expirations += removed
+
+        # Heap holds stale items for evicted entries; rebuild when it bloats
+        if len(heap) > 2 * len(self._entries) + 1024:
+            self._expiry_heap = [(e.deadline, k) for k, e in self._entries.items()]
+            heapq.heapify(self._expiry_heap)
+        return removed
+
+    def put(self, short_id: str, entry: Dict[str, Any]) -> None:
+        wall_now, mono_now = time.time(), time.monotonic()
+        item = _MemoryEntry(entry, wall_now, mono_now)
+
+        with self._lock:
+            self._purge_locked(mono_now, limit=self.PURGE_BATCH)
+
+            if short_id in self._entries:
+                self._remove(short_id)
+            self._add(short_id, item)
+            heapq.heappush(self._expiry_heap, (item.deadline, short_id))
+
+            while len(self._entries) > 1 and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._evictions += 1
+
+    def get(self, short_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(short_id)
+            if entry is None:
+                return None
+            self._entries.move_to_end(short_id)
+            return entry.to_dict(time.time(), time.monotonic())
+
+    def get_many(self, short_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        wall_now, mono_now = time.time(), time.monotonic()
+        entries = {}
+        with self._lock:
+            for short_id in short_ids:
+                entry = self._entries.get(short_id)
+                if entry is not None:
+                    self._entries.move_to_end(short_id)
+                    entries[short_id] = entry.to_dict(wall_now, mono_now)
+        return entries
+
+    def update_signed_url(
+        self, short_id: str, url: str, signed_expires_at: Optional[float]
+    ) -> None:
+        with self._lock:
+            self._update_signed_url_locked(short_id, url, signed_expires_at)
+
+    def _update_signed_url_locked(
+        self, short_id: str, url: str, signed_expires_at: Optional[float]
+    ) -> None:
+        entry = self._entries.get(short_id)
+        if entry is not None:
+            if entry.gs_url and entry.url is None:
+                self._lazy_pending -= 1
+            entry.url = url
+            entry.signed_expires_at = signed_expires_at
+            size = entry.estimate_size()
+            self._bytes += size - entry.size
+            entry.size = size
+
+    def update_signed_urls(
+        self, updates: Dict[str, Tuple[str, Optional[float]]]
+    ) -> None:
+        with self._lock:
+            for short_id, (url, signed_expires_at) in updates.items():
+                self._update_signed_url_locked(short_id, url, signed_expires_at)
+
+    def delete(self, short_id: str) -> None:
+        with self._lock:
+            if short_id in self._entries:
+                self._remove(short_id)
+
+    def delete_many(self, short_ids: List[str]) -> None:
+        with self._lock:
+            for short_id in short_ids:
+                if short_id in self._entries:
+                    self._remove(short_id)
+
+    def purge_expired(self, now: float) -> int:
+        mono_now = time.monotonic() + (now - time.time())
+        with self._lock:
+            return self._purge_locked(mono_now)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "backend": "memory",
+                "total_entries": len(self._entries),
+                "lazy_entries": self._lazy,
+                "lazy_pending": self._lazy_pending,
+                "max_entries": self.max_entries,
+                "estimated_bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+            }
+
+
+class SQLiteURLCacheBackend(IURLCacheBackend):
+    """
+    SQLite backend shared across threads and processes
+
+    WAL mode lets readers proceed while a writer commits, so many uvicorn
+    workers can resolve redirects against one file concurrently. Each thread
+    keeps its own connection (sqlite3 connections are not thread-safe).
+
+    The table is capped at max_entries: every TRIM_INTERVAL puts a process
+    drops expired entries and then the oldest ones (by created_at) beyond
+    the cap, so the file may briefly exceed it by a few puts per worker.
+    """
+
+    # Puts per process between cap checks (COUNT(*) is a full index scan)
+    TRIM_INTERVAL = 64
+
+    def __init__(self, path: str, busy_timeout_ms: int = 5000, max_entries: int = 50000):
+        """
+        Initialize SQLite backend
+
+        Args:
+            path: Database file path (parent directory is created if needed)
+            busy_timeout_ms: How long a writer waits for the database lock
+            max_entries: Cap on stored entries shared by all workers
+        """
+        self.path = path
+        self.busy_timeout_ms = int(busy_timeout_ms)
+        self.max_entries = int(max_entries)
+        self._local = threading.local()
+        self._puts_since_trim = 0
+        self._evictions = 0
+        self._trim_lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        conn = self._connect()
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS url_cache (
+                short_id TEXT PRIMARY KEY,
+                url TEXT,
+                gs_url TEXT,
+                expiration_seconds REAL,
+                friendly_filename TEXT,
+                signed_expires_at REAL,
+                expires_at REAL NOT NULL,
+                created_at REAL NOT NULL,
+                dedup_key TEXT
+            )
+            """
+        )
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(url_cache)")}
+        if "dedup_key" not in columns:
+            # Databases created before deterministic IDs existed
+            conn.execute("ALTER TABLE url_cache ADD COLUMN dedup_key TEXT")
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_url_cache_expires_at ON url_cache (expires_at)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_url_cache_created_at ON url_cache (created_at)"
+        )
+
+        print(f"[URL_CACHE] SQLite backend at {path} (WAL)", file=sys.stderr)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Autocommit mode: every statement is its own short transaction
+            conn = sqlite3.connect(
+                self.path,
+                timeout=self.busy_timeout_ms / 1000,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA busy_timeout={self.busy_timeout_ms}")
+            self._local.conn = conn
+        return conn
+
+    def put(self, short_id: str, entry: Dict[str, Any]) -> None:
+        self._connect().execute(
+            f"INSERT OR REPLACE INTO url_cache (short_id, {', '.join(_COLUMNS)}) "
+            f"VALUES (?, {', '.join('?' for _ in _COLUMNS)})",
+            (short_id, *(entry.get(column) for column in _COLUMNS)),
+        )
+
+        with self._trim_lock:
+            self._puts_since_trim += 1
+            due = self._puts_since_trim >= self.TRIM_INTERVAL
+            if due:
+                self._puts_since_trim = 0
+        if due:
+            self.trim(time.time())
+
+    def trim(self, now: float) -> int:
+        """
+        Enforce max_entries: drop expired entries, then the oldest created
+
+        Args:
+            now: Current epoch seconds
+
+        Returns:
+            Number of live entries evicted to get under the cap
+        """
+        conn = self._connect()
+        conn.execute("DELETE FROM url_cache WHERE expires_at < ?", (now,))
+        excess = conn.execute("SELECT COUNT(*) FROM url_cache").fetchone()[0] - self.max_entries
+        if excess <= 0:
+            return 0
+        cursor = conn.execute(
+            "DELETE FROM url_cache WHERE short_id IN "
+            "(SELECT short_id FROM url_cache ORDER BY created_at LIMIT ?)",
+            (excess,),
+        )
+        with self._trim_lock:
+            self._evictions += cursor.rowcount
+        return cursor.rowcount
+
+    def get(self, short_id: str) -> Optional[Dict[str, Any]]:
+        row = (
+            self._connect()
+            .execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM url_cache WHERE short_id = ?",
+                (short_id,),
+            )
+            .fetchone()
+        )
+        return dict(zip(_COLUMNS, row)) if row is not None else None
+
+    def get_many(self, short_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        entries = {}
+        conn = self._connect()
+        # Stay well below SQLITE_MAX_VARIABLE_NUMBER
+        for i in range(0, len(short_ids), 500):
+            chunk = short_ids[i:i + 500]
+            rows = conn.execute(
+                f"SELECT short_id, {', '.join(_COLUMNS)} FROM url_cache "
+                f"WHERE short_id IN ({', '.join('?' for _ in chunk)})",
+                chunk,
+            ).fetchall()
+            for row in rows:
+                entries[row[0]] = dict(zip(_COLUMNS, row[1:]))
+        return entries
+
+    def update_signed_url(
+        self, short_id: str, url: str, signed_expires_at: Optional[float]
+    ) -> None:
+        self._connect().execute(
+            "UPDATE url_cache SET url = ?, signed_expires_at = ? WHERE short_id = ?",
+            (url, signed_expires_at, short_id),
+        )
+
+    def update_signed_urls(
+        self, updates: Dict[str, Tuple[str, Optional[float]]]
+    ) -> None:
+        conn = self._connect()
+        conn.execute("BEGIN")
+        try:
+            conn.executemany(
+                "UPDATE url_cache SET url = ?, signed_expires_at = ? WHERE short_id = ?",
+                [
+                    (url, signed_expires_at, short_id)
+                    for short_id, (url, signed_expires_at) in updates.items()
+                ],
+            )
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def delete(self, short_id: str) -> None:
+        self._connect().execute("DELETE FROM url_cache WHERE short_id = ?", (short_id,))
+
+    def delete_many(self, short_ids: List[str]) -> None:
+        conn = self._connect()
+        for i in range(0, len(short_ids), 500):
+            chunk = short_ids[i:i + 500]
+            conn.execute(
+                f"DELETE FROM url_cache WHERE short_id IN ({', '.join('?' for _ in chunk)})",
+                chunk,
+            )
+
+    def purge_expired(self, now: float) -> int:
+        cursor = self._connect().execute(
+            "DELETE FROM url_cache WHERE expires_at < ?", (now,)
+        )
+        return cursor.rowcount
+
+    def stats(self) -> Dict[str, Any]:
+        conn = self._connect()
+        total, lazy, pending = (
+            conn
+            .execute(
+                "SELECT COUNT(*), "
+                "COALESCE(SUM(gs_url IS NOT NULL), 0), "
+                "COALESCE(SUM(gs_url IS NOT NULL AND url IS NULL), 0) "
+                "FROM url_cache"
+            )
+            .fetchone()
+        )
+        page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        return {
+            "backend": "sqlite",
+            "path": self.path,
+            "total_entries": total,
+            "lazy_entries": lazy,
+            "lazy_pending": pending,
+            "max_entries": self.max_entries,
+            "estimated_bytes": page_count * page_size,
+            "evictions": self._evictions,
+        }
+
+
+def create_url_cache_backend(config=None) -> IURLCacheBackend:
+    """
+    Build the URL cache backend selected in configuration
+
+    Args:
+        config: Configuration loader (defaults to the global config)
+
+    Returns:
+        Configured backend (memory if the setting is unknown)
+    """
+    config = config or get_config()
+    backend = str(config.get("url_cache.backend", "memory")).lower()
+
+    if backend == "sqlite":
+        return SQLiteURLCacheBackend(
+            path=config.get("url_cache.sqlite_path", "/tmp/url_cache.sqlite3"),
+            busy_timeout_ms=int(config.get("url_cache.busy_timeout_ms", 5000)),
+            max_entries=int(config.get("url_cache.max_entries", 50000)),
+        )
+
+    if backend != "memory":
+        print(
+            f"[URL_CACHE] WARNING: unknown backend '{backend}', using memory",
+            file=sys.stderr,
+        )
+    return MemoryURLCacheBackend(
+        max_entries=int(config.get("url_cache.max_entries", 50000)),
+        max_bytes=int(config.get("url_cache.max_bytes", 64 * 1024 * 1024)),
+    )
@@ -6,8 +6,10 @@ Strategy Pattern implementations for generating signed URLs from GCS paths.
 
 from .robust_url_signer import RobustURLSigner
 from .legacy_url_signer import LegacyURLSigner
+from .caching_url_signer import CachingURLSigner
 
 __all__ = [
     "RobustURLSigner",
     "LegacyURLSigner",
+    "CachingURLSigner",
 ]
@@ -0,0 +1,267 @@
+"""
+Adaptive Download Concurrency
+=============================
+AIMD (additive-increase, multiplicative-decrease) control of how many PDF
+downloads a ZIP build keeps in flight.
+
+A fixed pool size is wrong at both ends: a 4-PDF ZIP does not need 10
+threads, a 500-PDF ZIP is limited by them, and when GCS throttles the pool
+keeps sending requests at the same rate. The controller instead measures
+throughput over epochs of roughly ``limit`` completed downloads:
+
+- Throughput improved by more than ``min_gain``: limit + 1
+- Epoch latency above ``latency_spike_factor`` x best latency seen: limit x
+  ``decrease_factor``
+- A download failed with 429/503: limit x ``decrease_factor`` immediately
+  (at most once per epoch) and the download can be retried
+- Otherwise the limit is kept
+
+The limit stays within [min_workers, max_workers]. Each epoch is appended
+to a throughput curve reported in the ZIP metrics.
+
+Configuration (config.yaml):
+    pdf:
+      zip:
+        adaptive_concurrency:
+          enabled: true
+          min_workers: 2
+          max_workers: 32
+          initial_workers: 8
+          decrease_factor: 0.5
+          latency_spike_factor: 2.0
+          min_gain: 0.05
+          max_retries: 2          # Retries of a throttled download
+"""
+
+import re
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sized
+
+from google.api_core.exceptions import ServiceUnavailable, TooManyRequests
+
+from src.core.config import ConfigLoader
+
+_THROTTLE_STATUS_CODES = (429, 503)
+_THROTTLE_PATTERN = re.compile(
+    r"\b(429|503)\b|too many requests|rate limit|service unavailable", re.IGNORECASE
+)
+
+
+def is_throttling_error(error: BaseException) -> bool:
+    """
+    Check whether a download failed because GCS is throttling or overloaded
+
+    Recognizes google-api-core TooManyRequests/ServiceUnavailable,
+    exceptions exposing a 429/503 status (``code``, ``status_code`` or
+    ``response.status_code``) and matching error messages.
+    """
+    if isinstance(error, (TooManyRequests, ServiceUnavailable)):
+        return True
+    for attr in ("code", "status_code"):
+        if getattr(error, attr, None) in _THROTTLE_STATUS_CODES:
+            return True
+    response = getattr(error, "response", None)
+    if getattr(response, "status_code", None) in _THROTTLE_STATUS_CODES:
+        return True
+    return bool(_THROTTLE_PATTERN.search(str(error)))
+
+
+class AIMDConcurrencyController:
+    """
+    Thread-safe AIMD limit on concurrent downloads for one ZIP build
+
+    Example:
+        >>> controller = AIMDConcurrencyController(2, 32, initial_workers=8)
+        >>> download = controller.instrument(download_pdf)
+        >>> while len(in_flight) < controller.limit: ...  # submit download
+    """
+
+    def __init__(
+        self,
+        min_workers: int = 2,
+        max_workers: int = 32,
+        initial_workers: int = 8,
+        decrease_factor: float = 0.5,
+        latency_spike_factor: float = 2.0,
+        min_gain: float = 0.05,
+        max_retries: int = 2,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize controller
+
+        Args:
+            min_workers: Lower bound of the limit
+            max_workers: Upper bound of the limit (download pool size)
+            initial_workers: Starting limit (clamped to the bounds)
+            decrease_factor: Multiplier applied on throttling or latency spikes
+            latency_spike_factor: Epoch latency / best latency that counts
+                as a spike
+            min_gain: Relative throughput gain required to add a worker
+            max_retries: Times a throttled download may be retried
+            clock: Monotonic time source (seconds)
+        """
+        self.min_workers = max(1, int(min_workers))
+        self.max_workers = max(self.min_workers, int(max_workers))
+        self.decrease_factor = min(max(float(decrease_factor), 0.1), 0.9)
+        self.latency_spike_factor = max(1.0, float(latency_spike_factor))
+        self.min_gain = max(0.0, float(min_gain))
+        self.max_retries = max(0, int(max_retries))
+        self._clock = clock
+
+        self._limit = self._clamp(initial_workers)
+        self.initial = self._limit
+        self.peak = self._limit
+        self.throttled = 0
+        self.curve: List[Dict[str, Any]] = []
+
+        self._lock = threading.Lock()
+        self._epoch_start: Optional[float] = None
+        self._epoch_bytes = 0
+        self._epoch_count = 0
+        self._epoch_latency = 0.0
+        self._epoch_throttled = False
+        self._last_throughput: Optional[float] = None
+        self._best_latency: Optional[float] = None
+
+    @classmethod
+    def from_config(
+        cls, config: ConfigLoader, default_workers: int = 10
+    ) -> "AIMDConcurrencyController":
+        """
+        Build a controller from pdf.zip.adaptive_concurrency
+
+        When disabled the limit is pinned to ``default_workers``
+        (pdf.zip.max_concurrent_downloads), which keeps the fixed pool
+        behavior while still reporting the throughput curve.
+        """
+        prefix = "pdf.zip.adaptive_concurrency"
+        if not config.get(f"{prefix}.enabled", False):
+            workers = max(1, int(default_workers))
+            return cls(min_workers=workers, max_workers=workers, initial_workers=workers)
+        return cls(
+            min_workers=int(config.get(f"{prefix}.min_workers", 2)),
+            max_workers=int(config.get(f"{prefix}.max_workers", 32)),
+            initial_workers=int(config.get(f"{prefix}.initial_workers", default_workers)),
+            decrease_factor=float(config.get(f"{prefix}.decrease_factor", 0.5)),
+            latency_spike_factor=float(config.get(f"{prefix}.latency_spike_factor", 2.0)),
+            min_gain=float(config.get(f"{prefix}.min_gain", 0.05)),
+            max_retries=int(config.get(f"{prefix}.max_retries", 2)),
+        )
+
+    @property
+    def limit(self) -> int:
+        """Downloads that may currently be in flight"""
+        return self._limit
+
+    def instrument(self, download_func: Callable[[str], Sized]) -> Callable[[str], Sized]:
+        """Wrap a download callable so every call feeds the controller"""
+
+        def download(gs_path: str):
+            start = self._clock()
+            try:
+                content = download_func(gs_path)
+            except Exception as e:
+                if is_throttling_error(e):
+                    self.record_throttle()
+                raise
+            self.record_success(len(content), self._clock() - start)
+            return content
+
+        return download
+
+    def record_success(self, size_bytes: int, latency_seconds: float) -> None:
+        """Account one completed download; closes the epoch when it is full"""
+        with self._lock:
+            now = self._clock()
+            if self._epoch_start is None:
+                self._epoch_start = now - latency_seconds
+            self._epoch_bytes += size_bytes
+            self._epoch_count += 1
+            self._epoch_latency += latency_seconds
+            if self._epoch_count >= self._limit:
+                self._close_epoch(now)
+
+    def record_throttle(self) -> None:
+        """Back off after a 429/503 (once per epoch)"""
+        with self._lock:
+            self.throttled += 1
+            if self._epoch_throttled:
+                return
+            self._epoch_throttled = True
+            previous = self._limit
+            self._limit = self._clamp(int(self._limit * self.decrease_factor))
+            print(
+                f"[ZIP] Throttled by GCS: concurrency {previous} -> {self._limit}",
+                file=sys.stderr,
+            )
+
+    def should_retry(self, error: BaseException, attempt: int) -> bool:
+        """Whether a failed download (``attempt`` retries so far) is retried"""
+        return attempt < self.max_retries and is_throttling_error(error)
+
+    def summary(self) -> Dict[str, Any]:
+        """ZipPerformanceMetrics fields describing this build's concurrency"""
+        with self._lock:
+            if self._epoch_count:
+                self._close_epoch(self._clock(), adjust=False)
+            return {
+                "max_workers_used": self.peak,
+                "concurrency_initial": self.initial,
+                "concurrency_final": self._limit,
+                "concurrency_peak": self.peak,
+                "throughput_curve": list(self.curve),
+            }
+
+    def _close_epoch(self, now: float, adjust: bool = True) -> None:
+        """Record the epoch and adjust the limit (caller holds the lock)"""
+        start = now if self._epoch_start is None else self._epoch_start
+        elapsed = max(now - start, 1e-6)
+        throughput = self._epoch_bytes / elapsed
+        latency = self._epoch_latency / self._epoch_count
+        concurrency = self._limit
+
+        self.curve.append(
+            {
+                "concurrency": concurrency,
+                "downloads": self._epoch_count,
+                "mb_per_s": round(throughput / (1024 * 1024), 3),
+                "avg_latency_ms": int(latency * 1000),
+                "throttled": self._epoch_throttled,
+            }
+        )
+
+        if adjust and not self._epoch_throttled:
+            if (
+                self._best_latency is not None
+                and latency > self._best_latency * self.latency_spike_factor
+            ):
+                self._limit = self._clamp(int(self._limit * self.decrease_factor))
+            elif self._last_throughput is None or throughput > self._last_throughput * (
+                1 + self.min_gain
+            ):
+                self._limit = self._clamp(self._limit + 1)
+            self.peak = max(self.peak, self._limit)
+
+        if self._limit != concurrency:
+            print(
+                f"[ZIP] Concurrency {concurrency} -> {self._limit} "
+                f"({throughput / (1024 * 1024):.2f} MB/s, {latency * 1000:.0f}ms avg)",
+                file=sys.stderr,
+            )
+
+        self._last_throughput = throughput
+        if not self._epoch_throttled:
+            self._best_latency = (
+                latency if self._best_latency is None else min(self._best_latency, latency)
+            )
+        self._epoch_start = now
+        self._epoch_bytes = 0
+        self._epoch_count = 0
+        self._epoch_latency = 0.0
+        self._epoch_throttled = False
+
+    def _clamp(self, workers: int) -> int:
+        return max(self.min_workers, min(self.max_workers, int(workers)))
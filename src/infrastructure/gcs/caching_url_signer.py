@@ -0,0 +1,258 @@
+"""
+Caching URL Signer (Decorator)
+==============================
+Memoizes signed URLs in front of any IURLSigner implementation.
+
+The same PDFs (popular RUTs, the latest invoice of a solicitante) are signed
+repeatedly across conversations and every signature costs a signBlob round
+trip. A signed URL stays valid until its X-Goog-Date + X-Goog-Expires, so
+it can be handed out again while enough lifetime remains.
+
+Cache key: (bucket, blob, expiration bucket, signing identity, friendly name)
+Reuse rule: remaining lifetime >= max(min_remaining_minutes,
+                                      min_remaining_ratio * requested lifetime)
+Eviction:   LRU (max_entries) + TTL (entries drop once below the reuse floor)
+
+Configuration (config.yaml):
+    pdf:
+      signed_urls:
+        cache:
+          enabled: true
+          max_entries: 5000
+          expiration_bucket_minutes: 60
+          min_remaining_minutes: 30
+          min_remaining_ratio: 0.5
+"""
+
+import math
+import sys
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from src.core.config import ConfigLoader
+from src.core.domain.interfaces import IURLSigner
+from src.domain.interfaces.metrics_collector import IMetricsCollector
+
+CACHE_NAME = "signed_url"
+
+
+def parse_signed_url_expiry(signed_url: str) -> Optional[datetime]:
+    """
+    Extract the absolute expiry of a V4 signed URL
+
+    Args:
+        signed_url: URL containing X-Goog-Date and X-Goog-Expires
+
+    Returns:
+        Timezone-aware UTC expiry, or None if the URL is not V4-signed
+    """
+    params = {k.lower(): v for k, v in parse_qsl(urlsplit(signed_url).query)}
+    goog_date = params.get("x-goog-date")
+    goog_expires = params.get("x-goog-expires")
+    if not goog_date or not goog_expires:
+        return None
+
+    try:
+        signed_at = datetime.strptime(goog_date, "%Y%m%dT%H%M%SZ").replace(
+            tzinfo=timezone.utc
+        )
+        return signed_at + timedelta(seconds=int(goog_expires))
+    except ValueError:
+        return None
+
+
+class CachingURLSigner(IURLSigner):
+    """
+    IURLSigner decorator that reuses still-valid signed URLs
+
+    Thread-safe; signing happens outside the lock so a slow signBlob call
+    never blocks cache hits for other objects.
+
+    Example:
+        >>> signer = CachingURLSigner(RobustURLSigner(config), config)
+        >>> url1 = signer.generate_signed_url("gs://bucket/a.pdf")
+        >>> url2 = signer.generate_signed_url("gs://bucket/a.pdf")  # cache hit
+        >>> url1 == url2
+        True
+    """
+
+    def __init__(
+        self,
+        inner: IURLSigner,
+        config: ConfigLoader,
+        metrics_collector: Optional[IMetricsCollector] = None,
+    ):
+        """
+        Initialize caching signer
+
+        Args:
+            inner: Signer that performs the actual signing
+            config: Configuration loader instance
+            metrics_collector: Optional collector for hit/miss/eviction counters
+        """
+        self.inner = inner
+        self.metrics = metrics_collector
+
+        self.max_entries = int(config.get("pdf.signed_urls.cache.max_entries", 5000))
+        self.bucket_minutes = int(
+            config.get("pdf.signed_urls.cache.expiration_bucket_minutes", 60)
+        )
+        self.min_remaining = timedelta(
+            minutes=float(config.get("pdf.signed_urls.cache.min_remaining_minutes", 30))
+        )
+        self.min_remaining_ratio = float(
+            config.get("pdf.signed_urls.cache.min_remaining_ratio", 0.5)
+        )
+        self.default_expiration = timedelta(
+            hours=float(config.get("pdf.signed_urls.expiration_hours", 24))
+        )
+        self.identity = (
+            getattr(inner, "service_account_email", None)
+            or config.get("gcs.signed_urls.service_account_email")
+            or type(inner).__name__
+        )
+
+        # key -> (signed_url, expires_at)
+        self._entries: "OrderedDict[Tuple, Tuple[str, datetime]]" = OrderedDict()
+        self._lock = Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+        print(
+            f"SIGNER Signed URL cache enabled "
+            f"(max_entries={self.max_entries}, identity={self.identity})",
+            file=sys.stderr,
+        )
+
+    def _record(self, event: str, count: int = 1) -> None:
+        if self.metrics is not None:
+            self.metrics.record_cache_event(CACHE_NAME, event, count)
+
+    def _cache_key(
+        self, gs_url: str, expiration: timedelta, friendly_filename: Optional[str]
+    ) -> Tuple:
+        bucket_name, blob_name = self.extract_bucket_and_blob(gs_url)
+        bucket_seconds = self.bucket_minutes * 60
+        expiration_bucket = math.ceil(expiration.total_seconds() / bucket_seconds)
+        return (bucket_name, blob_name, expiration_bucket, self.identity, friendly_filename)
+
+    def _required_remaining(self, expiration: timedelta) -> timedelta:
+        """Minimum remaining lifetime for a cached URL to be handed out"""
+        return max(self.min_remaining, expiration * self.min_remaining_ratio)
+
+    def generate_signed_url(
+        self,
+        gs_url: str,
+        expiration: Optional[timedelta] = None,
+        friendly_filename: Optional[str] = None,
+    ) -> str:
+        """
+        Return a cached signed URL if it still has enough lifetime left,
+        otherwise sign through the wrapped signer and cache the result
+
+        Args:
+            gs_url: GCS path (gs://bucket/path/to/file.pdf)
+            expiration: URL expiration duration (defaults to configured)
+            friendly_filename: Optional user-friendly filename for downloads
+
+        Returns:
+            Signed HTTPS URL
+
+        Raises:
+            ValueError: If gs_url is invalid
+            Exception: If URL signing fails (propagated from wrapped signer)
+        """
+        requested = expiration or self.default_expiration
+        key = self._cache_key(gs_url, requested, friendly_filename)
+        now = datetime.now(timezone.utc)
+
+        required = self._required_remaining(requested)
+
+        expired = False
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] - now >= required:
+                self._entries.move_to_end(key)
+                self._hits += 1
+            else:
+                if entry is not None:
+                    # TTL: remaining lifetime fell below the reuse floor
+                    del self._entries[key]
+                    self._evictions += 1
+                    expired = True
+                entry = None
+                self._misses += 1
+
+        if entry is not None:
+            self._record("hit")
+            return entry[0]
+
+        self._record("miss")
+        if expired:
+            self._record("eviction")
+        signed_url = self.inner.generate_signed_url(
+            gs_url, expiration=expiration, friendly_filename=friendly_filename
+        )
+        expires_at = parse_signed_url_expiry(signed_url) or now + requested
+
+        if expires_at - now >= required:
+            evicted = 0
+            with self._lock:
+                self._entries[key] = (signed_url, expires_at)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    evicted += 1
+                self._evictions += evicted
+            if evicted:
+                self._record("eviction", evicted)
+
+        return signed_url
+
+    def validate_gs_url(self, gs_url: str) -> bool:
+        """Validate GCS URL format (delegated to wrapped signer)"""
+        return self.inner.validate_gs_url(gs_url)
+
+    def extract_bucket_and_blob(self, gs_url: str) -> tuple[str, str]:
+        """Extract bucket and blob from GCS URL (delegated to wrapped signer)"""
+        return self.inner.extract_bucket_and_blob(gs_url)
+
+    def invalidate(self, gs_url: Optional[str] = None) -> int:
+        """
+        Drop cached signatures
+
+        Args:
+            gs_url: Only drop entries for this object (None = clear all)
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            if gs_url is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                return removed
+
+            bucket_name, blob_name = self.extract_bucket_and_blob(gs_url)
+            keys = [k for k in self._entries if k[0] == bucket_name and k[1] == blob_name]
+            for k in keys:
+                del self._entries[k]
+            return len(keys)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+            }
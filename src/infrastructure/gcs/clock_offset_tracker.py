@@ -0,0 +1,261 @@
+"""
+Clock Offset Tracker Implementation
+====================================
+Keeps a background estimate of local clock skew versus Google.
+
+Previously every signed URL called ``TimeSyncValidator.get_sync_info()``,
+which performs a blocking HTTP HEAD to storage.googleapis.com. The tracker
+samples NTP (or the HTTP Date header as fallback) on a schedule, smooths the
+result with an exponentially weighted moving average and publishes it for
+O(1) reads by the signer, ``calculate_buffer`` and the metrics collector.
+
+Offsets follow the IClockOffsetProvider convention (local - Google, positive
+= local clock ahead). ntplib reports the opposite sign, so NTP samples are
+negated before they are mixed with HTTP Date samples.
+
+Configuration (config.yaml):
+    gcs:
+      time_sync:
+        tracker:
+          enabled: true
+          refresh_interval_seconds: 300  # Sampling period when healthy
+          retry_interval_seconds: 30     # Sampling period after a failure
+          ttl_seconds: 900               # Estimate considered stale after this
+          smoothing_alpha: 0.3           # EWMA weight of the newest sample
+"""
+
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from threading import Event, Lock, Thread
+from typing import Any, Dict, Optional, Tuple
+
+from src.core.config import get_config
+from src.domain.interfaces.clock_offset import IClockOffsetProvider
+from src.domain.interfaces.time_sync import ITimeSyncValidator
+
+logger = logging.getLogger(__name__)
+
+GOOG_DATE_FORMAT = "%Y%m%dT%H%M%SZ"
+
+
+class ClockOffsetTracker(IClockOffsetProvider):
+    """
+    Background clock offset estimator
+
+    Sampling happens on a daemon thread; readers only touch an immutable
+    state tuple that is swapped atomically, so ``current_offset()`` never
+    blocks on the network or on a lock.
+
+    Example:
+        >>> tracker = ClockOffsetTracker(TimeSyncValidator())
+        >>> tracker.start()
+        >>> tracker.current_offset()
+        0.012
+        >>> tracker.goog_date()
+        '20250101T120000Z'
+    """
+
+    def __init__(
+        self,
+        time_sync_validator: ITimeSyncValidator,
+        refresh_interval_seconds: Optional[float] = None,
+        ttl_seconds: Optional[float] = None,
+        smoothing_alpha: Optional[float] = None,
+    ):
+        """
+        Initialize tracker with configuration
+
+        Args:
+            time_sync_validator: Validator used to take raw samples
+            refresh_interval_seconds: Sampling period (default: from config)
+            ttl_seconds: Maximum estimate age before it is ignored
+            smoothing_alpha: EWMA weight of the newest sample (0 < alpha <= 1)
+        """
+        self.time_sync = time_sync_validator
+        self.config = get_config()
+
+        self.refresh_interval = float(
+            refresh_interval_seconds
+            if refresh_interval_seconds is not None
+            else self.config.get(
+                "gcs.time_sync.tracker.refresh_interval_seconds", 300
+            )
+        )
+        self.retry_interval = float(
+            self.config.get("gcs.time_sync.tracker.retry_interval_seconds", 30)
+        )
+        self.ttl_seconds = float(
+            ttl_seconds
+            if ttl_seconds is not None
+            else self.config.get("gcs.time_sync.tracker.ttl_seconds", 900)
+        )
+        self.smoothing_alpha = float(
+            smoothing_alpha
+            if smoothing_alpha is not None
+            else self.config.get("gcs.time_sync.tracker.smoothing_alpha", 0.3)
+        )
+        self.threshold_seconds = int(
+            self.config.get("gcs.time_sync.threshold_seconds", 60)
+        )
+
+        # (smoothed_offset, raw_offset, sampled_at_monotonic, source)
+        self._state: Optional[Tuple[float, float, float, str]] = None
+
+        self._sample_lock = Lock()
+        self._stop_event = Event()
+        self._thread: Optional[Thread] = None
+
+        # Statistics
+        self._samples = 0
+        self._failures = 0
+
+    def start(self) -> None:
+        """Start the background sampling thread (idempotent)"""
+        with self._sample_lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop_event.clear()
+            self._thread = Thread(
+                target=self._run, name="clock-offset-tracker", daemon=True
+            )
+            self._thread.start()
+
+        logger.info(
+            "Clock offset tracker started",
+            extra={
+                "refresh_interval_seconds": self.refresh_interval,
+                "ttl_seconds": self.ttl_seconds,
+                "smoothing_alpha": self.smoothing_alpha,
+            },
+        )
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the background sampling thread"""
+        self._stop_event.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout=timeout)
+
+    def _run(self) -> None:
+        """Sampling loop: sample, then wait (shorter after a failure)"""
+        while not self._stop_event.is_set():
+            ok = self.sample()
+            wait = self.refresh_interval if ok else self.retry_interval
+            self._stop_event.wait(wait)
+
+    def _measure(self) -> Tuple[Optional[float], Optional[str]]:
+        """
+        Take one raw offset measurement (NTP first, HTTP Date fallback)
+
+        Returns:
+            Tuple of (offset_seconds, source); offset is local - Google
+        """
+        _, ntp_offset = self.time_sync.verify_sync_ntp()
+        if ntp_offset is not None:
+            # ntplib: positive = server ahead (local behind); flip to local - Google
+            return -ntp_offset, "ntp"
+
+        _, _, http_offset = self.time_sync.get_sync_info()
+        if http_offset is not None:
+            return http_offset, "http_head"
+
+        return None, None
+
+    def sample(self) -> bool:
+        """
+        Take one sample and fold it into the smoothed estimate
+
+        Returns:
+            True if a measurement was obtained, False otherwise
+        """
+        try:
+            raw_offset, source = self._measure()
+        except Exception as e:
+            logger.warning(
+                "Clock offset sample failed",
+                extra={"error": str(e), "error_type": type(e).__name__},
+            )
+            raw_offset, source = None, None
+
+        with self._sample_lock:
+            if raw_offset is None:
+                self._failures += 1
+                return False
+
+            previous = self._state
+            now = time.monotonic()
+            if previous is None or now - previous[2] > self.ttl_seconds:
+                smoothed = raw_offset
+            else:
+                smoothed = (
+                    self.smoothing_alpha * raw_offset
+                    + (1 - self.smoothing_alpha) * previous[0]
+                )
+
+            self._state = (smoothed, raw_offset, now, source)
+            self._samples += 1
+
+        logger.debug(
+            "Clock offset sampled",
+            extra={
+                "source": source,
+                "raw_offset_seconds": round(raw_offset, 3),
+                "smoothed_offset_seconds": round(smoothed, 3),
+            },
+        )
+        return True
+
+    def _fresh_state(self) -> Optional[Tuple[float, float, float, str]]:
+        state = self._state
+        if state is None or time.monotonic() - state[2] > self.ttl_seconds:
+            return None
+        return state
+
+    def current_offset(self) -> Optional[float]:
+        """Get smoothed offset in seconds, or None if stale/unknown"""
+        state = self._fresh_state()
+        return state[0] if state is not None else None
+
+    def sync_status(self) -> Optional[bool]:
+        """Get sync status from the cached offset (None if stale/unknown)"""
+        offset = self.current_offset()
+        if offset is None:
+            return None
+        return abs(offset) <= self.threshold_seconds
+
+    def signing_time(self) -> datetime:
+        """Get UTC time corrected for the local clock offset"""
+        now = datetime.now(timezone.utc)
+        offset = self.current_offset()
+        if offset:
+            # Local ahead (positive offset) -> step back to Google's time
+            now -= timedelta(seconds=offset)
+        return now
+
+    def goog_date(self) -> str:
+        """
+        Get a skew-compensated X-Goog-Date value
+
+        Returns:
+            Timestamp in ``YYYYMMDDTHHMMSSZ`` format
+        """
+        return self.signing_time().strftime(GOOG_DATE_FORMAT)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get diagnostic snapshot for metrics summaries"""
+        state = self._state
+        age = time.monotonic() - state[2] if state is not None else None
+        fresh = age is not None and age <= self.ttl_seconds
+
+        return {
+            "offset_seconds": round(state[0], 3) if fresh else None,
+            "raw_offset_seconds": round(state[1], 3) if state else None,
+            "source": state[3] if state else None,
+            "age_seconds": round(age, 1) if age is not None else None,
+            "is_fresh": fresh,
+            "is_synchronized": self.sync_status(),
+            "samples": self._samples,
+            "failures": self._failures,
+            "running": self._thread is not None and self._thread.is_alive(),
+        }
@@ -0,0 +1,422 @@
+"""
+Parallel Composite Upload
+=========================
+Uploads a large in-memory archive as concurrent parts and assembles them
+with GCS ``compose``.
+
+A single ``upload_from_file`` stream is limited by one connection, so for
+archives of hundreds of MB the upload takes as long as downloading the
+PDFs. Here the buffer is cut into ``part_size`` slices (read straight from
+the buffer, no copies), each slice is uploaded as a temporary object on its
+own thread, and the parts are composed into the destination object. GCS
+composes at most 32 sources per call, so larger part counts are composed in
+tiers.
+
+For archives that are still being built, ``ParallelCompositeUploader.open``
+returns a write-only stream instead: parts are cut as the writer fills
+them and uploaded while later data is still being produced, with at most
+``max_parts_in_flight`` parts buffered (memory ~ (max_parts_in_flight + 1)
+x part_size, independent of the archive size). The parts are composed when
+the stream is closed.
+
+Temporary parts live next to the destination under
+``{blob_name}.parts/{upload_id}/`` and are deleted once the final object
+exists or the upload fails. A bucket lifecycle rule on that prefix catches
+parts left behind by a crashed process.
+
+Note: composite objects have a CRC32C but no MD5 hash.
+
+Configuration (config.yaml):
+    pdf:
+      zip:
+        composite_upload:
+          enabled: true
+          threshold_mb: 150      # Archives at least this large use parts
+          part_size_mb: 32
+          max_workers: 8
+          max_parts_in_flight: 4 # Parts buffered by a streamed upload
+"""
+
+import concurrent.futures
+import io
+import sys
+import time
+import uuid
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from google.api_core.exceptions import NotFound
+from google.cloud import storage
+
+from src.core.config import ConfigLoader
+
+# GCS limit for source objects in one compose request
+MAX_COMPOSE_SOURCES = 32
+
+
+class _SliceReader(io.RawIOBase):
+    """Read-only file object over a memoryview slice (no copy)"""
+
+    def __init__(self, view: memoryview):
+        self._view = view
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._pos, io.SEEK_END: len(self._view)}
+        self._pos = max(0, min(len(self._view), base[whence] + offset))
+        return self._pos
+
+    def readinto(self, buffer) -> int:
+        size = min(len(buffer), len(self._view) - self._pos)
+        buffer[:size] = self._view[self._pos : self._pos + size]
+        self._pos += size
+        return size
+
+
+@dataclass
+class CompositeUploadResult:
+    """Outcome of one composite upload"""
+
+    bytes_uploaded: int
+    parts: int
+    upload_time_ms: int
+
+
+class ParallelCompositeUploader:
+    """
+    Uploads a buffer to a blob as concurrent parts plus compose
+
+    Example:
+        >>> uploader = ParallelCompositeUploader(part_size_bytes=32 << 20)
+        >>> result = uploader.upload(zip_buffer, bucket.blob("zips/a/b.zip"))
+    """
+
+    def __init__(
+        self,
+        part_size_bytes: int = 32 * 1024 * 1024,
+        max_workers: int = 8,
+        max_parts_in_flight: int = 4,
+    ):
+        """
+        Initialize uploader
+
+        Args:
+            part_size_bytes: Size of each temporary part (last one may be
+                smaller)
+            max_workers: Concurrent part uploads
+            max_parts_in_flight: Parts a streamed upload (open()) keeps in
+                memory while they upload; the writer waits beyond this
+        """
+        self.part_size_bytes = max(1, int(part_size_bytes))
+        self.max_workers = max(1, int(max_workers))
+        self.max_parts_in_flight = max(1, int(max_parts_in_flight))
+
+    @classmethod
+    def from_config(cls, config: ConfigLoader) -> "ParallelCompositeUploader":
+        """Build the uploader from pdf.zip.composite_upload"""
+        return cls(
+            part_size_bytes=int(
+                float(config.get("pdf.zip.composite_upload.part_size_mb", 32))
+                * 1024
+                * 1024
+            ),
+            max_workers=int(config.get("pdf.zip.composite_upload.max_workers", 8)),
+            max_parts_in_flight=int(
+                config.get("pdf.zip.composite_upload.max_parts_in_flight", 4)
+            ),
+        )
+
+    def upload(
+        self,
+        buffer: io.BytesIO,
+        destination: storage.Blob,
+        content_type: str = "application/zip",
+    ) -> CompositeUploadResult:
+        """
+        Upload the whole buffer to ``destination``
+
+        ``destination.metadata`` (if set) is kept on the composed object.
+
+        Args:
+            buffer: In-memory archive
+            destination: Final blob
+            content_type: Content type of the final object
+
+        Returns:
+            CompositeUploadResult with size, part count and duration
+
+        Raises:
+            Exception: Any part upload or compose error (parts are deleted)
+        """
+        start = time.time()
+        view = buffer.getbuffer()
+        total = view.nbytes
+        bucket = destination.bucket
+        prefix = f"{destination.name}.parts/{uuid.uuid4().hex}"
+        temporary: List[storage.Blob] = []
+
+        try:
+            offsets = list(range(0, total, self.part_size_bytes)) or [0]
+            parts = [bucket.blob(f"{prefix}/part-{i:05d}") for i in range(len(offsets))]
+            temporary.extend(parts)
+
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(parts)),
+                thread_name_prefix="zip-upload",
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        self._upload_part, part, view[offset : offset + self.part_size_bytes]
+                    )
+                    for part, offset in zip(parts, offsets)
+                ]
+                for future in futures:
+                    future.result()
+
+            self._compose(parts, destination, prefix, content_type, temporary)
+        finally:
+            view.release()
+            self._delete_parts(temporary)
+
+        upload_time_ms = int((time.time() - start) * 1000)
+        print(
+            f"[ZIP] Composite upload {destination.name}: {len(offsets)} parts, "
+            f"{total} bytes in {upload_time_ms}ms",
+            file=sys.stderr,
+        )
+        return CompositeUploadResult(
+            bytes_uploaded=total, parts=len(offsets), upload_time_ms=upload_time_ms
+        )
+
+    def open(
+        self, destination: storage.Blob, content_type: str = "application/zip"
+    ) -> "CompositeUploadStream":
+        """
+        Open a write-only stream that uploads to ``destination`` in parts
+
+        Use it as a context manager: leaving the block normally composes the
+        parts into ``destination``; leaving it with an exception deletes the
+        parts and creates nothing.
+
+        Args:
+            destination: Final blob (``metadata``, if set, is kept)
+            content_type: Content type of the final object
+
+        Returns:
+            CompositeUploadStream (its result is set once it is closed)
+        """
+        return CompositeUploadStream(self, destination, content_type)
+
+    @staticmethod
+    def _compose(
+        parts: List[storage.Blob],
+        destination: storage.Blob,
+        prefix: str,
+        content_type: str,
+        temporary: List[storage.Blob],
+    ) -> None:
+        """Compose parts into destination, in tiers of at most 32 sources"""
+        bucket = destination.bucket
+        sources = parts
+        tier = 0
+        while len(sources) > MAX_COMPOSE_SOURCES:
+            composed = []
+            for i in range(0, len(sources), MAX_COMPOSE_SOURCES):
+                intermediate = bucket.blob(f"{prefix}/tier{tier}-{i:05d}")
+                intermediate.content_type = content_type
+                intermediate.compose(sources[i : i + MAX_COMPOSE_SOURCES])
+                temporary.append(intermediate)
+                composed.append(intermediate)
+            sources = composed
+            tier += 1
+
+        destination.content_type = content_type
+        destination.compose(sources)
+
+    @staticmethod
+    def _upload_part(part: storage.Blob, data: memoryview) -> None:
+        part.upload_from_file(
+            _SliceReader(data),
+            size=len(data),
+            content_type="application/octet-stream",
+        )
+
+    @staticmethod
+    def _delete_parts(parts: List[storage.Blob]) -> None:
+        """Delete temporary objects (never raises)"""
+        for part in parts:
+            try:
+                part.delete()
+            except NotFound:
+                pass
+            except Exception as e:
+                print(
+                    f"[ZIP] WARN Could not delete upload part {part.name}: {e}",
+                    file=sys.stderr,
+                )
+
+
+class CompositeUploadStream(io.RawIOBase):
+    """
+    Write-only stream that uploads fixed-size parts as they fill
+
+    Full parts are handed to an upload pool right away; once
+    ``max_parts_in_flight`` parts are uploading, write() waits for the
+    oldest one (backpressure on the archive writer). close() uploads the
+    last part and composes everything into the destination.
+
+    upload_time_ms in the result is the time at least one part upload (or
+    the compose) was running, so its throughput is that of the upload
+    itself even though it overlaps the build.
+    """
+
+    def __init__(
+        self,
+        uploader: ParallelCompositeUploader,
+        destination: storage.Blob,
+        content_type: str = "application/zip",
+    ):
+        self._uploader = uploader
+        self._destination = destination
+        self._content_type = content_type
+        self._prefix = f"{destination.name}.parts/{uuid.uuid4().hex}"
+        self._buffer = bytearray()
+        self._parts: List[storage.Blob] = []
+        self._temporary: List[storage.Blob] = []
+        self._in_flight: List[concurrent.futures.Future] = []
+        self._busy: List[Tuple[float, float]] = []
+        self._bytes_written = 0
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(uploader.max_workers, uploader.max_parts_in_flight),
+            thread_name_prefix="zip-upload",
+        )
+        self.result: Optional[CompositeUploadResult] = None
+
+    def writable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return False
+
+    def tell(self) -> int:
+        return self._bytes_written
+
+    def write(self, data) -> int:
+        if self.closed:
+            raise ValueError("write to closed CompositeUploadStream")
+        view = memoryview(data).cast("B")
+        part_size = self._uploader.part_size_bytes
+        offset = 0
+        while offset < len(view):
+            take = min(part_size - len(self._buffer), len(view) - offset)
+            self._buffer += view[offset : offset + take]
+            offset += take
+            if len(self._buffer) == part_size:
+                self._submit_part()
+        self._bytes_written += len(view)
+        return len(view)
+
+    def close(self) -> None:
+        """Upload the last part and compose (parts are deleted either way)"""
+        if self.closed:
+            return
+        try:
+            if self._buffer or not self._parts:
+                self._submit_part()
+            self._wait_parts(0)
+            compose_start = time.time()
+            self._uploader._compose(
+                self._parts,
+                self._destination,
+                self._prefix,
+                self._content_type,
+                self._temporary,
+            )
+            self._busy.append((compose_start, time.time()))
+        except BaseException:
+            self.abort()
+            raise
+        self._finish()
+
+        self.result = CompositeUploadResult(
+            bytes_uploaded=self._bytes_written,
+            parts=len(self._parts),
+            upload_time_ms=self._busy_ms(),
+        )
+        print(
+            f"[ZIP] Composite upload {self._destination.name}: "
+            f"{len(self._parts)} parts, {self._bytes_written} bytes, "
+            f"uploading for {self.result.upload_time_ms}ms",
+            file=sys.stderr,
+        )
+
+    def abort(self) -> None:
+        """Stop uploading and delete the parts; nothing is composed"""
+        if self.closed:
+            return
+        for future in self._in_flight:
+            future.cancel()
+        self._finish()
+
+    def __del__(self) -> None:
+        # IOBase would close(), composing a partial archive
+        try:
+            self.abort()
+        except Exception:
+            pass
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def _submit_part(self) -> None:
+        self._wait_parts(self._uploader.max_parts_in_flight - 1)
+        part = self._destination.bucket.blob(
+            f"{self._prefix}/part-{len(self._parts):05d}"
+        )
+        self._parts.append(part)
+        self._temporary.append(part)
+        data, self._buffer = self._buffer, bytearray()
+        self._in_flight.append(self._executor.submit(self._upload_timed, part, data))
+
+    def _upload_timed(self, part: storage.Blob, data: bytearray) -> None:
+        start = time.time()
+        self._uploader._upload_part(part, memoryview(data))
+        self._busy.append((start, time.time()))
+
+    def _wait_parts(self, max_pending: int) -> None:
+        """Wait until at most max_pending parts are uploading (raises their errors)"""
+        while len(self._in_flight) > max_pending:
+            self._in_flight.pop(0).result()
+
+    def _finish(self) -> None:
+        self._executor.shutdown(wait=True)
+        self._uploader._delete_parts(self._temporary)
+        self._buffer = bytearray()
+        super().close()
+
+    def _busy_ms(self) -> int:
+        """Length of the union of the upload intervals"""
+        total = 0.0
+        current_start = current_end = None
+        for start, end in sorted(self._busy):
+            if current_end is None or start > current_end:
+                if current_end is not None:
+                    total += current_end - current_start
+                current_start, current_end = start, end
+            else:
+                current_end = max(current_end, end)
+        if current_end is not None:
+            total += current_end - current_start
+        return int(total * 1000)
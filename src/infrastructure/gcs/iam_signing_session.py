@@ -0,0 +1,284 @@
+"""
+IAM Signing Session for Manual V4 Signed URLs
+==============================================
+Long-lived client for the IAM Credentials ``signBlob`` endpoint.
+
+The manual V4 path in RobustURLSigner used to resolve Application Default
+Credentials and build a discovery client for every URL. This session keeps
+the source credentials and a pooled HTTP session alive for the lifetime of
+the signer, so each signature costs a single HTTPS round trip.
+
+Features:
+- Source credentials resolved once and refreshed proactively before expiry
+- Pooled ``AuthorizedSession`` (keep-alive connections to iamcredentials)
+- Thread-safe reuse across concurrent ``generate_signed_url`` calls
+- Explicit ``invalidate()`` hook for forced credential renewal
+
+Configuration (config.yaml):
+    gcs:
+      signed_urls:
+        signing_session:
+          endpoint: https://iamcredentials.googleapis.com
+          timeout_seconds: 10
+          refresh_margin_seconds: 300
+          pool_maxsize: 20
+"""
+
+import base64
+import logging
+import time
+from datetime import datetime, timezone
+from threading import Lock
+from typing import Any, Dict, Optional
+
+import google.auth
+from google.auth.transport.requests import AuthorizedSession, Request
+from requests.adapters import HTTPAdapter
+
+from src.core.config import get_config
+
+logger = logging.getLogger(__name__)
+
+CLOUD_PLATFORM_SCOPE = "https://www.googleapis.com/auth/cloud-platform"
+DEFAULT_IAM_ENDPOINT = "https://iamcredentials.googleapis.com"
+
+
+class IAMSigningError(Exception):
+    """Raised when the IAM signBlob endpoint rejects a signing request"""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class SigningRateLimitError(IAMSigningError):
+    """Raised when signBlob returns 429 (quota exhausted); callers should back off"""
+
+
+class IAMSigningSession:
+    """
+    Reusable signBlob client bound to a single service account.
+
+    Credentials and the HTTP session are created lazily on first use and
+    shared by every caller. Token refresh happens under a lock when the
+    access token is within ``refresh_margin_seconds`` of expiring, so
+    concurrent signers never race on a refresh.
+
+    Example:
+        >>> session = IAMSigningSession("signer@project.iam.gserviceaccount.com")
+        >>> signature = session.sign_blob(b"string-to-sign")
+    """
+
+    def __init__(
+        self,
+        service_account_email: str,
+        credentials: Optional[Any] = None,
+        session: Optional[AuthorizedSession] = None,
+        endpoint: Optional[str] = None,
+        timeout_seconds: Optional[float] = None,
+        refresh_margin_seconds: Optional[int] = None,
+    ):
+        """
+        Initialize signing session.
+
+        Args:
+            service_account_email: Service account that owns the signing key
+            credentials: Source credentials (default: resolved via ADC on first use)
+            session: Pre-built authorized session (default: created on first use)
+            endpoint: IAM Credentials API base URL (default: from config)
+            timeout_seconds: HTTP timeout per signBlob call (default: from config)
+            refresh_margin_seconds: Refresh token this long before expiry
+        """
+        config = get_config()
+        self.service_account_email = service_account_email
+        self.endpoint = (
+            endpoint
+            or config.get("gcs.signed_urls.signing_session.endpoint")
+            or DEFAULT_IAM_ENDPOINT
+        ).rstrip("/")
+        self.timeout_seconds = float(
+            timeout_seconds
+            if timeout_seconds is not None
+            else config.get("gcs.signed_urls.signing_session.timeout_seconds", 10)
+        )
+        self.refresh_margin_seconds = int(
+            refresh_margin_seconds
+            if refresh_margin_seconds is not None
+            else config.get(
+                "gcs.signed_urls.signing_session.refresh_margin_seconds", 300
+            )
+        )
+        self.pool_maxsize = int(
+            config.get("gcs.signed_urls.signing_session.pool_maxsize", 20)
+        )
+
+        self._credentials = credentials
+        self._session = session
+        self._lock = Lock()
+
+        # Statistics
+        self._sign_count = 0
+        self._credential_refreshes = 0
+        self._sessions_created = 0
+        self._total_sign_time = 0.0
+
+    @property
+    def sign_url(self) -> str:
+        """Full signBlob URL for the configured service account"""
+        return (
+            f"{self.endpoint}/v1/projects/-/serviceAccounts/"
+            f"{self.service_account_email}:signBlob"
+        )
+
+    def _needs_refresh(self) -> bool:
+        """Check whether the cached token is missing or close to expiry"""
+        credentials = self._credentials
+        if credentials is None or not getattr(credentials, "token", None):
+            return True
+
+        expiry = getattr(credentials, "expiry", None)
+        if expiry is None:
+            return False
+
+        # google-auth stores expiry as naive UTC
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return (expiry - now).total_seconds() <= self.refresh_margin_seconds
+
+    def _ensure_session(self) -> AuthorizedSession:
+        """
+        Return the shared authorized session, refreshing credentials if needed
+
+        Uses double-checked locking so the common path takes no lock.
+        """
+        session = self._session
+        if session is not None and not self._needs_refresh():
+            return session
+
+        with self._lock:
+            if self._credentials is None:
+                self._credentials, _ = google.auth.default(
+                    scopes=[CLOUD_PLATFORM_SCOPE]
+                )
+                logger.info(
+                    "Signing session resolved source credentials",
+                    extra={"credential_type": type(self._credentials).__name__},
+                )
+
+            if self._needs_refresh():
+                self._credentials.refresh(Request())
+                self._credential_refreshes += 1
+                logger.debug(
+                    "Signing session refreshed access token",
+                    extra={"refresh_count": self._credential_refreshes},
+                )
+
+            if self._session is None:
+                session = AuthorizedSession(self._credentials)
+                adapter = HTTPAdapter(
+                    pool_connections=1, pool_maxsize=self.pool_maxsize
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._session = session
+                self._sessions_created += 1
+                logger.info(
+                    "Signing session created",
+                    extra={
+                        "service_account_email": self.service_account_email,
+                        "endpoint": self.endpoint,
+                        "pool_maxsize": self.pool_maxsize,
+                    },
+                )
+
+            return self._session
+
+    def sign_blob(self, payload: bytes) -> bytes:
+        """
+        Sign raw bytes with the service account key via IAM signBlob
+
+        Args:
+            payload: Raw bytes to sign (e.g. V4 string-to-sign)
+
+        Returns:
+            Raw RSA-SHA256 signature bytes
+
+        Raises:
+            SigningRateLimitError: If the endpoint throttles the request (429)
+            IAMSigningError: If the endpoint returns any other non-200 response
+        """
+        start_time = time.time()
+        session = self._ensure_session()
+        body = {"payload": base64.b64encode(payload).decode("utf-8")}
+
+        response = session.post(self.sign_url, json=body, timeout=self.timeout_seconds)
+
+        if response.status_code == 401:
+            # Token revoked server-side before expiry: force refresh once
+            self.invalidate(drop_credentials=False)
+            session = self._ensure_session()
+            response = session.post(
+                self.sign_url, json=body, timeout=self.timeout_seconds
+            )
+
+        if response.status_code == 429:
+            raise SigningRateLimitError(
+                "signBlob rate limited (HTTP 429)", status_code=429
+            )
+
+        if response.status_code != 200:
+            raise IAMSigningError(
+                f"signBlob failed with HTTP {response.status_code}: "
+                f"{response.text[:200]}",
+                status_code=response.status_code,
+            )
+
+        signature = base64.b64decode(response.json()["signedBlob"])
+
+        with self._lock:
+            self._sign_count += 1
+            self._total_sign_time += time.time() - start_time
+
+        return signature
+
+    def invalidate(self, drop_credentials: bool = True) -> None:
+        """
+        Discard cached state so the next call starts fresh
+
+        Args:
+            drop_credentials: Also forget the source credentials and re-run
+                ADC resolution (False only expires the current token)
+        """
+        with self._lock:
+            if drop_credentials:
+                if self._session is not None:
+                    self._session.close()
+                self._session = None
+                self._credentials = None
+            elif self._credentials is not None:
+                self._credentials.token = None
+
+        logger.info(
+            "Signing session invalidated",
+            extra={"drop_credentials": drop_credentials},
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get signing session statistics
+
+        Returns:
+            Dictionary with call counts, refreshes and average latency
+        """
+        with self._lock:
+            avg_ms = (
+                (self._total_sign_time / self._sign_count) * 1000
+                if self._sign_count
+                else 0.0
+            )
+            return {
+                "service_account_email": self.service_account_email,
+                "sign_count": self._sign_count,
+                "credential_refreshes": self._credential_refreshes,
+                "sessions_created": self._sessions_created,
+                "avg_sign_ms": round(avg_ms, 2),
+            }
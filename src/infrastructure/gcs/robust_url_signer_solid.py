@@ -29,14 +29,19 @@ from urllib.parse import quote
 from google.cloud import storage
 from google.auth import impersonated_credentials, default
 from google.oauth2 import service_account
-from googleapiclient import discovery
 
 from src.domain.interfaces.time_sync import ITimeSyncValidator
+from src.domain.interfaces.clock_offset import IClockOffsetProvider
 from src.domain.interfaces.environment_validator import IEnvironmentValidator
 from src.domain.interfaces.retry_strategy import IRetryStrategy
 from src.domain.interfaces.metrics_collector import IMetricsCollector
 from src.core.config.yaml_config_loader import ConfigLoader
 from src.infrastructure.gcs.circuit_breaker import CircuitBreaker
+from src.infrastructure.gcs.iam_signing_session import (
+    IAMSigningSession,
+    SigningRateLimitError,
+)
+from src.infrastructure.gcs.batch_signing_engine import BatchSigningEngine
 
 
 logger = logging.getLogger(__name__)
@@ -56,6 +61,8 @@ class RobustURLSigner:
     - IEnvironmentValidator: Validates environment configuration
     - IRetryStrategy: Handles transient errors with exponential backoff
     - IMetricsCollector: Collects performance and error metrics
+    - IClockOffsetProvider (optional): Cached clock offset, replaces the
+      per-URL HTTP HEAD time check and compensates X-Goog-Date for skew
 
     Configuration (config.yaml):
         gcs:
@@ -75,6 +82,7 @@ class RobustURLSigner:
         environment_validator: IEnvironmentValidator,
         retry_strategy: IRetryStrategy,
         metrics_collector: IMetricsCollector,
+        clock_offset_tracker: Optional[IClockOffsetProvider] = None,
     ):
         """
         Initialize robust URL signer with dependencies
@@ -84,11 +92,13 @@ class RobustURLSigner:
             environment_validator: Environment configuration validator
             retry_strategy: Retry strategy for transient errors
             metrics_collector: Metrics collector for monitoring
+            clock_offset_tracker: Optional cached clock offset provider
         """
         self.time_sync = time_sync_validator
         self.env_validator = environment_validator
         self.retry = retry_strategy
         self.metrics = metrics_collector
+        self.clock_offset = clock_offset_tracker
 
         # Configuration
         self.config = ConfigLoader()
@@ -113,6 +123,12 @@ class RobustURLSigner:
         self._impersonated_client = None
         self._adc_client = None
 
+        # Long-lived signBlob session for the manual V4 path
+        self._signing_session: Optional[IAMSigningSession] = None
+
+        # Concurrent, rate-limited engine for generate_batch_signed_urls
+        self._batch_engine: Optional[BatchSigningEngine] = None
+
         # Circuit breaker for preventing cascading failures
         self._circuit_breaker = CircuitBreaker(name="gcs_signed_url")
 
@@ -139,8 +155,12 @@ class RobustURLSigner:
         Returns:
             Buffer time in minutes (5/3/1 based on sync status)
         """
-        # get_sync_info returns (local_time, google_time, time_diff_seconds)
-        local_time, google_time, time_diff = self.time_sync.get_sync_info()
+        if self.clock_offset is not None:
+            # O(1) read of the background estimate (no network round trip)
+            time_diff = self.clock_offset.current_offset()
+        else:
+            # get_sync_info returns (local_time, google_time, time_diff_seconds)
+            local_time, google_time, time_diff = self.time_sync.get_sync_info()
 
         # Get threshold and buffer values from config
         threshold_seconds = self.config.get("gcs.time_sync.threshold_seconds", 60)
@@ -629,6 +649,39 @@ class RobustURLSigner:
 
         return signed_url
 
+    def _get_batch_engine(self) -> BatchSigningEngine:
+        """
+        Get the batch signing engine bound to generate_signed_url
+
+        Returns:
+            Batch engine sharing the process-wide signBlob rate limiter
+        """
+        if self._batch_engine is not None:
+            return self._batch_engine
+
+        with self._client_lock:
+            if self._batch_engine is None:
+                self._batch_engine = BatchSigningEngine(self.generate_signed_url)
+            return self._batch_engine
+
+    def _get_signing_session(self) -> IAMSigningSession:
+        """
+        Get the shared IAM signing session for manual V4 signing
+
+        Returns:
+            Signing session bound to the configured service account
+        """
+        # Thread-safe double-check locking pattern
+        if self._signing_session is not None:
+            return self._signing_session
+
+        with self._client_lock:
+            if self._signing_session is None:
+                self._signing_session = IAMSigningSession(
+                    service_account_email=self.service_account_email
+                )
+            return self._signing_session
+
     def _generate_signed_url_manual(
         self,
         bucket_name: str,
@@ -664,8 +717,11 @@ class RobustURLSigner:
             escaped_object_name = quote(blob_name.encode("utf-8"), safe=b"/~")
             canonical_uri = f"/{escaped_object_name}"
 
-            # Get current UTC time
-            datetime_now = datetime.now(tz=timezone.utc)
+            # Get current UTC time (corrected for local clock skew if tracked)
+            if self.clock_offset is not None:
+                datetime_now = self.clock_offset.signing_time()
+            else:
+                datetime_now = datetime.now(tz=timezone.utc)
             request_timestamp = datetime_now.strftime("%Y%m%dT%H%M%SZ")
             datestamp = datetime_now.strftime("%Y%m%d")
 
@@ -742,46 +798,11 @@ class RobustURLSigner:
                 ]
             )
 
-            # Sign using IAM signBlob API
-            # Get source credentials for impersonation
-            source_credentials, _ = default()
-
-            # Create IAM client
-            iam_client = discovery.build(
-                "iamcredentials",
-                "v1",
-                credentials=source_credentials,
-                cache_discovery=False,
-            )
-
-            import base64
-
-            # CRITICAL: IAM signBlob expects the RAW BYTES to sign (not pre-base64'd)
-            # The API will base64-encode internally, and return base64-encoded signature
-            # So we encode string_to_sign as bytes, then the API handles base64
-            string_to_sign_bytes = string_to_sign.encode("utf-8")
-
-            # Call signBlob - API expects base64-encoded payload
-            service_account_name = f"projects/-/serviceAccounts/{client_email}"
-            sign_request = (
-                iam_client.projects()
-                .serviceAccounts()
-                .signBlob(
-                    name=service_account_name,
-                    body={
-                        "payload": base64.b64encode(string_to_sign_bytes).decode(
-                            "utf-8"
-                        )
-                    },
-                )
+            # Sign using IAM signBlob API over the cached signing session
+            # (credentials and HTTP connection pool are reused across calls)
+            signature_bytes = self._get_signing_session().sign_blob(
+                string_to_sign.encode("utf-8")
             )
-
-            sign_response = sign_request.execute()
-
-            # Response contains base64-encoded signature bytes
-            # Decode from base64, then convert to hex (GCS V4 expects hex signature)
-            signed_blob_b64 = sign_response["signedBlob"]
-            signature_bytes = base64.b64decode(signed_blob_b64)
             signature = binascii.hexlify(signature_bytes).decode()
 
             # Build final URL
@@ -800,6 +821,10 @@ class RobustURLSigner:
 
             return signed_url
 
+        except SigningRateLimitError:
+            # Quota throttling: let batch callers back off instead of falling
+            # back to SDK methods that hit the same signBlob quota
+            raise
         except Exception as e:
             logger.error(
                 f"Failed to generate manual signed URL: {type(e).__name__}: {str(e)}",
@@ -911,6 +936,10 @@ class RobustURLSigner:
         with self._client_lock:
             self._impersonated_client = None
             self._last_credential_refresh = None
+            signing_session = self._signing_session
+
+        if signing_session is not None:
+            signing_session.invalidate()
 
         # Retry with fresh credentials
         signed_url = self.generate_signed_url(gs_url, expiration_minutes)
@@ -1098,6 +1127,15 @@ class RobustURLSigner:
 
                 break  # Success - exit fallback loop
 
+            except SigningRateLimitError:
+                # Throttling is not a signer failure (circuit breaker untouched)
+                self.metrics.record_url_generation(
+                    bucket=bucket_name,
+                    duration=time.time() - start_time,
+                    success=False,
+                    clock_skew_detected=clock_skew_detected,
+                )
+                raise
             except Exception as e:
                 logger.warning(
                     "URL generation failed with method - trying next",
@@ -1166,17 +1204,11 @@ class RobustURLSigner:
             },
         )
 
-        result = {}
-        for i, gs_url in enumerate(gs_urls):
-            # Add delay between requests to avoid signBlob rate limiting
-            # Google applies throttling on concurrent signBlob calls
-            if i > 0:
-                time.sleep(0.05)  # 50ms delay between generations
-
-            result[gs_url] = self.generate_signed_url(
-                gs_url=gs_url,
-                expiration_minutes=expiration_minutes,
-            )
+        # Concurrent signing under the shared signBlob rate limiter
+        # (replaces fixed 50ms sleeps between sequential generations)
+        result = self._get_batch_engine().sign_map(
+            gs_urls, expiration_minutes=expiration_minutes
+        )
 
         successful = sum(1 for url in result.values() if url is not None)
         logger.info(
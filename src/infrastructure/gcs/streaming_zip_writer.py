@@ -0,0 +1,281 @@
+"""
+Streaming ZIP Writer
+====================
+Builds a ZIP archive entry by entry into any writable stream (typically a
+GCS resumable upload opened with ``blob.open("wb")``) while PDFs are still
+being downloaded.
+
+The previous pipeline collected every PDF into one ``io.BytesIO`` and only
+then started the upload, so peak memory was the whole archive and upload
+could not overlap download. Here:
+
+- At most ``window`` downloads are in flight or waiting to be written; a new
+  download is submitted only when a finished one has been written
+  (backpressure on the download pool)
+- Each finished entry is appended to the ZIP immediately and the upload
+  stream pushes full chunks to GCS as they fill
+- Peak memory is roughly window x PDF size + one upload chunk, independent
+  of the archive size
+- With an AIMD concurrency controller the number of downloads in flight
+  follows the controller's limit instead of the fixed window, and throttled
+  downloads are retried at the reduced concurrency
+- Downloads are submitted in entry order (the ZIP planner passes them
+  largest-first) and a gs:// path shared by several entries is downloaded
+  once and written under each of its names
+
+Configuration (config.yaml):
+    pdf:
+      zip:
+        streaming:
+          enabled: true
+          chunk_size_mb: 8         # Resumable upload chunk (multiple of 256 KB)
+          window_per_worker: 2     # In-flight downloads per worker
+"""
+
+import concurrent.futures
+import io
+import sys
+import time
+import zipfile
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.infrastructure.gcs.adaptive_concurrency import AIMDConcurrencyController
+from src.infrastructure.gcs.zip_compression import CompressionStats, ZipCompressionPolicy
+
+# GCS resumable uploads require chunk sizes in multiples of 256 KB
+UPLOAD_CHUNK_ALIGNMENT = 256 * 1024
+
+
+def align_chunk_size(chunk_size_bytes: int) -> int:
+    """Round a chunk size up to the 256 KB multiple GCS requires"""
+    chunks = max(1, -(-int(chunk_size_bytes) // UPLOAD_CHUNK_ALIGNMENT))
+    return chunks * UPLOAD_CHUNK_ALIGNMENT
+
+
+def current_rss_bytes() -> int:
+    """
+    Current resident set size of this process
+
+    Reads /proc/self/statm on Linux; elsewhere falls back to the lifetime
+    maximum reported by getrusage. Returns 0 where neither is available
+    (the resource module is Unix-only, e.g. on Windows).
+    """
+    try:
+        import resource
+    except ImportError:
+        return 0
+    try:
+        with open("/proc/self/statm") as statm:
+            resident_pages = int(statm.read().split()[1])
+        return resident_pages * resource.getpagesize()
+    except (OSError, ValueError, IndexError):
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is bytes on macOS, kilobytes elsewhere
+        return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+class _ProgressStream(io.RawIOBase):
+    """
+    Write-only pass-through that counts bytes and timestamps the first
+    upload
+
+    The wrapped upload stream sends data once ``first_upload_bytes`` have
+    been buffered (one chunk) or when it is closed, so that is when the
+    first byte reaches GCS.
+    """
+
+    def __init__(self, raw, first_upload_bytes: int):
+        self._raw = raw
+        self._first_upload_bytes = first_upload_bytes
+        self.bytes_written = 0
+        self.first_upload_at: Optional[float] = None
+
+    def writable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return False
+
+    def tell(self) -> int:
+        return self.bytes_written
+
+    def write(self, data) -> int:
+        written = self._raw.write(data)
+        self.bytes_written += len(data)
+        if self.first_upload_at is None and self.bytes_written >= self._first_upload_bytes:
+            self.first_upload_at = time.time()
+        return written if written is not None else len(data)
+
+    def flush(self) -> None:
+        # zipfile flushes after the end record; upload streams flush on close
+        pass
+
+
+@dataclass
+class StreamingZipResult:
+    """Outcome of one streamed archive"""
+
+    files_included: int = 0
+    files_missing: int = 0
+    duplicate_downloads_avoided: int = 0
+    bytes_written: int = 0
+    parallel_download_time_ms: int = 0
+    time_to_first_upload_ms: Optional[int] = None
+    peak_rss_bytes: int = 0
+    compression: Optional[CompressionStats] = None
+    errors: List[str] = field(default_factory=list)
+
+
+class StreamingZipWriter:
+    """
+    Writes a ZIP into a stream as concurrent downloads complete
+
+    Example:
+        >>> writer = StreamingZipWriter(download_pdf, max_workers=10)
+        >>> with blob.open("wb", ignore_flush=True, chunk_size=8 << 20) as out:
+        ...     result = writer.write(entries, out, first_upload_bytes=8 << 20)
+    """
+
+    def __init__(
+        self,
+        download_func: Callable[[str], bytes],
+        max_workers: int = 10,
+        window: Optional[int] = None,
+        compression_policy: Optional[ZipCompressionPolicy] = None,
+        concurrency: Optional[AIMDConcurrencyController] = None,
+    ):
+        """
+        Initialize streaming writer
+
+        Args:
+            download_func: Callable returning the bytes of a gs:// path
+            max_workers: Download pool size
+            window: Maximum downloads in flight or awaiting write
+                (default: 2 x max_workers)
+            compression_policy: Per-entry compression policy
+                (default: DEFLATE, level 6)
+            concurrency: Adaptive limit on downloads in flight (pool size
+                becomes its max_workers; window is then ignored)
+        """
+        self.concurrency = concurrency
+        if concurrency is not None:
+            max_workers = concurrency.max_workers
+            download_func = concurrency.instrument(download_func)
+        self.download_func = download_func
+        self.max_workers = max(1, int(max_workers))
+        self.window = max(self.max_workers, int(window or 2 * self.max_workers))
+        self.compression_policy = compression_policy or ZipCompressionPolicy("deflate")
+
+    def write(
+        self,
+        entries: Iterable[Tuple[str, str]],
+        stream,
+        first_upload_bytes: int = 1,
+    ) -> StreamingZipResult:
+        """
+        Download entries and append them to a ZIP written to ``stream``
+
+        Downloads are submitted in entry order, one per distinct gs:// path,
+        and entries are written in completion order. A failed download is
+        logged and its entries skipped, like the buffered pipeline did. The ZIP central
+        directory is written at the end; the caller closes ``stream``.
+
+        Args:
+            entries: (archive filename, gs:// path) pairs
+            stream: Writable file object (need not be seekable)
+            first_upload_bytes: Bytes buffered by ``stream`` before it sends
+                its first chunk (used for time-to-first-upload)
+
+        Returns:
+            StreamingZipResult with counts, timings and peak RSS
+        """
+        result = StreamingZipResult(compression=self.compression_policy.new_stats())
+        progress = _ProgressStream(stream, first_upload_bytes)
+        start = time.time()
+        peak_rss = current_rss_bytes()
+
+        # gs:// path -> archive filenames, in first-seen order
+        arcnames_by_path: Dict[str, List[str]] = {}
+        for arcname, gs_path in entries:
+            arcnames_by_path.setdefault(gs_path, []).append(arcname)
+        result.duplicate_downloads_avoided = sum(
+            len(arcnames) - 1 for arcnames in arcnames_by_path.values()
+        )
+
+        # (archive filenames, gs:// path, retries so far)
+        pending = (
+            (arcnames, gs_path, 0) for gs_path, arcnames in arcnames_by_path.items()
+        )
+        retries = []
+        in_flight = {}
+
+        def in_flight_limit() -> int:
+            if self.concurrency is not None:
+                return self.concurrency.limit
+            return self.window
+
+        with zipfile.ZipFile(progress, "w", zipfile.ZIP_DEFLATED) as zip_file:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="zip-download",
+            ) as executor:
+
+                def submit_next() -> bool:
+                    entry = retries.pop(0) if retries else next(pending, None)
+                    if entry is None:
+                        return False
+                    arcnames, gs_path, attempt = entry
+                    future = executor.submit(self.download_func, gs_path)
+                    in_flight[future] = (arcnames, gs_path, attempt)
+                    return True
+
+                while len(in_flight) < in_flight_limit() and submit_next():
+                    pass
+
+                while in_flight:
+                    done, _ = concurrent.futures.wait(
+                        in_flight, return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+                    for future in done:
+                        arcnames, gs_path, attempt = in_flight.pop(future)
+                        try:
+                            content = future.result()
+                        except Exception as e:
+                            if self.concurrency is not None and self.concurrency.should_retry(
+                                e, attempt
+                            ):
+                                retries.append((arcnames, gs_path, attempt + 1))
+                                print(
+                                    f"[ZIP] RETRY {gs_path} after throttling "
+                                    f"(attempt {attempt + 1})",
+                                    file=sys.stderr,
+                                )
+                                continue
+                            result.files_missing += len(arcnames)
+                            result.errors.append(f"{gs_path}: {e}")
+                            print(f"[ZIP] FAIL {gs_path}: {e}", file=sys.stderr)
+                        else:
+                            for arcname in arcnames:
+                                # Upload errors propagate: the archive is unusable
+                                self.compression_policy.write_entry(
+                                    zip_file, arcname, content, result.compression
+                                )
+                                result.files_included += 1
+                                print(
+                                    f"[ZIP] [{result.files_included + result.files_missing}] "
+                                    f"{arcname} ({len(content) / 1024:.1f} KB) streamed",
+                                    file=sys.stderr,
+                                )
+                            del content
+                        peak_rss = max(peak_rss, current_rss_bytes())
+                    while len(in_flight) < in_flight_limit() and submit_next():
+                        pass
+
+            result.parallel_download_time_ms = int((time.time() - start) * 1000)
+
+        result.bytes_written = progress.bytes_written
+        if progress.first_upload_at is not None:
+            result.time_to_first_upload_ms = int((progress.first_upload_at - start) * 1000)
+        result.peak_rss_bytes = max(peak_rss, current_rss_bytes())
+        return result
@@ -29,6 +29,7 @@ except ImportError:
     NTP_AVAILABLE = False
 
 from src.core.config import get_config
+from src.domain.interfaces.clock_offset import IClockOffsetProvider
 from src.domain.interfaces.time_sync import ITimeSyncValidator
 
 logger = logging.getLogger(__name__)
@@ -72,6 +73,9 @@ class TimeSyncValidator(ITimeSyncValidator):
         )
         self.buffer_synced = int(self.config.get("gcs.buffer_time.synchronized", 1))
 
+        # Optional cached offset source (avoids network checks per call)
+        self._clock_offset_provider: Optional[IClockOffsetProvider] = None
+
         logger.info(
             "Time sync validator initialized",
             extra={
@@ -103,7 +107,9 @@ class TimeSyncValidator(ITimeSyncValidator):
         Returns:
             Tuple of (sync_status, offset_seconds):
             - sync_status: True if synced, False if skewed, None if failed
-            - offset_seconds: Time offset in seconds (positive = local ahead)
+            - offset_seconds: ntplib offset in seconds (server - local:
+              positive = local clock behind). Note this is the opposite of
+              get_sync_info(), which returns local - Google
         """
         if not NTP_AVAILABLE:
             logger.debug("NTP not available - ntplib not installed")
@@ -124,7 +130,7 @@ class TimeSyncValidator(ITimeSyncValidator):
             client = ntplib.NTPClient()
             response = client.request(self.ntp_server, version=3, timeout=timeout)
 
-            # offset is the time difference: positive = local clock is ahead
+            # ntplib offset is server - local: positive = local clock is behind
             offset = response.offset
 
             logger.info(
@@ -308,6 +314,7 @@ class TimeSyncValidator(ITimeSyncValidator):
 
         Returns:
             Tuple of (local_time, google_time, difference_seconds)
+            difference_seconds is local - Google (positive = local ahead).
             Any value can be None if there was an error
         """
         try:
@@ -341,6 +348,20 @@ class TimeSyncValidator(ITimeSyncValidator):
             )
             return None, None, None
 
+    def set_clock_offset_provider(
+        self, provider: Optional[IClockOffsetProvider]
+    ) -> None:
+        """
+        Attach a cached clock offset provider
+
+        When attached, calculate_buffer() reads the provider's sync status
+        instead of running a blocking NTP/HTTP check.
+
+        Args:
+            provider: Clock offset provider (None to detach)
+        """
+        self._clock_offset_provider = provider
+
     def calculate_buffer(self, sync_status: Optional[bool] = None) -> int:
         """
         Calculate buffer time in minutes based on synchronization status
@@ -351,7 +372,9 @@ class TimeSyncValidator(ITimeSyncValidator):
         Returns:
             Buffer time in minutes
         """
-        if sync_status is None:
+        if sync_status is None and self._clock_offset_provider is not None:
+            sync_status = self._clock_offset_provider.sync_status()
+        elif sync_status is None:
             sync_status = self.verify_sync()
 
         if sync_status is False:
@@ -14,11 +14,12 @@ Features:
 import logging
 import time
 from datetime import datetime, timezone
-from typing import Dict, Any, List, Callable
+from typing import Dict, Any, List, Callable, Optional
 from collections import defaultdict, deque
 from functools import wraps
 from threading import Lock
 
+from src.domain.interfaces.clock_offset import IClockOffsetProvider
 from src.domain.interfaces.metrics_collector import IMetricsCollector
 from src.core.config.yaml_config_loader import ConfigLoader
 
@@ -63,6 +64,7 @@ class URLMetricsCollector(IMetricsCollector):
         self._errors_lock = Lock()
         self._skew_lock = Lock()
         self._buckets_lock = Lock()
+        self._cache_lock = Lock()
 
         # Counters
         self.counters = {
@@ -92,10 +94,16 @@ class URLMetricsCollector(IMetricsCollector):
             }
         )
 
+        # Per-cache event counters (hit/miss/eviction/...)
+        self.cache_stats = defaultdict(lambda: defaultdict(int))
+
         # Histories
         self.error_history = deque(maxlen=self.error_history_size)
         self.clock_skew_history = deque(maxlen=self.clock_skew_history_size)
 
+        # Optional cached clock offset source (reported in summaries)
+        self._clock_offset_provider: Optional[IClockOffsetProvider] = None
+
         logger.info(
             "URLMetricsCollector initialized",
             extra={
@@ -201,6 +209,32 @@ class URLMetricsCollector(IMetricsCollector):
             },
         )
 
+    def record_cache_event(self, cache_name: str, event: str, count: int = 1):
+        """Record cache hit/miss/eviction events per cache name"""
+        if not self.metrics_enabled:
+            return
+
+        with self._cache_lock:
+            self.cache_stats[cache_name][event] += count
+
+    def _cache_summary(self) -> Dict[str, Any]:
+        """Build per-cache counters with hit ratio"""
+        with self._cache_lock:
+            caches = {name: dict(events) for name, events in self.cache_stats.items()}
+
+        for events in caches.values():
+            lookups = events.get("hit", 0) + events.get("miss", 0)
+            events["hit_ratio"] = (
+                round(events.get("hit", 0) / lookups, 4) if lookups else 0.0
+            )
+        return caches
+
+    def set_clock_offset_provider(
+        self, provider: Optional[IClockOffsetProvider]
+    ) -> None:
+        """Attach a clock offset provider whose snapshot is included in summaries"""
+        self._clock_offset_provider = provider
+
     def get_summary(self) -> Dict[str, Any]:
         """Get comprehensive metrics summary"""
         uptime = time.time() - self.start_time
@@ -262,9 +296,13 @@ class URLMetricsCollector(IMetricsCollector):
                 "avg_download_size_bytes": int(avg_download_size),
             },
             "bucket_stats": bucket_stats_copy,
+            "caches": self._cache_summary(),
             "timestamp": datetime.now(timezone.utc).isoformat(),
         }
 
+        if self._clock_offset_provider is not None:
+            summary["clock_offset"] = self._clock_offset_provider.snapshot()
+
         logger.debug(
             "Metrics summary generated",
             extra={
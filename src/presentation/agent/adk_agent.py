@@ -30,6 +30,8 @@ from toolbox_core import ToolboxSyncClient
 # Import service container
 from src.container import get_container
 from src.core.config import get_config
+from src.core.domain.interfaces import InvoiceProjection
+from src.application.services.zip_job_service import ZipJobQueueFullError
 
 # Import URL cache for LLM corruption prevention
 from src.infrastructure.cache.url_cache import url_cache
@@ -186,6 +188,67 @@ def _group_urls_by_invoice(gs_urls: list, redirect_urls: list) -> list:
     return list(invoices_dict.values())
 
 
+def _sign_gs_urls(gs_urls: list) -> tuple:
+    """
+    Sign gs:// URLs concurrently through the container's batch signing engine.
+
+    Returns:
+        Tuple of (signed_gs_urls, signed_urls, errors) where signed_gs_urls
+        and signed_urls are aligned lists containing only successful
+        signatures (in input order), and errors lists failure messages.
+    """
+    signed_gs_urls = []
+    signed_urls = []
+    errors = []
+
+    for result in container.batch_signing_engine.sign_all(gs_urls):
+        if result.success:
+            signed_gs_urls.append(result.target)
+            signed_urls.append(result.signed_url)
+            print(f"[TOOL] Signed: {result.target[:60]}...", file=sys.stderr)
+        else:
+            error_msg = f"Error signing {result.target}: {result.error}"
+            errors.append(error_msg)
+            print(f"[TOOL] ERROR: {error_msg}", file=sys.stderr)
+
+    return signed_gs_urls, signed_urls, errors
+
+
+def _build_redirect_links(gs_urls: list) -> tuple:
+    """
+    Build /r/{id} redirect links for gs:// URLs.
+
+    With pdf.signed_urls.lazy_redirect.enabled the raw gs:// paths are cached
+    and signed only when the user opens the link; otherwise every URL is
+    signed up front.
+
+    Returns:
+        Tuple of (link_gs_urls, signed_urls, redirect_urls, errors) where
+        link_gs_urls and redirect_urls are aligned. In lazy mode signed_urls
+        holds the /r/{id} links themselves (they sign on first access), so
+        clients reading download_urls / signed_urls keep getting one
+        working link per PDF.
+    """
+    if config.get("pdf.signed_urls.lazy_redirect.enabled", False):
+        url_cache.set_signer(container.url_signer)
+        redirect_urls = []
+        for gs_url in gs_urls:
+            short_id = url_cache.store_lazy(gs_url)
+            redirect_urls.append(f"{BACKEND_BASE_URL}/r/{short_id}")
+            print(f"[TOOL] PDF cached (lazy): {short_id} -> {gs_url[:60]}", file=sys.stderr)
+        return list(gs_urls), list(redirect_urls), redirect_urls, []
+
+    signed_gs_urls, signed_urls, errors = _sign_gs_urls(gs_urls)
+
+    redirect_urls = []
+    for signed_url in signed_urls:
+        short_id = url_cache.store(signed_url)
+        redirect_urls.append(f"{BACKEND_BASE_URL}/r/{short_id}")
+        print(f"[TOOL] PDF cached: {short_id}", file=sys.stderr)
+
+    return signed_gs_urls, signed_urls, redirect_urls, errors
+
+
 def generate_individual_download_links(
     pdf_urls: str,
     pdf_type: str = "both",
@@ -247,11 +310,18 @@ def generate_individual_download_links(
     zip_threshold = config.get("pdf.zip.threshold", 5)
     preview_limit = config.get("pdf.zip.preview_limit", 5)
 
-    # [INTERCEPTOR AUTO-ZIP] LEGACY PATTERN (SYNCHRONOUS)
-    # If count > threshold, create ZIP IMMEDIATELY and return ZIP URL
+    # [INTERCEPTOR AUTO-ZIP]
+    # If count > threshold, queue a background ZIP job and return its link
+    # (pdf.zip.async_jobs.enabled) or create the ZIP synchronously
     if count > zip_threshold:
+        async_zip = config.get("pdf.zip.async_jobs.enabled", False)
+        # Medium bundles: stream the ZIP on download instead of building it
+        stream_zip = config.get("pdf.zip.stream.enabled", False) and count <= int(
+            config.get("pdf.zip.stream.max_pdfs", 60)
+        )
+        mode = "STREAM" if stream_zip else "ASYNC" if async_zip else "SYNC"
         print(f"[TOOL] Count {count} > threshold {zip_threshold}", file=sys.stderr)
-        print("[TOOL] AUTO-ZIP INTERCEPTOR: Creating ZIP (SYNC)", file=sys.stderr)
+        print(f"[TOOL] AUTO-ZIP INTERCEPTOR: Creating ZIP ({mode})", file=sys.stderr)
 
         # Extract invoice numbers from gs:// URLs
         # Format: gs://bucket/descargas/{invoice_number}/filename.pdf
@@ -269,58 +339,40 @@ def generate_individual_download_links(
             urls_to_sign = pdf_urls_list[:preview_limit]
         else:
             print(
-                f"[TOOL] Creating ZIP for {len(invoice_numbers)} invoices (SYNC)...",
+                f"[TOOL] Creating ZIP for {len(invoice_numbers)} invoices ({mode})...",
                 file=sys.stderr,
             )
 
             try:
-                # SYNCHRONOUS ZIP creation with PDF type filtering
-                zip_result = create_zip_package(
+                # ZIP creation with PDF type filtering
+                if stream_zip:
+                    create_zip = create_zip_stream_link
+                elif async_zip:
+                    create_zip = create_zip_package_async
+                else:
+                    create_zip = create_zip_package
+                zip_result = create_zip(
                     invoice_numbers,
                     pdf_type=pdf_type,
                     pdf_variant=pdf_variant,
                 )
 
-                if zip_result.get("success") and zip_result.get("download_url"):
+                if zip_result.get("success") and zip_result.get("redirect_url"):
                     print(
-                        f"[TOOL] ZIP created: {zip_result['download_url']}",
+                        f"[TOOL] ZIP {zip_result.get('status', 'created')}: "
+                        f"{zip_result['redirect_url']}",
                         file=sys.stderr,
                     )
 
                     # Sign ONLY first 4 PDFs for preview
                     urls_to_sign = pdf_urls_list[:preview_limit]
-                    url_signer = container.url_signer
-                    signed_urls = []
-                    errors = []
-
-                    import time as time_module
-                    for i, gs_url in enumerate(urls_to_sign):
-                        # Add delay between requests to avoid signBlob rate limiting
-                        # Similar to generate_batch_signed_urls in robust_url_signer_solid.py
-                        if i > 0:
-                            time_module.sleep(0.05)  # 50ms delay between generations
-                        try:
-                            signed_url = url_signer.generate_signed_url(gs_url)
-                            signed_urls.append(signed_url)
-                            print(f"[TOOL] Signed: {gs_url[:60]}...", file=sys.stderr)
-                        except Exception as e:
-                            error_msg = f"Error signing {gs_url}: {str(e)}"
-                            errors.append(error_msg)
-                            print(f"[TOOL] {error_msg}", file=sys.stderr)
-
-                    # Store ZIP URL in cache and generate redirect URL
-                    zip_short_id = url_cache.store(zip_result["download_url"])
-                    zip_redirect_url = f"{BACKEND_BASE_URL}/r/{zip_short_id}"
-                    print(f"[TOOL] ZIP cached: {zip_short_id}", file=sys.stderr)
-                    print(f"[TOOL] ZIP redirect URL: {zip_redirect_url}", file=sys.stderr)
+                    link_gs_urls, signed_urls, redirect_urls, errors = _build_redirect_links(
+                        urls_to_sign
+                    )
 
-                    # Store signed URLs in cache and generate redirect URLs
-                    redirect_urls = []
-                    for signed_url in signed_urls:
-                        short_id = url_cache.store(signed_url)
-                        redirect_url = f"{BACKEND_BASE_URL}/r/{short_id}"
-                        redirect_urls.append(redirect_url)
-                        print(f"[TOOL] PDF cached: {short_id} -> {redirect_url}", file=sys.stderr)
+                    # LLM-safe ZIP link (/r/{id} or /zip/{package_id}/download)
+                    zip_redirect_url = zip_result["redirect_url"]
+                    print(f"[TOOL] ZIP redirect URL: {zip_redirect_url}", file=sys.stderr)
 
                     # Log what we're returning
                     print(f"[TOOL] Returning {len(redirect_urls)} PDF redirect URLs for preview", file=sys.stderr)
@@ -328,24 +380,41 @@ def generate_individual_download_links(
                         print(f"[TOOL]   PDF {i+1}: {url}", file=sys.stderr)
 
                     # Group URLs by invoice for frontend display
-                    invoices_grouped = _group_urls_by_invoice(urls_to_sign, redirect_urls)
+                    invoices_grouped = _group_urls_by_invoice(link_gs_urls, redirect_urls)
                     print(f"[TOOL] Grouped into {len(invoices_grouped)} invoices", file=sys.stderr)
 
+                    # Streamed ZIPs start downloading at once; only queued jobs wait
+                    zip_note = (
+                        "El ZIP se está preparando; el enlace inicia la descarga "
+                        "cuando esté listo. "
+                        if mode == "ASYNC"
+                        else ""
+                    )
+
                     # Return immediately with ZIP URL + first 5 signed URLs
                     return {
                         "success": True,
                         "signed_urls": signed_urls,
                         "redirect_urls": redirect_urls,  # LLM-safe short URLs
                         "invoices_grouped": invoices_grouped,  # Grouped by invoice for frontend
-                        "zip_url": zip_result["download_url"],
+                        "zip_url": zip_result.get("download_url") or zip_redirect_url,
                         "zip_redirect_url": zip_redirect_url,  # LLM-safe ZIP URL
+                        "zip_status_url": zip_result.get("status_url"),
+                        "zip_status": zip_result.get("status", "ready"),
+                        "zip_package_id": zip_result.get("package_id"),
+                        # One link per volume when the ZIP was split
+                        "zip_volume_redirect_urls": zip_result.get(
+                            "volume_redirect_urls", [zip_redirect_url]
+                        ),
                         "pdf_preview_links": redirect_urls,  # Alias for clarity
                         "message": (
                             f"CRITICAL: Se encontraron {count} facturas. "
                             f"DEBES mostrar al usuario: "
-                            f"1) El enlace ZIP (zip_redirect_url) como descarga principal. "
+                            f"1) El enlace ZIP (zip_redirect_url) como descarga principal "
+                            f"(si zip_volume_redirect_urls tiene varias partes, TODAS). "
                             f"2) Los enlaces de vista previa (redirect_urls/pdf_preview_links) "
                             f"para las primeras facturas. "
+                            f"{zip_note}"
                             f"USA SIEMPRE los campos con 'redirect' en el nombre, "
                             f"NO uses signed_urls ni zip_url directamente."
                         ),
@@ -372,48 +441,22 @@ def generate_individual_download_links(
         # Below threshold: sign all URLs
         urls_to_sign = pdf_urls_list
 
-    # Get URL signer from container
-    url_signer = container.url_signer
-
-    # Sign URLs (only first 5 if count > threshold)
-    signed_urls = []
-    errors = []
-
-    import time as time_module
-    for i, gs_url in enumerate(urls_to_sign):
-        # Add delay between requests to avoid signBlob rate limiting
-        # Similar to generate_batch_signed_urls in robust_url_signer_solid.py
-        if i > 0:
-            time_module.sleep(0.05)  # 50ms delay between generations
-        try:
-            signed_url = url_signer.generate_signed_url(gs_url)
-            signed_urls.append(signed_url)
-            print(f"[TOOL] Signed: {gs_url[:50]}...", file=sys.stderr)
-        except Exception as e:
-            error_msg = f"Error signing {gs_url}: {str(e)}"
-            errors.append(error_msg)
-            print(f"[TOOL] ERROR: {error_msg}", file=sys.stderr)
-
-    # Store signed URLs in cache and generate redirect URLs
-    redirect_urls = []
-    for signed_url in signed_urls:
-        short_id = url_cache.store(signed_url)
-        redirect_url = f"{BACKEND_BASE_URL}/r/{short_id}"
-        redirect_urls.append(redirect_url)
-        print(f"[TOOL] URL cached: {short_id}", file=sys.stderr)
+    # Sign URLs (only first 5 if count > threshold), or defer signing to
+    # the first click in lazy redirect mode
+    link_gs_urls, signed_urls, redirect_urls, errors = _build_redirect_links(urls_to_sign)
 
     # Group URLs by invoice for frontend display
-    invoices_grouped = _group_urls_by_invoice(urls_to_sign, redirect_urls)
+    invoices_grouped = _group_urls_by_invoice(link_gs_urls, redirect_urls)
     print(f"[TOOL] Grouped into {len(invoices_grouped)} invoices", file=sys.stderr)
 
     result = {
-        "success": len(signed_urls) > 0,
+        "success": len(redirect_urls) > 0,
         "download_urls": signed_urls,
         "redirect_urls": redirect_urls,  # LLM-safe short URLs
         "invoices_grouped": invoices_grouped,  # Grouped by invoice for frontend
         "total": len(pdf_urls_list),
         "total_invoices": len(invoices_grouped),
-        "signed": len(signed_urls),
+        "signed": len(signed_urls),  # Links issued (lazy links sign on first access)
         "failed": len(errors),
         "message": (
             "USA redirect_urls EN LUGAR de download_urls para mostrar al usuario. "
@@ -426,7 +469,10 @@ def generate_individual_download_links(
 
     signed_count = result["signed"]
     total_count = result["total"]
-    msg = f"[TOOL] Result: {signed_count}/{total_count} signed, {len(redirect_urls)} cached"
+    msg = (
+        f"[TOOL] Result: {signed_count}/{total_count} links issued, "
+        f"{len(redirect_urls)} cached"
+    )
     print(msg, file=sys.stderr)
     return result
 
@@ -436,25 +482,52 @@ def generate_individual_download_links(
 # ================================================================
 
 
-def search_invoices_by_rut(rut: str, limit: int = 10) -> dict:
+def search_invoices_by_rut(rut: str, limit: int = 10, after_factura: str = "") -> dict:
     """
     Search invoices by customer RUT
 
     Args:
         rut: Customer RUT (Chilean tax ID)
         limit: Maximum number of results
+        after_factura: To get the next page, pass the next_after_factura
+            value of the previous result (empty for the first page)
 
     Returns:
-        Dictionary with invoices (URLs NOT signed - agent must call
-        generate_individual_download_links tool)
+        Dictionary with invoices, newest first, and next_after_factura
+        (None when there are no more invoices). URLs NOT signed - agent
+        must call generate_individual_download_links tool
     """
     try:
         invoice_service = container.invoice_service
         # Don't generate URLs here - let agent call the tool
-        invoices = invoice_service.get_invoices_by_rut(
-            rut, limit=limit, generate_urls=False
-        )
-        return {"success": True, "count": len(invoices), "invoices": invoices}
+        # Line-item details are not needed to list invoices
+        # One extra row tells whether another page exists
+        if after_factura:
+            # Keyset page: starts below the cursor instead of re-reading
+            invoices = list(
+                invoice_service.iter_invoices_by_rut(
+                    rut,
+                    after_factura=after_factura,
+                    limit=limit + 1,
+                    generate_urls=False,
+                    projection=InvoiceProjection.LISTING,
+                )
+            )
+        else:
+            invoices = invoice_service.get_invoices_by_rut(
+                rut,
+                limit=limit + 1,
+                generate_urls=False,
+                projection=InvoiceProjection.LISTING,
+            )
+        has_more = len(invoices) > limit
+        invoices = invoices[:limit]
+        return {
+            "success": True,
+            "count": len(invoices),
+            "invoices": invoices,
+            "next_after_factura": invoices[-1]["factura"] if has_more else None,
+        }
     except Exception as e:
         print(f"ERROR search_invoices_by_rut: {e}", file=sys.stderr)
         return {"success": False, "error": str(e), "count": 0, "invoices": []}
@@ -492,22 +565,21 @@ def create_zip_package(
             file=sys.stderr,
         )
 
-        # Get invoices
+        # Get invoices (one batched query instead of one per invoice)
         invoice_service = container.invoice_service
         invoices = []
 
-        for invoice_number in invoice_numbers:
-            invoice_data = invoice_service.get_invoice_by_number(
-                invoice_number,
-                generate_urls=False,  # Don't need URLs, just creating ZIP
-            )
-            if invoice_data:
-                # Convert back to domain model (temporary - will improve this)
-                from src.core.domain.models import Invoice
+        from src.core.domain.models import Invoice
 
-                raw_row = invoice_data["metadata"]["raw_row"]
-                invoice = Invoice.from_bigquery_row(raw_row)
-                invoices.append(invoice)
+        for invoice_data in invoice_service.get_invoices_by_numbers(
+            invoice_numbers,
+            generate_urls=False,  # Don't need URLs, just creating ZIP
+            projection=InvoiceProjection.ZIP,
+        ):
+            # Convert back to domain model (temporary - will improve this)
+            raw_row = invoice_data["metadata"]["raw_row"]
+            invoice = Invoice.from_bigquery_row(raw_row)
+            invoices.append(invoice)
 
         if not invoices:
             return {
@@ -516,9 +588,10 @@ def create_zip_package(
                 "download_url": None,
             }
 
-        # Create ZIP with PDF type filtering
+        # Create ZIP with PDF type filtering (split into volumes when the
+        # set exceeds pdf.zip.max_files PDFs or max_volume_mb)
         zip_service = container.zip_service
-        zip_package = zip_service.create_zip_from_invoices(
+        zip_packages = zip_service.create_zip_volumes_from_invoices(
             invoices,
             pdf_type=pdf_type,
             pdf_variant=pdf_variant,
@@ -529,26 +602,194 @@ def create_zip_package(
         if zip_metrics:
             conversation_tracker.update_zip_metrics(zip_metrics)
 
-        # Store ZIP URL in cache and generate redirect URL
-        zip_short_id = url_cache.store(zip_package.download_url)
+        # Store ZIP URLs in cache and generate redirect URLs
+        volumes = []
+        for zip_package in zip_packages:
+            zip_short_id = url_cache.store(zip_package.download_url)
+            print(f"[ZIP] URL cached: {zip_short_id}", file=sys.stderr)
+            volumes.append(
+                {
+                    "package_id": zip_package.package_id,
+                    "redirect_url": f"{BACKEND_BASE_URL}/r/{zip_short_id}",
+                    "file_size_mb": zip_package.file_size_mb,
+                    "pdf_count": zip_package.pdf_count,
+                }
+            )
+
+        first = zip_packages[0]
+        message = (
+            "USA redirect_url EN LUGAR de download_url para mostrar al usuario. "
+            "La redirect_url es más corta y no se corrompe."
+        )
+        if len(volumes) > 1:
+            message += (
+                f" El ZIP se dividió en {len(volumes)} partes: muestra TODOS los "
+                f"enlaces de volume_redirect_urls."
+            )
+
+        return {
+            "success": True,
+            "package_id": first.package_id,
+            "download_url": first.download_url,
+            "redirect_url": volumes[0]["redirect_url"],  # LLM-safe short URL
+            "file_size_mb": round(sum(v["file_size_mb"] or 0 for v in volumes), 2),
+            "pdf_count": sum(v["pdf_count"] or 0 for v in volumes),
+            "volumes": volumes,
+            "volume_redirect_urls": [v["redirect_url"] for v in volumes],
+            "message": message,
+        }
+
+    except Exception as e:
+        print(f"ERROR create_zip_package: {e}", file=sys.stderr)
+        return {"success": False, "error": str(e), "download_url": None}
+
+
+def create_zip_package_async(
+    invoice_numbers: list[str],
+    pdf_type: str = "both",
+    pdf_variant: str = "cf",
+) -> dict:
+    """
+    Start building a ZIP package in the background and return its link now.
+
+    The link (redirect_url) downloads the ZIP once it is ready; until then
+    it reports that the package is still being prepared. Use this instead
+    of create_zip_package for large sets of invoices.
+
+    Args:
+        invoice_numbers: List of invoice numbers
+        pdf_type: Filter type:
+            - 'both': Tributaria + Cedible (default)
+            - 'tributaria_only': Only Copia Tributaria
+            - 'cedible_only': Only Copia Cedible
+            - 'termico_only': Only Doc Termico
+            - 'all': All available PDFs
+        pdf_variant: Variant filter:
+            - 'cf': Con Fondo (default)
+            - 'sf': Sin Fondo
+            - 'both': Both CF and SF variants
+
+    Returns:
+        Dictionary with package_id, status and the ZIP redirect_url of the
+        first volume, plus volume_redirect_urls (one link per volume)
+    """
+    try:
+        print(
+            f"[ZIP] create_zip_package_async called: "
+            f"invoices={len(invoice_numbers)}, "
+            f"pdf_type={pdf_type}, pdf_variant={pdf_variant}",
+            file=sys.stderr,
+        )
+
+        # One job per volume when the set exceeds pdf.zip.max_files PDFs
+        # or max_volume_mb
+        jobs = container.zip_job_service.submit_volumes(
+            invoice_numbers,
+            pdf_type=pdf_type,
+            pdf_variant=pdf_variant,
+        )
+        volumes = []
+        for job in jobs:
+            print(f"[ZIP] Job queued: {job.package_id}", file=sys.stderr)
+            volumes.append(
+                {
+                    "package_id": job.package_id,
+                    "status": job.status.value,
+                    # LLM-safe link, works once the volume is ready
+                    "redirect_url": f"{BACKEND_BASE_URL}/zip/{job.package_id}/download",
+                    "status_url": f"{BACKEND_BASE_URL}/zip/{job.package_id}/status",
+                }
+            )
+
+        message = (
+            "El ZIP se está preparando. USA redirect_url para mostrar al "
+            "usuario: inicia la descarga cuando el ZIP esté listo."
+        )
+        if len(volumes) > 1:
+            message += (
+                f" El ZIP se dividió en {len(volumes)} partes: muestra TODOS los "
+                f"enlaces de volume_redirect_urls."
+            )
+
+        first = volumes[0]
+        return {
+            "success": True,
+            "package_id": first["package_id"],
+            "status": first["status"],
+            "download_url": None,
+            "redirect_url": first["redirect_url"],
+            "status_url": first["status_url"],
+            "volumes": volumes,
+            "volume_redirect_urls": [v["redirect_url"] for v in volumes],
+            "message": message,
+        }
+
+    except ZipJobQueueFullError as e:
+        # Too many background jobs in this process: build synchronously
+        print(f"[ZIP] {e}; creating ZIP synchronously", file=sys.stderr)
+        return create_zip_package(invoice_numbers, pdf_type, pdf_variant)
+
+    except Exception as e:
+        print(f"ERROR create_zip_package_async: {e}", file=sys.stderr)
+        return {"success": False, "error": str(e), "download_url": None}
+
+
+def create_zip_stream_link(
+    invoice_numbers: list[str],
+    pdf_type: str = "both",
+    pdf_variant: str = "cf",
+) -> dict:
+    """
+    Return a link that streams the ZIP when opened (nothing is built now).
+
+    The archive is assembled while the user downloads it, so the download
+    starts within a second and no ZIP is stored in GCS.
+
+    Args:
+        invoice_numbers: List of invoice numbers
+        pdf_type: Filter type (same values as create_zip_package)
+        pdf_variant: Variant filter ('cf', 'sf', 'both')
+
+    Returns:
+        Dictionary with the ZIP redirect_url
+    """
+    try:
+        print(
+            f"[ZIP] create_zip_stream_link called: "
+            f"invoices={len(invoice_numbers)}, "
+            f"pdf_type={pdf_type}, pdf_variant={pdf_variant}",
+            file=sys.stderr,
+        )
+
+        stream_service = container.zip_stream_service
+        token = stream_service.issue_token(
+            invoice_numbers,
+            pdf_type=pdf_type,
+            pdf_variant=pdf_variant,
+        )
+        stream_url = f"{BACKEND_BASE_URL}/zip/stream/{token}"
+
+        # The token is long: hand out a short /r/{id} link like signed URLs
+        zip_short_id = url_cache.store(
+            stream_url, ttl_hours=max(1, -(-int(stream_service.token_ttl_seconds) // 3600))
+        )
         zip_redirect_url = f"{BACKEND_BASE_URL}/r/{zip_short_id}"
-        print(f"[ZIP] URL cached: {zip_short_id}", file=sys.stderr)
+        print(f"[ZIP] Stream link cached: {zip_short_id}", file=sys.stderr)
 
         return {
             "success": True,
-            "package_id": zip_package.package_id,
-            "download_url": zip_package.download_url,
+            "package_id": None,
+            "status": "streaming",
+            "download_url": stream_url,
             "redirect_url": zip_redirect_url,  # LLM-safe short URL
-            "file_size_mb": zip_package.file_size_mb,
-            "pdf_count": zip_package.pdf_count,
             "message": (
                 "USA redirect_url EN LUGAR de download_url para mostrar al usuario. "
-                "La redirect_url es más corta y no se corrompe."
+                "El ZIP se genera al descargarlo."
             ),
         }
 
     except Exception as e:
-        print(f"ERROR create_zip_package: {e}", file=sys.stderr)
+        print(f"ERROR create_zip_stream_link: {e}", file=sys.stderr)
         return {"success": False, "error": str(e), "download_url": None}
 
 
@@ -687,7 +928,8 @@ CRITICAL INSTRUCTIONS:
    
    Step 2: The tool will automatically:
    - Detect that 278 > 2 (threshold)
-   - Create a ZIP package with ALL invoices (this takes ~10 seconds)
+   - Start a ZIP package with ALL invoices (built in the background; the
+     ZIP link starts the download as soon as the archive is ready)
    - Return response with:
      * signed_urls: First 2 invoice PDFs for preview (ONLY FOR PREVIEW)
      * zip_url: Download link for ZIP with ALL invoices
@@ -939,6 +1181,7 @@ root_agent = Agent(
         # NOTE: FunctionTool names cannot collide with MCP tool names (gemini-3-flash-preview requirement)
         FunctionTool(generate_individual_download_links),
         FunctionTool(create_zip_package),
+        FunctionTool(create_zip_package_async),
         FunctionTool(validated_monthly_search),  # Renamed from search_invoices_by_month_year_validated
     ],
     instruction=system_instruction,
@@ -0,0 +1,137 @@
+"""
+Redirect Routes
+===============
+FastAPI routes that resolve short IDs from the URL cache.
+
+The LLM (Gemini) sometimes corrupts long hex signatures when formatting
+responses, so the agent hands out /r/{url_id} links instead of signed URLs.
+These routes are mounted on the ADK app by custom_server.py and can be
+mounted on a bare FastAPI app (e.g. for load tests).
+"""
+
+import logging
+from typing import List
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, RedirectResponse
+from pydantic import BaseModel, Field
+
+from src.infrastructure.cache.url_cache import LazySigningError, URLCache, url_cache
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on IDs per POST /r/batch call (a preview group plus the ZIP
+# link is typically well under 20)
+MAX_BATCH_IDS = 100
+
+
+class RedirectBatchRequest(BaseModel):
+    """Body of POST /r/batch"""
+
+    ids: List[str] = Field(..., min_length=1, max_length=MAX_BATCH_IDS)
+
+
+def create_redirect_router(cache: URLCache = url_cache) -> APIRouter:
+    """
+    Build the router with /r/{url_id}, /r/batch and /health/cache
+
+    Args:
+        cache: URL cache to resolve IDs from (default: global url_cache)
+
+    Returns:
+        APIRouter ready to be included in a FastAPI app
+    """
+    router = APIRouter()
+
+    @router.post("/r/batch")
+    async def resolve_batch(body: RedirectBatchRequest):
+        """
+        Resolve several short IDs in one call.
+
+        Lets the frontend resolve a whole preview group (plus the ZIP link)
+        with one round trip instead of one GET /r/{url_id} per link. The
+        cache is read once for all IDs; lazy entries are signed as needed.
+
+        Args:
+            body: {"ids": ["a1b2c3d4", ...]}
+
+        Returns:
+            {"results": {id: {"status", "url", "expires_at"}}} where status is
+            "ok", "missing", "expired" or "error"
+        """
+        resolved = await run_in_threadpool(cache.get_many, body.ids)
+
+        results = {}
+        for url_id, result in resolved.items():
+            expires_at = result["expires_at"]
+            results[url_id] = {
+                "status": result["status"],
+                "url": result["url"],
+                "expires_at": expires_at.isoformat() if expires_at else None,
+            }
+            if result["status"] == "error":
+                logger.error(f"Lazy signing failed for ID {url_id}: {result['error']}")
+
+        found = sum(1 for r in results.values() if r["status"] == "ok")
+        logger.info(f"Resolved batch of {len(results)} IDs ({found} found)")
+        return {"results": results}
+
+    @router.get("/r/{url_id}")
+    async def redirect_to_url(url_id: str, request: Request):
+        """
+        Redirect to stored signed URL or return JSON with URL.
+
+        This endpoint is used to bypass LLM corruption of signed URLs.
+        The backend stores URLs with short IDs, and this endpoint
+        redirects users to the actual GCS signed URL.
+
+        Behavior:
+        - If Accept header contains 'application/json': returns JSON with URL
+        - Otherwise: returns 302 redirect to the signed URL
+
+        Lookups (and lazy signing of raw gs:// entries) run in a worker
+        thread so backend I/O and signBlob calls never block the event loop.
+
+        Args:
+            url_id: Short ID for the stored URL
+            request: FastAPI request object
+
+        Returns:
+            302 redirect OR JSON response with URL
+        """
+        try:
+            url = await run_in_threadpool(cache.get, url_id)
+        except LazySigningError as e:
+            logger.error(f"Lazy signing failed for ID {url_id}: {e}")
+            raise HTTPException(
+                status_code=502,
+                detail=f"Could not generate download URL. ID: {url_id}"
+            )
+
+        if url is None:
+            logger.warning(f"URL not found for ID: {url_id}")
+            raise HTTPException(
+                status_code=404,
+                detail=f"URL not found or expired. ID: {url_id}"
+            )
+
+        # Check if frontend wants JSON response
+        accept_header = request.headers.get("accept", "")
+        if "application/json" in accept_header:
+            logger.info(f"Returning JSON for {url_id} (frontend request)")
+            return JSONResponse(content={"url": url, "url_id": url_id})
+
+        # Default: redirect for direct browser access
+        logger.info(f"Redirecting {url_id} to URL (length: {len(url)})")
+        return RedirectResponse(url=url, status_code=302)
+
+    @router.get("/health/cache")
+    async def cache_health():
+        """Get URL cache statistics."""
+        return {
+            "status": "healthy",
+            "cache": await run_in_threadpool(cache.stats)
+        }
+
+    return router
@@ -0,0 +1,172 @@
+"""
+ZIP Job Routes
+==============
+FastAPI routes for background ZIP jobs and streamed ZIP downloads.
+
+The agent hands out /zip/{package_id}/download as soon as a job is queued.
+The link redirects to the signed archive URL once the job is READY; until
+then it answers 202 with the job status so the frontend can poll
+/zip/{package_id}/status.
+
+For medium bundles it hands out /zip/stream/{token} instead: the archive is
+written into the response while its PDFs are fetched from GCS.
+"""
+
+import logging
+from typing import Callable
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, RedirectResponse, StreamingResponse
+
+from src.application.services.zip_job_service import ZipJobService
+from src.application.services.zip_stream_service import (
+    ZipStreamService,
+    ZipStreamTokenError,
+)
+from src.core.domain.models import ZipPackage, ZipStatus
+
+logger = logging.getLogger(__name__)
+
+# Suggested polling interval for unfinished jobs (Retry-After header)
+RETRY_AFTER_SECONDS = 3
+
+
+def _zip_status_body(package: ZipPackage) -> dict:
+    """Public status of a ZIP job (no gs:// paths)"""
+    status = ZipStatus.EXPIRED if package.is_expired else package.status
+    return {
+        "package_id": package.package_id,
+        "status": status.value,
+        "ready": status == ZipStatus.READY,
+        "invoice_count": package.invoice_count,
+        "pdf_count": package.pdf_count,
+        "file_size_bytes": package.file_size_bytes,
+        "created_at": package.created_at.isoformat() if package.created_at else None,
+        "expires_at": package.expires_at.isoformat() if package.expires_at else None,
+        "error_message": package.error_message,
+    }
+
+
+def create_zip_router(job_service_provider: Callable[[], ZipJobService]) -> APIRouter:
+    """
+    Build the router with /zip/{package_id}/status and /zip/{package_id}/download
+
+    Args:
+        job_service_provider: Returns the ZIP job service (called on first
+            request so importing the app does not touch GCP)
+
+    Returns:
+        APIRouter ready to be included in a FastAPI app
+    """
+    router = APIRouter()
+
+    async def _find_package(package_id: str) -> ZipPackage:
+        job_service = await run_in_threadpool(job_service_provider)
+        package = await run_in_threadpool(job_service.get_status, package_id)
+        if package is None:
+            logger.warning(f"ZIP package not found: {package_id}")
+            raise HTTPException(
+                status_code=404, detail=f"ZIP package not found. ID: {package_id}"
+            )
+        return package
+
+    @router.get("/zip/{package_id}/status")
+    async def zip_status(package_id: str):
+        """
+        Get the status of a ZIP job.
+
+        Returns:
+            {"package_id", "status", "ready", "pdf_count", ...} where status
+            is "pending", "creating", "ready", "failed" or "expired"
+        """
+        package = await _find_package(package_id)
+        return _zip_status_body(package)
+
+    @router.get("/zip/{package_id}/download")
+    async def zip_download(package_id: str, request: Request):
+        """
+        Redirect to the archive once the ZIP job is ready.
+
+        Behavior:
+        - READY: 302 to the signed URL (JSON {"url"} if Accept is JSON)
+        - PENDING/CREATING: 202 with the job status and Retry-After
+        - FAILED: 500, EXPIRED: 410
+        """
+        package = await _find_package(package_id)
+        body = _zip_status_body(package)
+
+        if body["status"] == ZipStatus.EXPIRED.value:
+            raise HTTPException(
+                status_code=410, detail=f"ZIP package expired. ID: {package_id}"
+            )
+        if package.status == ZipStatus.FAILED:
+            raise HTTPException(
+                status_code=500,
+                detail=f"ZIP creation failed: {package.error_message}. ID: {package_id}",
+            )
+        if package.status != ZipStatus.READY or not package.download_url:
+            return JSONResponse(
+                status_code=202,
+                content=body,
+                headers={"Retry-After": str(RETRY_AFTER_SECONDS)},
+            )
+
+        if "application/json" in request.headers.get("accept", ""):
+            return JSONResponse(
+                content={"url": package.download_url, "package_id": package_id}
+            )
+
+        logger.info(f"Redirecting ZIP {package_id} to signed URL")
+        return RedirectResponse(url=package.download_url, status_code=302)
+
+    return router
+
+
+def create_zip_stream_router(
+    stream_service_provider: Callable[[], ZipStreamService],
+) -> APIRouter:
+    """
+    Build the router with /zip/stream/{token}
+
+    Args:
+        stream_service_provider: Returns the ZIP stream service (called on
+            first request so importing the app does not touch GCP)
+
+    Returns:
+        APIRouter ready to be included in a FastAPI app
+    """
+    router = APIRouter()
+
+    @router.get("/zip/stream/{token}")
+    async def zip_stream(token: str):
+        """
+        Stream a ZIP of the token's invoices while fetching its PDFs.
+
+        Behavior:
+        - Valid token: 200 application/zip, chunked (no Content-Length);
+          the first bytes go out as soon as the first PDF is downloaded
+        - Invalid token: 403, expired token: 410, no invoices found: 404
+        """
+        stream_service = await run_in_threadpool(stream_service_provider)
+        try:
+            filename, chunks = await run_in_threadpool(stream_service.open_stream, token)
+        except ZipStreamTokenError as e:
+            logger.warning(f"Rejected ZIP stream token: {e}")
+            raise HTTPException(status_code=410 if e.expired else 403, detail=str(e))
+        except LookupError as e:
+            raise HTTPException(status_code=404, detail=str(e))
+
+        logger.info(f"Streaming ZIP {filename}")
+        # Sync iterator: Starlette pulls chunks in its threadpool and closes
+        # the iterator if the client disconnects (which stops the build)
+        return StreamingResponse(
+            chunks,
+            media_type="application/zip",
+            headers={
+                "Content-Disposition": f'attachment; filename="{filename}"',
+                "Cache-Control": "no-store",
+            },
+        )
+
+    return router
@@ -21,7 +21,9 @@ from src.domain.interfaces.time_sync import ITimeSyncValidator
 from src.domain.interfaces.environment_validator import IEnvironmentValidator
 from src.domain.interfaces.retry_strategy import IRetryStrategy
 from src.domain.interfaces.metrics_collector import IMetricsCollector
+from src.domain.interfaces.clock_offset import IClockOffsetProvider
 from src.infrastructure.gcs.robust_url_signer_solid import RobustURLSigner
+from src.infrastructure.gcs.iam_signing_session import SigningRateLimitError
 from src.core.config.yaml_config_loader import ConfigLoader
 
 
@@ -57,6 +59,7 @@ class SignedURLService:
         environment_validator: IEnvironmentValidator,
         retry_strategy: IRetryStrategy,
         metrics_collector: IMetricsCollector,
+        clock_offset_tracker: Optional[IClockOffsetProvider] = None,
     ):
         """
         Initialize signed URL service with dependencies
@@ -66,6 +69,7 @@ class SignedURLService:
             environment_validator: Environment configuration validator
             retry_strategy: Retry strategy for transient errors
             metrics_collector: Metrics collector for monitoring
+            clock_offset_tracker: Optional cached clock offset provider
         """
         self.time_sync = time_sync_validator
         self.env_validator = environment_validator
@@ -84,6 +88,7 @@ class SignedURLService:
             environment_validator=environment_validator,
             retry_strategy=retry_strategy,
             metrics_collector=metrics_collector,
+            clock_offset_tracker=clock_offset_tracker,
         )
 
         logger.info(
@@ -169,6 +174,9 @@ class SignedURLService:
 
             return signed_url
 
+        except SigningRateLimitError:
+            # Propagate throttling so batch callers can back off and retry
+            raise
         except Exception as e:
             logger.error(
                 "Exception during signed URL generation",
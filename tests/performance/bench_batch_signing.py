@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark: sequential signing with 50 ms sleeps vs BatchSigningEngine
+
+Runs the SOLID RobustURLSigner manual V4 path against a local fake signBlob
+server for 5/50/500 URLs, comparing the previous sequential loop (50 ms
+sleep between URLs) with the concurrent, token-bucket-limited engine.
+
+Usage:
+    python tests/performance/bench_batch_signing.py
+    python tests/performance/bench_batch_signing.py --sizes 5 50 --latency-ms 30
+    python tests/performance/bench_batch_signing.py --server-max-rps 40  # exercise 429s
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from unittest.mock import Mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from src.infrastructure.gcs.batch_signing_engine import (  # noqa: E402
+    BatchSigningEngine,
+    TokenBucket,
+)
+from src.infrastructure.gcs.iam_signing_session import IAMSigningSession  # noqa: E402
+from src.infrastructure.gcs.robust_url_signer_solid import RobustURLSigner  # noqa: E402
+from stub_iam_server import StubCredentials, StubIAMServer  # noqa: E402
+
+
+def build_signer(server_url: str, rate: float, workers: int) -> RobustURLSigner:
+    time_sync = Mock()
+    time_sync.get_sync_info.return_value = (None, None, 0.0)
+    signer = RobustURLSigner(
+        time_sync_validator=time_sync,
+        environment_validator=Mock(),
+        retry_strategy=Mock(),
+        metrics_collector=Mock(),
+    )
+    signer.use_legacy_method = False
+    signer._signing_session = IAMSigningSession(
+        signer.service_account_email,
+        credentials=StubCredentials(server_url),
+        endpoint=server_url,
+    )
+    signer._batch_engine = BatchSigningEngine(
+        signer.generate_signed_url,
+        max_workers=workers,
+        rate_limiter=TokenBucket(rate, capacity=min(rate, 10)),
+    )
+    return signer
+
+
+def sequential_with_sleep(signer: RobustURLSigner, gs_urls: list) -> dict:
+    """Previous behaviour: one URL at a time, 50 ms sleep between calls"""
+    result = {}
+    for i, gs_url in enumerate(gs_urls):
+        if i > 0:
+            time.sleep(0.05)
+        result[gs_url] = signer.generate_signed_url(gs_url)
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5, 50, 500])
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--rate", type=float, default=50.0)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--server-max-rps", type=float, default=0.0)
+    args = parser.parse_args()
+
+    print(
+        f"fake signBlob latency={args.latency_ms}ms, engine rate={args.rate}/s, "
+        f"workers={args.workers}, server quota={args.server_max_rps or 'none'}\n"
+    )
+    print(f"{'urls':>5} {'sequential':>12} {'engine':>10} {'speedup':>8} {'ok':>9} {'429s':>5}")
+
+    with StubIAMServer(
+        latency_ms=args.latency_ms, max_rps=args.server_max_rps
+    ) as server:
+        for size in args.sizes:
+            gs_urls = [f"gs://miguel-test/descargas/{i:08d}/Copia_Tributaria_cf.pdf" for i in range(size)]
+
+            signer = build_signer(server.url, args.rate, args.workers)
+            start = time.perf_counter()
+            sequential = sequential_with_sleep(signer, gs_urls)
+            sequential_s = time.perf_counter() - start
+
+            signer = build_signer(server.url, args.rate, args.workers)
+            throttled_before = server.counters["throttled"]
+            start = time.perf_counter()
+            batch = signer.generate_batch_signed_urls(gs_urls)
+            engine_s = time.perf_counter() - start
+
+            ok = sum(1 for url in batch.values() if url)
+            assert list(batch.keys()) == gs_urls
+            assert sum(1 for url in sequential.values() if url) >= 0
+            print(
+                f"{size:>5} {sequential_s:>11.2f}s {engine_s:>9.2f}s "
+                f"{sequential_s / engine_s:>7.1f}x {ok:>4}/{size:<4} "
+                f"{server.counters['throttled'] - throttled_before:>5}"
+            )
+            signer._batch_engine.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Benchmark: row-by-row invoice conversion vs the Arrow columnar path
+
+Builds a synthetic invoice result (100k rows by default) and times two
+tasks on both paths:
+  - invoices: BigQuery Row -> _row_to_dict -> Invoice.from_bigquery_row
+              vs invoices_from_arrow on the Arrow table
+  - summary:  the above plus a Python aggregation over the invoices
+              vs summarize_invoices (no invoices built)
+
+The Row objects are built before timing starts, so the row path is not
+charged for JSON decoding of REST pages (which it pays in production).
+
+Usage:
+    python tests/performance/bench_invoice_arrow.py
+    python tests/performance/bench_invoice_arrow.py --rows 500000 --customers 5000
+"""
+
+import argparse
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import pyarrow  # noqa: E402
+from google.cloud.bigquery.table import Row  # noqa: E402
+
+from src.core.domain.models import Invoice  # noqa: E402
+from src.infrastructure.bigquery.arrow_results import (  # noqa: E402
+    invoices_from_arrow,
+    summarize_invoices,
+)
+from src.infrastructure.bigquery.invoice_repository import (  # noqa: E402
+    BigQueryInvoiceRepository,
+)
+
+FIELD_MAPPING = {
+    "numero_factura": "Factura",
+    "cliente_rut": "Rut",
+    "cliente_nombre": "Nombre",
+    "solicitante": "Solicitante",
+    "factura_referencia": "Factura_Referencia",
+    "pdf_tributaria_cf": "Copia_Tributaria_cf",
+    "pdf_cedible_cf": "Copia_Cedible_cf",
+    "pdf_tributaria_sf": "Copia_Tributaria_sf",
+    "pdf_cedible_sf": "Copia_Cedible_sf",
+    "pdf_termico": "Doc_Termico",
+}
+
+PDF_COLUMNS = [
+    "Copia_Tributaria_cf",
+    "Copia_Cedible_cf",
+    "Copia_Tributaria_sf",
+    "Copia_Cedible_sf",
+    "Doc_Termico",
+]
+
+
+def make_table(rows: int, customers: int) -> pyarrow.Table:
+    """Synthetic LISTING-profile result; every 7th invoice lacks a cedible copy"""
+    numbers = [f"{105000000 + i:010d}" for i in range(rows)]
+    columns = {
+        "Factura": numbers,
+        "Rut": [f"{76000000 + i % customers}-{i % 10}" for i in range(rows)],
+        "Nombre": [f"Cliente {i % customers}" for i in range(rows)],
+        "Solicitante": [f"{i % 500:010d}" for i in range(rows)],
+        "Factura_Referencia": [None] * rows,
+    }
+    for column in PDF_COLUMNS:
+        columns[column] = [
+            None if column.startswith("Copia_Cedible") and i % 7 == 0
+            else f"gs://bench-pdfs/{n}/{column}.pdf"
+            for i, n in enumerate(numbers)
+        ]
+    return pyarrow.table(columns)
+
+
+def row_convert(repo, rows):
+    return [
+        Invoice.from_bigquery_row(repo._row_to_dict(row), field_mapping=FIELD_MAPPING)
+        for row in rows
+    ]
+
+
+def row_summary(repo, rows):
+    invoices = row_convert(repo, rows)
+    per_customer = Counter(invoice.rut for invoice in invoices)
+    pdfs_available = Counter(key for invoice in invoices for key in invoice.pdf_paths)
+    return {
+        "total_invoices": len(invoices),
+        "distinct_customers": len(per_customer),
+        "pdfs_available": dict(pdfs_available),
+        "top_customers": per_customer.most_common(10),
+    }
+
+
+def timed(fn, repeat):
+    best, result = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--customers", type=int, default=2_000)
+    parser.add_argument("--repeat", type=int, default=3, help="Best of N runs")
+    args = parser.parse_args()
+
+    table = make_table(args.rows, args.customers)
+    field_to_index = {name: i for i, name in enumerate(table.column_names)}
+    rows = [Row(tuple(row.values()), field_to_index) for row in table.to_pylist()]
+
+    repo = BigQueryInvoiceRepository.__new__(BigQueryInvoiceRepository)
+    repo.field_mapping = FIELD_MAPPING
+
+    row_convert_s, row_invoices = timed(lambda: row_convert(repo, rows), args.repeat)
+    row_summary_s, expected = timed(lambda: row_summary(repo, rows), args.repeat)
+    convert_s, invoices = timed(
+        lambda: invoices_from_arrow(table, FIELD_MAPPING), args.repeat
+    )
+    summary_s, summary = timed(
+        lambda: summarize_invoices(table, FIELD_MAPPING), args.repeat
+    )
+
+    # Both paths must agree before their timings mean anything
+    assert [i.pdf_paths for i in invoices] == [i.pdf_paths for i in row_invoices]
+    assert summary["distinct_customers"] == expected["distinct_customers"]
+    assert summary["pdfs_available"] == expected["pdfs_available"]
+
+    print(
+        f"\n{args.rows:,} invoices, {args.customers:,} customers, best of {args.repeat}\n",
+        file=sys.stderr,
+    )
+    print(f"{'task':<12} {'row-by-row':>11} {'columnar':>10} {'speedup':>8}", file=sys.stderr)
+    for task, row_s, columnar_s in (
+        ("invoices", row_convert_s, convert_s),
+        ("summary", row_summary_s, summary_s),
+    ):
+        print(
+            f"{task:<12} {row_s:>10.3f}s {columnar_s:>9.3f}s {row_s / columnar_s:>7.1f}x",
+            file=sys.stderr,
+        )
+
+
+if __name__ == "__main__":
+    main()
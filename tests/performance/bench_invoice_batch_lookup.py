@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-invoice lookups vs batched IN UNNEST lookup
+
+Runs BigQueryInvoiceRepository against a fake BigQuery client that charges
+a fixed latency per query job (job creation + result fetch) and answers
+from an in-memory table. Compares the old create_zip_package pattern (one
+find_by_invoice_number per invoice) with find_by_invoice_numbers.
+
+Usage:
+    python tests/performance/bench_invoice_batch_lookup.py
+    python tests/performance/bench_invoice_batch_lookup.py --invoices 278 --latency-ms 400
+"""
+
+import argparse
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.infrastructure.bigquery.invoice_repository import (  # noqa: E402
+    BigQueryInvoiceRepository,
+)
+
+FIELD_MAPPING = {
+    "numero_factura": "Factura",
+    "cliente_rut": "Rut",
+    "cliente_nombre": "Nombre",
+    "solicitante": "Solicitante",
+}
+
+
+class FakeRow(dict):
+    """Mimics google.cloud.bigquery Row.items()"""
+
+
+class FakeJob:
+    total_bytes_processed = 0
+
+    def __init__(self, rows):
+        self._rows = rows
+
+    def result(self, page_size=None):
+        return iter(self._rows)
+
+
+class FakeBigQueryClient:
+    """Fixed per-job latency; evaluates the two lookup shapes used by the repo"""
+
+    def __init__(self, table, latency_s):
+        self.table = table
+        self.latency_s = latency_s
+        self.queries = 0
+
+    def query(self, query, job_config=None):
+        self.queries += 1
+        time.sleep(self.latency_s)
+        params = {p.name: p for p in job_config.query_parameters}
+        if "invoice_numbers" in params:
+            wanted = set(params["invoice_numbers"].values)
+        else:
+            wanted = {params["invoice_number"].value}
+        return FakeJob([FakeRow(self.table[n]) for n in wanted if n in self.table])
+
+
+class FakeConfig:
+    def __init__(self, chunk_size):
+        self.chunk_size = chunk_size
+
+    def get(self, key, default=None):
+        if key == "bigquery.batch_lookup.chunk_size":
+            return self.chunk_size
+        return default
+
+
+def make_repository(table, latency_s, chunk_size):
+    repo = BigQueryInvoiceRepository.__new__(BigQueryInvoiceRepository)
+    repo.config = FakeConfig(chunk_size)
+    repo.table_full_path = "bench.invoices"
+    repo.field_mapping = FIELD_MAPPING
+    repo.client = FakeBigQueryClient(table, latency_s)
+    repo.result_cache = None
+    repo.single_flight = None
+    repo._projection_stats = {}
+    repo._stats_lock = threading.Lock()
+    return repo
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--invoices", type=int, default=278)
+    parser.add_argument("--latency-ms", type=float, default=100.0,
+                        help="Per-query job latency (BigQuery is typically 300ms-1s)")
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    numbers = [f"{105635000 + i:010d}" for i in range(args.invoices)]
+    table = {
+        n: {"Factura": n, "Rut": "76000000-0", "Nombre": "Cliente", "Solicitante": "1"}
+        for n in numbers
+    }
+    latency_s = args.latency_ms / 1000
+
+    results = {}
+    for mode in ("per_invoice", "batched"):
+        repo = make_repository(table, latency_s, args.chunk_size)
+        start = time.perf_counter()
+        if mode == "per_invoice":
+            invoices = [repo.find_by_invoice_number(n) for n in numbers]
+        else:
+            invoices = repo.find_by_invoice_numbers(numbers)
+        elapsed = time.perf_counter() - start
+        assert len([i for i in invoices if i]) == len(numbers)
+        results[mode] = (repo.client.queries, elapsed)
+
+    print(f"\n{args.invoices} invoices, {args.latency_ms:.0f} ms per query job\n", file=sys.stderr)
+    print(f"{'mode':<12} {'queries':>8} {'wall time':>10}", file=sys.stderr)
+    for mode, (queries, elapsed) in results.items():
+        print(f"{mode:<12} {queries:>8} {elapsed:>9.2f}s", file=sys.stderr)
+    speedup = results["per_invoice"][1] / results["batched"][1]
+    print(f"\nspeedup: {speedup:.0f}x", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
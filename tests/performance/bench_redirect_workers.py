@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark: /r/{url_id} redirect throughput with 1 vs N uvicorn workers
+
+Pre-populates a shared SQLite URL cache, starts the redirect routes under
+uvicorn with each worker count, and drives them from several client
+processes over keep-alive connections. Every response must be a 302: a 404
+means a worker could not see an entry stored by another process.
+
+Usage:
+    python tests/performance/bench_redirect_workers.py
+    python tests/performance/bench_redirect_workers.py --workers 1 2 4 --clients 8
+"""
+
+import argparse
+import http.client
+import multiprocessing
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from src.infrastructure.cache.url_cache import URLCache  # noqa: E402
+from src.infrastructure.cache.url_cache_backends import SQLiteURLCacheBackend  # noqa: E402
+
+
+def populate(db_path: str, entries: int) -> list:
+    cache = URLCache(backend=SQLiteURLCacheBackend(db_path))
+    return [
+        cache.store(f"https://storage.googleapis.com/bucket/{i:08d}.pdf?X-Goog-Signature=abc")
+        for i in range(entries)
+    ]
+
+
+def start_server(db_path: str, port: int, workers: int) -> subprocess.Popen:
+    env = dict(os.environ, URL_CACHE_BACKEND="sqlite", URL_CACHE_SQLITE_PATH=db_path)
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "redirect_bench_app:create_app",
+            "--factory", "--port", str(port), "--workers", str(workers),
+            "--log-level", "warning", "--no-access-log",
+            "--app-dir", str(Path(__file__).resolve().parent),
+        ],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            conn.request("GET", "/health/cache")
+            if conn.getresponse().status == 200:
+                # Give the remaining workers a moment to finish booting
+                time.sleep(1.0 + 0.25 * workers)
+                return process
+        except OSError:
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError("server did not start")
+
+
+def client(port: int, ids: list, duration: float, queue) -> None:
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    ok = missing = 0
+    deadline = time.monotonic() + duration
+    while time.monotonic() < deadline:
+        conn.request("GET", f"/r/{random.choice(ids)}")
+        response = conn.getresponse()
+        response.read()
+        if response.status == 302:
+            ok += 1
+        else:
+            missing += 1
+    queue.put((ok, missing))
+
+
+def run_load(port: int, ids: list, clients: int, duration: float) -> tuple:
+    queue = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(target=client, args=(port, ids, duration, queue))
+        for _ in range(clients)
+    ]
+    for p in processes:
+        p.start()
+    results = [queue.get() for _ in processes]
+    for p in processes:
+        p.join()
+    return sum(r[0] for r in results), sum(r[1] for r in results)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--entries", type=int, default=10000)
+    parser.add_argument("--port", type=int, default=18080)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "url_cache.sqlite3")
+        ids = populate(db_path, args.entries)
+
+        print(
+            f"{args.entries} entries, {args.clients} client processes, "
+            f"{args.duration}s per run, {os.cpu_count()} CPUs\n"
+        )
+        print(f"{'workers':>7} {'requests':>9} {'req/s':>9} {'404s':>5}")
+
+        for workers in args.workers:
+            server = start_server(db_path, args.port, workers)
+            try:
+                ok, missing = run_load(args.port, ids, args.clients, args.duration)
+            finally:
+                server.terminate()
+                server.wait(timeout=30)
+            print(
+                f"{workers:>7} {ok + missing:>9} "
+                f"{(ok + missing) / args.duration:>9.0f} {missing:>5}"
+            )
+
+
+if __name__ == "__main__":
+    main()
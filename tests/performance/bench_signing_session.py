@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: per-URL signing overhead, per-call setup vs cached session
+
+Compares the previous manual V4 signing flow (credential resolution +
+discovery client construction for every URL) against IAMSigningSession,
+both against a local stubbed signBlob endpoint.
+
+Usage:
+    python tests/performance/bench_signing_session.py --urls 50 --latency-ms 5
+"""
+
+import argparse
+import base64
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from googleapiclient import discovery  # noqa: E402
+
+from src.infrastructure.gcs.iam_signing_session import IAMSigningSession  # noqa: E402
+from stub_iam_server import StubCredentials, StubIAMServer  # noqa: E402
+
+SERVICE_ACCOUNT = "bench-signer@example.iam.gserviceaccount.com"
+STRING_TO_SIGN = b"GOOG4-RSA-SHA256\n20250101T000000Z\nscope\n" + b"0" * 64
+
+
+def sign_per_call_setup(server_url: str) -> bytes:
+    """Reproduce the old flow: fresh credentials + discovery client per URL"""
+    credentials = StubCredentials(server_url)
+    iam_client = discovery.build(
+        "iamcredentials",
+        "v1",
+        credentials=credentials,
+        cache_discovery=False,
+        client_options={"api_endpoint": f"{server_url}/"},
+    )
+    response = (
+        iam_client.projects()
+        .serviceAccounts()
+        .signBlob(
+            name=f"projects/-/serviceAccounts/{SERVICE_ACCOUNT}",
+            body={"payload": base64.b64encode(STRING_TO_SIGN).decode("utf-8")},
+        )
+        .execute()
+    )
+    return base64.b64decode(response["signedBlob"])
+
+
+def run(label: str, func, count: int) -> list:
+    samples = []
+    for _ in range(count):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    total = sum(samples)
+    print(
+        f"{label:<24} n={count:<4} total={total:8.1f}ms "
+        f"mean={statistics.mean(samples):6.2f}ms "
+        f"p50={statistics.median(samples):6.2f}ms "
+        f"max={max(samples):6.2f}ms"
+    )
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--urls", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    with StubIAMServer(latency_ms=args.latency_ms) as server:
+        before = run(
+            "per-call setup", lambda: sign_per_call_setup(server.url), args.urls
+        )
+        before_tokens = server.counters["token"]
+
+        session = IAMSigningSession(
+            SERVICE_ACCOUNT,
+            credentials=StubCredentials(server.url),
+            endpoint=server.url,
+        )
+        after = run("cached session", lambda: session.sign_blob(STRING_TO_SIGN), args.urls)
+        after_tokens = server.counters["token"] - before_tokens
+
+    print(
+        f"\ntoken fetches: per-call={before_tokens} cached={after_tokens}; "
+        f"mean overhead saved per URL: "
+        f"{statistics.mean(before) - statistics.mean(after):.2f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
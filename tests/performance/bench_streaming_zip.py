@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Benchmark: buffered ZIP (BytesIO, then upload) vs StreamingZipWriter
+
+Simulates GCS with fake downloads (fixed latency, incompressible PDFs) and a
+chunked upload sink with a fixed bandwidth. Each mode runs in its own
+subprocess so peak RSS is measured independently.
+
+Usage:
+    python tests/performance/bench_streaming_zip.py
+    python tests/performance/bench_streaming_zip.py --pdfs 400 --pdf-kb 300
+"""
+
+import argparse
+import concurrent.futures
+import io
+import json
+import os
+import subprocess
+import sys
+import time
+import zipfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.infrastructure.gcs.streaming_zip_writer import (  # noqa: E402
+    StreamingZipWriter,
+    current_rss_bytes,
+)
+
+CHUNK = 8 * 1024 * 1024
+
+
+class ChunkedUploadSink:
+    """Buffers one chunk and 'uploads' it at a fixed bandwidth"""
+
+    def __init__(self, mb_per_s: float):
+        self.mb_per_s = mb_per_s
+        self.pending = 0
+        self.first_upload_at = None
+
+    def _upload(self, size: int) -> None:
+        time.sleep(size / (self.mb_per_s * 1024 * 1024))
+        if self.first_upload_at is None:
+            self.first_upload_at = time.time()
+
+    def write(self, data) -> int:
+        self.pending += len(data)
+        while self.pending >= CHUNK:
+            self._upload(CHUNK)
+            self.pending -= CHUNK
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        if self.pending:
+            self._upload(self.pending)
+            self.pending = 0
+
+
+def fake_download(args):
+    latency_s, size = args
+
+    def download(gs_path: str) -> bytes:
+        time.sleep(latency_s)
+        return os.urandom(size)
+
+    return download
+
+
+def run_buffered(download, entries, workers, sink) -> int:
+    """Previous behaviour; returns RSS while the whole archive is in memory"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(download, gs): name for name, gs in entries}
+            for future in concurrent.futures.as_completed(futures):
+                zip_file.writestr(futures[future], future.result())
+    peak_rss = current_rss_bytes()
+    sink.write(buffer.getbuffer())
+    return peak_rss
+
+
+def run_mode(mode: str, pdfs: int, pdf_kb: int, latency_ms: float, workers: int, mbps: float) -> dict:
+    download = fake_download((latency_ms / 1000, pdf_kb * 1024))
+    entries = [(f"{i}.pdf", f"gs://b/{i}.pdf") for i in range(pdfs)]
+    sink = ChunkedUploadSink(mbps)
+    baseline_rss = current_rss_bytes()
+
+    start = time.time()
+    if mode == "buffered":
+        peak_rss = run_buffered(download, entries, workers, sink)
+    else:
+        result = StreamingZipWriter(download, max_workers=workers).write(entries, sink)
+        peak_rss = result.peak_rss_bytes
+    sink.close()
+    total = time.time() - start
+
+    return {
+        "total_s": total,
+        "ttfb_s": (sink.first_upload_at or time.time()) - start,
+        "peak_rss_mb": (peak_rss - baseline_rss) / (1024 * 1024),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pdfs", type=int, default=200)
+    parser.add_argument("--pdf-kb", type=int, default=250)
+    parser.add_argument("--latency-ms", type=float, default=40.0)
+    parser.add_argument("--workers", type=int, default=10)
+    parser.add_argument("--upload-mbps", type=float, default=40.0)
+    parser.add_argument("--mode", choices=["buffered", "streaming"])
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(run_mode(
+            args.mode, args.pdfs, args.pdf_kb, args.latency_ms, args.workers, args.upload_mbps
+        )))
+        return
+
+    print(
+        f"{args.pdfs} PDFs x {args.pdf_kb} KB, download latency {args.latency_ms} ms, "
+        f"{args.workers} workers, upload {args.upload_mbps} MB/s\n"
+    )
+    print(f"{'mode':>10} {'total':>8} {'ttfb':>8} {'peak RSS delta':>15}")
+    for mode in ("buffered", "streaming"):
+        output = subprocess.run(
+            [sys.executable, __file__, "--mode", mode]
+            + [f"--pdfs={args.pdfs}", f"--pdf-kb={args.pdf_kb}",
+               f"--latency-ms={args.latency_ms}", f"--workers={args.workers}",
+               f"--upload-mbps={args.upload_mbps}"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip().splitlines()[-1]
+        stats = json.loads(output)
+        print(
+            f"{mode:>10} {stats['total_s']:>7.2f}s {stats['ttfb_s']:>7.2f}s "
+            f"{stats['peak_rss_mb']:>12.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+"""
+Minimal app exposing only the redirect routes (no ADK), for load tests.
+
+Run by bench_redirect_workers.py through uvicorn's --factory mode; the URL
+cache backend is selected with the usual config environment overrides
+(URL_CACHE_BACKEND, URL_CACHE_SQLITE_PATH).
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from fastapi import FastAPI  # noqa: E402
+
+from src.presentation.api.redirect_routes import create_redirect_router  # noqa: E402
+
+
+def create_app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(create_redirect_router())
+    return app
@@ -0,0 +1,144 @@
+"""
+Stub IAM Credentials / OAuth server for signing benchmarks
+==========================================================
+Local HTTP server that mimics the ``signBlob`` and token endpoints closely
+enough to measure client-side overhead without touching Google APIs.
+
+Usage:
+    with StubIAMServer(latency_ms=5) as server:
+        session = IAMSigningSession(
+            "sa@example.iam.gserviceaccount.com",
+            credentials=StubCredentials(server.url),
+            endpoint=server.url,
+        )
+"""
+
+import base64
+import json
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+from google.auth import credentials as ga_credentials
+
+FAKE_SIGNATURE = bytes(range(256))
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Keep-alive + small writes would otherwise hit delayed-ACK stalls
+    disable_nagle_algorithm = True
+    wbufsize = 64 * 1024
+
+    def log_message(self, format, *args):  # noqa: A002 - silence stdlib logging
+        pass
+
+    def _send_json(self, status: int, payload: dict) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):  # noqa: N802 - stdlib naming
+        length = int(self.headers.get("Content-Length", 0))
+        raw = self.rfile.read(length) if length else b""
+        server = self.server
+        path = self.path.split("?", 1)[0]
+
+        if server.latency_ms:
+            time.sleep(server.latency_ms / 1000.0)
+
+        if path.endswith("/token"):
+            server.count("token")
+            self._send_json(200, {"access_token": "stub-token", "expires_in": 3600})
+            return
+
+        if path.endswith(":signBlob"):
+            server.count("sign")
+            if server.should_throttle():
+                server.count("throttled")
+                self._send_json(
+                    429, {"error": {"code": 429, "status": "RESOURCE_EXHAUSTED"}}
+                )
+                return
+            json.loads(raw or b"{}")
+            self._send_json(
+                200,
+                {
+                    "keyId": "stub-key",
+                    "signedBlob": base64.b64encode(FAKE_SIGNATURE).decode("utf-8"),
+                },
+            )
+            return
+
+        self._send_json(404, {"error": {"code": 404}})
+
+    # discovery clients may issue GET for unknown paths; answer 404 quickly
+    def do_GET(self):  # noqa: N802 - stdlib naming
+        self._send_json(404, {"error": {"code": 404}})
+
+
+class StubIAMServer(ThreadingHTTPServer):
+    """Threaded stub server with per-endpoint counters and optional throttling"""
+
+    daemon_threads = True
+
+    def __init__(self, latency_ms: float = 0.0, max_rps: float = 0.0):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.latency_ms = latency_ms
+        self.max_rps = max_rps
+        self.counters = {"token": 0, "sign": 0, "throttled": 0}
+        self._lock = threading.Lock()
+        self._window_start = time.monotonic()
+        self._window_count = 0
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self, name: str) -> None:
+        with self._lock:
+            self.counters[name] += 1
+
+    def should_throttle(self) -> bool:
+        """Return True when the 1-second window exceeds ``max_rps``"""
+        if not self.max_rps:
+            return False
+        with self._lock:
+            now = time.monotonic()
+            if now - self._window_start >= 1.0:
+                self._window_start = now
+                self._window_count = 0
+            self._window_count += 1
+            return self._window_count > self.max_rps
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+        self.server_close()
+
+
+class StubCredentials(ga_credentials.Credentials):
+    """Credentials whose refresh hits the stub token endpoint"""
+
+    def __init__(self, server_url: str):
+        super().__init__()
+        self._token_url = f"{server_url}/token"
+
+    def refresh(self, request):
+        response = requests.post(self._token_url, timeout=5)
+        payload = response.json()
+        self.token = payload["access_token"]
+        self.expiry = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(
+            seconds=payload["expires_in"]
+        )
@@ -0,0 +1,205 @@
+"""
+Unit tests for ZIP download planning
+
+Verifies downloads are deduplicated and scheduled largest-first from object
+metadata, that predictions come from the plan, and that ZipService downloads
+a shared PDF once while writing it under every name.
+"""
+
+import io
+import zipfile
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.application.services.zip_download_planner import plan_zip_downloads
+from src.application.services.zip_service import ZipService
+from src.core.domain.models import Invoice
+from src.infrastructure.gcs.object_metadata import ObjectMetadata
+
+
+class FakeConfig:
+    def __init__(self, values):
+        self.values = values
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+    def get_required(self, key):
+        return self.values[key]
+
+
+def _invoice(number, tributaria=None):
+    return Invoice(
+        factura=number,
+        rut="76000000-0",
+        nombre="Cliente",
+        pdf_paths={
+            "Copia_Tributaria_cf": tributaria or f"gs://pdfs/{number}_t.pdf",
+            "Copia_Cedible_cf": f"gs://pdfs/{number}_c.pdf",
+        },
+    )
+
+
+class TestPlanZipDownloads:
+    def test_largest_first_with_missing_last(self):
+        entries = [("a.pdf", "gs://b/a"), ("b.pdf", "gs://b/b"), ("c.pdf", "gs://b/c")]
+        metadata = {
+            "gs://b/a": ObjectMetadata(generation=1, size=10),
+            "gs://b/b": None,
+            "gs://b/c": ObjectMetadata(generation=3, size=500, crc32c="AAAAAA=="),
+        }
+
+        plan = plan_zip_downloads(entries, metadata)
+
+        assert [d.gs_path for d in plan.downloads] == ["gs://b/c", "gs://b/a", "gs://b/b"]
+        assert plan.downloads[0].crc32c == "AAAAAA=="
+        assert plan.missing_objects == 1
+        assert plan.generations == {"gs://b/a": 1, "gs://b/b": None, "gs://b/c": 3}
+
+    def test_shared_paths_downloaded_once(self):
+        entries = [("1.pdf", "gs://b/x"), ("2.pdf", "gs://b/y"), ("3.pdf", "gs://b/x")]
+        metadata = {
+            "gs://b/x": ObjectMetadata(generation=1, size=100),
+            "gs://b/y": ObjectMetadata(generation=2, size=50),
+        }
+
+        plan = plan_zip_downloads(entries, metadata)
+
+        assert len(plan.downloads) == 2
+        assert plan.downloads[0].arcnames == ["1.pdf", "3.pdf"]
+        assert plan.duplicate_entries == 1
+        assert plan.download_bytes == 150
+        assert plan.entries == [("1.pdf", "gs://b/x"), ("3.pdf", "gs://b/x"), ("2.pdf", "gs://b/y")]
+
+    def test_without_metadata_keeps_invoice_order(self):
+        entries = [("1.pdf", "gs://b/y"), ("2.pdf", "gs://b/x")]
+
+        plan = plan_zip_downloads(entries)
+
+        assert [d.gs_path for d in plan.downloads] == ["gs://b/y", "gs://b/x"]
+        assert plan.generations is None
+
+    def test_predictions(self):
+        plan = plan_zip_downloads(
+            [("a.pdf", "gs://b/a")],
+            {"gs://b/a": ObjectMetadata(generation=1, size=2 * 1024 * 1024)},
+        )
+
+        assert plan.predicted_download_ms(mb_per_s=4) == 500
+        # Content plus per-entry headers and the end record
+        assert plan.predicted_zip_bytes() > 2 * 1024 * 1024
+        assert plan.predicted_zip_bytes() < 2 * 1024 * 1024 + 200
+
+
+class TestZipServicePlanning:
+    @pytest.fixture
+    def service(self):
+        config = FakeConfig(
+            {
+                "google_cloud.write.project": "proj",
+                "google_cloud.write.bucket": "zips",
+                "pdf.zip.planning.enabled": True,
+                "pdf.zip.max_concurrent_downloads": 1,
+            }
+        )
+        with patch("src.application.services.zip_service.storage.Client"):
+            return ZipService(MagicMock(), MagicMock(), config)
+
+    def test_buffer_downloads_largest_first_and_once(self, service):
+        shared = "gs://pdfs/shared_t.pdf"
+        invoices = [_invoice("1", tributaria=shared), _invoice("2", tributaria=shared)]
+        sizes = {shared: 10, "gs://pdfs/1_c.pdf": 30, "gs://pdfs/2_c.pdf": 20}
+        metadata = {
+            path: ObjectMetadata(generation=1, size=size) for path, size in sizes.items()
+        }
+        downloaded = []
+
+        def download(gs_path, generation=None, cache_stats=None):
+            downloaded.append(gs_path)
+            return b"%PDF " + gs_path.encode()
+
+        with patch(
+            "src.application.services.zip_service.fetch_object_metadata",
+            return_value=metadata,
+        ), patch.object(service, "_download_pdf_from_gcs", side_effect=download):
+            plan = service.plan_zip(invoices)
+            buffer, metrics = service._create_zip_buffer(invoices, plan=plan)
+
+        # One worker: submission order is download order
+        assert downloaded == ["gs://pdfs/1_c.pdf", "gs://pdfs/2_c.pdf", shared]
+        with zipfile.ZipFile(buffer) as archive:
+            assert sorted(archive.namelist()) == [
+                "1_Copia_Cedible_cf.pdf",
+                "1_Copia_Tributaria_cf.pdf",
+                "2_Copia_Cedible_cf.pdf",
+                "2_Copia_Tributaria_cf.pdf",
+            ]
+        assert metrics.files_included == 4
+        assert metrics.duplicate_downloads_avoided == 1
+        assert metrics.planned_download_bytes == 60
+
+    def test_streamed_build_writes_shared_pdf_under_each_name(self, service):
+        shared = "gs://pdfs/shared_t.pdf"
+        invoices = [_invoice("1", tributaria=shared), _invoice("2", tributaria=shared)]
+        downloaded = []
+
+        def download(gs_path, generation=None, cache_stats=None):
+            downloaded.append(gs_path)
+            return b"%PDF"
+
+        service.planning_enabled = False
+        stream = io.BytesIO()
+        with patch.object(service, "_download_pdf_from_gcs", side_effect=download):
+            metrics = service.write_zip_to_stream(invoices, stream)
+
+        assert sorted(downloaded) == ["gs://pdfs/1_c.pdf", "gs://pdfs/2_c.pdf", shared]
+        assert metrics.files_included == 4
+        with zipfile.ZipFile(io.BytesIO(stream.getvalue())) as archive:
+            assert len(archive.namelist()) == 4
+
+    def test_streamed_build_reports_no_upload_throughput(self, service):
+        service.planning_enabled = False
+        blob = service.storage_client.bucket.return_value.blob.return_value
+        blob.open.return_value = io.BytesIO()
+
+        with patch.object(service, "_download_pdf_from_gcs", return_value=b"%PDF"):
+            _, size, metrics = service._stream_zip_to_gcs("p1", [_invoice("1")], "f")
+
+        # The upload overlaps the downloads: only end-to-end figures exist
+        assert metrics.upload_time_ms is None
+        assert metrics.upload_mb_per_s is None
+        assert metrics.upload_parts is None
+        assert metrics.streamed_chunks == 1
+        assert metrics.end_to_end_mb_per_s is not None
+
+    def test_estimate_uses_observed_throughput(self, service):
+        invoices = [_invoice("1")]
+        metadata = {
+            "gs://pdfs/1_t.pdf": ObjectMetadata(generation=1, size=3 * 1024 * 1024),
+            "gs://pdfs/1_c.pdf": ObjectMetadata(generation=1, size=1 * 1024 * 1024),
+        }
+        with patch(
+            "src.application.services.zip_service.fetch_object_metadata",
+            return_value=metadata,
+        ):
+            plan = service.plan_zip(invoices)
+            assert service.get_zip_estimate(invoices, plan=plan)["assumed_mb_per_s"] == 20
+
+            # A build that moved 4 MB in 500 ms observed 8 MB/s
+            service._record_download_throughput(plan, 500)
+            estimate = service.get_zip_estimate(invoices)
+
+        assert estimate["assumed_mb_per_s"] == 8
+        assert estimate["predicted_download_ms"] == 500
+        assert estimate["largest_object_bytes"] == 3 * 1024 * 1024
+
+    def test_metadata_failure_falls_back_to_invoice_order(self, service):
+        with patch(
+            "src.application.services.zip_service.fetch_object_metadata",
+            side_effect=RuntimeError("batch failed"),
+        ):
+            plan = service.plan_zip([_invoice("1")])
+
+        assert not plan.metadata_available
+        assert [d.gs_path for d in plan.downloads] == ["gs://pdfs/1_t.pdf", "gs://pdfs/1_c.pdf"]
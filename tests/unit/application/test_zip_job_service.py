@@ -0,0 +1,303 @@
+"""
+Unit tests for ZipJobService
+
+Verifies that submit() returns immediately with a persisted PENDING job, the
+status state machine, queue bounds, one job per volume and status lookups
+across processes.
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.application.services.zip_job_service import (
+    ZipJobQueueFullError,
+    ZipJobService,
+)
+from src.application.services.zip_service import ZipService
+from src.application.services.zip_volume_planner import ZipVolumePlan
+from src.core.domain.models import Invoice, ZipPackage, ZipStatus
+
+
+class FakeConfig:
+    def __init__(self, values=None):
+        self.values = values or {}
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+
+class RecordingZipRepo:
+    """In-memory IZipRepository recording every persisted status"""
+
+    def __init__(self):
+        self.rows = {}
+        self.history = []
+
+    def create(self, package):
+        self.rows[package.package_id] = package
+        self.history.append(package.status)
+        return package
+
+    def update(self, package):
+        self.rows[package.package_id] = package
+        self.history.append(package.status)
+        return package
+
+    def find_by_id(self, package_id):
+        return self.rows.get(package_id)
+
+
+def _invoice(number):
+    return Invoice(factura=number, rut="76000000-0", nombre="Cliente")
+
+
+@pytest.fixture
+def repo():
+    return RecordingZipRepo()
+
+
+@pytest.fixture
+def invoice_repo():
+    invoice_repo = MagicMock()
+    invoice_repo.find_by_invoice_numbers.side_effect = lambda numbers, **kwargs: [
+        _invoice(n) for n in numbers if n != "unknown"
+    ]
+    return invoice_repo
+
+
+def _make_service(repo, invoice_repo, build, **config):
+    zip_service = MagicMock()
+    zip_service.create_zip_from_invoices.side_effect = build
+    service = ZipJobService(zip_service, repo, invoice_repo, FakeConfig(config))
+    return service
+
+
+def _make_volume_service(repo, invoice_repo, build, volume_sizes, **config):
+    """Service whose ZipService splits the invoices into volume_sizes volumes"""
+    service = _make_service(repo, invoice_repo, build, **config)
+    zip_service = service.zip_service
+    zip_service.volumes_enabled = True
+    zip_service.get_zip_volume_names.side_effect = ZipService.get_zip_volume_names
+
+    def plan(invoices, pdf_type, pdf_variant):
+        volumes, start = [], 0
+        for size in volume_sizes:
+            chunk = invoices[start : start + size]
+            download_plan = SimpleNamespace(generations={chunk[0].factura: 1})
+            volumes.append((ZipVolumePlan(invoices=chunk), download_plan))
+            start += size
+        return volumes
+
+    zip_service.plan_zip_volumes.side_effect = plan
+    return service
+
+
+def _ready(package_id, invoice_numbers, expires_at=None):
+    return ZipPackage(
+        package_id=package_id,
+        invoice_numbers=invoice_numbers,
+        status=ZipStatus.READY,
+        expires_at=expires_at,
+        gcs_path=f"gs://zips/zips/{package_id}/f.zip",
+        download_url=f"https://signed/{package_id}",
+        file_size_bytes=10,
+        pdf_count=2,
+    )
+
+
+def test_submit_returns_pending_before_build_finishes(repo, invoice_repo):
+    release = threading.Event()
+
+    def build(invoices, package_id, **kwargs):
+        release.wait(5)
+        package = _ready(package_id, [inv.factura for inv in invoices])
+        repo.update(package)
+        return package
+
+    service = _make_service(repo, invoice_repo, build)
+    job = service.submit(["1", "2"])
+
+    assert job.status == ZipStatus.PENDING
+    assert service.get_status(job.package_id).status in (
+        ZipStatus.PENDING,
+        ZipStatus.CREATING,
+    )
+
+    release.set()
+    service.shutdown(wait=True)
+
+    assert service.get_status(job.package_id).is_ready
+    assert repo.history == [
+        ZipStatus.PENDING,
+        ZipStatus.CREATING,
+        ZipStatus.READY,
+    ]
+
+
+def test_unknown_invoices_are_skipped_and_empty_job_fails(repo, invoice_repo):
+    builds = []
+
+    def build(invoices, package_id, **kwargs):
+        builds.append([inv.factura for inv in invoices])
+        return _ready(package_id, builds[-1])
+
+    service = _make_service(repo, invoice_repo, build)
+    ok = service.submit(["1", "unknown"])
+    failed = service.submit(["unknown"])
+    service.shutdown(wait=True)
+
+    assert builds == [["1"]]
+    assert service.get_status(ok.package_id).is_ready
+    status = service.get_status(failed.package_id)
+    assert status.status == ZipStatus.FAILED
+    assert status.error_message == "No invoices found"
+    assert repo.rows[failed.package_id].status == ZipStatus.FAILED
+
+
+def test_build_error_marks_job_failed(repo, invoice_repo):
+    def build(invoices, package_id, **kwargs):
+        raise RuntimeError("upload failed")
+
+    service = _make_service(repo, invoice_repo, build)
+    job = service.submit(["1"])
+    service.shutdown(wait=True)
+
+    assert service.get_status(job.package_id).status == ZipStatus.FAILED
+    assert repo.rows[job.package_id].error_message == "upload failed"
+
+
+def test_reused_package_is_mapped_onto_job(repo, invoice_repo):
+    expires_at = datetime.now(timezone.utc) + timedelta(hours=5)
+
+    def build(invoices, package_id, **kwargs):
+        return _ready("existing", ["1"], expires_at=expires_at)
+
+    service = _make_service(repo, invoice_repo, build)
+    job = service.submit(["1"])
+    service.shutdown(wait=True)
+
+    status = service.get_status(job.package_id)
+    assert status.package_id == job.package_id
+    assert status.is_ready
+    assert status.download_url == "https://signed/existing"
+    assert status.expires_at == expires_at
+    assert repo.rows[job.package_id].gcs_path == "gs://zips/zips/existing/f.zip"
+
+
+def test_queue_is_bounded(repo, invoice_repo):
+    release = threading.Event()
+
+    def build(invoices, package_id, **kwargs):
+        release.wait(5)
+        return _ready(package_id, ["1"])
+
+    service = _make_service(
+        repo,
+        invoice_repo,
+        build,
+        **{"pdf.zip.async_jobs.max_workers": 1, "pdf.zip.async_jobs.max_queued": 2},
+    )
+    service.submit(["1"])
+    service.submit(["2"])
+    with pytest.raises(ZipJobQueueFullError):
+        service.submit(["3"])
+
+    release.set()
+    deadline = time.time() + 5
+    while service._unfinished and time.time() < deadline:
+        time.sleep(0.01)
+
+    # Finished jobs free their slots
+    service.submit(["4"])
+    service.shutdown(wait=True)
+
+
+def test_empty_submit_is_rejected(repo, invoice_repo):
+    service = _make_service(repo, invoice_repo, lambda *a, **k: None)
+    with pytest.raises(ValueError):
+        service.submit([])
+
+
+def test_status_of_job_from_another_process(repo, invoice_repo):
+    service = _make_service(repo, invoice_repo, lambda *a, **k: None)
+    created = datetime.now(timezone.utc)
+    repo.rows["other"] = ZipPackage(
+        package_id="other",
+        invoice_numbers=["1"],
+        status=ZipStatus.CREATING,
+        created_at=created,
+    )
+    repo.rows["stale"] = ZipPackage(
+        package_id="stale",
+        invoice_numbers=["1"],
+        status=ZipStatus.PENDING,
+        created_at=created - timedelta(hours=1),
+    )
+
+    assert service.get_status("other").status == ZipStatus.CREATING
+    assert service.get_status("stale").status == ZipStatus.FAILED
+    assert service.get_status("missing") is None
+
+
+def test_invalid_transition_is_rejected(repo, invoice_repo):
+    service = _make_service(repo, invoice_repo, lambda *a, **k: None)
+    pending = ZipPackage(package_id="p", invoice_numbers=["1"])
+
+    with pytest.raises(ValueError):
+        service._transition_zip_job(pending, _ready("p", ["1"]))
+
+
+def test_each_volume_is_a_job(repo, invoice_repo):
+    builds = {}
+
+    def build(invoices, package_id, **kwargs):
+        builds[package_id] = (kwargs["package_name"], kwargs["generations"])
+        return _ready(package_id, [inv.factura for inv in invoices])
+
+    service = _make_volume_service(repo, invoice_repo, build, [2, 1])
+    jobs = service.submit_volumes(["1", "2", "unknown", "3"], package_name="marzo")
+    service.shutdown(wait=True)
+
+    assert [job.invoice_numbers for job in jobs] == [["1", "2"], ["3"]]
+    assert all(service.get_status(job.package_id).is_ready for job in jobs)
+    assert [builds[job.package_id] for job in jobs] == [
+        ("marzo_parte_1_de_2", {"1": 1}),
+        ("marzo_parte_2_de_2", {"3": 1}),
+    ]
+    # Workers build from the planned volumes without a second lookup
+    invoice_repo.find_by_invoice_numbers.assert_called_once()
+
+
+def test_volumes_that_do_not_fit_queue_nothing(repo, invoice_repo):
+    service = _make_volume_service(
+        repo,
+        invoice_repo,
+        lambda *a, **k: None,
+        [1, 1, 1],
+        **{"pdf.zip.async_jobs.max_queued": 2},
+    )
+
+    with pytest.raises(ZipJobQueueFullError):
+        service.submit_volumes(["1", "2", "3"])
+
+    assert repo.rows == {}
+    assert service._unfinished == 0
+
+
+def test_submit_volumes_without_volumes_is_one_job(repo, invoice_repo):
+    def build(invoices, package_id, **kwargs):
+        return _ready(package_id, [inv.factura for inv in invoices])
+
+    service = _make_service(repo, invoice_repo, build)
+    service.zip_service.volumes_enabled = False
+    (job,) = service.submit_volumes(["1", "2"])
+    service.shutdown(wait=True)
+
+    assert job.invoice_numbers == ["1", "2"]
+    assert service.get_status(job.package_id).is_ready
+    service.zip_service.plan_zip_volumes.assert_not_called()
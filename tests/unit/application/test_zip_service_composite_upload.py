@@ -0,0 +1,146 @@
+"""
+Unit tests for ZipService archive upload
+
+Verifies the size threshold selects the composite upload path for both
+buffered and streamed builds and that upload throughput is reported.
+"""
+
+import io
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.application.services.zip_download_planner import (
+    PlannedDownload,
+    ZipDownloadPlan,
+)
+from src.application.services.zip_service import ZipService
+from src.core.domain.models import Invoice
+from src.infrastructure.gcs.composite_upload import CompositeUploadResult
+
+
+class FakeConfig:
+    def __init__(self, values):
+        self.values = values
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+    def get_required(self, key):
+        return self.values[key]
+
+
+@pytest.fixture
+def service():
+    config = FakeConfig(
+        {
+            "google_cloud.write.project": "proj",
+            "google_cloud.write.bucket": "zips",
+            "pdf.zip.composite_upload.enabled": True,
+            "pdf.zip.composite_upload.threshold_mb": 1,
+        }
+    )
+    with patch("src.application.services.zip_service.storage.Client"):
+        zip_service = ZipService(MagicMock(), MagicMock(), config)
+    zip_service.composite_uploader = MagicMock()
+    zip_service.composite_uploader.upload.return_value = CompositeUploadResult(
+        bytes_uploaded=2 * 1024 * 1024, parts=4, upload_time_ms=100
+    )
+    return zip_service
+
+
+def _blob(service):
+    return service.storage_client.bucket.return_value.blob.return_value
+
+
+def test_small_archive_uses_single_upload(service):
+    gcs_path, size, metrics = service._upload_zip_to_gcs(
+        "p1", io.BytesIO(b"x" * 1000), "facturas"
+    )
+
+    assert gcs_path == "gs://zips/zips/p1/facturas.zip"
+    assert size == 1000
+    _blob(service).upload_from_file.assert_called_once()
+    service.composite_uploader.upload.assert_not_called()
+    assert metrics["upload_parts"] == 1
+    assert metrics["upload_mb_per_s"] > 0
+
+
+def test_large_archive_uses_composite_upload(service):
+    buffer = io.BytesIO(b"x" * (2 * 1024 * 1024))
+
+    _, size, metrics = service._upload_zip_to_gcs("p2", buffer, "grande")
+
+    assert size == 2 * 1024 * 1024
+    service.composite_uploader.upload.assert_called_once_with(
+        buffer, _blob(service), content_type="application/zip"
+    )
+    _blob(service).upload_from_file.assert_not_called()
+    assert metrics["upload_parts"] == 4
+
+
+def _plan(size, metadata_available=True):
+    return ZipDownloadPlan(
+        downloads=[PlannedDownload("gs://pdfs/1_t.pdf", ["1_t.pdf"], size=size)],
+        metadata_available=metadata_available,
+    )
+
+
+class RecordingCompositeStream(io.BytesIO):
+    """Stands in for CompositeUploadStream; result is set like on close()"""
+
+    result = CompositeUploadResult(bytes_uploaded=4096, parts=4, upload_time_ms=50)
+
+
+def _stream(service, plan):
+    """Run a streamed build; returns the sink used and the metrics"""
+    invoice = Invoice(
+        factura="1",
+        rut="76000000-0",
+        nombre="Cliente",
+        pdf_paths={"Copia_Tributaria_cf": "gs://pdfs/1_t.pdf"},
+    )
+    _blob(service).open.return_value = io.BytesIO()
+    service.composite_uploader.open.return_value = RecordingCompositeStream()
+    service.composite_uploader.part_size_bytes = 1024 * 1024
+    with patch.object(service, "_download_pdf_from_gcs", return_value=b"%PDF"):
+        _, _, metrics = service._stream_zip_to_gcs(
+            "p1", [invoice], "facturas", "tributaria_only", "cf", plan=plan
+        )
+    if service.composite_uploader.open.called:
+        _blob(service).open.assert_not_called()
+        return "composite", metrics
+    _blob(service).open.assert_called_once()
+    return "resumable", metrics
+
+
+def test_streamed_archive_planned_above_threshold_uploads_parts(service):
+    sink, metrics = _stream(service, _plan(2 * 1024 * 1024))
+
+    assert sink == "composite"
+    service.composite_uploader.open.assert_called_once_with(
+        _blob(service), content_type="application/zip"
+    )
+    assert metrics.upload_parts == 4
+    assert metrics.upload_time_ms == 50
+    assert metrics.upload_mb_per_s == round(4096 / (1024 * 1024) / 0.05, 2)
+    assert metrics.streamed_chunks is None
+
+
+@pytest.mark.parametrize(
+    "plan",
+    [_plan(1000), _plan(2 * 1024 * 1024, metadata_available=False), None],
+    ids=["small", "no-metadata", "no-plan"],
+)
+def test_small_or_unplanned_archives_use_one_resumable_upload(service, plan):
+    sink, metrics = _stream(service, plan)
+
+    assert sink == "resumable"
+    assert metrics.upload_parts is None
+    assert metrics.streamed_chunks == 1
+
+
+def test_threshold_ignored_without_composite_upload(service):
+    service.composite_upload_enabled = False
+
+    assert _stream(service, _plan(2 * 1024 * 1024))[0] == "resumable"
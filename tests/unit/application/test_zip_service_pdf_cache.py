@@ -0,0 +1,89 @@
+"""
+Unit tests for the PDF cache path of ZipService downloads
+
+Verifies cache hits skip GCS, misses are downloaded with a generation
+precondition and stored, and per-package accounting.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from google.api_core.exceptions import PreconditionFailed
+
+from src.application.services.zip_service import ZipService
+from src.infrastructure.cache.pdf_blob_cache import BlobCacheStats
+
+
+class FakeConfig:
+    def __init__(self, values):
+        self.values = values
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+    def get_required(self, key):
+        return self.values[key]
+
+
+@pytest.fixture
+def service(tmp_path):
+    config = FakeConfig(
+        {
+            "google_cloud.write.project": "proj",
+            "google_cloud.write.bucket": "zips",
+            "pdf.zip.pdf_cache.enabled": True,
+            "pdf.zip.pdf_cache.directory": str(tmp_path / "cache"),
+            "pdf.zip.pdf_cache.max_size_mb": 1,
+        }
+    )
+    signer = MagicMock()
+    signer.extract_bucket_and_blob.side_effect = lambda path: tuple(
+        path[5:].split("/", 1)
+    )
+    with patch("src.application.services.zip_service.storage.Client"):
+        return ZipService(MagicMock(), signer, config)
+
+
+def _blob(service):
+    return service.storage_client.bucket.return_value.blob.return_value
+
+
+def test_miss_then_hit(service):
+    _blob(service).download_as_bytes.return_value = b"%PDF content"
+    stats = BlobCacheStats()
+    download = service._get_pdf_download_func({"gs://pdfs/a.pdf": 42}, stats)
+
+    assert download("gs://pdfs/a.pdf") == b"%PDF content"
+    _blob(service).download_as_bytes.assert_called_once_with(if_generation_match=42)
+
+    assert download("gs://pdfs/a.pdf")[:] == b"%PDF content"
+    assert _blob(service).download_as_bytes.call_count == 1
+    assert (stats.hits, stats.misses, stats.bytes_saved) == (1, 1, 12)
+
+    metrics = service._pdf_cache_metrics(stats)
+    assert metrics["pdf_cache_hit_ratio"] == 0.5
+    assert metrics["pdf_cache_bytes_saved"] == 12
+
+
+def test_unknown_generation_bypasses_cache(service):
+    _blob(service).download_as_bytes.return_value = b"x"
+    stats = BlobCacheStats()
+    download = service._get_pdf_download_func(None, stats)
+
+    download("gs://pdfs/a.pdf")
+    download("gs://pdfs/a.pdf")
+
+    assert _blob(service).download_as_bytes.call_count == 2
+    assert (stats.hits, stats.misses) == (0, 0)
+    assert service.pdf_cache.stats()["files"] == 0
+
+
+def test_overwritten_object_is_downloaded_but_not_cached(service):
+    _blob(service).download_as_bytes.side_effect = [
+        PreconditionFailed("generation changed"),
+        b"new content",
+    ]
+    download = service._get_pdf_download_func({"gs://pdfs/a.pdf": 1}, BlobCacheStats())
+
+    assert download("gs://pdfs/a.pdf") == b"new content"
+    assert service.pdf_cache.get("pdfs", "a.pdf", 1) is None
@@ -0,0 +1,265 @@
+"""
+Unit tests for content-addressed ZIP reuse in ZipService
+
+Verifies the request fingerprint, re-signing of a ready package instead of
+rebuilding it, and that concurrent identical requests share one build.
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.application.services.zip_service import ZipService
+from src.core.domain.models import Invoice, ZipPackage, ZipStatus
+
+
+class FakeConfig:
+    """Minimal ConfigLoader stand-in"""
+
+    def __init__(self, values):
+        self.values = values
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+    def get_required(self, key):
+        return self.values[key]
+
+
+def _invoice(number):
+    return Invoice(
+        factura=number,
+        rut="76000000-0",
+        nombre="Cliente",
+        pdf_paths={
+            "Copia_Tributaria_cf": f"gs://pdfs/{number}_t.pdf",
+            "Copia_Cedible_cf": f"gs://pdfs/{number}_c.pdf",
+        },
+    )
+
+
+@pytest.fixture
+def generations():
+    """Current GCS generation of each PDF (mutable per test)"""
+    return {}
+
+
+@pytest.fixture
+def service(generations):
+    config = FakeConfig(
+        {
+            "google_cloud.write.project": "proj",
+            "google_cloud.write.bucket": "zips",
+            "pdf.zip.reuse.enabled": True,
+        }
+    )
+    signer = MagicMock()
+    signer.generate_signed_url.side_effect = lambda path, expiration: (
+        f"https://signed/{path}?ttl={int(expiration.total_seconds())}"
+    )
+    signer.extract_bucket_and_blob.side_effect = lambda path: tuple(
+        path[5:].split("/", 1)
+    )
+
+    with patch("src.application.services.zip_service.storage.Client"):
+        zip_service = ZipService(MagicMock(), signer, config)
+
+    zip_service.zip_repo.find_ready_by_fingerprint.return_value = None
+
+    def fake_generations(client, gs_paths):
+        return {path: generations.get(path, 1) for path in gs_paths}
+
+    patcher = patch(
+        "src.application.services.zip_service.fetch_object_generations",
+        side_effect=fake_generations,
+    )
+    patcher.start()
+    yield zip_service
+    patcher.stop()
+
+
+def _ready_package(fingerprint, expires_in=timedelta(days=6)):
+    return ZipPackage(
+        package_id="existing",
+        invoice_numbers=["1", "2"],
+        status=ZipStatus.READY,
+        expires_at=datetime.now(timezone.utc) + expires_in,
+        gcs_path="gs://zips/zips/existing/facturas.zip",
+        download_url="https://signed/old",
+        file_size_bytes=1234,
+        pdf_count=4,
+        metadata={"raw_metadata": {"fingerprint": fingerprint}},
+    )
+
+
+class TestFingerprint:
+    def test_order_of_invoices_does_not_matter(self, service):
+        a = service._zip_fingerprint([_invoice("1"), _invoice("2")], "both", "cf")
+        b = service._zip_fingerprint([_invoice("2"), _invoice("1")], "both", "cf")
+        assert a == b
+
+    def test_filters_change_fingerprint(self, service):
+        invoices = [_invoice("1")]
+        both = service._zip_fingerprint(invoices, "both", "cf")
+        assert both != service._zip_fingerprint(invoices, "tributaria_only", "cf")
+        assert both != service._zip_fingerprint(invoices, "both", "sf")
+
+    def test_overwritten_pdf_changes_fingerprint(self, service, generations):
+        invoices = [_invoice("1")]
+        before = service._zip_fingerprint(invoices, "both", "cf")
+        generations["gs://pdfs/1_t.pdf"] = 2
+        assert service._zip_fingerprint(invoices, "both", "cf") != before
+
+    def test_generation_lookup_failure_disables_reuse(self, service):
+        with patch(
+            "src.application.services.zip_service.fetch_object_generations",
+            side_effect=RuntimeError("gcs down"),
+        ):
+            assert service._zip_fingerprint([_invoice("1")], "both", "cf") is None
+
+
+class TestReuse:
+    def test_ready_package_is_resigned_not_rebuilt(self, service):
+        invoices = [_invoice("1"), _invoice("2")]
+        fingerprint = service._zip_fingerprint(invoices, "both", "cf")
+        service.zip_repo.find_ready_by_fingerprint.return_value = _ready_package(
+            fingerprint
+        )
+
+        with patch.object(service, "_build_zip_package") as build:
+            package = service.create_zip_from_invoices(invoices)
+
+        build.assert_not_called()
+        service.zip_repo.find_ready_by_fingerprint.assert_called_once_with(fingerprint)
+        assert package.package_id == "existing"
+        assert package.download_url.startswith("https://signed/gs://zips/")
+        assert service.get_last_zip_metrics().reused_package_id == "existing"
+
+    def test_signed_url_never_outlives_package(self, service):
+        invoices = [_invoice("1")]
+        fingerprint = service._zip_fingerprint(invoices, "both", "cf")
+        service.zip_repo.find_ready_by_fingerprint.return_value = _ready_package(
+            fingerprint, expires_in=timedelta(hours=3)
+        )
+
+        service.create_zip_from_invoices(invoices)
+
+        expiration = service.url_signer.generate_signed_url.call_args.kwargs[
+            "expiration"
+        ]
+        assert expiration <= timedelta(hours=3)
+
+    def test_package_about_to_expire_is_rebuilt(self, service):
+        invoices = [_invoice("1")]
+        fingerprint = service._zip_fingerprint(invoices, "both", "cf")
+        service.zip_repo.find_ready_by_fingerprint.return_value = _ready_package(
+            fingerprint, expires_in=timedelta(minutes=10)
+        )
+
+        with patch.object(service, "_build_zip_package") as build:
+            service.create_zip_from_invoices(invoices)
+
+        build.assert_called_once()
+        assert build.call_args.kwargs["fingerprint"] == fingerprint
+
+    def test_missing_archive_is_rebuilt(self, service):
+        invoices = [_invoice("1")]
+        fingerprint = service._zip_fingerprint(invoices, "both", "cf")
+        service.zip_repo.find_ready_by_fingerprint.return_value = _ready_package(
+            fingerprint
+        )
+        service.storage_client.bucket.return_value.blob.return_value.exists.return_value = (
+            False
+        )
+
+        with patch.object(service, "_build_zip_package") as build:
+            service.create_zip_from_invoices(invoices)
+
+        build.assert_called_once()
+
+    def test_lookup_error_falls_back_to_build(self, service):
+        service.zip_repo.find_ready_by_fingerprint.side_effect = RuntimeError("bq")
+
+        with patch.object(service, "_build_zip_package") as build:
+            service.create_zip_from_invoices([_invoice("1")])
+
+        build.assert_called_once()
+
+
+class TestInFlightCoalescing:
+    def test_concurrent_identical_requests_share_one_build(self, service):
+        built = ZipPackage(package_id="new", invoice_numbers=["1"], pdf_count=2)
+        release = threading.Event()
+        calls = []
+
+        def slow_build(*args, **kwargs):
+            calls.append(kwargs["fingerprint"])
+            release.wait(5)
+            return built
+
+        results = []
+        with patch.object(service, "_build_zip_package", side_effect=slow_build):
+            threads = [
+                threading.Thread(
+                    target=lambda: results.append(
+                        service.create_zip_from_invoices([_invoice("1")])
+                    )
+                )
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            deadline = time.time() + 5
+            while not service._inflight_builds and time.time() < deadline:
+                time.sleep(0.01)
+            time.sleep(0.1)
+            release.set()
+            for thread in threads:
+                thread.join(5)
+
+        assert len(calls) == 1
+        assert len(results) == 4
+        assert all(result is built for result in results)
+        assert service._inflight_builds == {}
+
+    def test_build_failure_reaches_waiters_and_is_not_cached(self, service):
+        release = threading.Event()
+        errors = []
+
+        def failing_build(*args, **kwargs):
+            release.wait(5)
+            raise RuntimeError("upload failed")
+
+        def request():
+            try:
+                service.create_zip_from_invoices([_invoice("1")])
+            except RuntimeError as e:
+                errors.append(str(e))
+
+        with patch.object(service, "_build_zip_package", side_effect=failing_build):
+            threads = [threading.Thread(target=request) for _ in range(3)]
+            for thread in threads:
+                thread.start()
+            time.sleep(0.2)
+            release.set()
+            for thread in threads:
+                thread.join(5)
+
+        assert errors == ["upload failed"] * 3
+        assert service._inflight_builds == {}
+
+    def test_different_requests_build_independently(self, service):
+        with patch.object(
+            service,
+            "_build_zip_package",
+            side_effect=lambda *a, **k: ZipPackage(
+                package_id=k["fingerprint"][:8], invoice_numbers=["x"]
+            ),
+        ) as build:
+            service.create_zip_from_invoices([_invoice("1")])
+            service.create_zip_from_invoices([_invoice("2")])
+
+        assert build.call_count == 2
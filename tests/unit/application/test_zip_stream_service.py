@@ -0,0 +1,166 @@
+"""
+Unit tests for ZipStreamService
+
+Verifies stream tokens (round trip, forgery, expiry), that a streamed
+archive is a valid ZIP built from the filtered PDFs, and that a client
+disconnect stops the build.
+"""
+
+import io
+import threading
+import time
+import zipfile
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.application.services.zip_service import ZipService
+from src.application.services.zip_stream_service import (
+    ZipStreamService,
+    ZipStreamTokenError,
+)
+from src.core.domain.models import Invoice
+
+
+class FakeConfig:
+    def __init__(self, values):
+        self.values = values
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+    def get_required(self, key):
+        return self.values[key]
+
+
+CONFIG = {
+    "google_cloud.write.project": "proj",
+    "google_cloud.write.bucket": "zips",
+    "pdf.zip.stream.token_secret": "test-secret",
+    "pdf.zip.stream.chunk_size_kb": 1,
+    "pdf.zip.stream.buffered_chunks": 2,
+}
+
+
+def _invoice(number):
+    return Invoice(
+        factura=number,
+        rut="76000000-0",
+        nombre="Cliente",
+        pdf_paths={
+            "Copia_Tributaria_cf": f"gs://pdfs/{number}_t.pdf",
+            "Copia_Cedible_cf": f"gs://pdfs/{number}_c.pdf",
+        },
+    )
+
+
+@pytest.fixture
+def invoice_repo():
+    repo = MagicMock()
+    repo.find_by_invoice_numbers.side_effect = lambda numbers, **kwargs: [
+        _invoice(n) for n in numbers
+    ]
+    return repo
+
+
+def _stream_service(zip_service, invoice_repo, **overrides):
+    return ZipStreamService(zip_service, invoice_repo, FakeConfig({**CONFIG, **overrides}))
+
+
+class TestStreamTokens:
+    def test_round_trip(self, invoice_repo):
+        service = _stream_service(MagicMock(), invoice_repo)
+
+        token = service.issue_token(["101", "102", "101"], "tributaria_only", "sf")
+
+        assert service.resolve_token(token) == (["101", "102"], "tributaria_only", "sf")
+
+    def test_forged_token_rejected(self, invoice_repo):
+        service = _stream_service(MagicMock(), invoice_repo)
+        other = _stream_service(MagicMock(), invoice_repo, **{
+            "pdf.zip.stream.token_secret": "other-secret"
+        })
+
+        with pytest.raises(ZipStreamTokenError) as error:
+            service.resolve_token(other.issue_token(["101"]))
+        assert not error.value.expired
+
+        with pytest.raises(ZipStreamTokenError):
+            service.resolve_token("garbage")
+
+    def test_expired_token(self, invoice_repo):
+        service = _stream_service(MagicMock(), invoice_repo)
+        token = service.issue_token(["101"])
+        later = time.time() + 2 * 3600
+
+        with patch("src.application.services.zip_stream_service.time.time") as now:
+            now.return_value = later
+            with pytest.raises(ZipStreamTokenError) as error:
+                service.resolve_token(token)
+        assert error.value.expired
+
+
+class TestStreaming:
+    def test_streams_valid_zip(self, invoice_repo):
+        signer = MagicMock()
+        signer.extract_bucket_and_blob.side_effect = lambda path: tuple(
+            path[5:].split("/", 1)
+        )
+        with patch("src.application.services.zip_service.storage.Client"):
+            zip_service = ZipService(MagicMock(), signer, FakeConfig(CONFIG))
+        blob = zip_service.storage_client.bucket.return_value.blob.return_value
+        blob.download_as_bytes.return_value = b"%PDF-1.4" + b"x" * 3000
+
+        service = _stream_service(zip_service, invoice_repo)
+        filename, chunks = service.open_stream(
+            service.issue_token(["101", "102"], "tributaria_only")
+        )
+        data = b"".join(chunks)
+
+        assert filename == "facturas_2_items.zip"
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            assert sorted(archive.namelist()) == [
+                "101_Copia_Tributaria_cf.pdf",
+                "102_Copia_Tributaria_cf.pdf",
+            ]
+            assert archive.testzip() is None
+        # Nothing was uploaded
+        blob.open.assert_not_called()
+        blob.upload_from_file.assert_not_called()
+
+    def test_no_invoices_found(self, invoice_repo):
+        invoice_repo.find_by_invoice_numbers.side_effect = lambda numbers, **kwargs: []
+        service = _stream_service(MagicMock(), invoice_repo)
+
+        with pytest.raises(LookupError):
+            service.open_stream(service.issue_token(["999"]))
+
+    def test_disconnect_stops_build(self, invoice_repo):
+        stopped = threading.Event()
+
+        def endless_zip(invoices, stream, pdf_type, pdf_variant):
+            try:
+                while True:
+                    stream.write(b"x" * 1024)
+            except BrokenPipeError:
+                stopped.set()
+                raise
+
+        zip_service = MagicMock()
+        zip_service.write_zip_to_stream.side_effect = endless_zip
+        service = _stream_service(zip_service, invoice_repo)
+
+        _, chunks = service.open_stream(service.issue_token(["101"]))
+        next(chunks)
+        chunks.close()
+
+        assert stopped.wait(timeout=5)
+
+    def test_build_error_reaches_reader(self, invoice_repo):
+        zip_service = MagicMock()
+        zip_service.write_zip_to_stream.side_effect = RuntimeError("GCS down")
+        service = _stream_service(zip_service, invoice_repo)
+
+        _, chunks = service.open_stream(service.issue_token(["101"]))
+        with pytest.raises(RuntimeError):
+            b"".join(chunks)
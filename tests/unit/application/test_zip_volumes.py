@@ -0,0 +1,139 @@
+"""
+Unit tests for ZIP volume planning and multi-volume package creation
+
+Verifies volumes respect the file and size caps without splitting an
+invoice, and that ZipService builds one package per volume from a single
+metadata lookup.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.application.services.zip_service import ZipService
+from src.application.services.zip_volume_planner import plan_zip_volumes
+from src.core.domain.models import Invoice, ZipPackage, ZipStatus
+from src.infrastructure.gcs.object_metadata import ObjectMetadata
+
+
+class FakeConfig:
+    def __init__(self, values):
+        self.values = values
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+    def get_required(self, key):
+        return self.values[key]
+
+
+def _invoice(number):
+    return Invoice(
+        factura=number,
+        rut="76000000-0",
+        nombre="Cliente",
+        pdf_paths={
+            "Copia_Tributaria_cf": f"gs://pdfs/{number}_t.pdf",
+            "Copia_Cedible_cf": f"gs://pdfs/{number}_c.pdf",
+        },
+    )
+
+
+class TestPlanZipVolumes:
+    def test_single_volume_when_under_caps(self):
+        invoices = [_invoice(str(n)) for n in range(3)]
+
+        volumes = plan_zip_volumes(invoices, "both", "cf", {}, max_files=50)
+
+        assert len(volumes) == 1
+        assert volumes[0].pdf_count == 6
+
+    def test_file_cap_keeps_invoice_pdfs_together(self):
+        invoices = [_invoice(str(n)) for n in range(5)]
+
+        volumes = plan_zip_volumes(invoices, "both", "cf", {}, max_files=5)
+
+        # 2 PDFs per invoice: 2 invoices (4 PDFs) fit, a third would be 6
+        assert [v.pdf_count for v in volumes] == [4, 4, 2]
+        assert [inv.factura for inv in volumes[2].invoices] == ["4"]
+
+    def test_size_cap(self):
+        invoices = [_invoice(str(n)) for n in range(4)]
+        sizes = {
+            path: 300
+            for invoice in invoices
+            for path in invoice.filter_pdf_paths("both", "cf").values()
+        }
+
+        volumes = plan_zip_volumes(
+            invoices, "both", "cf", sizes, max_files=50, max_bytes=1000
+        )
+
+        assert [v.estimated_bytes for v in volumes] == [600, 600, 600, 600]
+
+    def test_oversized_invoice_gets_own_volume(self):
+        invoices = [_invoice("big"), _invoice("small")]
+        sizes = {"gs://pdfs/big_t.pdf": 5000}
+
+        volumes = plan_zip_volumes(
+            invoices, "both", "cf", sizes, max_files=50, max_bytes=1000
+        )
+
+        assert [[inv.factura for inv in v.invoices] for v in volumes] == [["big"], ["small"]]
+
+
+class TestCreateZipVolumes:
+    @pytest.fixture
+    def service(self):
+        config = FakeConfig(
+            {
+                "google_cloud.write.project": "proj",
+                "google_cloud.write.bucket": "zips",
+                "pdf.zip.volumes.enabled": True,
+                "pdf.zip.max_files": 4,
+            }
+        )
+        with patch("src.application.services.zip_service.storage.Client"):
+            return ZipService(MagicMock(), MagicMock(), config)
+
+    def test_builds_one_package_per_volume(self, service):
+        invoices = [_invoice(str(n)) for n in range(5)]
+        metadata = {
+            path: ObjectMetadata(generation=i + 1, size=100)
+            for i, (_, path) in enumerate(service._zip_entries(invoices, "both", "cf"))
+        }
+        built = []
+
+        def create(volume_invoices, package_name, pdf_type, pdf_variant, generations, plan):
+            built.append((package_name, [inv.factura for inv in volume_invoices], generations))
+            return ZipPackage(
+                package_id=package_name,
+                invoice_numbers=[inv.factura for inv in volume_invoices],
+                status=ZipStatus.READY,
+            )
+
+        with patch(
+            "src.application.services.zip_service.fetch_object_metadata",
+            return_value=metadata,
+        ) as fetch, patch.object(service, "create_zip_from_invoices", side_effect=create):
+            packages = service.create_zip_volumes_from_invoices(invoices, "lote")
+
+        fetch.assert_called_once()
+        assert [p.package_id for p in packages] == [
+            "lote_parte_1_de_3",
+            "lote_parte_2_de_3",
+            "lote_parte_3_de_3",
+        ]
+        names = {name: (numbers, generations) for name, numbers, generations in built}
+        numbers, generations = names["lote_parte_3_de_3"]
+        assert numbers == ["4"]
+        # Each volume only gets the generations of its own PDFs
+        assert set(generations) == {"gs://pdfs/4_t.pdf", "gs://pdfs/4_c.pdf"}
+
+    def test_disabled_builds_single_package(self, service):
+        service.volumes_enabled = False
+        with patch.object(service, "create_zip_from_invoices") as create:
+            packages = service.create_zip_volumes_from_invoices([_invoice("1")])
+
+        assert len(packages) == 1
+        create.assert_called_once()
@@ -0,0 +1,196 @@
+"""
+Unit tests for the AIMD download concurrency controller
+
+Verifies additive increase while throughput improves, multiplicative
+decrease on throttling and latency spikes, bounds, and that the writers
+retry throttled downloads.
+"""
+
+import io
+import threading
+import zipfile
+
+import pytest
+from google.api_core.exceptions import NotFound, TooManyRequests
+
+from src.infrastructure.gcs.adaptive_concurrency import (
+    AIMDConcurrencyController,
+    is_throttling_error,
+)
+from src.infrastructure.gcs.streaming_zip_writer import StreamingZipWriter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeConfig:
+    def __init__(self, values):
+        self.values = values
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+
+def _controller(clock, **kwargs):
+    params = dict(min_workers=2, max_workers=8, initial_workers=4)
+    params.update(kwargs)
+    return AIMDConcurrencyController(clock=clock, **params)
+
+
+def _run_epoch(controller, clock, size, latency):
+    """Complete one epoch (limit downloads) taking ``latency`` seconds"""
+    clock.now += latency
+    for _ in range(controller.limit):
+        controller.record_success(size, latency)
+
+
+class TestThrottlingErrors:
+    def test_recognizes_429_and_503(self):
+        assert is_throttling_error(TooManyRequests("slow down"))
+        error = Exception("backend")
+        error.code = 503
+        assert is_throttling_error(error)
+
+    def test_ignores_other_errors(self):
+        assert not is_throttling_error(NotFound("missing.pdf"))
+        assert not is_throttling_error(ValueError("bad pdf"))
+
+
+class TestAIMDConcurrencyController:
+    def test_increases_while_throughput_improves(self):
+        clock = FakeClock()
+        controller = _controller(clock)
+
+        # More workers, same latency: throughput scales with the limit
+        for _ in range(3):
+            _run_epoch(controller, clock, size=1000, latency=0.1)
+
+        assert controller.limit == 7
+        assert [point["concurrency"] for point in controller.curve] == [4, 5, 6]
+
+    def test_holds_on_throughput_plateau(self):
+        clock = FakeClock()
+        controller = _controller(clock)
+
+        _run_epoch(controller, clock, size=1000, latency=0.1)  # 4 -> 5
+        # Same bytes per second with one more worker: no gain
+        clock.now += 0.1
+        for _ in range(5):
+            controller.record_success(800, 0.1)
+
+        assert controller.limit == 5
+
+    def test_halves_on_throttling_once_per_epoch(self):
+        clock = FakeClock()
+        controller = _controller(clock, initial_workers=8)
+
+        controller.record_throttle()
+        controller.record_throttle()
+
+        assert controller.limit == 4
+        assert controller.throttled == 2
+
+    def test_decreases_on_latency_spike(self):
+        clock = FakeClock()
+        controller = _controller(clock, initial_workers=6)
+
+        _run_epoch(controller, clock, size=1000, latency=0.1)  # 6 -> 7
+        _run_epoch(controller, clock, size=5000, latency=0.5)
+
+        assert controller.limit == 3
+
+    def test_stays_within_bounds(self):
+        clock = FakeClock()
+        controller = _controller(clock, min_workers=2, max_workers=5, initial_workers=20)
+        assert controller.limit == 5
+
+        for _ in range(5):
+            controller.record_throttle()
+            _run_epoch(controller, clock, size=1, latency=1)
+        assert controller.limit == 2
+
+    def test_summary_reports_curve(self):
+        clock = FakeClock()
+        controller = _controller(clock)
+        _run_epoch(controller, clock, size=1024 * 1024, latency=1.0)
+        controller.record_success(1024 * 1024, 1.0)  # partial epoch
+
+        summary = controller.summary()
+
+        assert summary["concurrency_initial"] == 4
+        assert summary["concurrency_final"] == 5
+        assert summary["concurrency_peak"] == summary["max_workers_used"] == 5
+        assert len(summary["throughput_curve"]) == 2
+        assert summary["throughput_curve"][0]["mb_per_s"] == 4.0
+
+    def test_disabled_config_pins_limit(self):
+        controller = AIMDConcurrencyController.from_config(
+            FakeConfig({"pdf.zip.adaptive_concurrency.enabled": False}),
+            default_workers=10,
+        )
+        assert controller.min_workers == controller.max_workers == controller.limit == 10
+
+    def test_should_retry_only_throttling(self):
+        controller = AIMDConcurrencyController(max_retries=2)
+        assert controller.should_retry(TooManyRequests("429"), attempt=1)
+        assert not controller.should_retry(TooManyRequests("429"), attempt=2)
+        assert not controller.should_retry(NotFound("gone"), attempt=0)
+
+
+class TestStreamingWriterConcurrency:
+    def test_retries_throttled_download_and_limits_in_flight(self):
+        controller = AIMDConcurrencyController(
+            min_workers=1, max_workers=4, initial_workers=2
+        )
+        lock = threading.Lock()
+        active = {"now": 0, "max": 0}
+        failed_once = set()
+
+        def download(gs_path):
+            with lock:
+                active["now"] += 1
+                active["max"] = max(active["max"], active["now"])
+            try:
+                if gs_path.endswith("/3.pdf") and gs_path not in failed_once:
+                    failed_once.add(gs_path)
+                    raise TooManyRequests("rate limit exceeded")
+                return b"%PDF" * 10
+            finally:
+                with lock:
+                    active["now"] -= 1
+
+        entries = [(f"{i}.pdf", f"gs://b/{i}.pdf") for i in range(10)]
+        sink = io.BytesIO()
+        writer = StreamingZipWriter(download, concurrency=controller)
+
+        result = writer.write(entries, sink)
+
+        assert result.files_included == 10
+        assert result.files_missing == 0
+        assert controller.throttled == 1
+        assert active["max"] <= controller.max_workers
+        with zipfile.ZipFile(io.BytesIO(sink.getvalue())) as archive:
+            assert len(archive.namelist()) == 10
+
+    def test_gives_up_after_max_retries(self):
+        controller = AIMDConcurrencyController(
+            min_workers=1, max_workers=2, initial_workers=2, max_retries=1
+        )
+
+        def download(gs_path):
+            raise TooManyRequests("429")
+
+        writer = StreamingZipWriter(download, concurrency=controller)
+        result = writer.write([("a.pdf", "gs://b/a.pdf")], io.BytesIO())
+
+        assert result.files_missing == 1
+        assert controller.throttled == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,139 @@
+"""
+Unit tests for BatchSigningEngine and TokenBucket
+
+Covers ordering, per-URL error reporting, adaptive 429 handling and
+rate limiting without network access.
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.infrastructure.gcs.batch_signing_engine import (
+    BatchSigningEngine,
+    TokenBucket,
+    is_rate_limit_error,
+)
+from src.infrastructure.gcs.iam_signing_session import SigningRateLimitError
+
+
+def _engine(sign_func, rate=1000.0, **kwargs):
+    kwargs.setdefault("max_workers", 4)
+    return BatchSigningEngine(
+        sign_func, rate_limiter=TokenBucket(rate, capacity=rate), **kwargs
+    )
+
+
+class TestTokenBucket:
+    def test_burst_then_throttle(self):
+        bucket = TokenBucket(rate_per_second=20, capacity=2)
+
+        assert bucket.acquire(timeout=0)
+        assert bucket.acquire(timeout=0)
+        assert not bucket.acquire(timeout=0)
+
+        start = time.monotonic()
+        assert bucket.acquire(timeout=1)
+        assert time.monotonic() - start == pytest.approx(0.05, abs=0.04)
+
+    def test_set_rate_keeps_target(self):
+        bucket = TokenBucket(rate_per_second=10)
+        bucket.set_rate(2)
+
+        assert bucket.rate == 2
+        assert bucket.target_rate == 10
+
+
+class TestBatchSigningEngine:
+    def test_preserves_order_and_reports_errors(self):
+        def sign(gs_url):
+            if gs_url.endswith("bad.pdf"):
+                raise ValueError("boom")
+            if gs_url.endswith("none.pdf"):
+                return None
+            time.sleep(0.01 if gs_url.endswith("0.pdf") else 0)
+            return gs_url.replace("gs://", "https://signed/")
+
+        urls = [f"gs://b/{i}0.pdf" for i in range(5)] + [
+            "gs://b/bad.pdf",
+            "gs://b/none.pdf",
+        ]
+        engine = _engine(sign)
+        results = engine.sign_all(urls)
+
+        assert [r.target for r in results] == urls
+        assert results[0].signed_url == "https://signed/b/00.pdf"
+        assert "ValueError: boom" in results[5].error
+        assert results[6].error == "Signer returned no URL"
+        assert engine.get_stats()["failed"] == 2
+        engine.shutdown()
+
+    def test_runs_concurrently(self):
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def sign(gs_url):
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.pop()
+            return "https://signed"
+
+        engine = _engine(sign, max_workers=4)
+        engine.sign_all([f"gs://b/{i}.pdf" for i in range(8)])
+
+        assert max(peak) > 1
+        engine.shutdown()
+
+    def test_retries_rate_limited_and_decreases_rate(self):
+        calls = {"count": 0}
+
+        def sign(gs_url):
+            calls["count"] += 1
+            if calls["count"] == 1:
+                raise SigningRateLimitError("throttled", status_code=429)
+            return "https://signed"
+
+        engine = _engine(sign, rate=100.0, max_workers=1)
+        engine.base_backoff = 0.001
+        engine.recovery_step = 0.0
+
+        [result] = engine.sign_all(["gs://b/a.pdf"])
+
+        assert result.success
+        assert result.attempts == 2
+        assert engine.limiter.rate == pytest.approx(50.0)
+        assert engine.get_stats()["throttled"] == 1
+
+    def test_gives_up_after_max_retries(self):
+        def sign(gs_url):
+            raise SigningRateLimitError("throttled", status_code=429)
+
+        engine = _engine(sign, max_workers=1, max_retries=2)
+        engine.base_backoff = 0.001
+
+        [result] = engine.sign_all(["gs://b/a.pdf"])
+
+        assert not result.success
+        assert result.attempts == 3
+        assert "SigningRateLimitError" in result.error
+
+    def test_forwards_kwargs(self):
+        engine = _engine(lambda gs_url, expiration_minutes: f"{gs_url}?{expiration_minutes}")
+
+        assert engine.sign_map(["gs://b/a.pdf"], expiration_minutes=30) == {
+            "gs://b/a.pdf": "gs://b/a.pdf?30"
+        }
+
+
+class TestIsRateLimitError:
+    def test_detection(self):
+        assert is_rate_limit_error(SigningRateLimitError("x", status_code=429))
+        assert is_rate_limit_error(Exception("HTTP 429 Too Many Requests"))
+        assert is_rate_limit_error(Exception("RESOURCE_EXHAUSTED"))
+        assert not is_rate_limit_error(Exception("gs://b/descargas/0104290/a.pdf"))
+        assert not is_rate_limit_error(ValueError("boom"))
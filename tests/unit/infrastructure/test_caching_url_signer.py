@@ -0,0 +1,125 @@
+"""
+Unit tests for CachingURLSigner
+
+Verifies reuse of still-valid signatures, the remaining-lifetime floor,
+LRU eviction and metrics counters.
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from src.infrastructure.gcs.caching_url_signer import (
+    CachingURLSigner,
+    parse_signed_url_expiry,
+)
+from src.infrastructure.gcs.url_metrics_collector import URLMetricsCollector
+
+
+class FakeConfig:
+    def __init__(self, **overrides):
+        self.values = {
+            "pdf.signed_urls.cache.max_entries": 3,
+            "pdf.signed_urls.cache.expiration_bucket_minutes": 60,
+            "pdf.signed_urls.cache.min_remaining_minutes": 30,
+            "pdf.signed_urls.cache.min_remaining_ratio": 0.5,
+            "pdf.signed_urls.expiration_hours": 24,
+        }
+        self.values.update(overrides)
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+
+def _signed_url(gs_url, signed_at, expires_seconds):
+    path = gs_url.replace("gs://", "")
+    return (
+        f"https://storage.googleapis.com/{path}?X-Goog-Algorithm=GOOG4-RSA-SHA256"
+        f"&X-Goog-Date={signed_at.strftime('%Y%m%dT%H%M%SZ')}"
+        f"&X-Goog-Expires={expires_seconds}&X-Goog-Signature=abc"
+    )
+
+
+@pytest.fixture
+def inner():
+    signer = Mock()
+    signer.service_account_email = "signer@example.iam.gserviceaccount.com"
+    signer.extract_bucket_and_blob.side_effect = lambda url: tuple(
+        url.replace("gs://", "").split("/", 1)
+    )
+    signer.calls = 0
+
+    def sign(gs_url, expiration=None, friendly_filename=None):
+        signer.calls += 1
+        lifetime = int((expiration or timedelta(hours=24)).total_seconds())
+        return _signed_url(gs_url, datetime.now(timezone.utc), lifetime)
+
+    signer.generate_signed_url.side_effect = sign
+    return signer
+
+
+class TestCachingURLSigner:
+    def test_parse_expiry(self):
+        signed_at = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        url = _signed_url("gs://b/a.pdf", signed_at, 3600)
+
+        assert parse_signed_url_expiry(url) == signed_at + timedelta(hours=1)
+        assert parse_signed_url_expiry("https://example.com/a.pdf") is None
+
+    def test_reuses_valid_signature(self, inner):
+        metrics = URLMetricsCollector()
+        signer = CachingURLSigner(inner, FakeConfig(), metrics_collector=metrics)
+
+        first = signer.generate_signed_url("gs://b/a.pdf")
+        second = signer.generate_signed_url("gs://b/a.pdf")
+
+        assert first == second
+        assert inner.calls == 1
+        assert signer.stats()["hits"] == 1
+        caches = metrics.get_summary()["caches"]
+        assert caches["signed_url"]["hit"] == 1
+        assert caches["signed_url"]["miss"] == 1
+
+    def test_key_includes_friendly_filename_and_expiration_bucket(self, inner):
+        signer = CachingURLSigner(inner, FakeConfig())
+
+        signer.generate_signed_url("gs://b/a.pdf")
+        signer.generate_signed_url("gs://b/a.pdf", friendly_filename="a.pdf")
+        signer.generate_signed_url("gs://b/a.pdf", expiration=timedelta(hours=2))
+
+        assert inner.calls == 3
+
+    def test_resigns_when_remaining_lifetime_below_floor(self, inner):
+        signer = CachingURLSigner(inner, FakeConfig())
+        stale = _signed_url(
+            "gs://b/a.pdf", datetime.now(timezone.utc) - timedelta(minutes=50), 3600
+        )
+        inner.generate_signed_url.side_effect = [stale, "fresh"]
+
+        assert signer.generate_signed_url("gs://b/a.pdf", timedelta(hours=1)) == stale
+        # 10 minutes left < max(30 min floor, 50% of 1h): must re-sign
+        assert signer.generate_signed_url("gs://b/a.pdf", timedelta(hours=1)) == "fresh"
+
+    def test_lru_eviction(self, inner):
+        signer = CachingURLSigner(inner, FakeConfig())
+
+        for name in ["a", "b", "c"]:
+            signer.generate_signed_url(f"gs://b/{name}.pdf")
+        signer.generate_signed_url("gs://b/a.pdf")  # touch a
+        signer.generate_signed_url("gs://b/d.pdf")  # evicts b
+
+        assert signer.stats()["evictions"] == 1
+        calls = inner.calls
+        signer.generate_signed_url("gs://b/a.pdf")
+        assert inner.calls == calls
+        signer.generate_signed_url("gs://b/b.pdf")
+        assert inner.calls == calls + 1
+
+    def test_errors_are_not_cached(self, inner):
+        signer = CachingURLSigner(inner, FakeConfig())
+        inner.generate_signed_url.side_effect = RuntimeError("signBlob down")
+
+        with pytest.raises(RuntimeError):
+            signer.generate_signed_url("gs://b/a.pdf")
+        assert signer.stats()["entries"] == 0
@@ -0,0 +1,137 @@
+"""
+Unit tests for ClockOffsetTracker
+
+Verifies sampling fallback, EWMA smoothing, TTL expiry and skew-compensated
+signing time without network access.
+
+Sign conventions of the sources: ntplib's offset is server - local (positive
+= local behind), get_sync_info() returns local - Google (positive = local
+ahead). The tracker publishes local - Google.
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.domain.interfaces.clock_offset import IClockOffsetProvider
+from src.infrastructure.gcs.clock_offset_tracker import ClockOffsetTracker
+
+
+@pytest.fixture
+def validator():
+    validator = Mock()
+    # ntplib sign: server 2s behind = local clock 2s ahead
+    validator.verify_sync_ntp.return_value = (True, -2.0)
+    validator.get_sync_info.return_value = (None, None, None)
+    return validator
+
+
+def _tracker(validator, **kwargs):
+    kwargs.setdefault("ttl_seconds", 600)
+    kwargs.setdefault("smoothing_alpha", 0.5)
+    return ClockOffsetTracker(validator, **kwargs)
+
+
+class TestClockOffsetTracker:
+    def test_implements_interface(self, validator):
+        assert isinstance(_tracker(validator), IClockOffsetProvider)
+
+    def test_unknown_before_first_sample(self, validator):
+        tracker = _tracker(validator)
+
+        assert tracker.current_offset() is None
+        assert tracker.sync_status() is None
+        validator.verify_sync_ntp.assert_not_called()
+
+    def test_ntp_sample_then_ewma(self, validator):
+        tracker = _tracker(validator)
+
+        assert tracker.sample() is True
+        assert tracker.current_offset() == pytest.approx(2.0)
+
+        validator.verify_sync_ntp.return_value = (True, -4.0)
+        tracker.sample()
+        assert tracker.current_offset() == pytest.approx(3.0)
+        assert tracker.snapshot()["source"] == "ntp"
+
+    def test_falls_back_to_http_head(self, validator):
+        validator.verify_sync_ntp.return_value = (None, None)
+        validator.get_sync_info.return_value = (None, None, -90.0)
+        tracker = _tracker(validator)
+
+        tracker.sample()
+
+        assert tracker.current_offset() == pytest.approx(-90.0)
+        assert tracker.sync_status() is False
+        assert tracker.snapshot()["source"] == "http_head"
+
+    def test_failed_sample_keeps_previous_estimate(self, validator):
+        tracker = _tracker(validator)
+        tracker.sample()
+
+        validator.verify_sync_ntp.return_value = (None, None)
+        assert tracker.sample() is False
+
+        assert tracker.current_offset() == pytest.approx(2.0)
+        assert tracker.snapshot()["failures"] == 1
+
+    def test_estimate_expires_after_ttl(self, validator):
+        tracker = _tracker(validator, ttl_seconds=10)
+        with patch(
+            "src.infrastructure.gcs.clock_offset_tracker.time.monotonic",
+            side_effect=[100.0, 111.0],
+        ):
+            tracker.sample()
+            assert tracker.current_offset() is None
+
+    def test_ntp_local_behind_moves_signing_time_forward(self, validator):
+        # ntplib: server 120s ahead of us -> Google time is local + 120s
+        validator.verify_sync_ntp.return_value = (False, 120.0)
+        tracker = _tracker(validator)
+        tracker.sample()
+
+        correction = tracker.signing_time() - datetime.now(timezone.utc)
+
+        assert tracker.current_offset() == pytest.approx(-120.0)
+        assert correction.total_seconds() == pytest.approx(120.0, abs=1.0)
+        assert len(tracker.goog_date()) == len("20250101T000000Z")
+
+    def test_http_local_ahead_moves_signing_time_back(self, validator):
+        # get_sync_info: local - Google = +120s -> Google time is local - 120s
+        validator.verify_sync_ntp.return_value = (None, None)
+        validator.get_sync_info.return_value = (None, None, 120.0)
+        tracker = _tracker(validator)
+        tracker.sample()
+
+        correction = tracker.signing_time() - datetime.now(timezone.utc)
+
+        assert tracker.current_offset() == pytest.approx(120.0)
+        assert correction.total_seconds() == pytest.approx(-120.0, abs=1.0)
+
+    def test_sources_agree_on_the_same_skew(self, validator):
+        # Local clock 30s ahead, as reported by each source
+        validator.verify_sync_ntp.return_value = (True, -30.0)
+        ntp_tracker = _tracker(validator)
+        ntp_tracker.sample()
+
+        validator.verify_sync_ntp.return_value = (None, None)
+        validator.get_sync_info.return_value = (None, None, 30.0)
+        http_tracker = _tracker(validator)
+        http_tracker.sample()
+
+        assert ntp_tracker.current_offset() == pytest.approx(
+            http_tracker.current_offset()
+        )
+
+    def test_calculate_buffer_uses_attached_provider(self):
+        from src.infrastructure.gcs.time_sync_validator import TimeSyncValidator
+
+        time_sync = TimeSyncValidator()
+        provider = Mock()
+        provider.sync_status.return_value = False
+        time_sync.set_clock_offset_provider(provider)
+
+        with patch.object(time_sync, "verify_sync") as verify_sync:
+            assert time_sync.calculate_buffer() == time_sync.buffer_clock_skew
+            verify_sync.assert_not_called()
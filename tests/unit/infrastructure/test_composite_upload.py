@@ -0,0 +1,176 @@
+"""
+Unit tests for ParallelCompositeUploader
+
+Verifies parts reassemble into the original content (including tiered
+compose beyond 32 parts), that temporary parts are always deleted, and that
+the streamed upload cuts parts as it is written with bounded buffering.
+"""
+
+import io
+import threading
+import time
+
+import pytest
+from google.api_core.exceptions import NotFound
+
+from src.infrastructure.gcs.composite_upload import (
+    MAX_COMPOSE_SOURCES,
+    ParallelCompositeUploader,
+)
+
+
+class FakeBlob:
+    def __init__(self, bucket, name):
+        self.bucket = bucket
+        self.name = name
+        self.content_type = None
+        self.metadata = None
+
+    def upload_from_file(self, file_obj, size=None, content_type=None):
+        if self.bucket.fail_uploads_for and self.name.endswith(self.bucket.fail_uploads_for):
+            raise IOError("connection reset")
+        with self.bucket.lock:
+            self.bucket.uploading += 1
+            self.bucket.peak_uploading = max(self.bucket.peak_uploading, self.bucket.uploading)
+        time.sleep(self.bucket.upload_delay)
+        self.bucket.objects[self.name] = file_obj.read(size)
+        with self.bucket.lock:
+            self.bucket.uploading -= 1
+
+    def compose(self, sources):
+        assert len(sources) <= MAX_COMPOSE_SOURCES
+        self.bucket.compose_calls += 1
+        self.bucket.objects[self.name] = b"".join(
+            self.bucket.objects[source.name] for source in sources
+        )
+
+    def delete(self):
+        if self.name not in self.bucket.objects:
+            raise NotFound(self.name)
+        del self.bucket.objects[self.name]
+
+
+class FakeBucket:
+    def __init__(self):
+        self.objects = {}
+        self.compose_calls = 0
+        self.fail_uploads_for = None
+        self.upload_delay = 0
+        self.uploading = 0
+        self.peak_uploading = 0
+        self.lock = threading.Lock()
+
+    def blob(self, name):
+        return FakeBlob(self, name)
+
+
+@pytest.fixture
+def bucket():
+    return FakeBucket()
+
+
+def _payload(size):
+    return bytes(i % 251 for i in range(size))
+
+
+class TestParallelCompositeUploader:
+    def test_parts_compose_to_original(self, bucket):
+        data = _payload(10_000)
+        destination = bucket.blob("zips/p1/facturas.zip")
+        uploader = ParallelCompositeUploader(part_size_bytes=3000, max_workers=3)
+
+        result = uploader.upload(io.BytesIO(data), destination)
+
+        assert result.parts == 4
+        assert result.bytes_uploaded == len(data)
+        assert destination.content_type == "application/zip"
+        # Only the final object remains
+        assert bucket.objects == {"zips/p1/facturas.zip": data}
+
+    def test_tiered_compose_beyond_32_parts(self, bucket):
+        data = _payload(7000)
+        destination = bucket.blob("zips/p2/big.zip")
+        uploader = ParallelCompositeUploader(part_size_bytes=100, max_workers=8)
+
+        result = uploader.upload(io.BytesIO(data), destination)
+
+        assert result.parts == 70
+        # 70 parts -> 3 intermediates -> final
+        assert bucket.compose_calls == 4
+        assert bucket.objects == {"zips/p2/big.zip": data}
+
+    def test_failed_part_cleans_up(self, bucket):
+        bucket.fail_uploads_for = "part-00002"
+        destination = bucket.blob("zips/p3/broken.zip")
+        uploader = ParallelCompositeUploader(part_size_bytes=100, max_workers=2)
+
+        with pytest.raises(IOError):
+            uploader.upload(io.BytesIO(_payload(500)), destination)
+
+        assert bucket.objects == {}
+
+    def test_buffer_usable_after_upload(self, bucket):
+        buffer = io.BytesIO(_payload(1000))
+        ParallelCompositeUploader(part_size_bytes=400).upload(
+            buffer, bucket.blob("zips/p4/a.zip")
+        )
+        # The buffer export was released, so it can still be written
+        buffer.write(b"more")
+
+
+class TestCompositeUploadStream:
+    def test_parts_cut_while_writing_compose_to_original(self, bucket):
+        data = _payload(10_000)
+        destination = bucket.blob("zips/p5/stream.zip")
+        uploader = ParallelCompositeUploader(
+            part_size_bytes=3000, max_workers=3, max_parts_in_flight=1
+        )
+
+        with uploader.open(destination) as stream:
+            for offset in range(0, len(data), 700):
+                stream.write(data[offset : offset + 700])
+            # Three full parts were cut; the first two finished uploading
+            # before the third was submitted
+            assert len([name for name in bucket.objects if ".parts/" in name]) >= 2
+
+        assert stream.result.parts == 4
+        assert stream.result.bytes_uploaded == len(data)
+        assert destination.content_type == "application/zip"
+        assert bucket.objects == {"zips/p5/stream.zip": data}
+
+    def test_parts_in_flight_are_bounded(self, bucket):
+        bucket.upload_delay = 0.02
+        uploader = ParallelCompositeUploader(
+            part_size_bytes=100, max_workers=8, max_parts_in_flight=2
+        )
+
+        with uploader.open(bucket.blob("zips/p6/a.zip")) as stream:
+            stream.write(_payload(1000))
+
+        assert bucket.peak_uploading == 2
+        assert stream.result.parts == 10
+
+    def test_failed_build_composes_nothing(self, bucket):
+        uploader = ParallelCompositeUploader(part_size_bytes=100)
+
+        with pytest.raises(RuntimeError):
+            with uploader.open(bucket.blob("zips/p7/a.zip")) as stream:
+                stream.write(_payload(500))
+                raise RuntimeError("download failed")
+
+        assert bucket.objects == {}
+        assert bucket.compose_calls == 0
+
+    def test_failed_part_propagates_and_cleans_up(self, bucket):
+        bucket.fail_uploads_for = "part-00001"
+        uploader = ParallelCompositeUploader(part_size_bytes=100, max_parts_in_flight=1)
+
+        with pytest.raises(IOError):
+            with uploader.open(bucket.blob("zips/p8/a.zip")) as stream:
+                stream.write(_payload(500))
+
+        assert bucket.objects == {}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,120 @@
+"""
+Unit tests for IAMSigningSession
+
+Verifies credential/session reuse, proactive refresh and error surfacing
+without touching the real IAM Credentials API.
+"""
+
+import base64
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from src.infrastructure.gcs.iam_signing_session import (
+    IAMSigningError,
+    IAMSigningSession,
+)
+
+SA = "signer@example.iam.gserviceaccount.com"
+
+
+def _utcnow():
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class FakeCredentials:
+    def __init__(self, lifetime_seconds=3600):
+        self.token = None
+        self.expiry = None
+        self.refresh_count = 0
+        self.lifetime_seconds = lifetime_seconds
+
+    def refresh(self, request):
+        self.refresh_count += 1
+        self.token = f"token-{self.refresh_count}"
+        self.expiry = _utcnow() + timedelta(seconds=self.lifetime_seconds)
+
+
+def _response(status_code=200, signature=b"sig"):
+    response = Mock()
+    response.status_code = status_code
+    response.text = "error body"
+    response.json.return_value = {
+        "signedBlob": base64.b64encode(signature).decode("utf-8")
+    }
+    return response
+
+
+@pytest.fixture
+def http_session():
+    session = Mock()
+    session.post.return_value = _response()
+    return session
+
+
+class TestIAMSigningSession:
+    def test_reuses_credentials_and_session(self, http_session):
+        credentials = FakeCredentials()
+        signer = IAMSigningSession(
+            SA, credentials=credentials, session=http_session, endpoint="http://stub"
+        )
+
+        for _ in range(5):
+            assert signer.sign_blob(b"payload") == b"sig"
+
+        assert credentials.refresh_count == 1
+        assert http_session.post.call_count == 5
+        url = http_session.post.call_args[0][0]
+        assert url == f"http://stub/v1/projects/-/serviceAccounts/{SA}:signBlob"
+        body = http_session.post.call_args[1]["json"]
+        assert base64.b64decode(body["payload"]) == b"payload"
+
+        stats = signer.get_stats()
+        assert stats["sign_count"] == 5
+        assert stats["credential_refreshes"] == 1
+
+    def test_refreshes_before_expiry(self, http_session):
+        credentials = FakeCredentials(lifetime_seconds=60)
+        signer = IAMSigningSession(
+            SA,
+            credentials=credentials,
+            session=http_session,
+            refresh_margin_seconds=300,
+        )
+
+        signer.sign_blob(b"a")
+        signer.sign_blob(b"b")
+
+        # Token lifetime is inside the refresh margin, so each call refreshes
+        assert credentials.refresh_count == 2
+
+    def test_retries_once_on_unauthorized(self, http_session):
+        credentials = FakeCredentials()
+        http_session.post.side_effect = [_response(401), _response(200)]
+        signer = IAMSigningSession(SA, credentials=credentials, session=http_session)
+
+        assert signer.sign_blob(b"payload") == b"sig"
+        assert credentials.refresh_count == 2
+
+    def test_raises_with_status_code(self, http_session):
+        http_session.post.return_value = _response(403)
+        signer = IAMSigningSession(
+            SA, credentials=FakeCredentials(), session=http_session
+        )
+
+        with pytest.raises(IAMSigningError) as exc_info:
+            signer.sign_blob(b"payload")
+        assert exc_info.value.status_code == 403
+
+    def test_invalidate_drops_credentials(self, http_session):
+        signer = IAMSigningSession(
+            SA, credentials=FakeCredentials(), session=http_session
+        )
+        signer.sign_blob(b"payload")
+
+        signer.invalidate()
+
+        assert signer._credentials is None
+        assert signer._session is None
+        http_session.close.assert_called_once()
@@ -0,0 +1,145 @@
+"""
+Unit tests for the Arrow bulk path
+
+Verifies column-wise conversion matches Invoice.from_bigquery_row, the
+columnar summary, the REST fallback when the Storage Read API fails and
+the repository's bulk finders.
+"""
+
+import threading
+from datetime import date
+from unittest.mock import MagicMock
+
+import pytest
+
+pyarrow = pytest.importorskip("pyarrow")
+
+from src.core.domain.models import Invoice  # noqa: E402
+from src.infrastructure.bigquery import arrow_results  # noqa: E402
+from src.infrastructure.bigquery.arrow_results import (  # noqa: E402
+    invoices_from_arrow,
+    query_job_to_arrow,
+    summarize_invoices,
+)
+from src.infrastructure.bigquery.invoice_repository import (  # noqa: E402
+    BigQueryInvoiceRepository,
+)
+
+FIELD_MAPPING = {
+    "numero_factura": "Factura",
+    "cliente_rut": "Rut",
+    "cliente_nombre": "Nombre",
+    "solicitante": "Solicitante",
+    "pdf_tributaria_cf": "Copia_Tributaria_cf",
+    "pdf_cedible_cf": "Copia_Cedible_cf",
+}
+
+ROWS = [
+    {
+        "Factura": "0003",
+        "Rut": "76000000-0",
+        "Nombre": "Cliente A",
+        "Solicitante": "1",
+        "Copia_Tributaria_cf": "gs://pdfs/3_t.pdf",
+        "Copia_Cedible_cf": None,
+    },
+    {
+        "Factura": "0002",
+        "Rut": "76000000-0",
+        "Nombre": "Cliente A",
+        "Solicitante": "1",
+        "Copia_Tributaria_cf": "gs://pdfs/2_t.pdf",
+        "Copia_Cedible_cf": "gs://pdfs/2_c.pdf",
+    },
+    {
+        "Factura": "0001",
+        "Rut": "77000000-0",
+        "Nombre": "Cliente B",
+        "Solicitante": None,
+        "Copia_Tributaria_cf": "",
+        "Copia_Cedible_cf": None,
+    },
+]
+
+
+def _table():
+    return pyarrow.Table.from_pylist(ROWS)
+
+
+def test_columnar_conversion_matches_row_conversion():
+    columnar = invoices_from_arrow(_table(), FIELD_MAPPING)
+    row_by_row = [Invoice.from_bigquery_row(row, FIELD_MAPPING) for row in ROWS]
+
+    for fast, slow in zip(columnar, row_by_row):
+        assert fast.to_dict() | {"metadata": None} == slow.to_dict() | {"metadata": None}
+    assert "raw_row" not in columnar[0].metadata
+
+
+def test_raw_row_kept_on_request():
+    (invoice, *_) = invoices_from_arrow(_table(), FIELD_MAPPING, include_raw_row=True)
+
+    assert invoice.metadata["raw_row"] == ROWS[0]
+
+
+def test_summary_aggregates_columns():
+    summary = summarize_invoices(_table(), FIELD_MAPPING, top_customers=1)
+
+    assert summary["total_invoices"] == 3
+    assert summary["distinct_customers"] == 2
+    assert summary["pdfs_available"] == {"Copia_Tributaria_cf": 2, "Copia_Cedible_cf": 1}
+    assert summary["top_customers"] == [{"rut": "76000000-0", "invoices": 2}]
+
+
+def test_storage_api_failure_falls_back_to_rest(monkeypatch):
+    monkeypatch.setattr(arrow_results, "BQ_STORAGE_AVAILABLE", True)
+    query_job = MagicMock()
+    query_job.to_arrow.side_effect = [PermissionError("readsessions.create"), _table()]
+
+    table = query_job_to_arrow(query_job)
+
+    assert table.num_rows == 3
+    assert [c.kwargs for c in query_job.to_arrow.call_args_list] == [
+        {"create_bqstorage_client": True},
+        {"create_bqstorage_client": False},
+    ]
+
+
+def test_storage_api_disabled_uses_rest(monkeypatch):
+    monkeypatch.setattr(arrow_results, "BQ_STORAGE_AVAILABLE", True)
+    query_job = MagicMock()
+    query_job.to_arrow.return_value = _table()
+
+    query_job_to_arrow(query_job, use_storage_api=False)
+
+    query_job.to_arrow.assert_called_once_with(create_bqstorage_client=False)
+
+
+def _repository():
+    repo = BigQueryInvoiceRepository.__new__(BigQueryInvoiceRepository)
+    repo.config = MagicMock()
+    repo.config.get.side_effect = lambda key, default=None: default
+    repo.table_full_path = "p.d.invoices"
+    repo.field_mapping = FIELD_MAPPING
+    repo.result_cache = None
+    repo.single_flight = None
+    repo._projection_stats = {}
+    repo._stats_lock = threading.Lock()
+    repo.client = MagicMock()
+    query_job = repo.client.query.return_value
+    query_job.total_bytes_processed = 4096
+    query_job.to_arrow.return_value = _table()
+    return repo
+
+
+def test_repository_bulk_finder_and_summary():
+    repo = _repository()
+
+    invoices = repo.find_by_date_range_bulk(date(2025, 1, 1), date(2025, 1, 31))
+    summary = repo.get_date_range_summary(date(2025, 1, 1), date(2025, 1, 31))
+
+    assert [invoice.factura for invoice in invoices] == ["0003", "0002", "0001"]
+    assert summary["total_invoices"] == 3
+    (query,) = repo.client.query.call_args.args
+    assert "fecha_emision BETWEEN @start_date AND @end_date" in query
+    assert "SELECT *" not in query  # Summary reads the listing profile
+    assert repo.get_projection_stats()["listing"]["bytes_processed"] == 4096
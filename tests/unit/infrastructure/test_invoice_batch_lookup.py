@@ -0,0 +1,113 @@
+"""
+Unit tests for batched invoice lookups
+
+Verifies BigQueryInvoiceRepository.find_by_invoice_numbers issues one
+IN UNNEST query per chunk and the IInvoiceRepository fallback.
+"""
+
+from unittest.mock import MagicMock
+
+from src.core.domain.interfaces import IInvoiceRepository
+from src.core.domain.models import Invoice
+from src.infrastructure.bigquery.invoice_repository import BigQueryInvoiceRepository
+
+FIELD_MAPPING = {
+    "numero_factura": "Factura",
+    "cliente_rut": "Rut",
+    "cliente_nombre": "Nombre",
+    "solicitante": "Solicitante",
+}
+
+
+class FakeRow(dict):
+    pass
+
+
+def _repository(table, chunk_size=1000):
+    repo = BigQueryInvoiceRepository.__new__(BigQueryInvoiceRepository)
+    repo.config = MagicMock()
+    repo.config.get.side_effect = lambda key, default=None: (
+        chunk_size if key == "bigquery.batch_lookup.chunk_size" else default
+    )
+    repo.table_full_path = "p.d.invoices"
+    repo.field_mapping = FIELD_MAPPING
+    repo.result_cache = None
+    repo.single_flight = None
+    repo.queries = []
+
+    def execute(query, job_config):
+        (param,) = job_config.query_parameters
+        repo.queries.append((query, list(param.values)))
+        return [FakeRow(row) for row in table if row["Factura"] in param.values]
+
+    repo._execute_query = execute
+    return repo
+
+
+def _row(number, name="Cliente"):
+    return {"Factura": number, "Rut": "76000000-0", "Nombre": name, "Solicitante": "1"}
+
+
+def test_single_query_preserves_request_order():
+    repo = _repository([_row("1"), _row("2"), _row("3")])
+
+    invoices = repo.find_by_invoice_numbers(["3", "missing", "1", "3"])
+
+    assert [inv.factura for inv in invoices] == ["3", "1"]
+    assert len(repo.queries) == 1
+    query, numbers = repo.queries[0]
+    assert "IN UNNEST(@invoice_numbers)" in query
+    assert numbers == ["3", "missing", "1"]
+
+
+def test_large_lists_are_chunked():
+    repo = _repository([_row(str(i)) for i in range(25)], chunk_size=10)
+
+    invoices = repo.find_by_invoice_numbers([str(i) for i in range(25)])
+
+    assert len(invoices) == 25
+    assert [len(numbers) for _, numbers in repo.queries] == [10, 10, 5]
+
+
+def test_first_row_wins_for_duplicate_numbers():
+    repo = _repository([_row("1", "first"), _row("1", "second")])
+
+    (invoice,) = repo.find_by_invoice_numbers(["1"])
+
+    assert invoice.nombre == "first"
+
+
+def test_empty_list_runs_no_query():
+    repo = _repository([])
+    assert repo.find_by_invoice_numbers([]) == []
+    assert repo.queries == []
+
+
+def test_interface_default_falls_back_to_single_lookups():
+    class SingleLookupRepository(IInvoiceRepository):
+        def __init__(self):
+            self.calls = []
+
+        def find_by_invoice_number(self, invoice_number):
+            self.calls.append(invoice_number)
+            if invoice_number == "missing":
+                return None
+            return Invoice(factura=invoice_number, rut="1-9", nombre="x")
+
+        def find_by_rut(self, rut, limit=None):
+            return []
+
+        def find_by_solicitante(self, solicitante, limit=None):
+            return []
+
+        def find_by_date_range(self, start_date, end_date, rut=None):
+            return []
+
+        def search(self, query, limit=None):
+            return []
+
+    repo = SingleLookupRepository()
+    invoices = repo.find_by_invoice_numbers(["1", "missing", "1", "2"])
+
+    assert [inv.factura for inv in invoices] == ["1", "2"]
+    assert repo.calls == ["1", "missing", "2"]
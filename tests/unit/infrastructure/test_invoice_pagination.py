@@ -0,0 +1,147 @@
+"""
+Unit tests for streaming invoice finders
+
+Verifies the iter_* finders read page by page, yield before the last page
+is fetched, apply the after_factura keyset cursor in SQL and bypass the
+result cache.
+"""
+
+import threading
+from datetime import date
+from unittest.mock import MagicMock
+
+from src.core.domain.interfaces import IInvoiceRepository
+from src.core.domain.models import Invoice
+from src.infrastructure.bigquery.invoice_repository import BigQueryInvoiceRepository
+
+
+class PagedResult:
+    """Row iterator that records how many pages were fetched"""
+
+    def __init__(self, rows, page_size):
+        self.rows = rows
+        self.page_size = page_size
+        self.pages_fetched = 0
+
+    def __iter__(self):
+        for start in range(0, len(self.rows), self.page_size):
+            self.pages_fetched += 1
+            yield from self.rows[start : start + self.page_size]
+
+
+def _rows(count):
+    return [
+        {"Factura": f"{count - i:04d}", "Rut": "76000000-0"} for i in range(count)
+    ]
+
+
+def _repository(rows, config_values=None):
+    config_values = config_values or {}
+    repo = BigQueryInvoiceRepository.__new__(BigQueryInvoiceRepository)
+    repo.config = MagicMock()
+    repo.config.get.side_effect = lambda key, default=None: config_values.get(key, default)
+    repo.table_full_path = "p.d.invoices"
+    repo.field_mapping = {
+        "numero_factura": "Factura",
+        "cliente_rut": "Rut",
+        "solicitante": "Solicitante",
+    }
+    repo.result_cache = MagicMock()
+    repo.single_flight = None
+    repo._projection_stats = {}
+    repo._stats_lock = threading.Lock()
+
+    repo.client = MagicMock()
+    query_job = repo.client.query.return_value
+    query_job.total_bytes_processed = 0
+    repo.results = []
+
+    def result(page_size=None):
+        paged = PagedResult(rows, page_size)
+        repo.results.append(paged)
+        return paged
+
+    query_job.result.side_effect = result
+    return repo
+
+
+def _sent_query(repo):
+    (query,) = repo.client.query.call_args.args
+    return query, repo.client.query.call_args.kwargs["job_config"]
+
+
+def test_first_invoice_yielded_before_last_page():
+    repo = _repository(_rows(10))
+
+    invoices = repo.iter_by_rut("76000000-0", page_size=3)
+    first = next(invoices)
+
+    assert first.factura == "0010"
+    assert repo.results[0].pages_fetched == 1
+    assert [invoice.factura for invoice in invoices][-1] == "0001"
+    assert repo.results[0].pages_fetched == 4
+
+
+def test_query_runs_lazily_with_configured_page_size():
+    repo = _repository(_rows(2), {"bigquery.pagination.page_size": 250})
+
+    invoices = repo.iter_by_solicitante("0012345678")
+    repo.client.query.assert_not_called()
+
+    list(invoices)
+    repo.client.query.return_value.result.assert_called_once_with(page_size=250)
+    repo.result_cache.get_or_load.assert_not_called()
+
+
+def test_after_factura_cursor_is_a_keyset_condition():
+    repo = _repository(_rows(1))
+
+    list(repo.iter_by_rut("76000000-0", after_factura="0500", limit=20))
+
+    query, job_config = _sent_query(repo)
+    assert "Factura < @after_factura" in query
+    assert "OFFSET" not in query
+    assert "ORDER BY Factura DESC" in query
+    assert "LIMIT 20" in query
+    parameters = {p.name: p.value for p in job_config.query_parameters}
+    assert parameters == {"rut": "76000000-0", "after_factura": "0500"}
+
+
+def test_date_range_is_ordered_by_cursor_column():
+    repo = _repository(_rows(1))
+
+    list(
+        repo.iter_by_date_range(
+            date(2025, 1, 1), date(2025, 1, 31), rut="76000000-0", after_factura="0500"
+        )
+    )
+
+    query, job_config = _sent_query(repo)
+    assert "fecha_emision BETWEEN @start_date AND @end_date AND Rut = @rut" in query
+    assert "ORDER BY Factura DESC" in query
+    assert len(job_config.query_parameters) == 4
+
+
+def test_default_implementation_applies_cursor_to_loaded_results():
+    class ListRepository(IInvoiceRepository):
+        def find_by_invoice_number(self, invoice_number, projection=None):
+            return None
+
+        def find_by_rut(self, rut, limit=None, projection=None):
+            return [
+                Invoice(factura=number, rut="76000000-0", nombre="Cliente")
+                for number in ("0002", "0004", "0003", "0001")
+            ]
+
+        def find_by_solicitante(self, solicitante, limit=None, projection=None):
+            return []
+
+        def find_by_date_range(self, start_date, end_date, rut=None, projection=None):
+            return []
+
+        def search(self, query, limit=None, projection=None):
+            return []
+
+    invoices = ListRepository().iter_by_rut("76000000-0", after_factura="0004", limit=2)
+
+    assert [invoice.factura for invoice in invoices] == ["0003", "0002"]
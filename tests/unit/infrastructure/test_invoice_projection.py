@@ -0,0 +1,125 @@
+"""
+Unit tests for invoice projection profiles
+
+Verifies BigQueryInvoiceRepository reads only the columns of the requested
+profile, labels each query with it and reports bytes processed per profile.
+"""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core.domain.interfaces import InvoiceProjection
+from src.infrastructure.bigquery.invoice_repository import BigQueryInvoiceRepository
+
+FIELD_MAPPING = {
+    "numero_factura": "Factura",
+    "cliente_rut": "Rut",
+    "cliente_nombre": "Nombre",
+    "solicitante": "Solicitante",
+    "factura_referencia": "Factura_Referencia",
+    "detalles_items": "DetallesFactura",
+    "pdf_tributaria_cf": "Copia_Tributaria_cf",
+    "pdf_cedible_cf": "Copia_Cedible_cf",
+    "pdf_tributaria_sf": "Copia_Tributaria_sf",
+    "pdf_cedible_sf": "Copia_Cedible_sf",
+    "pdf_termico": "Doc_Termico",
+}
+
+
+def _repository(config_values=None, bytes_processed=1024):
+    config_values = config_values or {}
+    repo = BigQueryInvoiceRepository.__new__(BigQueryInvoiceRepository)
+    repo.config = MagicMock()
+    repo.config.get.side_effect = lambda key, default=None: config_values.get(key, default)
+    repo.table_full_path = "p.d.invoices"
+    repo.field_mapping = FIELD_MAPPING
+    repo.result_cache = None
+    repo.single_flight = None
+    repo._projection_stats = {}
+    repo._stats_lock = threading.Lock()
+
+    repo.client = MagicMock()
+    query_job = repo.client.query.return_value
+    query_job.total_bytes_processed = bytes_processed
+    query_job.result.return_value = [
+        {
+            "Factura": "1",
+            "Rut": "76000000-0",
+            "Nombre": "Cliente",
+            "Copia_Tributaria_cf": "gs://pdfs/1_t.pdf",
+        }
+    ]
+    return repo
+
+
+def _sent_query(repo):
+    (query,) = repo.client.query.call_args.args
+    return query, repo.client.query.call_args.kwargs["job_config"]
+
+
+def test_zip_profile_skips_details():
+    repo = _repository()
+
+    (invoice,) = repo.find_by_invoice_numbers(["1"], projection=InvoiceProjection.ZIP)
+
+    query, job_config = _sent_query(repo)
+    assert "SELECT *" not in query
+    assert "Copia_Tributaria_cf" in query
+    assert "DetallesFactura" not in query
+    assert "Solicitante" not in query
+    assert job_config.labels == {"projection": "zip"}
+    assert invoice.pdf_paths == {"Copia_Tributaria_cf": "gs://pdfs/1_t.pdf"}
+
+
+def test_listing_profile_keeps_mapped_columns_except_details():
+    repo = _repository()
+
+    repo.find_by_rut("76000000-0", projection=InvoiceProjection.LISTING)
+
+    query, _ = _sent_query(repo)
+    assert "Solicitante" in query and "Factura_Referencia" in query
+    assert "DetallesFactura" not in query
+
+
+def test_full_profile_is_default():
+    repo = _repository()
+
+    repo.search("cliente")
+
+    query, job_config = _sent_query(repo)
+    assert "SELECT *" in query
+    assert job_config.labels == {"projection": "full"}
+
+
+def test_profile_from_config():
+    repo = _repository(
+        {"bigquery.projection.profiles.zip": ["numero_factura", "cliente_rut"]}
+    )
+
+    repo.find_by_invoice_number("1", projection=InvoiceProjection.ZIP)
+
+    query, _ = _sent_query(repo)
+    assert "SELECT Factura, Rut" in query
+
+
+def test_unknown_profile_rejected():
+    repo = _repository()
+
+    with pytest.raises(ValueError):
+        repo.find_by_invoice_number("1", projection="everything")
+
+
+def test_bytes_processed_per_profile():
+    repo = _repository(bytes_processed=2048)
+
+    repo.find_by_invoice_numbers(["1"], projection=InvoiceProjection.ZIP)
+    repo.find_by_invoice_numbers(["1"], projection=InvoiceProjection.ZIP)
+    repo.find_by_invoice_number("1")
+
+    stats = repo.get_projection_stats()
+    assert stats["zip"]["queries"] == 2
+    assert stats["zip"]["bytes_processed"] == 4096
+    assert stats["zip"]["avg_bytes_per_query"] == 2048
+    assert stats["full"]["queries"] == 1
@@ -0,0 +1,100 @@
+"""
+Unit tests for batched GCS object metadata (generation, size) lookup
+"""
+
+from contextlib import contextmanager
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.infrastructure.gcs.object_metadata import (
+    ObjectMetadata,
+    fetch_object_generations,
+    fetch_object_metadata,
+    split_gs_path,
+)
+
+
+class FakeBlob:
+    def __init__(self, name, generation):
+        self.name = name
+        self._generation = generation
+        self.generation = None
+
+    def reload(self, projection=None):
+        # Inside a batch the response is applied when the batch exits;
+        # a missing object leaves no generation
+        self.generation = self._generation
+
+
+class FakeClient:
+    def __init__(self, generations):
+        self.generations = generations
+        self.batches = []
+
+    def bucket(self, bucket_name):
+        bucket = MagicMock()
+        bucket.blob.side_effect = lambda name: FakeBlob(
+            name, self.generations.get(f"gs://{bucket_name}/{name}")
+        )
+        return bucket
+
+    @contextmanager
+    def batch(self, raise_exception=True):
+        assert raise_exception is False
+        self.batches.append(1)
+        yield
+
+
+def test_split_gs_path():
+    assert split_gs_path("gs://bucket/a/b.pdf") == ("bucket", "a/b.pdf")
+    with pytest.raises(ValueError):
+        split_gs_path("https://bucket/a.pdf")
+    with pytest.raises(ValueError):
+        split_gs_path("gs://bucket")
+
+
+def test_generations_are_fetched_in_batches_of_100():
+    paths = [f"gs://b/{i}.pdf" for i in range(250)]
+    client = FakeClient({path: i + 1 for i, path in enumerate(paths)})
+
+    generations = fetch_object_generations(client, paths + paths[:10])
+
+    assert len(client.batches) == 3
+    assert generations["gs://b/0.pdf"] == 1
+    assert generations["gs://b/249.pdf"] == 250
+    assert len(generations) == 250
+
+
+def test_missing_objects_map_to_none():
+    client = FakeClient({"gs://b/present.pdf": 7})
+
+    generations = fetch_object_generations(
+        client, ["gs://b/present.pdf", "gs://b/missing.pdf"]
+    )
+
+    assert generations == {"gs://b/present.pdf": 7, "gs://b/missing.pdf": None}
+
+
+def test_metadata_includes_size():
+    client = FakeClient({"gs://b/a.pdf": 3})
+    original_bucket = client.bucket
+
+    def bucket(bucket_name):
+        fake = original_bucket(bucket_name)
+        make_blob = fake.blob.side_effect
+
+        def blob(name):
+            created = make_blob(name)
+            created.size = 2048
+            return created
+
+        fake.blob.side_effect = blob
+        return fake
+
+    client.bucket = bucket
+
+    metadata = fetch_object_metadata(client, ["gs://b/a.pdf", "gs://b/missing.pdf"])
+
+    assert metadata["gs://b/a.pdf"] == ObjectMetadata(generation=3, size=2048)
+    assert metadata["gs://b/missing.pdf"] is None
@@ -0,0 +1,138 @@
+"""
+Unit tests for LocalBlobCache
+
+Verifies generation-keyed lookups, LRU eviction under the size cap, atomic
+writes, index reload from disk and that mmap hits can be written to a ZIP.
+"""
+
+import io
+import mmap
+import os
+import zipfile
+
+import pytest
+
+from src.infrastructure.cache.pdf_blob_cache import BlobCacheStats, LocalBlobCache
+from src.infrastructure.gcs.zip_compression import ZipCompressionPolicy
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return str(tmp_path / "pdf_cache")
+
+
+def _files(directory):
+    return [
+        name
+        for _, _, names in os.walk(directory)
+        for name in names
+    ]
+
+
+def test_hit_requires_same_generation(cache_dir):
+    cache = LocalBlobCache(cache_dir, max_bytes=1 << 20)
+    cache.put("bucket", "a.pdf", 1, b"%PDF-1 v1")
+
+    hit = cache.get("bucket", "a.pdf", 1)
+    assert isinstance(hit, mmap.mmap)
+    assert hit[:] == b"%PDF-1 v1"
+    assert cache.get("bucket", "a.pdf", 2) is None
+    assert cache.get("other", "a.pdf", 1) is None
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (1, 2)
+
+
+def test_lru_eviction_keeps_recently_used(cache_dir):
+    cache = LocalBlobCache(cache_dir, max_bytes=300)
+    cache.put("b", "1.pdf", 1, b"x" * 100)
+    cache.put("b", "2.pdf", 1, b"x" * 100)
+    cache.put("b", "3.pdf", 1, b"x" * 100)
+    cache.get("b", "1.pdf", 1)  # 2.pdf becomes least recently used
+
+    cache.put("b", "4.pdf", 1, b"x" * 100)
+
+    assert cache.get("b", "2.pdf", 1) is None
+    for name in ("1.pdf", "3.pdf", "4.pdf"):
+        assert cache.get("b", name, 1) is not None
+    assert cache.stats()["bytes"] == 300
+    assert len(_files(cache_dir)) == 3
+
+
+def test_objects_larger_than_cap_are_not_cached(cache_dir):
+    cache = LocalBlobCache(cache_dir, max_bytes=10)
+    cache.put("b", "big.pdf", 1, b"x" * 11)
+    assert cache.get("b", "big.pdf", 1) is None
+    assert _files(cache_dir) == []
+
+
+def test_writes_leave_no_temp_files(cache_dir):
+    cache = LocalBlobCache(cache_dir, max_bytes=1 << 20)
+    for i in range(5):
+        cache.put("b", f"{i}.pdf", 7, os.urandom(1000))
+
+    assert len(_files(cache_dir)) == 5
+    assert not any(name.startswith(".tmp-") for name in _files(cache_dir))
+
+
+def test_index_is_rebuilt_and_stale_temp_files_removed(cache_dir):
+    cache = LocalBlobCache(cache_dir, max_bytes=1 << 20)
+    cache.put("b", "a.pdf", 1, b"content")
+    shard = os.path.join(cache_dir, os.listdir(cache_dir)[0])
+    with open(os.path.join(shard, ".tmp-crashed"), "wb") as partial:
+        partial.write(b"half")
+
+    reopened = LocalBlobCache(cache_dir, max_bytes=1 << 20)
+
+    assert reopened.stats()["files"] == 1
+    assert reopened.get("b", "a.pdf", 1)[:] == b"content"
+    assert not any(name.startswith(".tmp-") for name in _files(cache_dir))
+
+
+def test_file_removed_by_another_process_is_a_miss(cache_dir):
+    cache = LocalBlobCache(cache_dir, max_bytes=1 << 20)
+    cache.put("b", "a.pdf", 1, b"content")
+    for root, _, names in os.walk(cache_dir):
+        for name in names:
+            os.unlink(os.path.join(root, name))
+
+    assert cache.get("b", "a.pdf", 1) is None
+    assert cache.stats()["files"] == 0
+
+
+def test_mmap_hit_feeds_zip_writer(cache_dir):
+    cache = LocalBlobCache(cache_dir, max_bytes=1 << 20)
+    content = os.urandom(200_000)
+    cache.put("b", "a.pdf", 1, content)
+
+    buffer = io.BytesIO()
+    policy = ZipCompressionPolicy("adaptive")
+    with zipfile.ZipFile(buffer, "w") as zip_file:
+        policy.write_entry(zip_file, "a.pdf", cache.get("b", "a.pdf", 1), policy.new_stats())
+
+    with zipfile.ZipFile(buffer) as zip_file:
+        assert zip_file.read("a.pdf") == content
+
+
+def test_empty_object_round_trips(cache_dir):
+    cache = LocalBlobCache(cache_dir, max_bytes=1 << 20)
+    cache.put("b", "empty.pdf", 1, b"")
+    assert cache.get("b", "empty.pdf", 1) == b""
+
+
+def test_stats_hit_ratio():
+    stats = BlobCacheStats()
+    assert stats.hit_ratio is None
+    stats.record_hit(100)
+    stats.record_hit(50)
+    stats.record_miss()
+    assert stats.hit_ratio == pytest.approx(0.6667, abs=1e-4)
+    assert stats.bytes_saved == 150
+
+
+def test_disabled_by_default_in_code():
+    class Config:
+        def get(self, key, default=None):
+            return default
+
+    assert LocalBlobCache.from_config(Config()) is None
@@ -0,0 +1,189 @@
+"""
+Unit tests for QueryResultCache
+
+Verifies read-through hits, LRU and TTL eviction, invalidation when the
+table's modification time changes, the size guard and that the invoice
+repository bypasses the cache when it is disabled.
+"""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+from google.cloud import bigquery
+
+from src.infrastructure.bigquery.invoice_repository import BigQueryInvoiceRepository
+from src.infrastructure.cache.query_result_cache import QueryResultCache, query_cache_key
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _cache(clock, modified=None, **kwargs):
+    modified = modified if modified is not None else {"value": 1}
+    return QueryResultCache(lambda: modified["value"], clock=clock, **kwargs)
+
+
+def _loader(rows):
+    return MagicMock(side_effect=lambda: [dict(row) for row in rows])
+
+
+def test_second_lookup_is_a_hit_and_returns_copies():
+    cache = _cache(FakeClock())
+    loader = _loader([{"Factura": "1"}])
+
+    first = cache.get_or_load(("q",), loader)
+    first[0]["Factura"] = "changed"
+    second = cache.get_or_load(("q",), loader)
+
+    assert loader.call_count == 1
+    assert second == [{"Factura": "1"}]
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_ttl_expiry_reloads():
+    clock = FakeClock()
+    cache = _cache(clock, ttl_seconds=60, freshness_check_seconds=3600)
+    loader = _loader([{"Factura": "1"}])
+
+    cache.get_or_load(("q",), loader)
+    clock.now += 61
+    cache.get_or_load(("q",), loader)
+
+    assert loader.call_count == 2
+    assert cache.stats()["evictions"] == 1
+
+
+def test_lru_eviction():
+    cache = _cache(FakeClock(), max_entries=2)
+    loaders = {key: _loader([{"k": key}]) for key in "abc"}
+
+    cache.get_or_load(("a",), loaders["a"])
+    cache.get_or_load(("b",), loaders["b"])
+    cache.get_or_load(("a",), loaders["a"])  # a becomes most recent
+    cache.get_or_load(("c",), loaders["c"])  # evicts b
+    cache.get_or_load(("a",), loaders["a"])
+    cache.get_or_load(("b",), loaders["b"])
+
+    assert loaders["a"].call_count == 1
+    assert loaders["b"].call_count == 2
+
+
+def test_table_modification_invalidates():
+    clock = FakeClock()
+    modified = {"value": 1}
+    cache = _cache(clock, modified=modified, freshness_check_seconds=30)
+    loader = _loader([{"Factura": "1"}])
+
+    cache.get_or_load(("q",), loader)
+    modified["value"] = 2
+    clock.now += 10  # Not checked yet: still served from cache
+    cache.get_or_load(("q",), loader)
+    assert loader.call_count == 1
+
+    clock.now += 30
+    cache.get_or_load(("q",), loader)
+
+    assert loader.call_count == 2
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_freshness_check_is_rate_limited():
+    clock = FakeClock()
+    table_modified = MagicMock(return_value=1)
+    cache = QueryResultCache(table_modified, freshness_check_seconds=60, clock=clock)
+
+    for _ in range(5):
+        cache.get_or_load(("q",), _loader([]))
+
+    assert table_modified.call_count == 1
+
+
+def test_large_results_not_cached():
+    cache = _cache(FakeClock(), max_rows_per_entry=2)
+    loader = _loader([{"n": i} for i in range(3)])
+
+    cache.get_or_load(("q",), loader)
+    cache.get_or_load(("q",), loader)
+
+    assert loader.call_count == 2
+
+
+def test_errors_are_not_cached():
+    cache = _cache(FakeClock())
+    loader = MagicMock(side_effect=[RuntimeError("boom"), [{"Factura": "1"}]])
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_load(("q",), loader)
+    assert cache.get_or_load(("q",), loader) == [{"Factura": "1"}]
+
+
+def test_load_racing_an_invalidation_is_not_stored():
+    cache = _cache(FakeClock())
+
+    def load():
+        cache.invalidate()  # Table changed while the query ran
+        return [{"Factura": "stale"}]
+
+    cache.get_or_load(("q",), load)
+
+    assert cache.stats()["entries"] == 0
+
+
+def test_key_covers_sql_parameters_and_projection():
+    def config(value):
+        return bigquery.QueryJobConfig(
+            query_parameters=[bigquery.ScalarQueryParameter("rut", "STRING", value)]
+        )
+
+    sql = "SELECT * FROM t WHERE Rut = @rut"
+    assert query_cache_key(sql, config("1"), "full") == query_cache_key(
+        "SELECT *  FROM t\n WHERE Rut = @rut", config("1"), "full"
+    )
+    assert query_cache_key(sql, config("1"), "full") != query_cache_key(sql, config("2"), "full")
+    assert query_cache_key(sql, config("1"), "full") != query_cache_key(sql, config("1"), "zip")
+
+
+def _repository(cache):
+    repo = BigQueryInvoiceRepository.__new__(BigQueryInvoiceRepository)
+    repo.config = MagicMock()
+    repo.config.get.side_effect = lambda key, default=None: default
+    repo.table_full_path = "p.d.invoices"
+    repo.field_mapping = {"numero_factura": "Factura", "cliente_rut": "Rut"}
+    repo.result_cache = cache
+    repo.single_flight = None
+    repo._projection_stats = {}
+    repo._stats_lock = threading.Lock()
+    repo.client = MagicMock()
+    repo.client.query.return_value.total_bytes_processed = 0
+    repo.client.query.return_value.result.return_value = [
+        {"Factura": "1", "Rut": "76000000-0"}
+    ]
+    return repo
+
+
+def test_repository_serves_repeated_rut_lookups_from_cache():
+    repo = _repository(None)
+    repo.result_cache = QueryResultCache(repo._get_table_modified, clock=FakeClock())
+
+    repo.find_by_rut("76000000-0")
+    (invoice,) = repo.find_by_rut("76000000-0")
+
+    assert invoice.factura == "1"
+    assert repo.client.query.call_count == 1
+
+
+def test_repository_bypasses_disabled_cache():
+    repo = _repository(None)
+
+    repo.find_by_rut("76000000-0")
+    repo.find_by_rut("76000000-0")
+
+    assert repo.client.query.call_count == 2
+    repo.client.get_table.assert_not_called()
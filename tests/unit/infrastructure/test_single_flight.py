@@ -0,0 +1,154 @@
+"""
+Unit tests for SingleFlight
+
+Verifies identical concurrent calls share one execution, errors reach every
+caller without being remembered, a waiter timing out does not cancel the
+leader, and that the repositories coalesce identical reads.
+"""
+
+import concurrent.futures
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.infrastructure.bigquery.invoice_repository import BigQueryInvoiceRepository
+from src.infrastructure.bigquery.single_flight import SingleFlight, fetch_query_rows
+from src.infrastructure.cache.query_result_cache import QueryResultCache
+
+
+class BlockingCall:
+    """Callable that blocks until released, counting executions"""
+
+    def __init__(self, result=None, error=None):
+        self.result = result
+        self.error = error
+        self.calls = 0
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def __call__(self, *args, **kwargs):
+        self.calls += 1
+        self.started.set()
+        assert self.release.wait(timeout=5)
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+def _wait_for_waiters(flights, count):
+    for _ in range(500):
+        if flights.stats()["shared"] >= count:
+            return
+        threading.Event().wait(0.01)
+    raise AssertionError("waiters did not join the flight")
+
+
+def test_concurrent_identical_calls_share_one_execution():
+    flights = SingleFlight()
+    call = BlockingCall(result=("row",))
+
+    def target():
+        return flights.do("key", call)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
+        futures = [executor.submit(target) for _ in range(5)]
+        assert call.started.wait(timeout=5)
+        _wait_for_waiters(flights, 4)
+        call.release.set()
+        results = [future.result() for future in futures]
+
+    assert call.calls == 1
+    assert results == [("row",)] * 5
+    assert flights.stats()["executions"] == 1
+    assert flights.stats()["shared"] == 4
+
+
+def test_error_reaches_every_caller_and_is_not_remembered():
+    flights = SingleFlight()
+    call = BlockingCall(error=RuntimeError("quota exceeded"))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [executor.submit(flights.do, "key", call) for _ in range(3)]
+        assert call.started.wait(timeout=5)
+        _wait_for_waiters(flights, 2)
+        call.release.set()
+        errors = [future.exception() for future in futures]
+
+    assert all(isinstance(error, RuntimeError) for error in errors)
+    # Next call runs again
+    assert flights.do("key", lambda: "ok") == "ok"
+
+
+def test_waiter_timeout_does_not_cancel_leader():
+    flights = SingleFlight(wait_timeout_seconds=0.05)
+    call = BlockingCall(result="done")
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(flights.do, "key", call)
+        assert call.started.wait(timeout=5)
+        with pytest.raises(concurrent.futures.TimeoutError):
+            flights.do("key", call)
+        call.release.set()
+        assert leader.result() == "done"
+
+    assert call.calls == 1
+    assert flights.stats()["timeouts"] == 1
+
+
+def test_different_keys_run_separately():
+    flights = SingleFlight()
+
+    assert flights.do("a", lambda: 1) == 1
+    assert flights.do("b", lambda: 2) == 2
+    assert flights.stats()["executions"] == 2
+
+
+def test_fetch_query_rows_gives_each_caller_its_own_rows():
+    flights = SingleFlight()
+    job_config = MagicMock(query_parameters=[])
+    call = BlockingCall(result=[{"Factura": "1"}])
+
+    def execute(query, config):
+        return call()
+
+    def target():
+        return fetch_query_rows(flights, "SELECT 1", job_config, execute, dict)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(target) for _ in range(2)]
+        assert call.started.wait(timeout=5)
+        _wait_for_waiters(flights, 1)
+        call.release.set()
+        first, second = [future.result() for future in futures]
+
+    first[0]["Factura"] = "changed"
+    assert second == [{"Factura": "1"}]
+    assert call.calls == 1
+
+
+def test_expired_cache_entry_refreshed_by_one_query():
+    repo = BigQueryInvoiceRepository.__new__(BigQueryInvoiceRepository)
+    repo.config = MagicMock()
+    repo.config.get.side_effect = lambda key, default=None: default
+    repo.table_full_path = "p.d.invoices"
+    repo.field_mapping = {"numero_factura": "Factura", "cliente_rut": "Rut"}
+    repo._projection_stats = {}
+    repo._stats_lock = threading.Lock()
+    repo.single_flight = SingleFlight()
+    repo.result_cache = QueryResultCache(lambda: 1)
+
+    call = BlockingCall(result=[{"Factura": "1", "Rut": "76000000-0"}])
+    repo.client = MagicMock()
+    repo.client.query.return_value.total_bytes_processed = 0
+    repo.client.query.return_value.result.side_effect = call
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(repo.find_by_rut, "76000000-0") for _ in range(4)]
+        assert call.started.wait(timeout=5)
+        _wait_for_waiters(repo.single_flight, 3)
+        call.release.set()
+        results = [future.result() for future in futures]
+
+    assert call.calls == 1
+    assert [invoices[0].factura for invoices in results] == ["1"] * 4
@@ -0,0 +1,143 @@
+"""
+Unit tests for StreamingZipWriter
+
+Verifies the archive is valid when written to a non-seekable stream, that
+the download window bounds in-flight work, and failure handling.
+"""
+
+import io
+import os
+import sys
+import threading
+import time
+import zipfile
+
+import pytest
+
+from src.infrastructure.gcs.streaming_zip_writer import (
+    StreamingZipWriter,
+    align_chunk_size,
+    current_rss_bytes,
+)
+from src.infrastructure.gcs.zip_compression import ZipCompressionPolicy
+
+
+class UploadSink:
+    """Non-seekable write-only stream, like a GCS BlobWriter"""
+
+    def __init__(self):
+        self.buffer = io.BytesIO()
+        self.writes = 0
+
+    def write(self, data):
+        self.writes += 1
+        return self.buffer.write(data)
+
+    def flush(self):
+        pass
+
+
+def _entries(count):
+    return [(f"{i}_tributaria_cf.pdf", f"gs://b/{i}.pdf") for i in range(count)]
+
+
+class TestStreamingZipWriter:
+    def test_writes_valid_archive_to_unseekable_stream(self):
+        sink = UploadSink()
+        writer = StreamingZipWriter(lambda gs_path: gs_path.encode() * 100, max_workers=3)
+
+        result = writer.write(_entries(7), sink)
+
+        with zipfile.ZipFile(io.BytesIO(sink.buffer.getvalue())) as archive:
+            assert sorted(archive.namelist()) == sorted(name for name, _ in _entries(7))
+            assert archive.read("3_tributaria_cf.pdf") == b"gs://b/3.pdf" * 100
+        assert result.files_included == 7
+        assert result.bytes_written == len(sink.buffer.getvalue())
+        assert result.peak_rss_bytes > 0
+
+    def test_window_bounds_downloads_in_flight(self, monkeypatch):
+        lock = threading.Lock()
+        started = []
+        written = []
+        peak_ahead = []
+
+        def download(gs_path):
+            with lock:
+                started.append(gs_path)
+            time.sleep(0.005)
+            return b"%PDF"
+
+        # Track how far downloads run ahead of written entries
+        original_writestr = zipfile.ZipFile.writestr
+
+        def writestr(self, name, data, *args, **kwargs):
+            written.append(name)
+            with lock:
+                peak_ahead.append(len(started) - len(written))
+            return original_writestr(self, name, data, *args, **kwargs)
+
+        monkeypatch.setattr(zipfile.ZipFile, "writestr", writestr)
+        writer = StreamingZipWriter(download, max_workers=2, window=3)
+
+        result = writer.write(_entries(20), UploadSink())
+
+        assert result.files_included == 20
+        assert max(peak_ahead) <= 3
+
+    def test_failed_download_is_skipped(self):
+        def download(gs_path):
+            if gs_path.endswith("2.pdf"):
+                raise IOError("404 Not Found")
+            return b"%PDF"
+
+        sink = UploadSink()
+        result = StreamingZipWriter(download, max_workers=2).write(_entries(4), sink)
+
+        assert result.files_included == 3
+        assert result.files_missing == 1
+        assert "gs://b/2.pdf" in result.errors[0]
+
+    def test_upload_failure_propagates(self):
+        class BrokenSink(UploadSink):
+            def write(self, data):
+                raise ConnectionError("upload session lost")
+
+        writer = StreamingZipWriter(lambda gs_path: b"%PDF", max_workers=2)
+
+        with pytest.raises(ConnectionError):
+            writer.write(_entries(3), BrokenSink())
+
+    def test_time_to_first_upload_recorded_at_chunk_threshold(self):
+        sink = UploadSink()
+        # Random bytes do not compress, so the archive crosses the threshold
+        writer = StreamingZipWriter(lambda gs_path: os.urandom(4096), max_workers=1)
+
+        result = writer.write(_entries(4), sink, first_upload_bytes=1024)
+
+        assert result.time_to_first_upload_ms is not None
+        assert result.time_to_first_upload_ms <= result.parallel_download_time_ms
+
+    def test_rss_is_zero_without_resource_module(self, monkeypatch):
+        # resource is Unix-only; None in sys.modules makes the import fail
+        monkeypatch.setitem(sys.modules, "resource", None)
+
+        assert current_rss_bytes() == 0
+
+    def test_align_chunk_size(self):
+        assert align_chunk_size(1) == 256 * 1024
+        assert align_chunk_size(8 * 1024 * 1024) == 8 * 1024 * 1024
+        assert align_chunk_size(300 * 1024) == 512 * 1024
+
+    def test_stored_entries_readable_from_unseekable_stream(self):
+        sink = UploadSink()
+        writer = StreamingZipWriter(
+            lambda gs_path: os.urandom(2048),
+            max_workers=2,
+            compression_policy=ZipCompressionPolicy("adaptive"),
+        )
+
+        result = writer.write(_entries(3), sink)
+
+        with zipfile.ZipFile(io.BytesIO(sink.buffer.getvalue())) as archive:
+            assert archive.testzip() is None
+        assert result.compression.entries_stored == 3
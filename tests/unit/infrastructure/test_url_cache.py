@@ -0,0 +1,389 @@
+"""
+Unit tests for URLCache
+
+Covers eager entries and lazy (sign-on-click) entries: first-hit signing,
+reuse, transparent re-signing and signing failures, batch resolution, plus
+sharing entries through the SQLite backend.
+"""
+
+import hashlib
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from src.infrastructure.cache.url_cache import LazySigningError, URLCache
+from src.infrastructure.cache.url_cache_backends import (
+    MemoryURLCacheBackend,
+    SQLiteURLCacheBackend,
+    create_url_cache_backend,
+)
+
+SECRET = "test-id-secret"
+
+
+def _signed_url(gs_url, signed_at, expires_seconds):
+    path = gs_url.replace("gs://", "")
+    return (
+        f"https://storage.googleapis.com/{path}?X-Goog-Algorithm=GOOG4-RSA-SHA256"
+        f"&X-Goog-Date={signed_at.strftime('%Y%m%dT%H%M%SZ')}"
+        f"&X-Goog-Expires={expires_seconds}&X-Goog-Signature=abc"
+    )
+
+
+@pytest.fixture
+def signer():
+    signer = Mock()
+    signer.generate_signed_url.side_effect = lambda gs_url, **kwargs: _signed_url(
+        gs_url, datetime.now(timezone.utc), 3600
+    )
+    return signer
+
+
+class TestURLCache:
+    def test_store_and_get(self):
+        cache = URLCache()
+        short_id = cache.store("https://example.com/a.pdf")
+
+        assert len(short_id) == 8
+        assert cache.get(short_id) == "https://example.com/a.pdf"
+        assert cache.get("missing") is None
+
+    def test_lazy_entry_signed_on_first_get_only(self, signer):
+        cache = URLCache()
+        cache.set_signer(signer)
+        short_id = cache.store_lazy("gs://b/a.pdf", friendly_filename="a.pdf")
+
+        assert signer.generate_signed_url.call_count == 0
+        assert cache.stats()["lazy_pending"] == 1
+
+        first = cache.get(short_id)
+        second = cache.get(short_id)
+
+        assert first == second
+        assert first.startswith("https://storage.googleapis.com/b/a.pdf")
+        signer.generate_signed_url.assert_called_once_with(
+            "gs://b/a.pdf", expiration=None, friendly_filename="a.pdf"
+        )
+        stats = cache.stats()
+        assert stats["lazy_pending"] == 0
+        assert stats["lazy_signed"] == 1
+
+    def test_lazy_entry_resigned_when_signature_expires(self, signer):
+        cache = URLCache(resign_margin_minutes=5)
+        cache.set_signer(signer)
+        stale = _signed_url(
+            "gs://b/a.pdf", datetime.now(timezone.utc) - timedelta(minutes=58), 3600
+        )
+        signer.generate_signed_url.side_effect = [stale, "https://fresh"]
+        short_id = cache.store_lazy("gs://b/a.pdf")
+
+        assert cache.get(short_id) == stale
+        # 2 minutes left < 5 minute margin: must re-sign
+        assert cache.get(short_id) == "https://fresh"
+        assert cache.stats()["lazy_resigned"] == 1
+
+    def test_lazy_signing_failure_raises_and_keeps_entry(self, signer):
+        cache = URLCache()
+        cache.set_signer(signer)
+        signer.generate_signed_url.side_effect = [RuntimeError("signBlob down"), "https://ok"]
+        short_id = cache.store_lazy("gs://b/a.pdf")
+
+        with pytest.raises(LazySigningError):
+            cache.get(short_id)
+        assert cache.get(short_id) == "https://ok"
+
+    def test_lazy_entry_without_signer(self):
+        cache = URLCache()
+        short_id = cache.store_lazy("gs://b/a.pdf")
+
+        with pytest.raises(LazySigningError):
+            cache.get(short_id)
+
+
+class TestGetMany:
+    def test_pending_entries_signed_concurrently(self, signer):
+        threads = set()
+
+        def sign(gs_url, **kwargs):
+            threads.add(threading.get_ident())
+            time.sleep(0.05)
+            return _signed_url(gs_url, datetime.now(timezone.utc), 3600)
+
+        signer.generate_signed_url.side_effect = sign
+        cache = URLCache()
+        cache.set_signer(signer)
+        ids = [cache.store_lazy(f"gs://b/{i}.pdf") for i in range(6)]
+
+        results = cache.get_many(ids)
+
+        assert [results[i]["status"] for i in ids] == ["ok"] * 6
+        assert results[ids[3]]["url"].startswith("https://storage.googleapis.com/b/3.pdf")
+        assert len(threads) > 1
+        assert cache.stats()["lazy_signed"] == 6
+
+    def test_one_backend_write_per_batch(self, signer):
+        backend = Mock(wraps=MemoryURLCacheBackend())
+        cache = URLCache(backend=backend)
+        cache.set_signer(signer)
+        lazy_ids = [cache.store_lazy(f"gs://b/{i}.pdf") for i in range(3)]
+        eager_id = cache.store("https://example.com/a.pdf")
+        expired_id = cache.store("https://example.com/old.pdf", ttl_hours=-1)
+
+        results = cache.get_many([*lazy_ids, eager_id, expired_id, "missing"])
+
+        backend.update_signed_urls.assert_called_once()
+        assert sorted(backend.update_signed_urls.call_args.args[0]) == sorted(lazy_ids)
+        backend.update_signed_url.assert_not_called()
+        backend.delete_many.assert_called_once_with([expired_id])
+        assert results[eager_id]["url"] == "https://example.com/a.pdf"
+        assert results[expired_id]["status"] == "expired"
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["lazy_pending"]) == (4, 2, 0)
+
+    def test_failed_entry_reported_others_signed(self, signer):
+        def sign(gs_url, **kwargs):
+            if gs_url.endswith("bad.pdf"):
+                raise RuntimeError("signBlob down")
+            return _signed_url(gs_url, datetime.now(timezone.utc), 3600)
+
+        signer.generate_signed_url.side_effect = sign
+        cache = URLCache()
+        cache.set_signer(signer)
+        good = cache.store_lazy("gs://b/good.pdf")
+        bad = cache.store_lazy("gs://b/bad.pdf")
+
+        results = cache.get_many([good, bad])
+
+        assert results[good]["status"] == "ok"
+        assert results[bad]["status"] == "error"
+        assert "signBlob down" in results[bad]["error"]
+        assert cache.stats()["lazy_pending"] == 1
+
+
+class TestSQLiteBackend:
+    def test_entries_shared_between_caches(self, tmp_path):
+        db_path = str(tmp_path / "url_cache.sqlite3")
+        writer = URLCache(backend=SQLiteURLCacheBackend(db_path))
+        short_id = writer.store("https://example.com/a.pdf")
+
+        # A second worker (or a restarted instance) opens the same file
+        reader = URLCache(backend=SQLiteURLCacheBackend(db_path))
+
+        assert reader.get(short_id) == "https://example.com/a.pdf"
+        assert reader.stats()["backend"] == "sqlite"
+        assert reader.stats()["total_entries"] == 1
+
+    def test_lazy_entry_signed_by_other_worker(self, tmp_path, signer):
+        db_path = str(tmp_path / "url_cache.sqlite3")
+        agent_worker = URLCache(backend=SQLiteURLCacheBackend(db_path))
+        short_id = agent_worker.store_lazy(
+            "gs://b/a.pdf", expiration=timedelta(hours=2), friendly_filename="a.pdf"
+        )
+
+        redirect_worker = URLCache(backend=SQLiteURLCacheBackend(db_path))
+        redirect_worker.set_signer_factory(lambda: signer)
+        signed_url = redirect_worker.get(short_id)
+
+        signer.generate_signed_url.assert_called_once_with(
+            "gs://b/a.pdf", expiration=timedelta(hours=2), friendly_filename="a.pdf"
+        )
+        # The signed URL is persisted, so the first worker reuses it
+        assert agent_worker.get(short_id) == signed_url
+        assert agent_worker.stats()["lazy_pending"] == 0
+
+    def test_batched_updates_and_deletes(self, tmp_path):
+        backend = SQLiteURLCacheBackend(str(tmp_path / "cache.db"))
+        cache = URLCache(backend=backend)
+        lazy_ids = [cache.store_lazy(f"gs://b/{i}.pdf") for i in range(3)]
+
+        backend.update_signed_urls(
+            {short_id: ("https://signed", 123.0) for short_id in lazy_ids[:2]}
+        )
+        backend.delete_many([lazy_ids[2]])
+
+        entries = backend.get_many(lazy_ids)
+        assert sorted(entries) == sorted(lazy_ids[:2])
+        assert {entry["url"] for entry in entries.values()} == {"https://signed"}
+        assert backend.stats()["lazy_pending"] == 0
+
+    def test_expired_entries_removed(self, tmp_path):
+        backend = SQLiteURLCacheBackend(str(tmp_path / "url_cache.sqlite3"))
+        cache = URLCache(backend=backend)
+        short_id = cache.store("https://example.com/a.pdf")
+
+        assert backend.purge_expired(time.time() + 200 * 3600) == 1
+        assert cache.get(short_id) is None
+
+    def test_entry_cap_evicts_oldest(self, tmp_path):
+        backend = SQLiteURLCacheBackend(str(tmp_path / "url_cache.sqlite3"), max_entries=3)
+        backend.TRIM_INTERVAL = 1
+        cache = URLCache(backend=backend)
+        ids = [cache.store(f"https://example.com/{i}.pdf") for i in range(5)]
+
+        assert [cache.get(short_id) for short_id in ids[:2]] == [None, None]
+        assert cache.get(ids[-1]) == "https://example.com/4.pdf"
+        stats = cache.stats()
+        assert stats["total_entries"] == 3
+        assert stats["evictions"] == 2
+
+    def test_expired_entries_trimmed_before_live_ones(self, tmp_path):
+        backend = SQLiteURLCacheBackend(str(tmp_path / "url_cache.sqlite3"), max_entries=2)
+        cache = URLCache(backend=backend)
+        old = cache.store("https://example.com/old.pdf")
+        stale = backend.get(old)
+        stale["expires_at"] = time.time() - 1
+        backend.put(old, stale)
+        live = cache.store("https://example.com/live.pdf")
+
+        assert backend.trim(time.time()) == 0
+        assert backend.get(old) is None
+        assert cache.get(live) == "https://example.com/live.pdf"
+
+
+class TestCreateBackend:
+    def test_selects_backend_from_config(self, tmp_path):
+        config = Mock()
+        config.get.side_effect = lambda key, default=None: {
+            "url_cache.backend": "sqlite",
+            "url_cache.sqlite_path": str(tmp_path / "cache.sqlite3"),
+        }.get(key, default)
+
+        assert isinstance(create_url_cache_backend(config), SQLiteURLCacheBackend)
+
+        config.get.side_effect = lambda key, default=None: default
+        assert isinstance(create_url_cache_backend(config), MemoryURLCacheBackend)
+
+
+class TestMemoryBackendBounds:
+    def test_lru_eviction_by_entry_cap(self):
+        backend = MemoryURLCacheBackend(max_entries=2)
+        cache = URLCache(backend=backend)
+        first = cache.store("https://example.com/a.pdf")
+        second = cache.store("https://example.com/b.pdf")
+        cache.get(first)  # touch: second becomes least recently used
+        third = cache.store("https://example.com/c.pdf")
+
+        assert cache.get(second) is None
+        assert cache.get(first) == "https://example.com/a.pdf"
+        assert cache.get(third) == "https://example.com/c.pdf"
+        assert backend.stats()["evictions"] == 1
+
+    def test_eviction_by_byte_cap(self):
+        backend = MemoryURLCacheBackend(max_bytes=1000)
+        cache = URLCache(backend=backend)
+        for i in range(10):
+            cache.store(f"https://example.com/{i}.pdf?sig=" + "a" * 200)
+
+        stats = backend.stats()
+        assert stats["estimated_bytes"] <= 1000
+        assert stats["total_entries"] + stats["evictions"] == 10
+
+    def test_heap_expiry_only_removes_expired(self):
+        backend = MemoryURLCacheBackend()
+        cache = URLCache(backend=backend)
+        short_id = cache.store("https://example.com/a.pdf", ttl_hours=1)
+        long_id = cache.store("https://example.com/b.pdf")
+
+        assert backend.purge_expired(time.time() + 2 * 3600) == 1
+        assert cache.get(short_id) is None
+        assert cache.get(long_id) == "https://example.com/b.pdf"
+        assert backend.stats()["expirations"] == 1
+
+    def test_stats_report_hit_ratio(self):
+        cache = URLCache()
+        short_id = cache.store("https://example.com/a.pdf")
+        cache.get(short_id)
+        cache.get("missing")
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_ratio"] == 0.5
+        assert stats["estimated_bytes"] > 0
+
+
+class TestDeterministicIds:
+    def test_repeated_store_reuses_entry(self):
+        cache = URLCache(deterministic_ids=True, id_secret=SECRET)
+        first = cache.store("https://storage.googleapis.com/b/a.pdf?X-Goog-Signature=1")
+        second = cache.store("https://storage.googleapis.com/b/a.pdf?X-Goog-Signature=1")
+
+        assert first == second
+        stats = cache.stats()
+        assert stats["total_entries"] == 1
+        assert stats["dedup_hits"] == 1
+
+    def test_resigned_url_keeps_id_and_replaces_signature(self):
+        cache = URLCache(deterministic_ids=True, id_secret=SECRET)
+        first = cache.store("https://storage.googleapis.com/b/a.pdf?X-Goog-Signature=1")
+        second = cache.store("https://storage.googleapis.com/b/a.pdf?X-Goog-Signature=2")
+
+        assert first == second
+        assert cache.get(first).endswith("X-Goog-Signature=2")
+
+    def test_lazy_store_keyed_by_path_and_variant(self, signer):
+        cache = URLCache(deterministic_ids=True, id_secret=SECRET)
+        cache.set_signer(signer)
+        short_id = cache.store_lazy("gs://b/a.pdf")
+        cache.get(short_id)
+
+        assert cache.store_lazy("gs://b/a.pdf") == short_id
+        assert cache.store_lazy("gs://b/a.pdf", friendly_filename="a.pdf") != short_id
+        assert cache.store_lazy("gs://b/a.pdf", variant="zip") != short_id
+        # The cached signature survives the repeated store
+        cache.get(short_id)
+        assert signer.generate_signed_url.call_count == 1
+
+    def test_collision_gets_another_id(self):
+        cache = URLCache(deterministic_ids=True, id_secret=SECRET)
+        short_id = cache.store("https://example.com/a.pdf")
+        # Pretend another document already owns the first candidate ID
+        collided = cache.backend.get(short_id)
+        collided["dedup_key"] = "url|https://example.com/other.pdf|"
+        cache.backend.put(short_id, collided)
+
+        new_id = cache.store("https://example.com/a.pdf")
+
+        assert new_id != short_id
+        assert cache.get(new_id) == "https://example.com/a.pdf"
+
+    def test_requires_secret(self):
+        with pytest.raises(ValueError):
+            URLCache(deterministic_ids=True)
+
+    def test_ids_depend_on_secret(self):
+        url = "https://storage.googleapis.com/b/descargas/0105/a.pdf"
+        first = URLCache(deterministic_ids=True, id_secret="one").store(url)
+        second = URLCache(deterministic_ids=True, id_secret="two").store(url)
+        unkeyed = hashlib.blake2b(
+            f"url|{url}|".encode("utf-8"), digest_size=16
+        ).hexdigest()
+
+        assert first != second
+        assert first not in unkeyed
+
+    def test_disposition_and_expiry_get_their_own_ids(self):
+        cache = URLCache(deterministic_ids=True, id_secret=SECRET)
+        base = "https://storage.googleapis.com/b/a.pdf?X-Goog-Expires=3600"
+        inline = cache.store(f"{base}&response-content-disposition=inline&X-Goog-Signature=1")
+        attachment = cache.store(
+            f"{base}&response-content-disposition=attachment&X-Goog-Signature=2"
+        )
+        longer = cache.store(
+            "https://storage.googleapis.com/b/a.pdf?X-Goog-Expires=7200"
+            "&response-content-disposition=inline&X-Goog-Signature=3"
+        )
+
+        assert len({inline, attachment, longer}) == 3
+        assert "disposition=inline" in cache.get(inline)
+        assert cache.get(inline).endswith("X-Goog-Signature=1")
+
+    def test_random_ids_by_default(self):
+        cache = URLCache()
+
+        assert cache.store("https://example.com/a.pdf") != cache.store(
+            "https://example.com/a.pdf"
+        )
@@ -0,0 +1,69 @@
+"""
+Unit tests for ZipCompressionPolicy
+
+Covers store/deflate/adaptive decisions and per-package accounting.
+"""
+
+import io
+import os
+import zipfile
+
+import pytest
+
+from src.infrastructure.gcs.zip_compression import ZipCompressionPolicy
+
+INCOMPRESSIBLE = os.urandom(200 * 1024)  # like an already-compressed PDF
+COMPRESSIBLE = b"%PDF-1.4 " + b"0 0 0 RG\n" * 20000
+
+
+def _write(policy, entries):
+    buffer = io.BytesIO()
+    stats = policy.new_stats()
+    with zipfile.ZipFile(buffer, "w") as zip_file:
+        for name, data in entries:
+            policy.write_entry(zip_file, name, data, stats)
+    return zipfile.ZipFile(io.BytesIO(buffer.getvalue())), stats
+
+
+class TestZipCompressionPolicy:
+    def test_adaptive_stores_incompressible_and_deflates_compressible(self):
+        archive, stats = _write(
+            ZipCompressionPolicy("adaptive"),
+            [("scan.pdf", INCOMPRESSIBLE), ("text.pdf", COMPRESSIBLE)],
+        )
+
+        assert archive.getinfo("scan.pdf").compress_type == zipfile.ZIP_STORED
+        assert archive.getinfo("text.pdf").compress_type == zipfile.ZIP_DEFLATED
+        assert archive.read("scan.pdf") == INCOMPRESSIBLE
+        assert stats.entries_stored == 1
+        assert stats.entries_deflated == 1
+        assert stats.cpu_time_saved_ms >= 0
+
+    def test_store_mode(self):
+        archive, stats = _write(ZipCompressionPolicy("store"), [("text.pdf", COMPRESSIBLE)])
+
+        assert archive.getinfo("text.pdf").compress_type == zipfile.ZIP_STORED
+        assert stats.ratio == 1.0
+
+    def test_deflate_mode_reports_ratio(self):
+        archive, stats = _write(
+            ZipCompressionPolicy("deflate", level=9), [("text.pdf", COMPRESSIBLE)]
+        )
+
+        assert archive.getinfo("text.pdf").compress_type == zipfile.ZIP_DEFLATED
+        assert stats.uncompressed_bytes == len(COMPRESSIBLE)
+        assert stats.ratio < 0.1
+
+    def test_from_config_with_override(self):
+        class Config:
+            def get(self, key, default=None):
+                return {"pdf.zip.compression.mode": "adaptive"}.get(key, default)
+
+        assert ZipCompressionPolicy.from_config(Config()).mode == "adaptive"
+        assert ZipCompressionPolicy.from_config(Config(), "store").mode == "store"
+
+    def test_rejects_invalid_settings(self):
+        with pytest.raises(ValueError):
+            ZipCompressionPolicy("zstd")
+        with pytest.raises(ValueError):
+            ZipCompressionPolicy("deflate", level=0)
@@ -0,0 +1,102 @@
+"""
+Unit tests for the redirect routes
+
+Exercises GET /r/{url_id} and POST /r/batch against an in-memory URLCache
+through FastAPI's TestClient.
+"""
+
+import time
+from unittest.mock import Mock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.infrastructure.cache.url_cache import URLCache
+from src.presentation.api.redirect_routes import MAX_BATCH_IDS, create_redirect_router
+
+SIGNED_URL = (
+    "https://storage.googleapis.com/b/a.pdf?X-Goog-Algorithm=GOOG4-RSA-SHA256"
+    "&X-Goog-Date=20250101T000000Z&X-Goog-Expires=3600&X-Goog-Signature=abc"
+)
+
+
+@pytest.fixture
+def cache():
+    return URLCache()
+
+
+@pytest.fixture
+def client(cache):
+    app = FastAPI()
+    app.include_router(create_redirect_router(cache))
+    return TestClient(app)
+
+
+class TestRedirect:
+    def test_redirects_and_returns_json(self, cache, client):
+        short_id = cache.store(SIGNED_URL)
+
+        response = client.get(f"/r/{short_id}", follow_redirects=False)
+        assert response.status_code == 302
+        assert response.headers["location"] == SIGNED_URL
+
+        response = client.get(f"/r/{short_id}", headers={"Accept": "application/json"})
+        assert response.json() == {"url": SIGNED_URL, "url_id": short_id}
+
+    def test_unknown_id_is_404(self, client):
+        assert client.get("/r/missing", follow_redirects=False).status_code == 404
+
+    def test_lazy_signing_failure_is_502(self, cache, client):
+        signer = Mock()
+        signer.generate_signed_url.side_effect = RuntimeError("signBlob down")
+        cache.set_signer(signer)
+        short_id = cache.store_lazy("gs://b/a.pdf")
+
+        assert client.get(f"/r/{short_id}", follow_redirects=False).status_code == 502
+
+
+class TestBatch:
+    def test_resolves_each_id_with_status(self, cache, client):
+        ok_id = cache.store(SIGNED_URL)
+        expired_id = cache.store("https://example.com/old.pdf")
+        entry = cache.backend.get(expired_id)
+        entry["expires_at"] = time.time() - 1
+        cache.backend.put(expired_id, entry)
+
+        response = client.post("/r/batch", json={"ids": [ok_id, expired_id, "missing"]})
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert results[ok_id] == {
+            "status": "ok",
+            "url": SIGNED_URL,
+            "expires_at": "2025-01-01T01:00:00+00:00",
+        }
+        assert results[expired_id]["status"] == "expired"
+        assert results["missing"] == {"status": "missing", "url": None, "expires_at": None}
+
+    def test_reads_backend_once(self, cache, client):
+        ids = [cache.store(f"https://example.com/{i}.pdf") for i in range(5)]
+        cache.backend.get = Mock(side_effect=AssertionError("per-ID read"))
+
+        response = client.post("/r/batch", json={"ids": ids})
+
+        assert all(r["status"] == "ok" for r in response.json()["results"].values())
+
+    def test_lazy_signing_error_reported_per_id(self, cache, client):
+        signer = Mock()
+        signer.generate_signed_url.side_effect = RuntimeError("signBlob down")
+        cache.set_signer(signer)
+        lazy_id = cache.store_lazy("gs://b/a.pdf")
+        ok_id = cache.store(SIGNED_URL)
+
+        results = client.post("/r/batch", json={"ids": [lazy_id, ok_id]}).json()["results"]
+
+        assert results[lazy_id]["status"] == "error"
+        assert results[ok_id]["status"] == "ok"
+
+    def test_rejects_empty_and_oversized_batches(self, client):
+        assert client.post("/r/batch", json={"ids": []}).status_code == 422
+        too_many = [f"id{i}" for i in range(MAX_BATCH_IDS + 1)]
+        assert client.post("/r/batch", json={"ids": too_many}).status_code == 422
@@ -0,0 +1,129 @@
+"""
+Unit tests for the ZIP job routes
+
+Exercises /zip/{package_id}/status, /zip/{package_id}/download and
+/zip/stream/{token} through FastAPI's TestClient with stubbed services.
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.application.services.zip_stream_service import ZipStreamTokenError
+from src.core.domain.models import ZipPackage, ZipStatus
+from src.presentation.api.zip_routes import create_zip_router, create_zip_stream_router
+
+SIGNED_URL = "https://storage.googleapis.com/zips/zips/p/f.zip?X-Goog-Signature=abc"
+
+
+def _package(status, **kwargs):
+    return ZipPackage(package_id="p", invoice_numbers=["1", "2"], status=status, **kwargs)
+
+
+@pytest.fixture
+def job_service():
+    return Mock()
+
+
+@pytest.fixture
+def client(job_service):
+    app = FastAPI()
+    app.include_router(create_zip_router(lambda: job_service))
+    return TestClient(app)
+
+
+def test_status_reports_job_state(job_service, client):
+    job_service.get_status.return_value = _package(ZipStatus.CREATING)
+
+    body = client.get("/zip/p/status").json()
+
+    assert body["status"] == "creating"
+    assert body["ready"] is False
+    assert body["invoice_count"] == 2
+    assert "gcs_path" not in body
+
+
+def test_unknown_package_is_404(job_service, client):
+    job_service.get_status.return_value = None
+
+    assert client.get("/zip/x/status").status_code == 404
+    assert client.get("/zip/x/download", follow_redirects=False).status_code == 404
+
+
+def test_download_waits_while_building(job_service, client):
+    job_service.get_status.return_value = _package(ZipStatus.PENDING)
+
+    response = client.get("/zip/p/download", follow_redirects=False)
+
+    assert response.status_code == 202
+    assert response.headers["retry-after"]
+    assert response.json()["status"] == "pending"
+
+
+def test_download_redirects_when_ready(job_service, client):
+    job_service.get_status.return_value = _package(
+        ZipStatus.READY, download_url=SIGNED_URL, gcs_path="gs://zips/zips/p/f.zip"
+    )
+
+    response = client.get("/zip/p/download", follow_redirects=False)
+    assert response.status_code == 302
+    assert response.headers["location"] == SIGNED_URL
+
+    response = client.get("/zip/p/download", headers={"Accept": "application/json"})
+    assert response.json() == {"url": SIGNED_URL, "package_id": "p"}
+
+
+def test_failed_and_expired_packages(job_service, client):
+    job_service.get_status.return_value = _package(
+        ZipStatus.FAILED, error_message="upload failed"
+    )
+    assert client.get("/zip/p/download", follow_redirects=False).status_code == 500
+
+    job_service.get_status.return_value = _package(
+        ZipStatus.READY,
+        download_url=SIGNED_URL,
+        created_at=datetime.now(timezone.utc) - timedelta(days=8),
+        expires_at=datetime.now(timezone.utc) - timedelta(days=1),
+    )
+    assert client.get("/zip/p/download", follow_redirects=False).status_code == 410
+    assert client.get("/zip/p/status").json()["status"] == "expired"
+
+
+class TestZipStreamRoute:
+    @pytest.fixture
+    def stream_service(self):
+        return Mock()
+
+    @pytest.fixture
+    def stream_client(self, stream_service):
+        app = FastAPI()
+        app.include_router(create_zip_stream_router(lambda: stream_service))
+        return TestClient(app)
+
+    def test_streams_zip_attachment(self, stream_service, stream_client):
+        stream_service.open_stream.return_value = (
+            "facturas_2_items.zip",
+            iter([b"PK\x03\x04", b"rest"]),
+        )
+
+        response = stream_client.get("/zip/stream/tok")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/zip"
+        assert 'filename="facturas_2_items.zip"' in response.headers["content-disposition"]
+        assert response.content == b"PK\x03\x04rest"
+        stream_service.open_stream.assert_called_once_with("tok")
+
+    def test_invalid_and_expired_tokens(self, stream_service, stream_client):
+        stream_service.open_stream.side_effect = ZipStreamTokenError("bad")
+        assert stream_client.get("/zip/stream/tok").status_code == 403
+
+        stream_service.open_stream.side_effect = ZipStreamTokenError("old", expired=True)
+        assert stream_client.get("/zip/stream/tok").status_code == 410
+
+    def test_missing_invoices_is_404(self, stream_service, stream_client):
+        stream_service.open_stream.side_effect = LookupError("No invoices found")
+        assert stream_client.get("/zip/stream/tok").status_code == 404